@@ -0,0 +1,199 @@
+"""
+MQ 어댑터 XML(*.SND.xml / *.RCV.xml) 파일 모델
+
+한 번의 파싱으로 SQL, fields 개수/이름, preaction/postaction, adapter/database/dbnode 속성을
+추출합니다. XMLComparator(comp_xml.py)와 XMLQueryValidator(test23.py)가 같은 프로세스에서
+shared_cache를 통해 같은 파일의 파싱 결과를 함께 사용합니다.
+"""
+import os
+import threading
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+def file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """파일 변경 감지용 (수정시각, 크기)를 반환합니다. 파일이 없으면 None"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _node_text(node) -> str:
+    """노드의 앞뒤 공백을 제거한 텍스트, 노드나 텍스트가 없으면 빈 문자열"""
+    if node is None or not node.text:
+        return ''
+    return node.text.strip()
+
+
+class AdapterFile:
+    """
+    MQ 어댑터 XML 파일 하나의 파싱 결과
+
+    Attributes:
+        path (str): 파일 경로
+        signature (Tuple[int, int]): 파싱 시점의 (수정시각, 크기)
+        adapter_attrs (Dict[str, str]): 최상위 adapter 태그 속성 (poll_time, buffer_size, mode 등)
+        database_attrs (Dict[str, str]): database 태그 속성 (commit_count, autocommit 등)
+        dbnode_attrs (Dict[str, str]): dbnode 태그 속성 (table_name, use_cursor 등)
+        direction (str): 'send'(DB -> MQ), 'recv'(MQ -> DB), 알 수 없으면 ''
+        sql (Optional[str]): SQL 태그 내용, 없거나 비어 있으면 None
+        has_sql_text (bool): SQL 태그에 (공백뿐이라도) 텍스트가 있는지 여부
+        preaction (str): preaction 태그 내용
+        postaction (str): postaction 태그 내용
+        fields_attrs (Optional[Dict[str, str]]): fields 태그 원본 속성, 태그가 없으면 None
+        fields_count (int): fields 태그의 count 속성
+        field_names (List[str]): field 태그의 name 속성 목록 (원래 대소문자)
+    """
+
+    def __init__(self, path: str):
+        """
+        파일을 파싱합니다.
+
+        Args:
+            path (str): 어댑터 XML 파일 경로
+
+        Raises:
+            ET.ParseError: XML 형식 오류
+            OSError: 파일을 읽을 수 없음
+        """
+        self.path = path
+        self.signature = file_signature(path)
+        root = ET.parse(path).getroot()
+        self._root = root
+        self._xml_content = None
+        self._xml_lock = threading.Lock()
+
+        self.adapter_attrs = dict(root.attrib)
+
+        database = root.find('.//database')
+        self.database_attrs = dict(database.attrib) if database is not None else {}
+        if root.find('./in/database') is not None:
+            self.direction = 'send'
+        elif root.find('./out/database') is not None:
+            self.direction = 'recv'
+        else:
+            self.direction = ''
+
+        dbnode = root.find('.//dbnode')
+        self.dbnode_attrs = dict(dbnode.attrib) if dbnode is not None else {}
+
+        sql_node = root.find('.//SQL')
+        self.has_sql_text = sql_node is not None and bool(sql_node.text)
+        self.sql = _node_text(sql_node) or None
+        self.preaction = _node_text(root.find('.//preaction'))
+        self.postaction = _node_text(root.find('.//postaction'))
+
+        fields = root.find('.//fields')
+        self.fields_attrs = dict(fields.attrib) if fields is not None else None
+        self.fields_count = 0
+        self.field_names = []
+        if fields is not None:
+            try:
+                self.fields_count = int(fields.get('count', '0'))
+            except ValueError:
+                self.fields_count = 0
+            for field in fields.findall('.//field'):
+                name = field.get('name')
+                if name:
+                    self.field_names.append(name)
+
+    @property
+    def xml_content(self) -> str:
+        """
+        ET.tostring()으로 직렬화한 XML 내용. 처음 요청될 때 한 번만 만들고,
+        이후에는 파싱 트리를 메모리에서 해제합니다. 캐시를 여러 스레드가 공유하므로
+        직렬화와 트리 해제는 인스턴스 잠금 안에서 수행합니다.
+        """
+        with self._xml_lock:
+            if self._xml_content is None:
+                self._xml_content = ET.tostring(self._root, encoding='unicode')
+                self._root = None
+            return self._xml_content
+
+    def to_dict(self) -> Dict:
+        """XML 내용을 제외한 추출 항목을 딕셔너리로 반환합니다."""
+        return {
+            'path': self.path,
+            'direction': self.direction,
+            'sql': self.sql,
+            'preaction': self.preaction,
+            'postaction': self.postaction,
+            'fields_count': self.fields_count,
+            'field_names': list(self.field_names),
+            'adapter_attrs': dict(self.adapter_attrs),
+            'database_attrs': dict(self.database_attrs),
+            'dbnode_attrs': dict(self.dbnode_attrs)
+        }
+
+
+def int_value(value) -> Optional[int]:
+    """정수로 해석되는 설정 값, 전역 변수(%%...%%)나 빈 값은 None (어댑터/BW 설정 공통)"""
+    try:
+        return int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+
+
+class AdapterCache:
+    """
+    파일 경로별 AdapterFile 캐시
+    파일의 (수정시각, 크기)가 바뀌면 다시 파싱하고, max_entries를 넘으면 오래 사용하지 않은 항목부터 제거합니다.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Args:
+            max_entries (int): 최대 보관 파일 수
+        """
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    def get(self, path: str) -> Tuple[AdapterFile, bool]:
+        """
+        파일의 AdapterFile을 반환합니다. 파일이 바뀌지 않았으면 이전 파싱 결과를 사용합니다.
+
+        Args:
+            path (str): 어댑터 XML 파일 경로
+
+        Returns:
+            Tuple[AdapterFile, bool]: (파싱 결과, 캐시 적중 여부)
+                적중 여부는 호출마다 반환하므로 여러 스레드가 같은 캐시를 사용해도 섞이지 않습니다.
+
+        Raises:
+            ET.ParseError: XML 형식 오류
+            OSError: 파일을 읽을 수 없음
+        """
+        signature = file_signature(path)
+        with self.lock:
+            adapter = self.entries.get(path)
+            if adapter is not None and adapter.signature == signature:
+                self.entries.move_to_end(path)
+                self.hits += 1
+                return adapter, True
+
+        adapter = AdapterFile(path)
+        with self.lock:
+            self.misses += 1
+            self.entries[path] = adapter
+            self.entries.move_to_end(path)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return adapter, False
+
+    def clear(self):
+        """캐시를 비웁니다."""
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+# 같은 프로세스의 비교/검증 도구가 함께 사용하는 캐시
+shared_cache = AdapterCache()
@@ -0,0 +1,459 @@
+"""
+MQ/BW 비교 가상 코퍼스 생성 및 단계별 벤치마크
+
+N개 인터페이스의 입력 엑셀, MQ 송수신 어댑터 파일(*.SND.xml / *.RCV.xml), BW 프로세스 파일,
+컬럼 정보 SQLite 픽스처를 생성한 뒤 아래 단계를 실행하고 소요 시간, 최대 메모리(RSS),
+처리량을 JSON으로 출력합니다. DB 연결 없이 실행됩니다.
+
+    - compare_excel : XMLComparator.process_all_interfaces_with_bw() (comp_xml.py excel)
+    - find_table    : QueryParser.find_files_by_table() (comp_q.py find_table)
+    - compare       : QueryParser.compare_mq_bw_queries() (comp_q.py compare)
+    - validate      : test23.validate_xml_files_in_directory()
+
+    python bench_corpus.py --interfaces 200 --out-dir bench_out --json bench.json
+    python bench_corpus.py --interfaces 200 --baseline bench.json --tolerance 0.2
+"""
+import os
+import sys
+import json
+import time
+import random
+import shutil
+import argparse
+import contextlib
+from typing import Dict, List, Optional
+
+import openpyxl
+
+from metadata_provider import (SQLiteMetadataProvider, create_sqlite_fixture,
+                               generate_synthetic_schema, synthetic_interfaces)
+
+# 생성하는 인터페이스의 DB 정보 (SQLite 픽스처를 사용하므로 실제 접속하지 않음)
+BENCH_DB_INFO = {'sid': 'BENCH', 'username': 'bench', 'password': 'bench', 'system': 'BENCH'}
+
+BW_NAMESPACES = ('xmlns:pd="http://xmlns.tibco.com/bw/process/2003" '
+                 'xmlns:xsl="http://www.w3.org/1999/XSL/Transform"')
+
+
+def peak_rss_mb() -> Optional[float]:
+    """현재 프로세스의 최대 RSS(MB)를 반환합니다. 측정할 수 없으면 None"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            return round(psutil.Process().memory_info().peak_wset / (1024 * 1024), 1)
+        except (ImportError, AttributeError):
+            return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return round(usage / (1024 * 1024) if sys.platform == 'darwin' else usage / 1024, 1)
+
+
+def _select_expression(name: str, info: Dict) -> str:
+    """송신 SELECT 컬럼 표현식 (DATE는 문자열로 변환)"""
+    if info['type'] == 'DATE':
+        return f"TO_CHAR({name}, 'YYYYMMDDHH24MISS')"
+    return name
+
+
+def _pairs(items: List[str]) -> str:
+    """MQ 어댑터 SQL처럼 두 개씩 한 줄로 묶습니다."""
+    lines = []
+    for idx in range(0, len(items), 2):
+        lines.append('     ' + ', '.join(items[idx:idx + 2]))
+    return ',\n'.join(lines)
+
+
+def build_mq_send_xml(interface: Dict, columns: Dict[str, Dict]) -> str:
+    """MQ 송신 어댑터 XML을 생성합니다."""
+    send = interface['send']
+    names = send['columns']
+    table = f"{send['owner']}.{send['table_name']}"
+    fields = '\n'.join(f'<field key="0" nofetch="0" name="{name}" length_info="0" start_info="0"/>' for name in names)
+    return f'''<?xml version="1.0" encoding="utf-8"?>
+<adapter poll_time="1000" in="Oracle8" out="MQSeries" vender="MOCOCO" id="3" buffer_size="10M" mode="batch" process_id="BENCH" intf_ver="1.0">
+<in>
+<database conn="BENCH" user="eai_inf" password="bench" format="xml" data_name="data" commit_count="3000" autocommit="0" onepass="0" cursor_expiry="0" cursor_set="0">
+<dbnode db_name="BENCH" record_name="{send['table_name']}" table_name="{send['table_name']}" noaction="0" use_cursor="0" deferred_define="0" no_fetch="0" apply_all_null="0">
+<preaction noaction="0">UPDATE {table}
+    SET EAI_TRANSFER_FLAG = 'P'
+    WHERE EAI_TRANSFER_FLAG = 'N'</preaction>
+<postaction noaction="0">UPDATE {table}
+    SET EAI_TRANSFER_FLAG = 'Y', EAI_TRANSFER_DATE=SYSDATE
+   WHERE EAI_TRANSFER_FLAG = 'P'</postaction>
+<SQL noaction="0">SELECT
+{_pairs([_select_expression(name, columns[name]) for name in names])}
+    FROM {table}
+    WHERE EAI_TRANSFER_FLAG = 'P'</SQL>
+<update noaction="0"/>
+<fields count="{len(names)}">
+{fields}
+</fields>
+</dbnode>
+</database>
+</in>
+<out>
+<MQSeries QMgr="BENCH" outputq="BENCH.{interface['interface_id']}" errorq="BENCH.ERRQ" eventq="MTE.EVQ" compress="0"/>
+</out>
+</adapter>
+'''
+
+
+def build_mq_recv_xml(interface: Dict) -> str:
+    """MQ 수신 어댑터 XML을 생성합니다."""
+    recv = interface['recv']
+    names = recv['columns']
+    table = f"{recv['owner']}.{recv['table_name']}"
+    fields = '\n'.join(f'<field key="0" nofetch="0" name="{name}"/>' for name in names)
+    return f'''<?xml version="1.0"?>
+<adapter poll_time="1000" in="MQSeries" out="Oracle8" vender="MOCOCO" id="1" buffer_size="10M" mode="batch" process_id="BENCH" policy="128" intf_ver="1.0">
+<in>
+<MQSeries QMgr="BENCH" inputq="BENCH.{interface['interface_id']}" errorq="BENCH.ERRQ" eventq="MTE.EVQ" compress="0"/>
+</in>
+<out>
+<database user="eai_inf" password="bench" conn="BENCH" format="xml" data_name="data" commit_count="3000" autocommit="0" onepass="0" cursor_expiry="0" cursor_set="0">
+<dbnode db_name="BENCH" record_name="{recv['table_name']}" table_name="{recv['table_name']}" use_cursor="0" deferred_define="0" no_fetch="0">
+<preaction noaction="0" />
+<postaction noaction="0" />
+<SQL noaction="0">INSERT INTO {table} (
+{_pairs(names)}
+)
+VALUES (
+{_pairs([':' + name for name in names])}
+)</SQL>
+<update noaction="0"/>
+<fields count="{len(names)}">
+{fields}
+</fields>
+</dbnode>
+</database>
+</out>
+</adapter>
+'''
+
+
+def build_bw_process_xml(interface: Dict, columns: Dict[str, Dict], drop_column: bool, filler: int) -> str:
+    """
+    BW 프로세스 XML을 생성합니다. BWQueryExtractor가 찾는 구조
+    (Group 내 SelectP 조회, Prepared_Param_DataType/Record 매핑을 가진 JDBC INSERT)를 따릅니다.
+
+    Args:
+        interface (Dict): 인터페이스 정보
+        columns (Dict[str, Dict]): 송신 테이블 컬럼 정보
+        drop_column (bool): True이면 송신 SELECT에서 마지막 컬럼을 빼서 MQ와 차이를 만듦
+        filler (int): 파일 크기를 실제와 비슷하게 만들기 위한 추가 Assign 액티비티 수
+    """
+    send, recv = interface['send'], interface['recv']
+    send_names = send['columns'][:-1] if drop_column and len(send['columns']) > 1 else send['columns']
+    recv_names = recv['columns']
+    params = '\n'.join(
+        f'\t\t\t\t\t<parameter><parameterName>{name}</parameterName><dataType>VARCHAR</dataType></parameter>'
+        for name in recv_names
+    )
+    record = '\n'.join(f'\t\t\t\t\t\t\t<{name}><xsl:value-of select="{name}"/></{name}>' for name in recv_names)
+    fillers = '\n'.join(
+        f'''\t<pd:activity name="Assign_{idx}">
+\t\t<pd:type>com.tibco.pe.core.AssignActivity</pd:type>
+\t\t<pd:resourceType>ae.activities.assignActivity</pd:resourceType>
+\t\t<config><variableName>INFO</variableName></config>
+\t\t<pd:inputBindings><INFO><IF_ID><xsl:value-of select="&quot;{interface['interface_id']}&quot;"/></IF_ID><STEP><xsl:value-of select="&quot;{idx}&quot;"/></STEP></INFO></pd:inputBindings>
+\t</pd:activity>'''
+        for idx in range(filler)
+    )
+    return f'''<?xml version="1.0" encoding="UTF-8"?>
+<pd:ProcessDefinition {BW_NAMESPACES}>
+\t<pd:name>Processes/BENCH/{interface['interface_id']}.process</pd:name>
+\t<pd:startName>Timer</pd:startName>
+\t<pd:starter name="Timer">
+\t\t<pd:type>com.tibco.plugin.timer.TimerEventSource</pd:type>
+\t\t<config><TimeInterval>5</TimeInterval><FrequencyIndex>Minute</FrequencyIndex></config>
+\t</pd:starter>
+{fillers}
+\t<pd:group name="Group">
+\t\t<pd:type>com.tibco.pe.core.LoopGroup</pd:type>
+\t\t<pd:activity name="SelectP">
+\t\t\t<pd:type>com.tibco.plugin.jdbc.JDBCQueryActivity</pd:type>
+\t\t\t<config>
+\t\t\t\t<timeout>10</timeout>
+\t\t\t\t<commit>false</commit>
+\t\t\t\t<maxRows>1000</maxRows>
+\t\t\t\t<statement>SELECT {', '.join(_select_expression(name, columns[name]) for name in send_names)} FROM {send['owner']}.{send['table_name']} WHERE EAI_TRANSFER_FLAG = 'P'</statement>
+\t\t\t</config>
+\t\t</pd:activity>
+\t\t<pd:activity name="InsertR">
+\t\t\t<pd:type>com.tibco.plugin.jdbc.JDBCUpdateActivity</pd:type>
+\t\t\t<config>
+\t\t\t\t<timeout>10</timeout>
+\t\t\t\t<commit>false</commit>
+\t\t\t\t<statement>INSERT INTO {recv['owner']}.{recv['table_name']} ({', '.join(recv_names)}) VALUES ({', '.join('?' for _ in recv_names)})</statement>
+\t\t\t\t<Prepared_Param_DataType>
+{params}
+\t\t\t\t</Prepared_Param_DataType>
+\t\t\t</config>
+\t\t\t<pd:inputBindings>
+\t\t\t\t<jdbcUpdateActivityInput>
+\t\t\t\t\t<xsl:for-each select="$SelectP/resultSet/Record">
+\t\t\t\t\t\t<Record>
+{record}
+\t\t\t\t\t\t</Record>
+\t\t\t\t\t</xsl:for-each>
+\t\t\t\t</jdbcUpdateActivityInput>
+\t\t\t</pd:inputBindings>
+\t\t</pd:activity>
+\t</pd:group>
+</pd:ProcessDefinition>
+'''
+
+
+def write_input_workbook(path: str, interfaces: List[Dict]):
+    """read_interface_block() 형식(3컬럼 단위 블록)의 입력 엑셀을 생성합니다."""
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    for idx, interface in enumerate(interfaces):
+        col = 2 + idx * 3
+        ws.cell(row=1, column=col, value=interface['interface_name'])
+        ws.cell(row=2, column=col, value=interface['interface_id'])
+        ws.cell(row=3, column=col, value=repr(interface['send']['db_info']))
+        ws.cell(row=3, column=col + 1, value=repr(interface['recv']['db_info']))
+        ws.cell(row=4, column=col, value=repr({'owner': interface['send']['owner'], 'table_name': interface['send']['table_name']}))
+        ws.cell(row=4, column=col + 1, value=repr({'owner': interface['recv']['owner'], 'table_name': interface['recv']['table_name']}))
+        for row, (send_col, recv_col) in enumerate(zip(interface['send']['columns'], interface['recv']['columns']), 5):
+            ws.cell(row=row, column=col, value=send_col)
+            ws.cell(row=row, column=col + 1, value=recv_col)
+    wb.save(path)
+    wb.close()
+
+
+def generate_corpus(out_dir: str, interface_count: int, min_columns: int = 5, max_columns: int = 40,
+                    mismatch_rate: float = 0.1, bw_filler: int = 20, seed: int = 0) -> Dict:
+    """
+    벤치마크용 가상 코퍼스를 생성합니다. out_dir의 기존 내용은 삭제됩니다.
+
+    Args:
+        out_dir (str): 출력 디렉토리
+        interface_count (int): 인터페이스 수
+        min_columns (int): 테이블당 최소 컬럼 수
+        max_columns (int): 테이블당 최대 컬럼 수
+        mismatch_rate (float): MQ/BW 쿼리와 송수신 컬럼을 다르게 만들 비율
+        bw_filler (int): BW 파일마다 추가할 Assign 액티비티 수
+        seed (int): 난수 시드
+
+    Returns:
+        Dict: 생성된 경로와 인터페이스 목록
+            {'excel', 'xml_dir', 'bw_dir', 'schema_db', 'interfaces'}
+    """
+    if os.path.exists(out_dir):
+        shutil.rmtree(out_dir)
+    xml_dir = os.path.join(out_dir, 'xml')
+    bw_dir = os.path.join(out_dir, 'bw')
+    os.makedirs(xml_dir)
+    os.makedirs(bw_dir)
+
+    schema = generate_synthetic_schema(interface_count, min_columns, max_columns, mismatch_rate, seed=seed)
+    interfaces = synthetic_interfaces(schema, BENCH_DB_INFO)
+    rng = random.Random(seed)
+
+    schema_db = os.path.join(out_dir, 'schema.db')
+    create_sqlite_fixture(schema_db, schema)
+
+    excel_path = os.path.join(out_dir, 'input.xlsx')
+    write_input_workbook(excel_path, interfaces)
+
+    for interface in interfaces:
+        if_id = interface['interface_id']
+        columns = schema[(interface['send']['owner'], interface['send']['table_name'])]
+        with open(os.path.join(xml_dir, f'{if_id}.BENCH.SND.xml'), 'w', encoding='utf-8') as f:
+            f.write(build_mq_send_xml(interface, columns))
+        with open(os.path.join(xml_dir, f'{if_id}.BENCH.RCV.xml'), 'w', encoding='utf-8') as f:
+            f.write(build_mq_recv_xml(interface))
+        # BW 파일은 실제처럼 하위 디렉토리에 분산
+        sub_dir = os.path.join(bw_dir, f'Processes_{int(if_id[-5:]) // 100:03d}')
+        os.makedirs(sub_dir, exist_ok=True)
+        with open(os.path.join(sub_dir, f'{if_id}.xml'), 'w', encoding='utf-8') as f:
+            f.write(build_bw_process_xml(interface, columns, rng.random() < mismatch_rate, bw_filler))
+
+    return {
+        'excel': excel_path,
+        'xml_dir': xml_dir,
+        'bw_dir': bw_dir,
+        'schema_db': schema_db,
+        'interfaces': interfaces
+    }
+
+
+def _dir_size_mb(path: str) -> float:
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            total += os.path.getsize(os.path.join(root, file))
+    return round(total / (1024 * 1024), 2)
+
+
+class StageTimer:
+    """단계별 소요 시간, 처리 건수, 최대 RSS를 기록하는 클래스"""
+
+    def __init__(self, quiet: bool = True):
+        """
+        Args:
+            quiet (bool): True이면 단계 실행 중 표준 출력을 버림 (비교 모듈의 디버그 출력 제외)
+        """
+        self.quiet = quiet
+        self.stages = {}
+
+    @contextlib.contextmanager
+    def stage(self, name: str, items: int):
+        """with 블록의 실행 시간을 name 단계로 기록합니다."""
+        devnull = open(os.devnull, 'w', encoding='utf-8') if self.quiet else None
+        start = time.perf_counter()
+        try:
+            if devnull:
+                with contextlib.redirect_stdout(devnull):
+                    yield
+            else:
+                yield
+        finally:
+            elapsed = time.perf_counter() - start
+            if devnull:
+                devnull.close()
+            self.stages[name] = {
+                'seconds': round(elapsed, 4),
+                'items': items,
+                'items_per_sec': round(items / elapsed, 2) if elapsed > 0 else None,
+                'peak_rss_mb': peak_rss_mb()
+            }
+            print(f"  {name:<14} {elapsed:8.3f}s  {items:6d}건")
+
+
+def run_benchmark(corpus: Dict, out_dir: str, find_table_samples: int = 10, quiet: bool = True) -> Dict:
+    """
+    생성된 코퍼스로 단계별 벤치마크를 실행합니다.
+
+    Args:
+        corpus (Dict): generate_corpus()의 반환값
+        out_dir (str): 결과 파일 출력 디렉토리
+        find_table_samples (int): find_table 단계에서 검색할 테이블 수
+        quiet (bool): 단계 실행 중 표준 출력 숨김 여부
+
+    Returns:
+        Dict: {'stages': {단계: {'seconds', 'items', 'items_per_sec', 'peak_rss_mb'}}}
+    """
+    from comp_xml import XMLComparator
+    from comp_q import QueryParser
+    from test23 import validate_xml_files_in_directory
+
+    interfaces = corpus['interfaces']
+    timer = StageTimer(quiet)
+    provider = SQLiteMetadataProvider(corpus['schema_db'])
+
+    # comp_xml.py excel 모드
+    XMLComparator.BW_SEARCH_DIR = corpus['bw_dir']
+    comparator = XMLComparator(corpus['excel'], corpus['xml_dir'])
+    comparator.mapper.metadata_provider = provider
+    comparator.output_path = os.path.join(out_dir, 'comp_mq_bw.xlsx')
+    with timer.stage('compare_excel', len(interfaces)):
+        comparator.process_all_interfaces_with_bw()
+    comparator.close()
+
+    # comp_q.py find_table 모드
+    samples = interfaces[:find_table_samples]
+    query_parser = QueryParser()
+    with timer.stage('find_table', len(samples)):
+        for interface in samples:
+            query_parser.find_files_by_table(corpus['bw_dir'], interface['send']['table_name'])
+
+    # comp_q.py compare 모드
+    pairs = []
+    for interface in interfaces:
+        if_id = interface['interface_id']
+        bw_file = os.path.join(corpus['bw_dir'], f'Processes_{int(if_id[-5:]) // 100:03d}', f'{if_id}.xml')
+        for suffix in ('SND', 'RCV'):
+            pairs.append((os.path.join(corpus['xml_dir'], f'{if_id}.BENCH.{suffix}.xml'), bw_file))
+    with timer.stage('compare', len(pairs)):
+        for mq_path, bw_path in pairs:
+            QueryParser().compare_mq_bw_queries(mq_path, bw_path)
+
+    # test23.py 디렉토리 검증
+    with timer.stage('validate', len(interfaces) * 2):
+        validate_xml_files_in_directory(corpus['xml_dir'])
+
+    provider.close()
+    return {'stages': timer.stages}
+
+
+def compare_with_baseline(report: Dict, baseline: Dict, tolerance: float) -> List[str]:
+    """
+    기준 결과보다 tolerance 비율 이상 느려진 단계를 찾습니다.
+
+    Args:
+        report (Dict): 현재 벤치마크 결과
+        baseline (Dict): 기준 벤치마크 결과
+        tolerance (float): 허용 비율 (0.2 = 20%)
+
+    Returns:
+        List[str]: 회귀 설명 목록 (없으면 빈 리스트)
+    """
+    regressions = []
+    for name, stage in report['stages'].items():
+        base = baseline.get('stages', {}).get(name)
+        if not base or not base.get('items_per_sec') or not stage.get('items_per_sec'):
+            continue
+        if stage['items_per_sec'] < base['items_per_sec'] * (1 - tolerance):
+            regressions.append(
+                f"{name}: {stage['items_per_sec']}건/초 (기준 {base['items_per_sec']}건/초)"
+            )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MQ/BW 비교 가상 코퍼스 벤치마크")
+    parser.add_argument("--interfaces", type=int, default=100, help="생성할 인터페이스 수")
+    parser.add_argument("--min-columns", type=int, default=5, help="테이블당 최소 컬럼 수")
+    parser.add_argument("--max-columns", type=int, default=40, help="테이블당 최대 컬럼 수")
+    parser.add_argument("--mismatch-rate", type=float, default=0.1, help="MQ/BW 및 송수신 차이 비율")
+    parser.add_argument("--bw-filler", type=int, default=20, help="BW 파일당 추가 액티비티 수 (파일 크기 조절)")
+    parser.add_argument("--find-table-samples", type=int, default=10, help="find_table 단계에서 검색할 테이블 수")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--out-dir", default='bench_out', help="코퍼스/결과 출력 디렉토리 (기존 내용 삭제)")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="기준 대비 허용 처리량 감소 비율")
+    parser.add_argument("--verbose", action="store_true", help="단계 실행 중 비교 모듈 출력 표시")
+    args = parser.parse_args()
+
+    print(f"[코퍼스 생성] 인터페이스 {args.interfaces}개 -> {args.out_dir}")
+    start = time.perf_counter()
+    corpus = generate_corpus(args.out_dir, args.interfaces, args.min_columns, args.max_columns,
+                             args.mismatch_rate, args.bw_filler, args.seed)
+    generate_seconds = time.perf_counter() - start
+
+    print("[벤치마크 실행]")
+    report = run_benchmark(corpus, args.out_dir, args.find_table_samples, quiet=not args.verbose)
+    report['config'] = {key: value for key, value in vars(args).items() if key not in ('json', 'baseline', 'verbose')}
+    report['corpus'] = {
+        'generate_seconds': round(generate_seconds, 4),
+        'mq_size_mb': _dir_size_mb(corpus['xml_dir']),
+        'bw_size_mb': _dir_size_mb(corpus['bw_dir'])
+    }
+    report['python'] = sys.version.split()[0]
+
+    print(json.dumps(report, ensure_ascii=False, indent=1))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+        print(f"결과 파일: {args.json}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("\n[성능 회귀 감지]")
+            for regression in regressions:
+                print(f"  - {regression}")
+            sys.exit(1)
+        print("\n[기준 대비 회귀 없음]")
+
+
+if __name__ == "__main__":
+    main()
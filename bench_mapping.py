@@ -0,0 +1,121 @@
+"""
+컬럼 매핑 처리량 벤치마크
+
+DB 없이 metadata_provider의 가상 스키마로 ColumnMapper의 컬럼 조회, compare_columns(),
+SQL/필드 XML 생성, xltest 결과 시트 작성 단계별 처리 시간을 측정합니다.
+
+    python bench_mapping.py --tables 2000 --provider sqlite --json bench_mapping.json
+"""
+import os
+import json
+import time
+import argparse
+import tempfile
+from typing import Dict, List
+
+import openpyxl
+
+from maptest import ColumnMapper
+from xltest import write_interface_result_to_sheet
+from metadata_provider import (MetadataProvider, InMemoryMetadataProvider, SQLiteMetadataProvider,
+                               create_sqlite_fixture, generate_synthetic_schema, synthetic_interfaces)
+
+
+def run_mapping_benchmark(provider: MetadataProvider, interfaces: List[Dict], output_path: str = None) -> Dict:
+    """
+    인터페이스마다 xltest.process_interface()와 같은 순서로 처리하며 단계별 시간을 측정합니다.
+
+    Args:
+        provider (MetadataProvider): 컬럼 정보 제공자
+        interfaces (List[Dict]): 인터페이스 정보 목록
+        output_path (str, optional): 결과 엑셀 저장 경로, 없으면 저장 단계 생략
+
+    Returns:
+        Dict: {'interfaces': 개수, 'columns': 비교한 컬럼 수, 'stages': {단계: 초}, 'throughput': {단계: 건/초}}
+    """
+    stages = {'lookup': 0.0, 'compare_columns': 0.0, 'generate_sql': 0.0, 'excel_write': 0.0, 'excel_save': 0.0}
+    mapper = ColumnMapper()
+    mapper.metadata_provider = provider
+    wb = openpyxl.Workbook()
+    wb.remove(wb.active)
+    column_count = 0
+
+    for num, interface_info in enumerate(interfaces, 1):
+        send, recv = interface_info['send'], interface_info['recv']
+
+        start = time.perf_counter()
+        mapper.connect_send_db(send['db_info']['sid'], send['db_info']['username'], send['db_info']['password'])
+        mapper.connect_recv_db(recv['db_info']['sid'], recv['db_info']['username'], recv['db_info']['password'])
+        mapper.set_send_table(send['owner'], send['table_name'])
+        mapper.set_recv_table(recv['owner'], recv['table_name'])
+        mapper.set_send_mapping('\n'.join(send['columns']))
+        mapper.set_recv_mapping('\n'.join(recv['columns']))
+        stages['lookup'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        results = {'comparison': mapper.compare_columns(), 'errors': []}
+        stages['compare_columns'] += time.perf_counter() - start
+        column_count += len(results['comparison'])
+
+        start = time.perf_counter()
+        results['send_sql'] = mapper.generate_send_sql_from_mapping()
+        results['recv_sql'] = mapper.generate_recv_sql()
+        results['field_xml'] = mapper.generate_field_xml_from_mapping()
+        stages['generate_sql'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        write_interface_result_to_sheet(wb, interface_info, results, num)
+        stages['excel_write'] += time.perf_counter() - start
+
+    if output_path:
+        start = time.perf_counter()
+        wb.save(output_path)
+        stages['excel_save'] += time.perf_counter() - start
+    wb.close()
+    mapper.close_connections()
+
+    count = len(interfaces)
+    return {
+        'interfaces': count,
+        'columns': column_count,
+        'stages': {name: round(seconds, 4) for name, seconds in stages.items()},
+        'throughput': {name: round(count / seconds, 1) for name, seconds in stages.items() if seconds > 0}
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="컬럼 매핑 처리량 벤치마크")
+    parser.add_argument("--tables", type=int, default=500, help="가상 테이블 쌍(인터페이스) 개수")
+    parser.add_argument("--provider", choices=["memory", "sqlite"], default="memory", help="컬럼 정보 제공자")
+    parser.add_argument("--seed", type=int, default=0, help="가상 스키마 난수 시드")
+    parser.add_argument("--output", help="결과 엑셀 저장 경로 (지정시 저장 시간도 측정)")
+    parser.add_argument("--json", help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    schema = generate_synthetic_schema(args.tables, seed=args.seed)
+    interfaces = synthetic_interfaces(schema)
+
+    fixture_path = None
+    if args.provider == "sqlite":
+        fixture_path = os.path.join(tempfile.gettempdir(), f'bench_schema_{os.getpid()}.db')
+        create_sqlite_fixture(fixture_path, schema)
+        provider = SQLiteMetadataProvider(fixture_path)
+    else:
+        provider = InMemoryMetadataProvider(schema)
+
+    try:
+        result = run_mapping_benchmark(provider, interfaces, args.output)
+    finally:
+        provider.close()
+        if fixture_path and os.path.exists(fixture_path):
+            os.remove(fixture_path)
+    result['provider'] = args.provider
+
+    print(json.dumps(result, ensure_ascii=False, indent=1))
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(result, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == "__main__":
+    main()
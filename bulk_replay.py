@@ -0,0 +1,346 @@
+"""
+송신 SELECT / 수신 INSERT 대량 전송 재현(replay) 모듈
+
+ColumnMapper가 생성한 generate_full_send_sql / generate_full_receive_sql 쌍을
+SQLite에서 그대로 실행하여 인터페이스별 전송 처리량(rows/sec)을 측정합니다.
+
+- 송신/수신 테이블은 컬럼 정보의 타입을 SQLite 타입으로 바꿔 owner별 ATTACH 데이터베이스에 만듭니다.
+- 송신 테이블에 가상 행을 채운 뒤 송신 SELECT를 batch_size 단위로 읽어
+  수신 INSERT를 executemany로 실행하고, MQ 어댑터의 commit_count처럼 일정 행마다 커밋합니다.
+- TO_CHAR / TO_DATE / SYSDATE는 Python 함수로 등록하므로 DATE 변환이 많은 매핑의
+  행당 비용이 그대로 드러납니다. baseline을 지정하면 변환을 뺀 INSERT와 비교합니다.
+
+    python bulk_replay.py --tables 5 --rows 30000 --batch 1000 --adapter mq_rcv.xml --baseline
+"""
+import re
+import json
+import time
+import sqlite3
+import argparse
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from column_rules import normalize_type
+from sql_templates import RECV_AUTO_INTO, SEND_AUTO_SELECT
+
+# MQ 어댑터 database 태그의 기본 commit_count
+DEFAULT_COMMIT_COUNT = 3000
+DEFAULT_BATCH_SIZE = 1000
+
+# Oracle 기본 타입 -> SQLite 선언 타입
+SQLITE_TYPES = {
+    'NUMBER': 'NUMERIC',
+    'FLOAT': 'REAL',
+    'DATE': 'TEXT',
+    'RAW': 'BLOB',
+    'BLOB': 'BLOB',
+}
+# 테이블에 없으면 추가하는 EAI 표준 컬럼
+EAI_COLUMN_TYPES = {
+    'EAI_SEQ_ID': 'NUMERIC',
+    'DATA_INTERFACE_TYPE_CODE': 'TEXT',
+    'EAI_INTERFACE_DATE': 'TEXT',
+    'APPLICATION_TRANSFER_FLAG': 'TEXT',
+}
+
+ISO_FORMAT = '%Y-%m-%d %H:%M:%S'
+_ORACLE_FORMAT_TOKENS = {'YYYY': '%Y', 'YY': '%y', 'MM': '%m', 'DD': '%d', 'HH24': '%H', 'MI': '%M', 'SS': '%S'}
+_ORACLE_FORMAT_PATTERN = re.compile('YYYY|HH24|YY|MM|DD|MI|SS')
+_SYSDATE_PATTERN = re.compile(r'\bSYSDATE\b(?!\s*\()')
+_CONVERSION_PATTERN = re.compile(r"TO_(?:DATE|CHAR)\((:?\w+), '[^']*'\)")
+
+
+@lru_cache(maxsize=None)
+def strftime_format(oracle_format: str) -> str:
+    """Oracle 날짜 형식(YYYYMMDDHH24MISS 등)을 strftime 형식으로 바꿉니다."""
+    return _ORACLE_FORMAT_PATTERN.sub(lambda match: _ORACLE_FORMAT_TOKENS[match.group(0)], oracle_format)
+
+
+class ReplayConnection(sqlite3.Connection):
+    """
+    TO_CHAR/TO_DATE/SYSDATE 함수를 등록한 재현용 연결
+    SQLite는 등록 함수의 예외 내용을 알려주지 않으므로 마지막 변환 오류를 conversion_error에 남깁니다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.conversion_error = None
+        self.create_function('TO_CHAR', 2, self._to_char, deterministic=True)
+        self.create_function('TO_DATE', 2, self._to_date, deterministic=True)
+        self.create_function('SYSDATE', 0, self._sysdate)
+
+    def _convert(self, name, value, parse_format, output_format):
+        if value is None:
+            return None
+        try:
+            return datetime.strptime(str(value), parse_format).strftime(output_format)
+        except ValueError as e:
+            self.conversion_error = f"{name}({value!r}): {str(e)}"
+            raise
+
+    def _to_char(self, value, oracle_format):
+        """TO_CHAR(날짜, 형식): ISO 문자열로 저장된 날짜를 형식 문자열로 변환"""
+        return self._convert('TO_CHAR', value, ISO_FORMAT, strftime_format(oracle_format))
+
+    def _to_date(self, value, oracle_format):
+        """TO_DATE(문자열, 형식): 형식 문자열을 ISO 문자열 날짜로 변환"""
+        return self._convert('TO_DATE', value, strftime_format(oracle_format), ISO_FORMAT)
+
+    @staticmethod
+    def _sysdate():
+        return datetime.now().strftime(ISO_FORMAT)
+
+
+def to_sqlite_sql(sql: str) -> str:
+    """Oracle SQL의 SYSDATE를 등록 함수 호출로 바꿉니다. TO_CHAR/TO_DATE는 같은 이름의 함수로 등록합니다."""
+    return _SYSDATE_PATTERN.sub('SYSDATE()', sql)
+
+
+def strip_conversions(sql: str) -> str:
+    """TO_CHAR/TO_DATE 변환을 뺀 SQL (baseline 측정용)"""
+    return _CONVERSION_PATTERN.sub(r'\1', sql)
+
+
+def connect_replay_db(owners: List[str], path: str = ':memory:') -> ReplayConnection:
+    """
+    재현용 SQLite 연결을 만들고 owner별 데이터베이스를 ATTACH 합니다.
+
+    Args:
+        owners (List[str]): 송신/수신 테이블 owner 목록
+        path (str): 기본 데이터베이스 경로
+
+    Returns:
+        ReplayConnection: TO_CHAR/TO_DATE/SYSDATE 함수가 등록된 연결
+    """
+    connection = sqlite3.connect(path, factory=ReplayConnection)
+    for owner in dict.fromkeys(owner for owner in owners if owner):
+        connection.execute(f"ATTACH DATABASE ':memory:' AS {owner}")
+    return connection
+
+
+def sqlite_type(info: Dict) -> str:
+    """컬럼 정보의 Oracle 타입에 대응하는 SQLite 선언 타입"""
+    return SQLITE_TYPES.get(normalize_type(info['type'])[0], 'TEXT')
+
+
+def create_table(connection: sqlite3.Connection, table_info: Dict, columns: Dict[str, Dict], eai_columns):
+    """
+    컬럼 정보로 테이블을 만듭니다. NOT NULL 제약을 그대로 두어 미매핑 NOT NULL 컬럼은 INSERT 오류가 납니다.
+
+    Args:
+        connection (sqlite3.Connection): 재현용 연결
+        table_info (Dict): {'owner', 'table_name'}
+        columns (Dict[str, Dict]): 컬럼 정보
+        eai_columns: 테이블에 없으면 추가할 EAI 표준 컬럼
+    """
+    definitions = [f"{name} {sqlite_type(info)}{' NOT NULL' if info['nullable'] == 'N' else ''}"
+                   for name, info in columns.items()]
+    definitions.extend(f"{name} {EAI_COLUMN_TYPES[name]}" for name in eai_columns if name not in columns)
+    table = f"{table_info['owner']}.{table_info['table_name']}" if table_info['owner'] else table_info['table_name']
+    connection.execute(f"CREATE TABLE {table} (\n    " + ",\n    ".join(definitions) + "\n)")
+    return table
+
+
+def synthetic_value(info: Dict, row: int, base_date: datetime):
+    """컬럼 타입에 맞는 가상 값"""
+    base_type = normalize_type(info['type'])[0]
+    if base_type in ('NUMBER', 'FLOAT'):
+        return row
+    if base_type == 'DATE' or base_type.startswith('TIMESTAMP'):
+        return (base_date + timedelta(seconds=row)).strftime(ISO_FORMAT)
+    if base_type in ('RAW', 'BLOB'):
+        return bytes([row % 256]) * 16
+    try:
+        size = int(info['size'])
+    except (TypeError, ValueError):
+        size = 32
+    return f"V{row}".ljust(min(size, 32), 'x')[:max(size, 1)]
+
+
+def fill_send_table(connection: sqlite3.Connection, table: str, columns: Dict[str, Dict], rows: int, batch_size: int):
+    """송신 테이블에 가상 행을 채웁니다. (EAI_SEQ_ID는 행 번호, DATA_INTERFACE_TYPE_CODE는 'I')"""
+    names = list(columns) + [name for name in SEND_AUTO_SELECT if name not in columns]
+    infos = [columns.get(name) for name in names]
+    sql = f"INSERT INTO {table} ({', '.join(names)}) VALUES ({', '.join('?' * len(names))})"
+    base_date = datetime(2024, 1, 1)
+    for start in range(0, rows, batch_size):
+        batch = []
+        for row in range(start, min(start + batch_size, rows)):
+            values = [synthetic_value(info, row, base_date) if info else None for info in infos]
+            for index, name in enumerate(names):
+                if name == 'EAI_SEQ_ID':
+                    values[index] = row
+                elif name == 'DATA_INTERFACE_TYPE_CODE':
+                    values[index] = 'I'
+            batch.append(values)
+        connection.executemany(sql, batch)
+    connection.commit()
+
+
+def transfer(connection: sqlite3.Connection, select_sql: str, insert_sql: str, bind_names: List[str],
+             batch_size: int, commit_count: int) -> Dict:
+    """
+    송신 SELECT 결과를 batch_size 단위로 읽어 수신 INSERT를 executemany로 실행합니다.
+
+    Returns:
+        Dict: {'rows', 'commits', 'select', 'insert'} (select/insert는 초)
+    """
+    stats = {'rows': 0, 'commits': 0, 'select': 0.0, 'insert': 0.0}
+    cursor = connection.cursor()
+    cursor.arraysize = batch_size
+    start = time.perf_counter()
+    cursor.execute(select_sql)
+    stats['select'] += time.perf_counter() - start
+    uncommitted = 0
+    while True:
+        start = time.perf_counter()
+        rows = cursor.fetchmany(batch_size)
+        stats['select'] += time.perf_counter() - start
+        if not rows:
+            break
+
+        start = time.perf_counter()
+        connection.executemany(insert_sql, [dict(zip(bind_names, row)) for row in rows])
+        uncommitted += len(rows)
+        if uncommitted >= commit_count:
+            connection.commit()
+            stats['commits'] += 1
+            uncommitted = 0
+        stats['insert'] += time.perf_counter() - start
+        stats['rows'] += len(rows)
+
+    if uncommitted:
+        start = time.perf_counter()
+        connection.commit()
+        stats['commits'] += 1
+        stats['insert'] += time.perf_counter() - start
+    cursor.close()
+    return stats
+
+
+def _rate(rows: int, seconds: float) -> Optional[float]:
+    return round(rows / seconds, 1) if seconds > 0 else None
+
+
+def replay_interface(mapper, interface_info: Dict, rows: int = 10000, batch_size: int = DEFAULT_BATCH_SIZE,
+                     commit_count: int = DEFAULT_COMMIT_COUNT, baseline: bool = False) -> Dict:
+    """
+    인터페이스 하나의 생성 SQL 쌍을 SQLite에서 재현하여 처리량을 측정합니다.
+
+    Args:
+        mapper (ColumnMapper): 컬럼 정보 조회용 매퍼 (metadata_provider 지정)
+        interface_info (Dict): read_interface_block() 형식의 인터페이스 정보
+        rows (int): 전송할 가상 행 수
+        batch_size (int): fetchmany / executemany 단위
+        commit_count (int): 커밋 간격(행), MQ 어댑터의 commit_count
+        baseline (bool): TO_CHAR/TO_DATE 변환을 뺀 SQL로도 측정하여 변환 비용 비율 계산
+
+    Returns:
+        Dict: 인터페이스별 측정 결과, 실행 오류는 'error'에 기록
+    """
+    send, recv = interface_info['send'], interface_info['recv']
+    result = {'interface_id': interface_info['interface_id'], 'rows': rows,
+              'batch_size': batch_size, 'commit_count': commit_count}
+
+    mapper.connect_send_db(send['db_info']['sid'], send['db_info']['username'], send['db_info']['password'])
+    mapper.connect_recv_db(recv['db_info']['sid'], recv['db_info']['username'], recv['db_info']['password'])
+    mapper.set_send_table(send['owner'], send['table_name'])
+    mapper.set_recv_table(recv['owner'], recv['table_name'])
+    mapper.set_send_mapping('\n'.join(col or '' for col in send['columns']))
+    mapper.set_recv_mapping('\n'.join(col or '' for col in recv['columns']))
+
+    send_sql = mapper.generate_full_send_sql(mapper.send_table_info, mapper.send_mapping, mapper.send_columns)
+    recv_sql = mapper.generate_full_receive_sql(mapper.recv_table_info, mapper.recv_mapping, mapper.recv_columns)
+    bind_names = mapper.statement_plan().select_names
+    result['date_conversions'] = len(_CONVERSION_PATTERN.findall(send_sql + recv_sql))
+
+    variants = [('mapped', send_sql, recv_sql)]
+    if baseline:
+        variants.append(('baseline', strip_conversions(send_sql), strip_conversions(recv_sql)))
+
+    for name, select_sql, insert_sql in variants:
+        connection = connect_replay_db([send['owner'], recv['owner']])
+        try:
+            start = time.perf_counter()
+            send_table = create_table(connection, mapper.send_table_info, mapper.send_columns, SEND_AUTO_SELECT)
+            create_table(connection, mapper.recv_table_info, mapper.recv_columns, RECV_AUTO_INTO)
+            fill_send_table(connection, send_table, mapper.send_columns, rows, batch_size)
+            fill_seconds = time.perf_counter() - start
+
+            stats = transfer(connection, to_sqlite_sql(select_sql), to_sqlite_sql(insert_sql),
+                             bind_names, batch_size, commit_count)
+        except sqlite3.Error as e:
+            result['error'] = f"{name}: {connection.conversion_error or str(e)}"
+            break
+        finally:
+            connection.close()
+
+        total = stats['select'] + stats['insert']
+        result[name] = {
+            'fill': round(fill_seconds, 4),
+            'select': round(stats['select'], 4),
+            'insert': round(stats['insert'], 4),
+            'transferred': stats['rows'],
+            'commits': stats['commits'],
+            'rows_per_sec': _rate(stats['rows'], total),
+            'per_row_us': round(total / stats['rows'] * 1e6, 2) if stats['rows'] else None
+        }
+
+    if 'mapped' in result and 'baseline' in result and result['baseline']['per_row_us']:
+        result['conversion_overhead'] = round(result['mapped']['per_row_us'] / result['baseline']['per_row_us'], 2)
+    return result
+
+
+def adapter_commit_count(path: str) -> int:
+    """MQ 어댑터 XML의 database commit_count (없으면 DEFAULT_COMMIT_COUNT)"""
+    from adapter_model import AdapterFile
+
+    try:
+        return int(AdapterFile(path).database_attrs.get('commit_count', DEFAULT_COMMIT_COUNT))
+    except ValueError:
+        return DEFAULT_COMMIT_COUNT
+
+
+def main():
+    from maptest import ColumnMapper
+    from metadata_provider import InMemoryMetadataProvider, generate_synthetic_schema, synthetic_interfaces
+
+    parser = argparse.ArgumentParser(description="생성 SQL 대량 전송 재현 (SQLite)")
+    parser.add_argument("--tables", type=int, default=3, help="가상 테이블 쌍(인터페이스) 개수")
+    parser.add_argument("--rows", type=int, default=10000, help="인터페이스당 전송 행 수")
+    parser.add_argument("--batch", type=int, default=DEFAULT_BATCH_SIZE, help="fetchmany/executemany 단위")
+    parser.add_argument("--commit-count", type=int, help=f"커밋 간격(행), 기본 {DEFAULT_COMMIT_COUNT}")
+    parser.add_argument("--adapter", help="commit_count를 읽을 MQ 어댑터 XML (--commit-count가 우선)")
+    parser.add_argument("--baseline", action="store_true", help="TO_CHAR/TO_DATE를 뺀 SQL과 비교")
+    parser.add_argument("--seed", type=int, default=0, help="가상 스키마 난수 시드")
+    parser.add_argument("--mismatch-rate", type=float, default=0.0,
+                        help="수신 컬럼을 다르게 만들 비율 (기본 0, 타입이 다른 쌍은 TO_DATE 오류로 측정되지 않음)")
+    parser.add_argument("--json", help="측정 결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    commit_count = args.commit_count or (adapter_commit_count(args.adapter) if args.adapter else DEFAULT_COMMIT_COUNT)
+    schema = generate_synthetic_schema(args.tables, mismatch_rate=args.mismatch_rate, seed=args.seed)
+    mapper = ColumnMapper()
+    mapper.metadata_provider = InMemoryMetadataProvider(schema)
+
+    results = []
+    for interface_info in synthetic_interfaces(schema):
+        result = replay_interface(mapper, interface_info, args.rows, args.batch, commit_count, args.baseline)
+        results.append(result)
+        if 'error' in result:
+            print(f"{result['interface_id']}: 오류 {result['error']}")
+            continue
+        line = (f"{result['interface_id']}: {result['mapped']['rows_per_sec']} rows/sec, "
+                f"{result['mapped']['per_row_us']} us/row, DATE 변환 {result['date_conversions']}개")
+        if 'conversion_overhead' in result:
+            line += f", 변환 비용 x{result['conversion_overhead']}"
+        print(line)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""
+BW 프로세스 그래프 모델
+
+BW 프로세스 XML을 한 번 파싱하여 시작점(pd:starter), 액티비티(pd:activity), 그룹(pd:group)의
+중첩 관계와 전이(pd:transition)를 메모리 그래프로 만들고, 한 주기(타이머 1회 또는 배수 루프 1회)의
+비용을 계산합니다.
+
+- 루프 1회당 JDBC 호출 수 (inputLoop가 조회 결과 Record를 돌면 행 수만큼 곱함)
+- 루프 안 Sleep 시간, 타이머 주기(TimeInterval x FrequencyIndex)
+- 행 단위 JDBC 호출 액티비티와 인터페이스의 예상 최대 처리량(rows/sec)
+
+예상 처리량은 JDBC 호출 1회를 call_seconds(기본 JDBC_CALL_SECONDS)로 가정한 상한 추정치입니다.
+전역 변수(%%...%%)나 XPath 식으로 지정된 값은 해석하지 않고 unresolved에 남깁니다.
+
+    python bw_graph.py BW소스 [--call-ms 5]
+"""
+import os
+import re
+import argparse
+import xml.etree.ElementTree as ET
+from typing import Dict, List, Optional
+
+from adapter_model import int_value
+
+PD_NS = 'http://xmlns.tibco.com/bw/process/2003'
+XSL_NS = 'http://www.w3.org/1999/XSL/Transform'
+NS = {'pd': PD_NS, 'xsl': XSL_NS}
+
+# 가정한 JDBC 호출 1회 왕복 시간(초)
+JDBC_CALL_SECONDS = 0.005
+
+# TimerEventSource FrequencyIndex -> 초
+TIMER_UNITS = {
+    'Millisecond': 0.001, 'Second': 1, 'Minute': 60, 'Hour': 3600, 'Day': 86400, 'Week': 604800
+}
+
+# LoopGroup groupType 중 조회 결과를 한 행씩 도는 루프
+INPUT_LOOP = 'inputLoop'
+
+_OVER_SOURCE_PATTERN = re.compile(r'\$([\w.\-]+)/')
+
+
+def _xpath_name(name: str) -> str:
+    """XPath 변수에서 쓰는 액티비티 이름 (공백은 '-')"""
+    return name.replace(' ', '-')
+
+
+class BWNode:
+    """
+    BW 프로세스의 시작점/액티비티/그룹 노드
+
+    Attributes:
+        name (str): 이름
+        type (str): pd:type
+        kind (str): 'starter', 'activity', 'group'
+        parent (Optional[str]): 바로 바깥 그룹 이름, 최상위는 None
+        jdbc (Optional[str]): JDBC 액티비티면 'query' 또는 'update'
+        max_rows, timeout, commit (str): JDBC config 값 (XML 그대로)
+        for_each (bool): inputBindings에서 Record를 xsl:for-each로 넘기는지 (배열 실행)
+        sleep (Optional[str]): SleepActivity의 IntervalInMillisec 값 또는 식
+        group_type (str): 그룹의 pd:groupType (LoopGroup에 없으면 'repeat')
+        over (str): inputLoop의 pd:over 식
+        timer_interval, timer_unit (str): Timer 시작점의 TimeInterval / FrequencyIndex 값 (XML 그대로)
+        children (List[str]): 그룹에 직접 들어 있는 노드 이름
+    """
+
+    def __init__(self, name: str, node_type: str, kind: str, parent: Optional[str]):
+        self.name = name
+        self.type = node_type
+        self.kind = kind
+        self.parent = parent
+        self.jdbc = None
+        self.max_rows = ''
+        self.timeout = ''
+        self.commit = ''
+        self.for_each = False
+        self.sleep = None
+        self.group_type = ''
+        self.over = ''
+        self.timer_interval = ''
+        self.timer_unit = ''
+        self.children = []
+
+    @property
+    def is_loop(self) -> bool:
+        return self.kind == 'group' and self.type.endswith('LoopGroup')
+
+
+class BWProcessGraph:
+    """
+    BW 프로세스 하나의 노드/전이 그래프
+
+    Attributes:
+        path (str): 파일 경로
+        start_name (str): pd:startName
+        nodes (Dict[str, BWNode]): {이름: 노드}, 시작점 포함
+        transitions (Dict[Optional[str], List[tuple]]): {그룹 이름(최상위 None): [(from, to, conditionType)]}
+    """
+
+    def __init__(self, path: str = ''):
+        self.path = path
+        self.start_name = ''
+        self.nodes = {}
+        self.transitions = {}
+
+    @classmethod
+    def from_file(cls, path: str) -> 'BWProcessGraph':
+        """
+        BW 프로세스 XML을 한 번 파싱하여 그래프를 만듭니다.
+
+        Raises:
+            ET.ParseError: XML 형식 오류
+        """
+        graph = cls(path)
+        graph._load(ET.parse(path).getroot())
+        return graph
+
+    @classmethod
+    def from_string(cls, xml_text: str) -> 'BWProcessGraph':
+        graph = cls()
+        graph._load(ET.fromstring(xml_text))
+        return graph
+
+    def _load(self, root):
+        self.start_name = root.findtext('pd:startName', '', NS)
+        starter = root.find('pd:starter', NS)
+        if starter is not None:
+            node = BWNode(starter.get('name', self.start_name), starter.findtext('pd:type', '', NS), 'starter', None)
+            config = starter.find('config')
+            if config is not None:
+                node.timer_interval = (config.findtext('TimeInterval') or '').strip()
+                node.timer_unit = (config.findtext('FrequencyIndex') or '').strip()
+            self.nodes[node.name] = node
+        self._load_scope(root, None)
+
+    def _load_scope(self, element, parent: Optional[str]):
+        """element 바로 아래의 액티비티/그룹/전이를 읽습니다. 그룹은 재귀로 읽습니다."""
+        for child in element:
+            if child.tag == f'{{{PD_NS}}}activity':
+                self._add_activity(child, parent)
+            elif child.tag == f'{{{PD_NS}}}group':
+                name = child.get('name', '')
+                node = BWNode(name, child.findtext('pd:type', '', NS), 'group', parent)
+                config = child.find('config')
+                node.group_type = (config.findtext('pd:groupType', '', NS) if config is not None else '').strip()
+                node.over = (config.findtext('pd:over', '', NS) if config is not None else '').strip()
+                if node.is_loop and not node.group_type:
+                    node.group_type = 'repeat'
+                self._register(node)
+                self._load_scope(child, name)
+            elif child.tag == f'{{{PD_NS}}}transition':
+                self.transitions.setdefault(parent, []).append((
+                    child.findtext('pd:from', '', NS),
+                    child.findtext('pd:to', '', NS),
+                    child.findtext('pd:conditionType', '', NS)
+                ))
+
+    def _register(self, node: BWNode):
+        self.nodes[node.name] = node
+        if node.parent is not None:
+            self.nodes[node.parent].children.append(node.name)
+
+    def _add_activity(self, element, parent: Optional[str]):
+        node = BWNode(element.get('name', ''), element.findtext('pd:type', '', NS), 'activity', parent)
+        config = element.find('config')
+        if node.type.endswith('SleepActivity'):
+            interval = element.find('.//IntervalInMillisec')
+            node.sleep = ''
+            if interval is not None:
+                value_of = interval.find('xsl:value-of', NS)
+                node.sleep = value_of.get('select', '') if value_of is not None else (interval.text or '').strip()
+        elif 'jdbc' in node.type.lower() and config is not None and config.find('statement') is not None:
+            node.jdbc = 'query' if node.type.endswith('JDBCQueryActivity') else 'update'
+            node.max_rows = (config.findtext('maxRows') or '').strip()
+            node.timeout = (config.findtext('timeout') or '').strip()
+            node.commit = (config.findtext('commit') or '').strip()
+            node.for_each = element.find('.//xsl:for-each', NS) is not None
+        self._register(node)
+
+    # ----------------------------------------------------------------- 그래프 조회
+
+    def successors(self, name: str, scope: Optional[str] = None) -> List[str]:
+        """scope(그룹 이름, 최상위 None) 안에서 name 다음에 실행되는 노드"""
+        return [to for frm, to, _ in self.transitions.get(scope, []) if frm == name]
+
+    def reachable(self) -> List[str]:
+        """
+        시작점에서 전이를 따라 실행될 수 있는 노드 이름 (그룹 안 노드 포함)
+        전이가 없는 범위(그룹)는 모든 노드를 실행되는 것으로 봅니다.
+        """
+        result = []
+
+        def visit_scope(scope: Optional[str], start: str, members: List[str]):
+            if not self.transitions.get(scope):
+                names = members
+            else:
+                names, stack, seen = [], [start], {start}
+                while stack:
+                    for nxt in self.successors(stack.pop(), scope):
+                        if nxt not in seen:
+                            seen.add(nxt)
+                            stack.append(nxt)
+                            if nxt in self.nodes and nxt in members:
+                                names.append(nxt)
+            for name in names:
+                result.append(name)
+                node = self.nodes[name]
+                if node.kind == 'group':
+                    visit_scope(name, 'start', node.children)
+
+        top_members = [name for name, node in self.nodes.items() if node.parent is None and node.kind != 'starter']
+        visit_scope(None, self.start_name, top_members)
+        return result
+
+    def enclosing_groups(self, name: str) -> List[BWNode]:
+        """노드를 감싸는 그룹 (안쪽부터)"""
+        groups = []
+        parent = self.nodes[name].parent
+        while parent is not None:
+            groups.append(self.nodes[parent])
+            parent = self.nodes[parent].parent
+        return groups
+
+    def loop_source(self, group: BWNode) -> Optional[BWNode]:
+        """inputLoop가 도는 조회 결과의 JDBC 조회 액티비티 ($SelectP/resultSet/Record -> SelectP)"""
+        if group.group_type != INPUT_LOOP:
+            return None
+        match = _OVER_SOURCE_PATTERN.search(group.over)
+        if not match:
+            return None
+        for node in self.nodes.values():
+            if node.jdbc == 'query' and _xpath_name(node.name) == match.group(1):
+                return node
+        return None
+
+    def timer_seconds(self) -> Optional[float]:
+        """TimerEventSource 시작점의 주기(초), 타이머가 아니거나 해석할 수 없으면 None"""
+        starter = self.nodes.get(self.start_name)
+        if starter is None or not starter.type.endswith('TimerEventSource'):
+            return None
+        interval = int_value(starter.timer_interval)
+        unit = TIMER_UNITS.get(starter.timer_unit)
+        if interval is None or unit is None:
+            return None
+        return interval * unit
+
+    # ----------------------------------------------------------------- 비용 계산
+
+    def per_row_jdbc(self) -> List[str]:
+        """조회 결과를 한 행씩 도는 루프 안에서 실행되는 JDBC 액티비티 이름"""
+        return [
+            name for name in self.reachable()
+            if self.nodes[name].jdbc and any(self.loop_source(group) for group in self.enclosing_groups(name))
+        ]
+
+    def cycle_cost(self, call_seconds: float = JDBC_CALL_SECONDS) -> Dict:
+        """
+        한 주기의 비용과 예상 최대 처리량을 계산합니다.
+        조회 결과를 다시 읽는 반복 루프(repeat/while) 안에 조회가 있으면 그 루프 1회를 한 주기로,
+        아니면 프로세스 실행 1회(타이머 1회)를 한 주기로 봅니다.
+
+        Args:
+            call_seconds (float): 가정한 JDBC 호출 1회 시간(초)
+
+        Returns:
+            Dict: {
+                'timer_seconds', 'rows_source', 'rows_per_cycle', 'draining_loop',
+                'jdbc_calls_per_cycle', 'jdbc_calls_per_row', 'sleep_seconds_per_cycle',
+                'per_row_jdbc', 'max_rows_per_sec', 'unresolved'
+            }
+        """
+        reachable = self.reachable()
+        unresolved = []
+        jdbc_nodes = [self.nodes[name] for name in reachable if self.nodes[name].jdbc]
+
+        # 행을 공급하는 조회: inputLoop가 도는 조회, 없으면 maxRows가 가장 큰 조회
+        rows_source = None
+        for name in reachable:
+            node = self.nodes[name]
+            source = self.loop_source(node) if node.kind == 'group' else None
+            if source is not None and source.name in reachable:
+                rows_source = source
+                break
+        if rows_source is None:
+            queries = [node for node in jdbc_nodes if node.jdbc == 'query' and int_value(node.max_rows)]
+            rows_source = max(queries, key=lambda node: int_value(node.max_rows), default=None)
+        rows_per_cycle = int_value(rows_source.max_rows) if rows_source else None
+        for node in jdbc_nodes:
+            if node.jdbc == 'query' and node.max_rows and int_value(node.max_rows) is None:
+                unresolved.append(f"{node.name}.maxRows={node.max_rows}")
+
+        draining_loop = None
+        if rows_source is not None:
+            for group in self.enclosing_groups(rows_source.name):
+                if group.is_loop and group.group_type != INPUT_LOOP:
+                    draining_loop = group.name
+                    break
+
+        def multiplier(name: str) -> Optional[float]:
+            """주기 1회당 실행 횟수 (행 단위 루프는 행 수, 그 밖의 루프는 1회로 계산)"""
+            count = 1.0
+            for group in self.enclosing_groups(name):
+                if group.name == draining_loop:
+                    break
+                source = self.loop_source(group)
+                if source is not None:
+                    rows = int_value(source.max_rows)
+                    if rows is None:
+                        return None
+                    count *= rows
+            return count
+
+        calls = 0.0
+        calls_known = True
+        for node in jdbc_nodes:
+            count = multiplier(node.name)
+            if count is None:
+                calls_known = False
+                continue
+            calls += count
+
+        sleep_seconds = 0.0
+        for name in reachable:
+            node = self.nodes[name]
+            if node.sleep is None:
+                continue
+            interval = int_value(node.sleep)
+            count = multiplier(name)
+            if interval is None or count is None:
+                unresolved.append(f"{name}.IntervalInMillisec={node.sleep}")
+                continue
+            sleep_seconds += interval / 1000.0 * count
+
+        timer = self.timer_seconds()
+        cycle_seconds = sleep_seconds + calls * call_seconds
+        max_rows_per_sec = None
+        if rows_per_cycle and calls_known:
+            period = cycle_seconds if draining_loop else max(timer or 0.0, cycle_seconds)
+            if period > 0:
+                max_rows_per_sec = round(rows_per_cycle / period, 1)
+
+        return {
+            'timer_seconds': timer,
+            'rows_source': rows_source.name if rows_source else None,
+            'rows_per_cycle': rows_per_cycle,
+            'draining_loop': draining_loop,
+            'jdbc_calls_per_cycle': calls if calls_known else None,
+            'jdbc_calls_per_row': round(calls / rows_per_cycle, 3) if calls_known and rows_per_cycle else None,
+            'sleep_seconds_per_cycle': round(sleep_seconds, 3),
+            'per_row_jdbc': self.per_row_jdbc(),
+            'max_rows_per_sec': max_rows_per_sec,
+            'unresolved': unresolved
+        }
+
+    def throughput_settings(self) -> Dict[str, List[Dict]]:
+        """
+        BWQueryExtractor.extract_throughput_settings() 형식의 처리량 설정
+
+        Returns:
+            Dict[str, List[Dict]]: {'jdbc': [...], 'sleeps': [...]}
+        """
+        per_row = set(self.per_row_jdbc())
+        settings = {'jdbc': [], 'sleeps': []}
+        for name, node in self.nodes.items():
+            if node.jdbc is None and node.sleep is None:
+                continue
+            groups = self.enclosing_groups(name)
+            group_name = groups[0].name if groups else ''
+            in_loop = any(group.is_loop for group in groups)
+            if node.sleep is not None:
+                settings['sleeps'].append({'name': name, 'group': group_name, 'in_loop': in_loop,
+                                           'interval': node.sleep})
+            else:
+                settings['jdbc'].append({
+                    'name': name, 'kind': node.jdbc, 'group': group_name, 'in_loop': in_loop,
+                    'maxRows': node.max_rows, 'timeout': node.timeout, 'commit': node.commit,
+                    'for_each': node.for_each, 'per_row': name in per_row
+                })
+        return settings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BW 프로세스 주기 비용/예상 처리량 분석")
+    parser.add_argument("path", help="BW 프로세스 XML 파일 또는 디렉토리")
+    parser.add_argument("--call-ms", type=float, default=JDBC_CALL_SECONDS * 1000, help="가정한 JDBC 호출 1회 시간(ms)")
+    args = parser.parse_args()
+
+    paths = [args.path]
+    if os.path.isdir(args.path):
+        paths = [os.path.join(dir_path, file_name)
+                 for dir_path, _, file_names in sorted(os.walk(args.path))
+                 for file_name in sorted(file_names) if file_name.lower().endswith(('.xml', '.process'))]
+
+    for path in paths:
+        try:
+            cost = BWProcessGraph.from_file(path).cycle_cost(args.call_ms / 1000.0)
+        except ET.ParseError as e:
+            print(f"{path}: XML 파싱 오류 {e}")
+            continue
+        per_row = f", 행 단위 JDBC: {', '.join(cost['per_row_jdbc'])}" if cost['per_row_jdbc'] else ""
+        print(f"{path}: 최대 {cost['max_rows_per_sec']} rows/sec "
+              f"(주기당 {cost['rows_per_cycle']}행, JDBC {cost['jdbc_calls_per_cycle']}회, "
+              f"Sleep {cost['sleep_seconds_per_cycle']}초, 타이머 {cost['timer_seconds']}초{per_row})")
+
+
+if __name__ == "__main__":
+    main()
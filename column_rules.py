@@ -0,0 +1,224 @@
+"""
+컬럼 타입 호환성 규칙 모듈
+
+송신/수신 컬럼의 타입 호환 여부와 크기 비교 방법을 선언형 매트릭스(COMPATIBILITY_MATRIX)로 정의하고,
+처음 한 번 (송신 기본 타입, 수신 기본 타입) -> 규칙 조회 테이블로 컴파일합니다.
+컬럼마다의 평가는 타입 정규화(캐시)와 딕셔너리 조회 한 번으로 끝납니다.
+
+ColumnMapper.check_type_diff / check_size_diff / check_size_over_1024(maptest.py)와
+일괄 비교(comp_columns.py)가 같은 규칙 테이블(DEFAULT_RULES)을 사용합니다.
+"""
+import re
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+TEXT_TYPES = ('VARCHAR', 'VARCHAR2', 'CHAR')
+NCHAR_TYPES = ('NVARCHAR', 'NCHAR', 'NVARCHAR2')
+TIMESTAMP_TYPES = ('TIMESTAMP', 'TIMESTAMP WITH TIME ZONE', 'TIMESTAMP WITH LOCAL TIME ZONE')
+LOB_TYPES = ('CLOB', 'NCLOB')
+
+# 크기 비교 방법
+SIZE_NONE = 'none'            # 크기 비교 안 함
+SIZE_LENGTH = 'length'        # data_length (바이트/문자 길이)
+SIZE_NUMBER = 'number'        # NUMBER(precision, scale) 정수부 자릿수와 소수 자릿수
+SIZE_FRACTION = 'fraction'    # TIMESTAMP 소수 초 자릿수
+
+# 타입 판정
+OK = 'OK'
+NG = 'NG'
+
+TYPE_NG_MESSAGE = "칼럼 Type NG"
+SIZE_OVER_MESSAGE = "칼럼 Size > 1024"
+
+# 선언형 호환성 매트릭스: (송신 타입들, 수신 타입들, 타입 판정, 크기 비교 방법)
+# 매트릭스에 없는 조합은 같은 타입이면 OK/크기 비교 안 함, 다른 타입이면 NG
+COMPATIBILITY_MATRIX = [
+    (TEXT_TYPES, TEXT_TYPES, OK, SIZE_LENGTH),
+    (('DATE',), ('DATE',), OK, SIZE_NONE),
+    (('DATE',), TIMESTAMP_TYPES, OK, SIZE_NONE),        # DATE -> TIMESTAMP는 손실 없음
+    (('NUMBER',), ('NUMBER',), OK, SIZE_NUMBER),
+    (('TIMESTAMP',), ('TIMESTAMP',), OK, SIZE_FRACTION),
+    (('TIMESTAMP WITH TIME ZONE',), ('TIMESTAMP WITH TIME ZONE',), OK, SIZE_FRACTION),
+    (('TIMESTAMP WITH LOCAL TIME ZONE',), ('TIMESTAMP WITH LOCAL TIME ZONE',), OK, SIZE_FRACTION),
+    (TEXT_TYPES, ('CLOB',), OK, SIZE_NONE),             # 문자 -> CLOB는 길이 제한 없음
+    (NCHAR_TYPES, ('NCLOB',), OK, SIZE_NONE),
+    (LOB_TYPES, LOB_TYPES, OK, SIZE_NONE),
+    (('RAW',), ('RAW',), OK, SIZE_LENGTH),
+    (('RAW',), ('BLOB',), OK, SIZE_NONE),
+    (('BLOB',), ('BLOB',), OK, SIZE_NONE),
+]
+
+# 송신 컬럼 크기 한도 (check_size_over_1024), 없는 타입은 DEFAULT_SIZE_LIMIT
+DEFAULT_SIZE_LIMIT = 1024
+SIZE_LIMITS = {data_type: 1024 / 3 for data_type in NCHAR_TYPES}
+
+_PAREN_PATTERN = re.compile(r'\((\d+)\)')
+
+
+@lru_cache(maxsize=None)
+def normalize_type(data_type: str) -> Tuple[str, Optional[int]]:
+    """
+    all_tab_columns의 data_type을 (기본 타입, 괄호 안 자릿수)로 나눕니다.
+    예: 'TIMESTAMP(6) WITH TIME ZONE' -> ('TIMESTAMP WITH TIME ZONE', 6)
+
+    Args:
+        data_type (str): 데이터 타입
+
+    Returns:
+        Tuple[str, Optional[int]]: (기본 타입, 자릿수 또는 None)
+    """
+    match = _PAREN_PATTERN.search(data_type)
+    digits = int(match.group(1)) if match else None
+    base = ' '.join(_PAREN_PATTERN.sub('', data_type).upper().split())
+    return base, digits
+
+
+def _optional_int(value) -> Optional[int]:
+    """정수 또는 None (빈 문자열/None은 None)"""
+    if value is None or value == '':
+        return None
+    return int(value)
+
+
+def _compare_length(send: Dict, recv: Dict) -> str:
+    """data_length 비교 (기존 VARCHAR 계열 규칙)"""
+    try:
+        send_size = int(send['size'])
+        recv_size = int(recv['size'])
+    except ValueError:
+        return "크기 변환 오류"
+    if send_size > recv_size:
+        return f"송신({send_size}) > 수신({recv_size})"
+    return ""
+
+
+def _number_digits(info: Dict) -> Tuple[Optional[int], Optional[int]]:
+    """
+    NUMBER의 (정수부 자릿수, 소수 자릿수)
+    정밀도가 없으면 정수부 자릿수는 None(제한 없음), 정밀도와 소수 자릿수가 모두 없으면 소수 자릿수도 None(제한 없음)
+    NUMBER(*,0)처럼 소수 자릿수만 있으면 정수부만 제한이 없습니다.
+    """
+    precision = _optional_int(info.get('precision'))
+    scale = _optional_int(info.get('scale'))
+    if precision is None:
+        return None, scale
+    scale = scale or 0
+    return precision - scale, scale
+
+
+def _describe_number(info: Dict) -> str:
+    precision = _optional_int(info.get('precision'))
+    scale = _optional_int(info.get('scale'))
+    if precision is None:
+        return "NUMBER" if scale is None else f"*,{scale}"
+    return f"{precision},{scale or 0}"
+
+
+def _compare_number(send: Dict, recv: Dict) -> str:
+    """NUMBER(p,s) 비교: 수신의 정수부 자릿수나 소수 자릿수가 더 작으면 잘림/오류 가능"""
+    try:
+        send_int, send_scale = _number_digits(send)
+        recv_int, recv_scale = _number_digits(recv)
+    except ValueError:
+        return "크기 변환 오류"
+    if recv_int is None and recv_scale is None:
+        return ""
+    int_over = recv_int is not None and (send_int is None or send_int > recv_int)
+    scale_over = recv_scale is not None and (send_scale is None or send_scale > recv_scale)
+    if int_over or scale_over:
+        return f"송신({_describe_number(send)}) > 수신({_describe_number(recv)})"
+    return ""
+
+
+def _fraction_digits(info: Dict) -> int:
+    """TIMESTAMP 소수 초 자릿수 (타입 문자열의 괄호 값, 없으면 scale, 기본 6)"""
+    digits = normalize_type(info['type'])[1]
+    if digits is None:
+        digits = _optional_int(info.get('scale'))
+    return 6 if digits is None else digits
+
+
+def _compare_fraction(send: Dict, recv: Dict) -> str:
+    """TIMESTAMP 소수 초 자릿수 비교"""
+    try:
+        send_digits = _fraction_digits(send)
+        recv_digits = _fraction_digits(recv)
+    except ValueError:
+        return "크기 변환 오류"
+    if send_digits > recv_digits:
+        return f"송신({send_digits}) > 수신({recv_digits})"
+    return ""
+
+
+_SIZE_COMPARATORS = {
+    SIZE_NONE: None,
+    SIZE_LENGTH: _compare_length,
+    SIZE_NUMBER: _compare_number,
+    SIZE_FRACTION: _compare_fraction,
+}
+
+
+class CompiledRules:
+    """
+    호환성 매트릭스를 (송신 기본 타입, 수신 기본 타입) -> (타입 판정, 크기 비교 함수) 조회 테이블로 컴파일한 규칙
+    """
+
+    def __init__(self, matrix=None, size_limits: Dict = None, default_size_limit: float = DEFAULT_SIZE_LIMIT):
+        """
+        Args:
+            matrix (list, optional): 호환성 매트릭스, 없으면 COMPATIBILITY_MATRIX
+            size_limits (Dict, optional): 송신 타입별 크기 한도, 없으면 SIZE_LIMITS
+            default_size_limit (float): 한도가 정의되지 않은 타입의 크기 한도
+        """
+        self.table = {}
+        for send_types, recv_types, verdict, size_rule in (matrix or COMPATIBILITY_MATRIX):
+            if size_rule not in _SIZE_COMPARATORS:
+                raise ValueError(f"알 수 없는 크기 비교 방법: {size_rule}")
+            for send_type in send_types:
+                for recv_type in recv_types:
+                    self.table[(send_type, recv_type)] = (verdict, _SIZE_COMPARATORS[size_rule])
+        self.size_limits = dict(SIZE_LIMITS if size_limits is None else size_limits)
+        self.default_size_limit = default_size_limit
+
+    def lookup(self, send_type: str, recv_type: str) -> Tuple[str, Optional[callable]]:
+        """
+        타입 조합의 (타입 판정, 크기 비교 함수)를 반환합니다.
+
+        Args:
+            send_type (str): 송신 data_type
+            recv_type (str): 수신 data_type
+
+        Returns:
+            Tuple[str, Optional[callable]]: (OK/NG, 크기 비교 함수 또는 None)
+        """
+        send_base = normalize_type(send_type)[0]
+        recv_base = normalize_type(recv_type)[0]
+        rule = self.table.get((send_base, recv_base))
+        if rule is not None:
+            return rule
+        return (OK, None) if send_base == recv_base else (NG, None)
+
+    def type_diff(self, send: Dict, recv: Dict) -> str:
+        """타입 호환 여부, 호환되면 빈 문자열"""
+        return TYPE_NG_MESSAGE if self.lookup(send['type'], recv['type'])[0] == NG else ""
+
+    def size_diff(self, send: Dict, recv: Dict) -> str:
+        """타입 조합의 크기 비교 결과, 문제가 없거나 비교하지 않는 조합이면 빈 문자열"""
+        verdict, comparator = self.lookup(send['type'], recv['type'])
+        if verdict == NG or comparator is None:
+            return ""
+        return comparator(send, recv)
+
+    def size_over(self, col_info: Dict) -> str:
+        """
+        송신 컬럼 크기가 타입별 한도를 넘는지 확인합니다.
+        float() 변환 실패는 기존과 같이 ValueError로 전달합니다.
+        """
+        limit = self.size_limits.get(normalize_type(col_info['type'])[0], self.default_size_limit)
+        size = float(col_info['size'])
+        if size > limit or size > self.default_size_limit:
+            return SIZE_OVER_MESSAGE
+        return ""
+
+
+DEFAULT_RULES = CompiledRules()
@@ -0,0 +1,254 @@
+"""
+MQ 어댑터 / BW 프로세스 처리량 설정 점검 모듈
+
+MQ 어댑터 XML(AdapterFile)의 poll_time, buffer_size, mode, commit_count, autocommit,
+use_cursor, cursor_expiry와 BW 프로세스(BWQueryExtractor.extract_throughput_settings)의
+maxRows, timeout, commit, LoopGroup 안의 SleepActivity를 인터페이스별로 모아
+MQ와 BW 설정을 비교하고 처리량을 떨어뜨리는 구성을 찾습니다.
+BW 파일에 주기 비용(bw_graph.BWProcessGraph.cycle_cost)이 있으면 예상 최대 처리량도 기록합니다.
+
+XMLComparator.process_all_interfaces_with_bw(audit=True)가 결과를 '처리량 설정' 시트로 기록합니다.
+estimate_throughput()은 송신 매핑 컬럼의 메시지 크기(comp_payload)로 행 크기, 폴링당 행 수, MB/s를 추정하여
+'요약' 시트의 예상 처리량 열(ESTIMATE_HEADERS)로 기록됩니다.
+"""
+from typing import Dict, List, Optional, Tuple
+
+from adapter_model import int_value
+from comp_payload import message_capacity, payload_size
+from sql_templates import MappingPlan
+
+# (태그, 속성) - AdapterFile의 adapter_attrs / database_attrs / dbnode_attrs
+MQ_SETTING_KEYS = [
+    ('adapter', 'poll_time'),
+    ('adapter', 'buffer_size'),
+    ('adapter', 'mode'),
+    ('database', 'commit_count'),
+    ('database', 'autocommit'),
+    ('dbnode', 'use_cursor'),
+    ('database', 'cursor_expiry'),
+    ('database', 'format'),
+    ('database', 'data_name'),
+]
+
+# Sleep 폴링 루프에서 한 번에 읽는 행 수가 이보다 작으면 점검 대상
+SMALL_MAX_ROWS = 1000
+
+THROUGHPUT_HEADERS = [
+    "번호", "인터페이스 ID", "인터페이스 명",
+    "MQ 송신 poll_time", "MQ 송신 buffer_size", "MQ 송신 mode", "MQ 송신 commit_count",
+    "MQ 송신 autocommit", "MQ 송신 use_cursor", "MQ 송신 cursor_expiry",
+    "MQ 수신 mode", "MQ 수신 commit_count", "MQ 수신 autocommit",
+    "BW maxRows", "BW timeout", "BW commit", "BW Sleep 루프", "BW 예상 최대 rows/sec", "판정", "점검 내용"
+]
+
+# '요약' 시트 11번째 열부터 붙는 예상 처리량 열
+ESTIMATE_HEADERS = ["행 크기(B)", "폴링당 행 수", "MQ 예상 MB/s", "BW 예상 MB/s", "크기 점검"]
+
+MB = 1024 ** 2
+
+
+def mq_throughput_settings(adapter) -> Dict[str, str]:
+    """
+    MQ 어댑터 파일의 처리량 관련 속성을 추출합니다.
+
+    Args:
+        adapter (AdapterFile): 어댑터 파일 파싱 결과, None이면 빈 딕셔너리
+
+    Returns:
+        Dict[str, str]: {속성명: 값}, 없는 속성은 빠짐
+    """
+    if adapter is None:
+        return {}
+    sources = {'adapter': adapter.adapter_attrs, 'database': adapter.database_attrs, 'dbnode': adapter.dbnode_attrs}
+    return {name: sources[tag][name] for tag, name in MQ_SETTING_KEYS if name in sources[tag]}
+
+
+def check_throughput(mq: Dict[str, Dict[str, str]], bw: Dict[str, List[Dict]]) -> List[str]:
+    """
+    MQ와 BW 설정을 비교하여 처리량을 떨어뜨리는 구성을 찾습니다.
+
+    Args:
+        mq (Dict): {'send': mq_throughput_settings(), 'recv': mq_throughput_settings()}
+        bw (Dict): BW 파일 전체의 {'jdbc': [...], 'sleeps': [...], 'cycles': [cycle_cost(), ...]}
+
+    Returns:
+        List[str]: 점검 내용 목록, 문제가 없으면 빈 목록
+    """
+    findings = []
+    for direction, label in (('send', '송신'), ('recv', '수신')):
+        settings = mq.get(direction) or {}
+        if settings.get('autocommit') == '1':
+            findings.append(f"MQ {label} autocommit=1 (행 단위 커밋)")
+        commit_count = int_value(settings.get('commit_count'))
+        if commit_count is not None and commit_count <= 1:
+            findings.append(f"MQ {label} commit_count={commit_count}")
+        if settings.get('mode') and settings['mode'] != 'batch':
+            findings.append(f"MQ {label} mode={settings['mode']} (batch 아님)")
+
+    recv_commit = int_value((mq.get('recv') or {}).get('commit_count'))
+    sleep_groups = {sleep['group'] for sleep in bw.get('sleeps', []) if sleep['in_loop']}
+
+    for activity in bw.get('jdbc', []):
+        name = activity['name']
+        if activity.get('per_row'):
+            findings.append(f"BW 행 단위 JDBC 호출({name}, {activity['group']} 루프의 행마다 실행)")
+        if activity['kind'] == 'update' and activity['in_loop']:
+            if activity['commit'].lower() == 'true':
+                against = f" vs MQ 수신 commit_count={recv_commit}" if recv_commit and recv_commit > 1 else ""
+                findings.append(f"BW 루프 내 행 단위 커밋({name}){against}")
+            elif not activity['for_each'] and not activity.get('per_row'):
+                findings.append(f"BW 루프 내 단건 실행({name}, Record for-each 없음)")
+
+        max_rows = int_value(activity['maxRows'])
+        if activity['kind'] != 'query' or max_rows is None:
+            continue
+        if activity['group'] in sleep_groups and max_rows < SMALL_MAX_ROWS:
+            findings.append(f"Sleep 폴링 루프({activity['group']})의 작은 maxRows={max_rows} ({name})")
+        elif max_rows <= 1:
+            findings.append(f"BW 단건 조회 maxRows={max_rows} ({name})")
+    return findings
+
+
+def audit_interface(adapter_files: Dict, bw_settings: List[Dict[str, List[Dict]]]) -> Dict:
+    """
+    인터페이스 하나의 처리량 설정을 모으고 점검합니다.
+
+    Args:
+        adapter_files (Dict): {'send': AdapterFile 또는 None, 'recv': AdapterFile 또는 None}
+        bw_settings (List[Dict]): BW 파일별 extract_throughput_settings() 결과
+
+    Returns:
+        Dict: {'mq': {'send', 'recv'}, 'bw': {'jdbc', 'sleeps', 'cycles'}, 'findings': [...]}
+            (증분 실행 매니페스트에 저장할 수 있는 JSON 형식)
+    """
+    mq = {direction: mq_throughput_settings(adapter_files.get(direction)) for direction in ('send', 'recv')}
+    bw = {'jdbc': [], 'sleeps': [], 'cycles': []}
+    for settings in bw_settings:
+        bw['jdbc'].extend(settings.get('jdbc', []))
+        bw['sleeps'].extend(settings.get('sleeps', []))
+        if settings.get('cycle'):
+            bw['cycles'].append(settings['cycle'])
+    return {'mq': mq, 'bw': bw, 'findings': check_throughput(mq, bw)}
+
+
+def _distinct(values) -> str:
+    """빈 값을 빼고 중복 없이 ', '로 연결"""
+    return ', '.join(dict.fromkeys(value for value in values if value))
+
+
+def _max_rows_per_sec(cycles: List[Dict]):
+    """BW 파일 중 가장 느린 파일의 예상 최대 rows/sec, 추정할 수 없으면 빈 값"""
+    estimates = [cycle['max_rows_per_sec'] for cycle in cycles if cycle.get('max_rows_per_sec') is not None]
+    return min(estimates) if estimates else ''
+
+
+def throughput_row(num: int, interface_info: Dict, audit: Dict) -> List:
+    """
+    '처리량 설정' 시트의 한 행 (THROUGHPUT_HEADERS 순서)
+
+    Args:
+        num (int): 번호
+        interface_info (Dict): 인터페이스 정보
+        audit (Dict): audit_interface() 결과
+
+    Returns:
+        List: 행 값 목록
+    """
+    send, recv = audit['mq'].get('send', {}), audit['mq'].get('recv', {})
+    jdbc = audit['bw']['jdbc']
+    sleeps = [f"{sleep['group']}/{sleep['name']}" for sleep in audit['bw']['sleeps'] if sleep['in_loop']]
+    return [
+        num, interface_info.get('interface_id', ''), interface_info.get('interface_name', ''),
+        send.get('poll_time', ''), send.get('buffer_size', ''), send.get('mode', ''), send.get('commit_count', ''),
+        send.get('autocommit', ''), send.get('use_cursor', ''), send.get('cursor_expiry', ''),
+        recv.get('mode', ''), recv.get('commit_count', ''), recv.get('autocommit', ''),
+        _distinct(activity['maxRows'] for activity in jdbc if activity['kind'] == 'query'),
+        _distinct(activity['timeout'] for activity in jdbc),
+        _distinct(activity['commit'] for activity in jdbc if activity['kind'] == 'update'),
+        ', '.join(sleeps),
+        _max_rows_per_sec(audit['bw'].get('cycles', [])),
+        'NG' if audit['findings'] else 'OK',
+        '\n'.join(audit['findings'])
+    ]
+
+
+def row_width(excel_results: Optional[Dict], data_name: str = 'data',
+              message_format: str = 'xml') -> Tuple[int, List[str]]:
+    """
+    송신 SELECT(MappingPlan.select_names) 순서의 한 행 메시지 크기(comp_payload.payload_size)와
+    1024 바이트 초과 컬럼을 구합니다. comp_payload.interface_payload()와 같이 EAI 자동 컬럼을 포함하며,
+    자동 컬럼 정보는 process_interface()가 남긴 'send_columns'를 사용합니다 (없는 이전 결과는 제외).
+
+    Args:
+        excel_results (Dict): xltest.process_interface() 결과 ('comparison', 'send_columns')
+        data_name (str): 어댑터 data_name
+        message_format (str): 어댑터 format
+
+    Returns:
+        Tuple[int, List[str]]: (행 크기 바이트, check_size_over_1024에 걸린 송신 컬럼 목록)
+    """
+    excel_results = excel_results or {}
+    columns = dict(excel_results.get('send_columns') or {})
+    mapping, oversized = [], []
+    for entry in excel_results.get('comparison') or []:
+        info = entry.get('send_info')
+        if not isinstance(info, dict):
+            continue
+        mapping.append(entry.get('send_column', ''))
+        columns.setdefault(mapping[-1], info)
+        if entry.get('size_over'):
+            oversized.append(mapping[-1])
+    if not mapping:
+        return 0, oversized
+    plan = MappingPlan(mapping, [], columns, {})
+    return payload_size(plan.select_names, plan.send_columns, data_name, message_format)['row_bytes'], oversized
+
+
+def estimate_throughput(excel_results: Optional[Dict], audit: Dict) -> Dict:
+    """
+    인터페이스의 행 크기와 MQ/BW 설정으로 처리량을 추정합니다.
+    MQ 송신 어댑터는 poll_time(ms)마다 commit_count 행까지 읽어 buffer_size 메시지에 담는다고 보고,
+    BW는 cycle_cost()의 예상 최대 rows/sec를 사용합니다.
+
+    Args:
+        excel_results (Dict): xltest.process_interface() 결과
+        audit (Dict): audit_interface() 결과
+
+    Returns:
+        Dict: {
+            'row_bytes', 'oversized', 'buffer_bytes', 'rows_per_message', 'rows_per_poll',
+            'mq_rows_per_sec', 'mq_mb_per_sec', 'bw_rows_per_sec', 'bw_mb_per_sec', 'findings'
+        }
+    """
+    send = audit.get('mq', {}).get('send', {})
+    row_bytes, oversized = row_width(excel_results, send.get('data_name') or 'data', send.get('format') or 'xml')
+    capacity = message_capacity(row_bytes, send.get('buffer_size'), send.get('commit_count'))
+    commit_count = capacity['commit_count']
+    poll_ms = int_value(send.get('poll_time'))
+
+    estimate = {
+        'row_bytes': row_bytes or None, 'oversized': oversized, 'buffer_bytes': capacity['buffer_bytes'],
+        'rows_per_message': capacity['rows_per_message'], 'rows_per_poll': None,
+        'mq_rows_per_sec': None, 'mq_mb_per_sec': None, 'bw_rows_per_sec': None, 'bw_mb_per_sec': None,
+        'findings': []
+    }
+    findings = estimate['findings']
+    if oversized:
+        findings.append(f"1024 바이트 초과 컬럼: {', '.join(oversized)}")
+    if not row_bytes:
+        return estimate
+
+    findings.extend(capacity['findings'])
+    rows_per_poll = commit_count
+    if estimate['rows_per_message'] is not None:
+        rows_per_poll = min(rows_per_poll, estimate['rows_per_message']) if rows_per_poll else estimate['rows_per_message']
+    estimate['rows_per_poll'] = rows_per_poll
+    if rows_per_poll is not None and poll_ms:
+        estimate['mq_rows_per_sec'] = round(rows_per_poll * 1000.0 / poll_ms, 1)
+        estimate['mq_mb_per_sec'] = round(estimate['mq_rows_per_sec'] * row_bytes / MB, 3)
+
+    bw_rows = _max_rows_per_sec(audit.get('bw', {}).get('cycles', []))
+    if bw_rows != '':
+        estimate['bw_rows_per_sec'] = bw_rows
+        estimate['bw_mb_per_sec'] = round(bw_rows * row_bytes / MB, 3)
+    return estimate
@@ -0,0 +1,503 @@
+"""
+컬럼 비교 일괄(벡터화) 처리 모듈
+
+ColumnMapper.compare_columns()는 인터페이스마다 매핑된 컬럼 쌍을 하나씩 돌며
+check_type_diff / check_size_diff / check_size_over_1024 / check_nullable_diff를 호출합니다.
+이 모듈은 워크북의 모든 인터페이스에 대해 송신/수신 메타데이터 프레임을 한 번 만들고
+같은 규칙을 pandas 컬럼 연산으로 한꺼번에 평가하여, compare_columns()와 같은 형식의
+행 단위 결과(xltest.write_interface_result_to_sheet 입력)를 만듭니다.
+
+pandas는 일괄 비교를 실행할 때만 import 합니다.
+
+    python comp_columns.py --input input.xlsx --output output.xlsx
+"""
+import argparse
+from typing import Dict, List, Optional, Tuple
+
+from column_rules import DEFAULT_RULES
+
+RECV_OPTIONAL_WARNING = "수신 매핑이 설정되지 않았습니다 (선택적 수신)"
+
+# 일괄 비교 결과 프레임의 컬럼
+RESULT_COLUMNS = [
+    'interface', 'seq', 'send_column', 'recv_column',
+    'send_type', 'send_size', 'send_nullable', 'recv_type', 'recv_size', 'recv_nullable',
+    'type_diff', 'size_diff', 'size_over', 'nullable_diff', 'errors', 'warnings', 'fatal'
+]
+
+
+def _load_pandas():
+    """pandas를 처음 사용할 때 import 합니다."""
+    try:
+        import pandas as pd
+    except ImportError:
+        raise ImportError("일괄 컬럼 비교에는 pandas 패키지가 필요합니다. (pip install pandas)")
+    return pd
+
+
+def _table_key(side: Dict) -> Tuple[str, str, str, str]:
+    """인터페이스 송신/수신 정보에서 메타데이터 테이블 키 (sid, username, owner, table_name)를 만듭니다."""
+    db_info = side.get('db_info') or {}
+    return (db_info.get('sid', ''), db_info.get('username', ''), side.get('owner', ''), side.get('table_name', ''))
+
+
+def prepare_interfaces(interfaces: List[Dict], mapper) -> List[Dict]:
+    """
+    인터페이스별 매핑과 테이블 메타데이터를 준비합니다.
+    같은 (DB, 테이블)은 스키마 카탈로그로 한 번만 조회합니다.
+
+    Args:
+        interfaces (List[Dict]): read_interface_block() 결과 목록
+        mapper (ColumnMapper): 컬럼 정보 조회에 사용할 매퍼
+
+    Returns:
+        List[Dict]: [{'info', 'send_mapping', 'recv_mapping', 'send_key', 'recv_key', 'errors'}]
+            errors가 있는 인터페이스는 비교하지 않습니다.
+    """
+    if mapper.schema_catalog is None:
+        mapper.schema_catalog = {}
+
+    entries = []
+    for interface_info in interfaces:
+        send, recv = interface_info['send'], interface_info['recv']
+        entry = {
+            'info': interface_info,
+            'send_mapping': [col.strip() for col in send['columns'] if col and col.strip()],
+            'recv_mapping': [col.strip() for col in recv['columns'] if col and col.strip()],
+            'send_key': _table_key(send),
+            'recv_key': _table_key(recv),
+            'errors': []
+        }
+        entries.append(entry)
+
+        # xltest.process_interface()와 같은 순서로 필수 정보 확인
+        if not send['db_info']:
+            entry['errors'].append("송신 DB 연결 정보가 없습니다.")
+            continue
+        if not recv['db_info']:
+            entry['errors'].append("수신 DB 연결 정보가 없습니다.")
+            continue
+        if not (send['owner'] and send['table_name']):
+            entry['errors'].append("송신 테이블 정보가 없습니다.")
+            continue
+        if not (recv['owner'] and recv['table_name']):
+            entry['errors'].append("수신 테이블 정보가 없습니다.")
+            continue
+
+        try:
+            mapper.connect_send_db(send['db_info']['sid'], send['db_info']['username'], send['db_info']['password'])
+            mapper.connect_recv_db(recv['db_info']['sid'], recv['db_info']['username'], recv['db_info']['password'])
+            mapper.lookup_columns('send', send['owner'], send['table_name'])
+            mapper.lookup_columns('recv', recv['owner'], recv['table_name'])
+        except Exception as e:
+            entry['errors'].append(str(e))
+
+    mapper.close_connections()
+    return entries
+
+
+def build_metadata_frame(catalog: Dict, table_ids: Dict):
+    """
+    스키마 카탈로그를 (테이블 번호, 컬럼명) 단위의 메타데이터 프레임으로 변환합니다.
+
+    Args:
+        catalog (Dict): {(sid, username, owner, table_name): {컬럼명: {'type', 'size', 'nullable'}}}
+        table_ids (Dict): {테이블 키: 테이블 번호}
+
+    Returns:
+        DataFrame: table_id, column, type, size, nullable, precision, scale
+    """
+    pd = _load_pandas()
+    table_id, names, infos = [], [], []
+    for key, columns in catalog.items():
+        table_id.extend([table_ids[key]] * len(columns))
+        names.extend(columns)
+        infos.extend(columns.values())
+
+    # None을 NaN으로 바꾸지 않도록 object 형식 유지
+    frame = pd.DataFrame({
+        'table_id': pd.Series(table_id, dtype=int),
+        'column': pd.Series(names, dtype=object)
+    })
+    for name in ('type', 'size', 'nullable', 'precision', 'scale'):
+        frame[name] = pd.Series([info.get(name) for info in infos], dtype=object)
+    return frame
+
+
+def build_pair_frame(entries: List[Dict], table_ids: Dict):
+    """
+    비교할 컬럼 쌍 프레임을 만듭니다. compare_columns()처럼 수신 매핑은 송신 길이에 맞춰 빈 값으로 채우고
+    송신보다 긴 수신 매핑은 무시합니다.
+
+    Args:
+        entries (List[Dict]): prepare_interfaces() 결과
+        table_ids (Dict): {테이블 키: 테이블 번호}, 카탈로그에 없는 테이블은 -1
+
+    Returns:
+        DataFrame: interface(entries 순번), seq, send_column, recv_column, send_table, recv_table
+    """
+    pd = _load_pandas()
+    data = {'interface': [], 'seq': [], 'send_column': [], 'recv_column': [], 'send_table': [], 'recv_table': []}
+    for index, entry in enumerate(entries):
+        if entry['errors'] or not entry['send_mapping']:
+            continue
+        count = len(entry['send_mapping'])
+        recv_mapping = (entry['recv_mapping'] + [""] * count)[:count]
+        data['interface'].extend([index] * count)
+        data['seq'].extend(range(count))
+        data['send_column'].extend(entry['send_mapping'])
+        data['recv_column'].extend(recv_mapping)
+        data['send_table'].extend([table_ids.get(entry['send_key'], -1)] * count)
+        data['recv_table'].extend([table_ids.get(entry['recv_key'], -1)] * count)
+    return pd.DataFrame({name: pd.Series(values, dtype=object if name.endswith('column') else int)
+                         for name, values in data.items()})
+
+
+def _info(key: Tuple) -> Dict:
+    """(type, size, precision, scale) 키를 컬럼 정보 딕셔너리로 되돌립니다. None 항목은 없는 것으로 봅니다."""
+    return {name: value for name, value in zip(('type', 'size', 'precision', 'scale'), key) if value is not None}
+
+
+def _check_pair(rules, send_key: Tuple, recv_key: Tuple) -> Tuple[str, str]:
+    """check_type_diff / check_size_diff와 같은 (타입 결과, 크기 결과)"""
+    send, recv = _info(send_key), _info(recv_key)
+    if 'type' not in send or 'type' not in recv:
+        return "컬럼 타입 정보 누락", "컬럼 크기 정보 누락"
+    if 'size' not in send or 'size' not in recv:
+        return rules.type_diff(send, recv), "컬럼 크기 정보 누락"
+    return rules.type_diff(send, recv), rules.size_diff(send, recv)
+
+
+def _check_size_over(rules, send_key: Tuple) -> Tuple[str, Optional[str]]:
+    """
+    check_size_over_1024와 같은 (결과, 인터페이스 오류)
+    float() 변환 실패는 compare_columns()에서 예외로 인터페이스 전체가 오류가 되므로 오류 메시지로 반환합니다.
+    """
+    send = _info(send_key)
+    if 'type' not in send or 'size' not in send:
+        return "컬럼 크기 정보 누락", None
+    try:
+        return rules.size_over(send), None
+    except ValueError as e:
+        return "", str(e)
+
+
+def _messages(mask, template, *columns):
+    """mask가 True인 행만 template 메시지를 만듭니다. (행 번호, 메시지) 목록"""
+    rows = mask.nonzero()[0]
+    return list(zip(rows, [template.format(*values) for values in zip(*(column[rows] for column in columns))]))
+
+
+def compare_frames(pairs, metadata, rules=None):
+    """
+    컬럼 쌍 프레임과 메타데이터 프레임으로 모든 비교 규칙을 한꺼번에 평가합니다.
+    규칙과 메시지는 ColumnMapper.check_* 메서드와 같습니다. 타입/크기 규칙은 컴파일된 규칙 테이블을
+    (타입, 크기, 정밀도, 스케일) 조합마다 한 번만 조회하고, 존재/Nullable 검사는 배열 연산으로 평가합니다.
+
+    Args:
+        pairs (DataFrame): build_pair_frame() 결과
+        metadata (DataFrame): build_metadata_frame() 결과
+        rules (CompiledRules, optional): 타입/크기 호환성 규칙, 없으면 column_rules.DEFAULT_RULES
+
+    Returns:
+        DataFrame: RESULT_COLUMNS, errors/warnings는 메시지 리스트,
+            fatal은 compare_columns()가 예외로 중단되는 행의 오류 메시지
+    """
+    pd = _load_pandas()
+    import numpy as np
+
+    rules = rules or DEFAULT_RULES
+    count = len(pairs)
+    meta_index = pd.MultiIndex.from_arrays([metadata['table_id'], metadata['column']])
+    send_row = meta_index.get_indexer(pd.MultiIndex.from_arrays([pairs['send_table'], pairs['send_column']]))
+    recv_row = meta_index.get_indexer(pd.MultiIndex.from_arrays([pairs['recv_table'], pairs['recv_column']]))
+    send_found, recv_found = send_row >= 0, recv_row >= 0
+
+    def gather(name, rows, found, fill=None):
+        values = metadata[name].to_numpy(dtype=object)
+        if len(values) == 0:
+            return np.full(count, fill, dtype=object)
+        picked = values[rows]
+        picked[~found] = fill
+        return picked
+
+    send_column = pairs['send_column'].to_numpy(dtype=object)
+    recv_column = pairs['recv_column'].to_numpy(dtype=object)
+    send_type, recv_type = gather('type', send_row, send_found), gather('type', recv_row, recv_found)
+    send_size, recv_size = gather('size', send_row, send_found), gather('size', recv_row, recv_found)
+    send_null = gather('nullable', send_row, send_found)
+    recv_null = gather('nullable', recv_row, recv_found)
+    send_precision = gather('precision', send_row, send_found)
+    recv_precision = gather('precision', recv_row, recv_found)
+    send_scale, recv_scale = gather('scale', send_row, send_found), gather('scale', recv_row, recv_found)
+
+    send_blank = send_column == ''
+    recv_blank = recv_column == ''
+    # 수신 테이블에 컬럼이 하나도 없으면 compare_columns()의 "수신 테이블 정보가 설정되지 않았습니다."
+    recv_has_columns = pairs['recv_table'].isin(metadata['table_id'].unique()).to_numpy()
+    checked = send_found & recv_found & ~recv_blank
+
+    errors = [[] for _ in range(count)]
+    warnings = [[] for _ in range(count)]
+
+    for row in send_blank.nonzero()[0]:
+        errors[row].append("송신 컬럼이 비어있습니다.")
+    for row, message in _messages(~send_blank & ~send_found, "송신 테이블에 {} 컬럼이 존재하지 않습니다.", send_column):
+        errors[row].append(message)
+    for row in (~recv_blank & ~recv_has_columns).nonzero()[0]:
+        errors[row].append("수신 테이블 정보가 설정되지 않았습니다.")
+    for row, message in _messages(~recv_blank & recv_has_columns & ~recv_found,
+                                  "수신 테이블에 {} 컬럼이 존재하지 않습니다.", recv_column):
+        errors[row].append(message)
+    for row in recv_blank.nonzero()[0]:
+        warnings[row].append(RECV_OPTIONAL_WARNING)
+
+    def is_none(values):
+        return np.equal(values, None)
+
+    def flag_column(flags):
+        column = np.full(count, None, dtype=object)
+        for mask, message in flags:
+            if isinstance(message, str):
+                column[mask & checked] = message
+            else:
+                for row, text in message:
+                    if checked[row]:
+                        column[row] = text
+        return column
+
+    # 타입/크기 비교 (check_type_diff, check_size_diff): 같은 메타데이터 조합은 규칙 테이블로 한 번만 평가
+    type_diff = np.full(count, None, dtype=object)
+    size_diff = np.full(count, None, dtype=object)
+    size_over = np.full(count, None, dtype=object)
+    fatal = np.full(count, None, dtype=object)
+    pair_cache, over_cache = {}, {}
+    checked_rows = checked.nonzero()[0]
+    send_keys = zip(send_type[checked_rows], send_size[checked_rows],
+                    send_precision[checked_rows], send_scale[checked_rows])
+    recv_keys = zip(recv_type[checked_rows], recv_size[checked_rows],
+                    recv_precision[checked_rows], recv_scale[checked_rows])
+    for row, send_key, recv_key in zip(checked_rows, send_keys, recv_keys):
+        pair = pair_cache.get((send_key, recv_key))
+        if pair is None:
+            pair = pair_cache[(send_key, recv_key)] = _check_pair(rules, send_key, recv_key)
+        type_diff[row], size_diff[row] = pair
+        over = over_cache.get(send_key)
+        if over is None:
+            over = over_cache[send_key] = _check_size_over(rules, send_key)
+        size_over[row], fatal[row] = over
+    type_diff[type_diff == ''] = None
+    size_diff[size_diff == ''] = None
+    size_over[size_over == ''] = None
+
+    # Nullable 비교 (check_nullable_diff)
+    null_missing = is_none(send_null) | is_none(recv_null)
+    send_null_bad = ~null_missing & ~np.isin(send_null, ['Y', 'N'])
+    recv_null_bad = ~null_missing & ~send_null_bad & ~np.isin(recv_null, ['Y', 'N'])
+    null_ng = ~null_missing & (recv_null == 'N') & (send_null == 'Y')
+    nullable_diff = flag_column([
+        (null_ng, "Nullable NG (수신 Not Null 제약 위반 가능성)"),
+        (recv_null_bad, _messages(recv_null_bad & checked, "수신 Nullable 값 오류: {}", recv_null)),
+        (send_null_bad, _messages(send_null_bad & checked, "송신 Nullable 값 오류: {}", send_null)),
+        (null_missing, "Nullable 정보 누락")
+    ])
+
+    # compare_columns()와 같은 순서로 경고 추가
+    has_type, has_size = ~is_none(type_diff), ~is_none(size_diff)
+    has_over, has_null = ~is_none(size_over), ~is_none(nullable_diff)
+    warn_type = dict(_messages(has_type, "타입이 다릅니다: 송신({}) vs 수신({})", send_type, recv_type))
+    warn_size = dict(_messages(has_size, "크기가 다릅니다: {}", size_diff))
+    warn_null = dict(_messages(has_null, "NULL 허용 여부가 다릅니다: 송신({}) vs 수신({})", send_null, recv_null))
+    for row in (has_type | has_size | has_over | has_null).nonzero()[0]:
+        if has_type[row]:
+            warnings[row].append(warn_type[row])
+        if has_size[row]:
+            warnings[row].append(warn_size[row])
+        if has_over[row]:
+            warnings[row].append("송신 컬럼 크기가 1024 바이트를 초과합니다.")
+        if has_null[row]:
+            warnings[row].append(warn_null[row])
+
+    columns = {
+        'send_column': send_column,
+        'recv_column': recv_column,
+        'send_type': send_type, 'send_size': send_size, 'send_nullable': send_null,
+        'recv_type': recv_type, 'recv_size': recv_size, 'recv_nullable': recv_null,
+        'type_diff': type_diff, 'size_diff': size_diff, 'size_over': size_over, 'nullable_diff': nullable_diff,
+        'errors': errors, 'warnings': warnings, 'fatal': fatal
+    }
+    # 비교하지 않은 항목의 None이 NaN으로 바뀌지 않도록 object 형식 유지
+    frame = pd.DataFrame({name: pd.Series(values, dtype=object) for name, values in columns.items()})
+    frame.insert(0, 'interface', pairs['interface'].to_numpy())
+    frame.insert(1, 'seq', pairs['seq'].to_numpy())
+    return frame[RESULT_COLUMNS]
+
+
+def compare_interfaces(entries: List[Dict], catalog: Dict, rules=None):
+    """
+    준비된 인터페이스 전체를 한 번에 비교합니다.
+
+    Args:
+        entries (List[Dict]): prepare_interfaces() 결과
+        catalog (Dict): 스키마 카탈로그
+        rules (CompiledRules, optional): 타입/크기 호환성 규칙
+
+    Returns:
+        DataFrame: compare_frames() 결과
+    """
+    table_ids = {key: index for index, key in enumerate(catalog)}
+    return compare_frames(build_pair_frame(entries, table_ids), build_metadata_frame(catalog, table_ids), rules)
+
+
+def frame_to_results(frame, entries: List[Dict], catalog: Dict) -> List[Optional[List[Dict]]]:
+    """
+    일괄 비교 결과 프레임을 인터페이스별 compare_columns() 결과 형식으로 변환합니다.
+
+    Returns:
+        List[Optional[List[Dict]]]: entries 순서의 비교 결과, 오류가 있는 인터페이스는 None
+            (비교 중 발생한 인터페이스 오류는 entries의 errors에 추가)
+    """
+    results = [None] * len(entries)
+    compared = set()
+    for index, entry in enumerate(entries):
+        if entry['errors']:
+            continue
+        if not entry['send_mapping']:
+            results[index] = [{"error": "송신 매핑 정보가 설정되지 않았습니다."}]
+        elif not catalog.get(entry['send_key']):
+            results[index] = [{"error": "송신 테이블 정보가 설정되지 않았습니다."}]
+        else:
+            results[index] = []
+            compared.add(index)
+
+    # 예외로 중단되는 행이 있는 인터페이스는 compare_columns()처럼 결과 없이 오류로 처리
+    for interface, message in zip(frame['interface'].tolist(), frame['fatal'].tolist()):
+        if message is not None and interface in compared:
+            entries[interface]['errors'].append(message)
+            results[interface] = None
+            compared.discard(interface)
+
+    columns = [frame[name].tolist() for name in ('interface', 'send_column', 'recv_column', 'type_diff',
+                                                  'size_diff', 'size_over', 'nullable_diff', 'errors', 'warnings')]
+    for interface, send_col, recv_col, type_diff, size_diff, size_over, nullable_diff, errors, warnings in zip(*columns):
+        if interface not in compared:
+            continue
+        entry = entries[interface]
+        send_columns = catalog.get(entry['send_key'], {})
+        recv_columns = catalog.get(entry['recv_key'], {})
+        results[interface].append({
+            'send_column': send_col,
+            'recv_column': recv_col,
+            'send_info': send_columns.get(send_col),
+            'recv_info': recv_columns.get(recv_col) if recv_col else None,
+            'type_diff': type_diff,
+            'size_diff': size_diff,
+            'size_over': size_over,
+            'nullable_diff': nullable_diff,
+            'errors': errors,
+            'warnings': warnings
+        })
+    return results
+
+
+def build_interface_results(entries: List[Dict], comparisons: List, catalog: Dict, mapper) -> List[Dict]:
+    """
+    일괄 비교 결과에 SQL/필드 XML을 붙여 xltest.process_interface()와 같은 결과 형식으로 만듭니다.
+    """
+    all_results = []
+    for entry, comparison in zip(entries, comparisons):
+        results = {'comparison': None, 'send_sql': None, 'recv_sql': None, 'field_xml': None,
+                   'errors': list(entry['errors'])}
+        if comparison is not None:
+            send, recv = entry['info']['send'], entry['info']['recv']
+            mapper.send_mapping = entry['send_mapping']
+            mapper.recv_mapping = entry['recv_mapping']
+            mapper.send_columns = catalog.get(entry['send_key'], {})
+            mapper.recv_columns = catalog.get(entry['recv_key'], {})
+            mapper.send_table_info = {'owner': send['owner'], 'table_name': send['table_name']}
+            mapper.recv_table_info = {'owner': recv['owner'], 'table_name': recv['table_name']}
+            results['comparison'] = comparison
+            results['send_sql'] = mapper.generate_send_sql_from_mapping()
+            results['recv_sql'] = mapper.generate_recv_sql()
+            results['field_xml'] = mapper.generate_field_xml_from_mapping()
+        all_results.append(results)
+    return all_results
+
+
+def load_interfaces(input_path: str) -> List[Dict]:
+    """
+    입력 워크북의 B열부터 3열 단위 인터페이스 블록을 모두 읽습니다.
+
+    Args:
+        input_path (str): 인터페이스 정보 엑셀 경로
+
+    Returns:
+        List[Dict]: read_interface_block() 결과 목록
+    """
+    import openpyxl
+    from xltest import read_interface_block
+
+    wb_input = openpyxl.load_workbook(input_path)
+    ws_input = wb_input.active
+    interfaces = []
+    current_col = 2  # B열부터 시작
+    while current_col <= ws_input.max_column:
+        interface_info = read_interface_block(ws_input, current_col)
+        if not interface_info:
+            break
+        interfaces.append(interface_info)
+        current_col += 3
+    wb_input.close()
+    return interfaces
+
+
+def compare_workbook(input_path: str, output_path: str, mapper=None) -> Dict:
+    """
+    입력 워크북의 모든 인터페이스를 일괄 비교하여 xltest와 같은 결과 엑셀을 작성합니다.
+
+    Args:
+        input_path (str): 인터페이스 정보 엑셀 경로
+        output_path (str): 결과 엑셀 경로
+        mapper (ColumnMapper, optional): 컬럼 정보 조회용 매퍼, 없으면 새로 생성
+
+    Returns:
+        Dict: {'interfaces': 인터페이스 수, 'columns': 비교한 컬럼 수, 'errors': 오류 인터페이스 수}
+    """
+    import openpyxl
+    from maptest import ColumnMapper
+    from xltest import write_interface_result_to_sheet
+
+    interfaces = load_interfaces(input_path)
+    mapper = mapper or ColumnMapper()
+    entries = prepare_interfaces(interfaces, mapper)
+    catalog = mapper.schema_catalog
+    frame = compare_interfaces(entries, catalog, mapper.rules)
+    comparisons = frame_to_results(frame, entries, catalog)
+    all_results = build_interface_results(entries, comparisons, catalog, mapper)
+
+    wb_output = openpyxl.Workbook()
+    wb_output.remove(wb_output.active)
+    for num, (entry, results) in enumerate(zip(entries, all_results), 1):
+        write_interface_result_to_sheet(wb_output, entry['info'], results, num)
+    wb_output.save(output_path)
+    wb_output.close()
+
+    return {
+        'interfaces': len(entries),
+        'columns': len(frame),
+        'errors': sum(1 for results in all_results if results['errors'])
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='워크북 전체 인터페이스 컬럼 일괄 비교')
+    parser.add_argument('--input', default='input.xlsx', help='인터페이스 정보 엑셀 파일')
+    parser.add_argument('--output', default='output.xlsx', help='결과 엑셀 파일')
+    args = parser.parse_args()
+
+    summary = compare_workbook(args.input, args.output)
+    print(f"총 인터페이스: {summary['interfaces']}, 비교 컬럼: {summary['columns']}, 오류 인터페이스: {summary['errors']}")
+
+
+if __name__ == "__main__":
+    main()
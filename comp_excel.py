@@ -5,6 +5,7 @@ import os
 from typing import Dict, List, Optional, Tuple
 import datetime
 import ast
+from comp_audit import ESTIMATE_HEADERS
 
 
 def read_interface_block(ws, start_col):
@@ -143,10 +144,13 @@ class ExcelManager:
         sheet.column_dimensions['H'].width = 25  # MQ 수신 파일
         sheet.column_dimensions['I'].width = 25  # BW 수신 파일
         sheet.column_dimensions['J'].width = 15  # 수신 비교 결과
+        for col in 'KLMN':
+            sheet.column_dimensions[col].width = 12  # 예상 처리량
+        sheet.column_dimensions['O'].width = 40  # 크기 점검
         
-        # 헤더 행 생성
+        # 헤더 행 생성 (K열부터 예상 처리량)
         headers = ["번호", "인터페이스 ID", "인터페이스 명", "송신 테이블", "MQ 송신 파일", "BW 송신 파일", "송신 비교 결과", 
-                  "MQ 수신 파일", "BW 수신 파일", "수신 비교 결과"]
+                  "MQ 수신 파일", "BW 수신 파일", "수신 비교 결과"] + ESTIMATE_HEADERS
         
         for col_idx, header in enumerate(headers, 1):
             cell = sheet.cell(row=1, column=col_idx, value=header)
@@ -338,6 +342,18 @@ class ExcelManager:
             cell = sheet.cell(row=row, column=10, value="비교불가")
             cell.fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")  # 노란색
         cell.font = font_normal
+        
+        # 예상 처리량 (comp_audit.estimate_throughput), 크기 점검 내용이 있으면 빨간색
+        estimate = data.get("estimate")
+        if estimate:
+            values = [estimate.get("row_bytes"), estimate.get("rows_per_poll"), estimate.get("mq_mb_per_sec"),
+                      estimate.get("bw_mb_per_sec"), "\n".join(estimate.get("findings", []))]
+            for col_idx, value in enumerate(values, 11):
+                cell = sheet.cell(row=row, column=col_idx, value=value if value is not None else "")
+                cell.font = font_normal
+            if estimate.get("findings"):
+                cell.fill = self.mismatch_fill
+                cell.alignment = Alignment(wrap_text=True, vertical='top')
 
     def save_excel_output(self, output_path):
         """
@@ -670,7 +686,144 @@ class ExcelManager:
                 cell.border = border
         
         return sheet
-    
+
+    def _write_table(self, sheet, start_row, title, headers, rows):
+        """
+        제목, 헤더, 데이터 행으로 이루어진 표를 시트에 기록합니다.
+
+        Returns:
+            int: 다음 표를 시작할 행 번호
+        """
+        header_fill = PatternFill(start_color="CCCCFF", end_color="CCCCFF", fill_type="solid")
+        border = Border(
+            left=Side(style='thin'),
+            right=Side(style='thin'),
+            top=Side(style='thin'),
+            bottom=Side(style='thin')
+        )
+        align_center = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+        sheet.cell(row=start_row, column=1, value=title).font = Font(bold=True, size=10)
+        for col_idx, header in enumerate(headers, 1):
+            cell = sheet.cell(row=start_row + 1, column=col_idx, value=header)
+            cell.font = Font(bold=True, size=9)
+            cell.fill = header_fill
+            cell.alignment = align_center
+            cell.border = border
+        for row_idx, values in enumerate(rows, start_row + 2):
+            for col_idx, value in enumerate(values, 1):
+                cell = sheet.cell(row=row_idx, column=col_idx, value=value)
+                cell.font = Font(size=9)
+                cell.border = border
+        return start_row + len(rows) + 3
+
+    def create_profile_sheet(self, summary, interfaces):
+        """
+        실행 프로파일(단계별 시간, 카운터, 캐시 적중률, 인터페이스별 시간)을 '프로파일' 시트에 기록합니다.
+
+        Args:
+            summary (dict): RunProfiler.summary()의 결과
+            interfaces (list): RunProfiler.interfaces (인터페이스별 기록)
+
+        Returns:
+            openpyxl.worksheet.worksheet.Worksheet: 생성된 시트 객체
+        """
+        if "프로파일" in self.workbook.sheetnames:
+            del self.workbook["프로파일"]
+        sheet = self.workbook.create_sheet("프로파일", 1)
+        sheet.column_dimensions['A'].width = 25
+        for col in range(2, 12):
+            sheet.column_dimensions[get_column_letter(col)].width = 14
+
+        sheet.cell(row=1, column=1, value="실행 시각").font = Font(bold=True, size=9)
+        sheet.cell(row=1, column=2, value=summary['started_at'])
+        sheet.cell(row=2, column=1, value="전체 시간(초)").font = Font(bold=True, size=9)
+        sheet.cell(row=2, column=2, value=summary['total_seconds'])
+        sheet.cell(row=3, column=1, value="인터페이스 수").font = Font(bold=True, size=9)
+        sheet.cell(row=3, column=2, value=summary['interface_count'])
+
+        # 단계별 분포 (인터페이스 단위)
+        stage_rows = [
+            [name, stat['count'], stat['total'], stat['p50'], stat['p95'], stat['max']]
+            for name, stat in sorted(summary['stages'].items(), key=lambda item: -item[1]['total'])
+        ]
+        stage_rows += [[name, 1, seconds, '', '', ''] for name, seconds in summary['run_stages'].items()]
+        row = self._write_table(sheet, 5, "단계별 시간(초) - 하위 단계 시간은 상위 단계에도 포함됨",
+                                ["단계", "건수", "합계", "p50", "p95", "max"], stage_rows)
+
+        row = self._write_table(sheet, row, "카운터", ["항목", "값"],
+                                [[name, value] for name, value in sorted(summary['counters'].items())])
+
+        row = self._write_table(sheet, row, "캐시 적중률", ["캐시", "적중률"],
+                                [[name, rate] for name, rate in sorted(summary['cache_hit_rates'].items())])
+
+        # 인터페이스별 단계 시간
+        stage_names = sorted(summary['stages'])
+        interface_rows = [
+            [record['if_id']] + [round(record['stages'].get(name, 0.0), 4) for name in stage_names]
+            for record in interfaces
+        ]
+        self._write_table(sheet, row, "인터페이스별 단계 시간(초)", ["인터페이스 ID"] + stage_names, interface_rows)
+
+        return sheet
+
+    def create_throughput_sheet(self, headers, rows):
+        """
+        인터페이스별 MQ/BW 처리량 설정 점검 결과를 '처리량 설정' 시트에 기록합니다.
+        점검 내용이 있는(판정 NG) 행은 빨간색으로 표시합니다.
+
+        Args:
+            headers (list): 헤더 목록 (comp_audit.THROUGHPUT_HEADERS)
+            rows (list): 행 목록 (comp_audit.throughput_row()), 마지막 두 값은 판정과 점검 내용
+
+        Returns:
+            openpyxl.worksheet.worksheet.Worksheet: 생성된 시트 객체
+        """
+        if "처리량 설정" in self.workbook.sheetnames:
+            del self.workbook["처리량 설정"]
+        sheet = self.workbook.create_sheet("처리량 설정", 1)
+        sheet.column_dimensions['A'].width = 5
+        sheet.column_dimensions['B'].width = 20
+        sheet.column_dimensions['C'].width = 25
+        for col in range(4, len(headers)):
+            sheet.column_dimensions[get_column_letter(col)].width = 12
+        sheet.column_dimensions[get_column_letter(len(headers))].width = 60
+
+        ng_count = sum(1 for row in rows if row[-2] == 'NG')
+        self._write_table(sheet, 1, f"처리량 설정 점검 - {len(rows)}개 인터페이스 중 {ng_count}개 점검 필요",
+                          headers, rows)
+        for row_idx, values in enumerate(rows, 3):
+            status_cell = sheet.cell(row=row_idx, column=len(headers) - 1)
+            status_cell.fill = self.mismatch_fill if values[-2] == 'NG' else self.match_fill
+            sheet.cell(row=row_idx, column=len(headers)).alignment = Alignment(wrap_text=True, vertical='top')
+        sheet.freeze_panes = 'D3'
+        return sheet
+
+    def create_duplicates_sheet(self, headers, rows):
+        """
+        내용이 같은 BW/MQ 파일 그룹을 '중복 파일' 시트에 기록합니다.
+
+        Args:
+            headers (list): 헤더 목록 (content_index.DUPLICATE_HEADERS)
+            rows (list): 행 목록 (ContentIndex.duplicate_rows()), 마지막 값은 중복 경로
+
+        Returns:
+            openpyxl.worksheet.worksheet.Worksheet: 생성된 시트 객체
+        """
+        if "중복 파일" in self.workbook.sheetnames:
+            del self.workbook["중복 파일"]
+        sheet = self.workbook.create_sheet("중복 파일")
+        for col, width in zip('ABCDEFG', [5, 6, 14, 10, 8, 50, 60]):
+            sheet.column_dimensions[col].width = width
+
+        copies = sum(row[4] - 1 for row in rows)
+        self._write_table(sheet, 1, f"중복 파일 - {len(rows)}개 그룹, 대표 파일 외 {copies}개 파일은 검색/파싱 생략",
+                          headers, rows)
+        for row_idx in range(3, len(rows) + 3):
+            sheet.cell(row=row_idx, column=len(headers)).alignment = Alignment(wrap_text=True, vertical='top')
+        sheet.freeze_panes = 'A3'
+        return sheet
+
     def close(self):
         """
         리소스 정리
@@ -0,0 +1,453 @@
+"""
+비교 결과 파일 내보내기 모듈
+
+인터페이스 처리 결과를 세 개의 표로 나누어 행 단위로 바로 파일에 씁니다.
+
+    summary     : 인터페이스별 요약 (요약 시트와 같은 항목 + 컬럼 점검/쿼리 차이 건수)
+    columns     : ColumnMapper.compare_columns()의 컬럼 쌍별 점검 결과
+    query_diffs : QueryDifference의 MQ/BW 쿼리 차이
+
+형식은 csv(utf-8-sig, 엑셀에서 한글이 깨지지 않음), jsonl, parquet(pyarrow가 설치된 경우)을 지원합니다.
+엑셀 결과는 내보낸 파일을 다시 읽어 만들 수 있습니다 (render_workbook(), 시트당 최대 행 수를 넘으면 시트를 나눔).
+
+    python comp_export.py <내보내기_디렉토리> --output result.xlsx
+"""
+import os
+import csv
+import json
+import argparse
+from typing import Dict, Iterator, List, Optional, Sequence
+
+# 표별 (항목명, 형식) - 형식은 'int', 'float', 'str'
+SUMMARY_FIELDS = [
+    ('seq', 'int'), ('interface_id', 'str'), ('interface_name', 'str'),
+    ('send_table', 'str'), ('recv_table', 'str'),
+    ('mq_send_file', 'str'), ('bw_send_file', 'str'), ('send_result', 'str'), ('send_differences', 'int'),
+    ('mq_recv_file', 'str'), ('bw_recv_file', 'str'), ('recv_result', 'str'), ('recv_differences', 'int'),
+    ('bw_files', 'str'), ('column_count', 'int'), ('column_warnings', 'int'), ('column_errors', 'int'),
+    ('row_bytes', 'int'), ('rows_per_poll', 'int'), ('mq_mb_per_sec', 'float'), ('bw_mb_per_sec', 'float'),
+    ('findings', 'str')
+]
+COLUMN_FIELDS = [
+    ('interface_seq', 'int'), ('interface_id', 'str'), ('seq', 'int'),
+    ('send_column', 'str'), ('recv_column', 'str'),
+    ('send_type', 'str'), ('send_size', 'str'), ('send_nullable', 'str'),
+    ('recv_type', 'str'), ('recv_size', 'str'), ('recv_nullable', 'str'),
+    ('type_diff', 'str'), ('size_diff', 'str'), ('size_over', 'str'), ('nullable_diff', 'str'),
+    ('errors', 'str'), ('warnings', 'str')
+]
+QUERY_DIFF_FIELDS = [
+    ('interface_seq', 'int'), ('interface_id', 'str'), ('direction', 'str'),
+    ('query_type', 'str'), ('table_name', 'str'), ('column', 'str'), ('mq_value', 'str'), ('bw_value', 'str')
+]
+TABLES = {'summary': SUMMARY_FIELDS, 'columns': COLUMN_FIELDS, 'query_diffs': QUERY_DIFF_FIELDS}
+SHEET_NAMES = {'summary': '요약', 'columns': '컬럼 점검', 'query_diffs': '쿼리 차이'}
+FORMATS = ('csv', 'jsonl', 'parquet')
+
+PARQUET_BATCH_ROWS = 65536  # parquet 행 그룹 크기 (메모리에는 이 행 수만큼만 유지)
+EXCEL_MAX_ROWS = 1048576  # 엑셀 시트 최대 행 수 (헤더 포함)
+
+
+def _load_pyarrow():
+    """pyarrow를 처음 사용할 때 import 합니다. 설치되어 있지 않으면 None을 반환합니다."""
+    try:
+        import pyarrow
+        import pyarrow.parquet
+    except ImportError:
+        return None
+    return pyarrow
+
+
+def parse_formats(text: str) -> List[str]:
+    """
+    쉼표로 구분한 형식 목록을 읽습니다.
+
+    Args:
+        text (str): 예: 'csv,parquet'
+
+    Returns:
+        List[str]: 형식 목록
+
+    Raises:
+        ValueError: 지원하지 않는 형식이 있는 경우
+    """
+    formats = [name.strip().lower() for name in text.split(',') if name.strip()]
+    unknown = [name for name in formats if name not in FORMATS]
+    if unknown or not formats:
+        raise ValueError(f"지원하지 않는 내보내기 형식: {', '.join(unknown) or text} (사용 가능: {', '.join(FORMATS)})")
+    return list(dict.fromkeys(formats))
+
+
+def _text(value) -> Optional[str]:
+    """표 값을 문자열로 변환합니다. 목록은 줄바꿈으로 연결합니다."""
+    if value is None:
+        return None
+    if isinstance(value, (list, tuple)):
+        return '\n'.join(str(item) for item in value) if value else None
+    if isinstance(value, dict):
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return str(value)
+
+
+def _convert(value, kind: str):
+    """값을 항목 형식으로 변환합니다. 빈 값이나 변환할 수 없는 값은 None입니다."""
+    if value is None or value == '':
+        return None
+    if kind == 'str':
+        return _text(value)
+    try:
+        if kind == 'float':
+            return float(value)
+        return value if isinstance(value, int) else int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def comparison_status(comparison) -> str:
+    """요약 시트와 같은 쿼리 비교 결과 문자열 ('일치', '불일치', '비교불가')"""
+    if comparison is None:
+        return '비교불가'
+    if isinstance(comparison, dict):
+        if 'is_equal' not in comparison:
+            return '비교불가'
+        return '일치' if comparison['is_equal'] else '불일치'
+    return str(comparison)
+
+
+def _differences(comparison) -> List[Dict]:
+    if comparison is None:
+        return []
+    if isinstance(comparison, dict):
+        return comparison.get('differences', [])
+    return comparison.differences
+
+
+class _CsvWriter:
+    def __init__(self, path: str, fields: Sequence):
+        self.file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self.writer = csv.writer(self.file)
+        self.writer.writerow([name for name, _ in fields])
+
+    def write(self, row: List):
+        self.writer.writerow(['' if value is None else value for value in row])
+
+    def close(self):
+        self.file.close()
+
+
+class _JsonLinesWriter:
+    def __init__(self, path: str, fields: Sequence):
+        self.file = open(path, 'w', encoding='utf-8')
+        self.names = [name for name, _ in fields]
+
+    def write(self, row: List):
+        self.file.write(json.dumps(dict(zip(self.names, row)), ensure_ascii=False) + '\n')
+
+    def close(self):
+        self.file.close()
+
+
+class _ParquetWriter:
+    def __init__(self, path: str, fields: Sequence, pyarrow):
+        types = {'int': pyarrow.int64(), 'float': pyarrow.float64(), 'str': pyarrow.string()}
+        self.pyarrow = pyarrow
+        self.schema = pyarrow.schema([(name, types[kind]) for name, kind in fields])
+        self.writer = pyarrow.parquet.ParquetWriter(path, self.schema)
+        self.rows = []
+
+    def write(self, row: List):
+        self.rows.append(row)
+        if len(self.rows) >= PARQUET_BATCH_ROWS:
+            self.flush()
+
+    def flush(self):
+        if not self.rows:
+            return
+        columns = [list(values) for values in zip(*self.rows)]
+        self.writer.write_table(self.pyarrow.Table.from_arrays(
+            [self.pyarrow.array(values, type=field.type) for values, field in zip(columns, self.schema)],
+            schema=self.schema))
+        self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+
+class ResultExporter:
+    """
+    비교 결과를 summary/columns/query_diffs 표 파일로 행 단위 기록하는 클래스
+
+    파일은 생성 시 열고 add_*()를 호출할 때마다 기록하므로 결과 전체를 메모리에 모으지 않습니다.
+    """
+
+    def __init__(self, out_dir: str, formats: Sequence[str] = ('csv',)):
+        """
+        Args:
+            out_dir (str): 내보내기 디렉토리 (없으면 생성)
+            formats (Sequence[str]): 'csv', 'jsonl', 'parquet' 중 하나 이상
+                parquet은 pyarrow가 없으면 경고를 출력하고 건너뜁니다.
+        """
+        self.out_dir = out_dir
+        self.formats = parse_formats(','.join(formats))
+        pyarrow = None
+        if 'parquet' in self.formats:
+            pyarrow = _load_pyarrow()
+            if pyarrow is None:
+                print("Warning: pyarrow가 설치되어 있지 않아 parquet 파일은 만들지 않습니다. (pip install pyarrow)")
+                self.formats.remove('parquet')
+        os.makedirs(out_dir, exist_ok=True)
+
+        self.paths = {}
+        self.writers = {}
+        self.counts = {}
+        for table, fields in TABLES.items():
+            self.paths[table] = []
+            self.writers[table] = []
+            self.counts[table] = 0
+            for fmt in self.formats:
+                path = os.path.join(out_dir, f"{table}.{fmt}")
+                if fmt == 'csv':
+                    writer = _CsvWriter(path, fields)
+                elif fmt == 'jsonl':
+                    writer = _JsonLinesWriter(path, fields)
+                else:
+                    writer = _ParquetWriter(path, fields, pyarrow)
+                self.paths[table].append(path)
+                self.writers[table].append(writer)
+
+    def write_row(self, table: str, values: Dict):
+        """
+        표에 한 행을 기록합니다. 없는 항목은 빈 값, 형식이 맞지 않는 값은 변환합니다.
+
+        Args:
+            table (str): 'summary', 'columns', 'query_diffs'
+            values (Dict): {항목명: 값}
+        """
+        row = [_convert(values.get(name), kind) for name, kind in TABLES[table]]
+        for writer in self.writers[table]:
+            writer.write(row)
+        self.counts[table] += 1
+
+    def add_column_checks(self, seq: int, interface_id: str, comparison: Optional[List[Dict]]) -> Dict[str, int]:
+        """
+        compare_columns() 결과를 columns 표에 기록합니다.
+
+        Args:
+            seq (int): 인터페이스 번호
+            interface_id (str): 인터페이스 ID
+            comparison (List[Dict], optional): compare_columns() 결과
+
+        Returns:
+            Dict[str, int]: {'count', 'warnings', 'errors'} 점검 행 수와 경고/오류가 있는 행 수
+        """
+        counts = {'count': 0, 'warnings': 0, 'errors': 0}
+        for column_seq, check in enumerate(comparison or [], 1):
+            send_info = check.get('send_info') or {}
+            recv_info = check.get('recv_info') or {}
+            errors = [check['error']] if 'error' in check else check.get('errors', [])
+            self.write_row('columns', {
+                'interface_seq': seq,
+                'interface_id': interface_id,
+                'seq': column_seq,
+                'send_column': check.get('send_column'),
+                'recv_column': check.get('recv_column'),
+                'send_type': send_info.get('type'),
+                'send_size': send_info.get('size'),
+                'send_nullable': send_info.get('nullable'),
+                'recv_type': recv_info.get('type'),
+                'recv_size': recv_info.get('size'),
+                'recv_nullable': recv_info.get('nullable'),
+                'type_diff': check.get('type_diff'),
+                'size_diff': check.get('size_diff'),
+                'size_over': check.get('size_over'),
+                'nullable_diff': check.get('nullable_diff'),
+                'errors': errors,
+                'warnings': check.get('warnings')
+            })
+            counts['count'] += 1
+            counts['warnings'] += 1 if check.get('warnings') else 0
+            counts['errors'] += 1 if errors else 0
+        return counts
+
+    def add_result(self, seq: int, result: Dict):
+        """
+        XMLComparator.process_interface_with_bw() 결과(또는 매니페스트/저널에서 복원한 결과)를
+        세 표에 기록합니다.
+
+        Args:
+            seq (int): 인터페이스 번호
+            result (Dict): 인터페이스 처리 결과
+        """
+        interface_info = result.get('interface_info', {})
+        interface_id = interface_info.get('interface_id', '')
+        file_results = result.get('file_results', {})
+        comparisons = result.get('comparisons', {})
+        bw_files = result.get('bw_files') or []
+        estimate = result.get('estimate') or {}
+
+        column_counts = self.add_column_checks(
+            seq, interface_id, (result.get('excel_results') or {}).get('comparison'))
+
+        diff_counts = {}
+        for direction in ('send', 'recv'):
+            comparison = comparisons.get(direction)
+            differences = _differences(comparison)
+            diff_counts[direction] = len(differences)
+            for difference in differences:
+                self.write_row('query_diffs', {
+                    'interface_seq': seq,
+                    'interface_id': interface_id,
+                    'direction': direction,
+                    'query_type': comparison.get('query_type') if isinstance(comparison, dict) else comparison.query_type,
+                    'table_name': comparison.get('table_name') if isinstance(comparison, dict) else comparison.table_name,
+                    'column': difference.get('column'),
+                    'mq_value': difference.get('query1_value'),
+                    'bw_value': difference.get('query2_value')
+                })
+
+        send, recv = interface_info.get('send') or {}, interface_info.get('recv') or {}
+        self.write_row('summary', {
+            'seq': seq,
+            'interface_id': interface_id,
+            'interface_name': interface_info.get('interface_name'),
+            'send_table': f"{send.get('owner', '')}.{send.get('table_name', '')}",
+            'recv_table': f"{recv.get('owner', '')}.{recv.get('table_name', '')}",
+            'mq_send_file': (file_results.get('send') or {}).get('path'),
+            'bw_send_file': bw_files[0] if len(bw_files) > 0 else None,
+            'send_result': comparison_status(comparisons.get('send')),
+            'send_differences': diff_counts['send'],
+            'mq_recv_file': (file_results.get('recv') or {}).get('path'),
+            'bw_recv_file': bw_files[1] if len(bw_files) > 1 else None,
+            'recv_result': comparison_status(comparisons.get('recv')),
+            'recv_differences': diff_counts['recv'],
+            'bw_files': bw_files,
+            'column_count': column_counts['count'],
+            'column_warnings': column_counts['warnings'],
+            'column_errors': column_counts['errors'],
+            'row_bytes': estimate.get('row_bytes'),
+            'rows_per_poll': estimate.get('rows_per_poll'),
+            'mq_mb_per_sec': estimate.get('mq_mb_per_sec'),
+            'bw_mb_per_sec': estimate.get('bw_mb_per_sec'),
+            'findings': estimate.get('findings')
+        })
+
+    def close(self) -> Dict[str, List[str]]:
+        """
+        모든 파일을 닫습니다.
+
+        Returns:
+            Dict[str, List[str]]: {표 이름: 파일 경로 목록}
+        """
+        for writers in self.writers.values():
+            for writer in writers:
+                writer.close()
+        self.writers = {table: [] for table in TABLES}
+        return self.paths
+
+
+def read_table(export_dir: str, table: str) -> Iterator[List]:
+    """
+    내보낸 표 파일을 행 단위로 읽습니다. csv, jsonl, parquet 순으로 있는 파일을 사용합니다.
+
+    Args:
+        export_dir (str): 내보내기 디렉토리
+        table (str): 'summary', 'columns', 'query_diffs'
+
+    Yields:
+        List: 항목 형식으로 변환한 행 (TABLES[table] 순서)
+    """
+    fields = TABLES[table]
+    names = [name for name, _ in fields]
+    csv_path = os.path.join(export_dir, f"{table}.csv")
+    jsonl_path = os.path.join(export_dir, f"{table}.jsonl")
+    parquet_path = os.path.join(export_dir, f"{table}.parquet")
+    if os.path.exists(csv_path):
+        with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            positions = [header.index(name) if name in header else None for name in names]
+            for row in reader:
+                yield [_convert(row[pos], kind) if pos is not None else None
+                       for pos, (_, kind) in zip(positions, fields)]
+    elif os.path.exists(jsonl_path):
+        with open(jsonl_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    yield [_convert(record.get(name), kind) for name, kind in fields]
+    elif os.path.exists(parquet_path):
+        pyarrow = _load_pyarrow()
+        if pyarrow is None:
+            raise ImportError(f"parquet 파일을 읽으려면 pyarrow 패키지가 필요합니다: {parquet_path}")
+        parquet = pyarrow.parquet.ParquetFile(parquet_path)
+        for batch in parquet.iter_batches(batch_size=PARQUET_BATCH_ROWS, columns=names):
+            yield from (list(row.values()) for row in batch.to_pylist())
+    else:
+        raise FileNotFoundError(f"내보낸 {table} 파일이 없습니다: {export_dir}")
+
+
+def render_workbook(export_dir: str, output_path: str, max_rows: int = EXCEL_MAX_ROWS) -> Dict[str, int]:
+    """
+    내보낸 표 파일로 엑셀 결과를 만듭니다 (openpyxl write-only 모드, 행 단위 기록).
+    한 시트에 max_rows를 넘는 표는 '컬럼 점검 (2)'처럼 시트를 나눕니다.
+
+    Args:
+        export_dir (str): 내보내기 디렉토리
+        output_path (str): 결과 엑셀 경로
+        max_rows (int): 시트당 최대 행 수 (헤더 포함)
+
+    Returns:
+        Dict[str, int]: {표 이름: 기록한 행 수}
+    """
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Font, PatternFill
+
+    workbook = openpyxl.Workbook(write_only=True)
+    header_font = Font(bold=True, color='FFFFFF', size=9)
+    header_fill = PatternFill(start_color='366092', end_color='366092', fill_type='solid')
+    counts = {}
+    for table, fields in TABLES.items():
+        def new_sheet(part: int):
+            title = SHEET_NAMES[table] if part == 1 else f"{SHEET_NAMES[table]} ({part})"
+            sheet = workbook.create_sheet(title)
+            header = []
+            for name, _ in fields:
+                cell = WriteOnlyCell(sheet, value=name)
+                cell.font = header_font
+                cell.fill = header_fill
+                header.append(cell)
+            sheet.append(header)
+            return sheet
+
+        part = 1
+        sheet = new_sheet(part)
+        sheet_rows = 1
+        counts[table] = 0
+        for row in read_table(export_dir, table):
+            if sheet_rows >= max_rows:
+                part += 1
+                sheet = new_sheet(part)
+                sheet_rows = 1
+            sheet.append(row)
+            sheet_rows += 1
+            counts[table] += 1
+    workbook.save(output_path)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='내보낸 비교 결과(csv/jsonl/parquet)로 엑셀 결과 작성')
+    parser.add_argument('export_dir', help='내보내기 디렉토리 (comp_xml.py excel --export)')
+    parser.add_argument('--output', help='결과 엑셀 파일 (기본: 내보내기 디렉토리의 results.xlsx)')
+    args = parser.parse_args()
+
+    output_path = args.output or os.path.join(args.export_dir, 'results.xlsx')
+    counts = render_workbook(args.export_dir, output_path)
+    print(', '.join(f"{SHEET_NAMES[table]}: {count}행" for table, count in counts.items()))
+    print(f"결과 파일: {output_path}")
+
+
+if __name__ == "__main__":
+    main()
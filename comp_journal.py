@@ -0,0 +1,145 @@
+"""
+comp_xml.py 엑셀 출력 모드의 실행 저널 모듈
+
+인터페이스 처리 결과를 끝나는 대로 JSON-lines 파일에 한 줄씩 추가하고 바로 디스크에 씁니다.
+실행이 중간에 끊기거나(DB 연결 끊김, 강제 종료) 결과 엑셀을 저장하지 못한 경우(파일이 열려 있음)
+--resume으로 다시 실행하면 저널에 완료된 인터페이스는 처리하지 않고 저장된 결과로 보고서를 다시 만듭니다.
+
+    {"type": "run", "version": 1, "started_at": ..., "excel": 입력 엑셀 경로}
+    {"type": "interface", "index": 1, "if_id": ..., "block": 블록 해시, "hashes": ..., "result": ...}
+
+결과 엑셀을 저장하면 저널은 삭제됩니다.
+"""
+import os
+import json
+import datetime
+from typing import Dict, Optional, Tuple
+
+from comp_manifest import hash_object, result_to_dict, result_from_dict
+
+# read_interface_block()이 읽는 항목 (처리 중에 더해지는 send_system 등은 제외)
+BLOCK_FIELDS = ('interface_name', 'interface_id', 'send', 'recv')
+
+
+def block_hash(interface_info: Dict) -> str:
+    """입력 엑셀 인터페이스 블록의 해시를 반환합니다."""
+    return hash_object({key: interface_info.get(key) for key in BLOCK_FIELDS})
+
+
+class RunJournal:
+    """
+    인터페이스별 처리 결과를 추가 전용 JSON-lines 파일로 기록하는 클래스
+
+    IF ID와 입력 블록이 같은 완료 기록만 재사용하며, 처리에 실패한 인터페이스는 기록하지 않으므로
+    --resume 시 다시 처리됩니다.
+    """
+    VERSION = 1
+
+    def __init__(self, path: str, excel_path: str, resume: bool = False):
+        """
+        Args:
+            path (str): 저널 파일 경로
+            excel_path (str): 입력 엑셀 경로 (다른 입력의 저널은 재사용하지 않음)
+            resume (bool): True이면 기존 저널의 완료 기록을 읽고 이어서 기록, False이면 새로 시작
+        """
+        self.path = path
+        self.excel_path = os.path.abspath(excel_path)
+        self.entries = {}  # {if_id: 저널 레코드}
+        self._file = None
+        if resume:
+            self.load()
+        self._rewrite()
+
+    def load(self):
+        """
+        저널 파일의 완료 기록을 읽습니다. 중간에 끊겨 읽을 수 없는 줄은 건너뜁니다.
+        입력 엑셀이나 버전이 다르면 기록을 사용하지 않습니다.
+        """
+        self.entries = {}
+        if not os.path.exists(self.path):
+            print(f"Warning: 저널 파일이 없어 처음부터 처리합니다: {self.path}")
+            return
+        header = None
+        skipped = 0
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    skipped += 1
+                    continue
+                if record.get('type') == 'run':
+                    header = record
+                elif record.get('type') == 'interface' and record.get('result'):
+                    self.entries[record['if_id']] = record
+        if skipped:
+            print(f"Warning: 저널에서 읽을 수 없는 {skipped}줄을 건너뜁니다: {self.path}")
+        if not header or header.get('version') != self.VERSION or header.get('excel') != self.excel_path:
+            print(f"Warning: 입력 엑셀 또는 버전이 다른 저널이므로 처음부터 처리합니다: {self.path}")
+            self.entries = {}
+
+    def _rewrite(self):
+        """헤더와 유효한 완료 기록만 다시 쓰고 추가 모드로 엽니다 (끊긴 마지막 줄 정리)."""
+        header = {
+            'type': 'run',
+            'version': self.VERSION,
+            'started_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'excel': self.excel_path
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for record in [header] + list(self.entries.values()):
+                f.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        os.replace(tmp_path, self.path)
+        self._file = open(self.path, 'a', encoding='utf-8')
+
+    def completed(self, interface_info: Dict) -> Optional[Tuple[Dict, Optional[Dict]]]:
+        """
+        이전 실행에서 완료된 인터페이스의 결과를 반환합니다.
+
+        Args:
+            interface_info (Dict): read_interface_block()의 결과
+
+        Returns:
+            Optional[Tuple[Dict, Optional[Dict]]]: (처리 결과, 증분 실행 해시), 기록이 없거나 블록이 바뀌었으면 None
+        """
+        record = self.entries.get(interface_info.get('interface_id'))
+        if not record or record.get('block') != block_hash(interface_info):
+            return None
+        return result_from_dict(record['result']), record.get('hashes')
+
+    def append(self, index: int, interface_info: Dict, result: Dict, hashes: Optional[Dict] = None):
+        """
+        완료된 인터페이스 결과를 기록하고 디스크에 씁니다.
+
+        Args:
+            index (int): 인터페이스 번호
+            interface_info (Dict): 인터페이스 정보
+            result (Dict): 처리 결과
+            hashes (Dict, optional): 증분 실행 입력 해시
+        """
+        record = {
+            'type': 'interface',
+            'index': index,
+            'if_id': interface_info['interface_id'],
+            'block': block_hash(interface_info),
+            'hashes': hashes,
+            'result': result_to_dict(result)
+        }
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        """저널 파일을 닫습니다."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """결과 엑셀을 저장한 뒤 저널 파일을 삭제합니다."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
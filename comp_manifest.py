@@ -0,0 +1,206 @@
+"""
+comp_xml.py 증분 실행(--incremental)을 위한 실행 매니페스트 모듈
+
+인터페이스별로 입력 블록, MQ 송수신 파일, 매칭된 BW 파일, 테이블 컬럼 메타데이터의
+해시를 기록하고, 이전 실행의 처리 결과를 함께 저장합니다.
+"""
+import os
+import json
+import hashlib
+import datetime
+from typing import Dict, List, Optional
+
+from comp_q import QueryDifference
+
+
+def hash_bytes(data: bytes) -> str:
+    """바이트 데이터의 SHA-1 해시를 반환합니다."""
+    return hashlib.sha1(data).hexdigest()
+
+
+def hash_file(path: str) -> str:
+    """
+    파일 내용의 SHA-1 해시를 반환합니다.
+
+    Args:
+        path (str): 파일 경로
+
+    Returns:
+        str: 해시 문자열, 파일이 없거나 읽을 수 없으면 빈 문자열
+    """
+    if not path or not os.path.exists(path):
+        return ''
+    digest = hashlib.sha1()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(chunk)
+    except IOError:
+        return ''
+    return digest.hexdigest()
+
+
+def hash_object(obj) -> str:
+    """JSON으로 직렬화한 객체의 SHA-1 해시를 반환합니다."""
+    text = json.dumps(obj, sort_keys=True, ensure_ascii=False, default=str)
+    return hash_bytes(text.encode('utf-8'))
+
+
+def _mask_db_info(db_info):
+    """저장용 DB 정보에서 비밀번호를 제거합니다."""
+    if not isinstance(db_info, dict):
+        return db_info
+    masked = dict(db_info)
+    if 'password' in masked:
+        masked['password'] = '***'
+    return masked
+
+
+def result_to_dict(result: Dict) -> Dict:
+    """
+    process_interface_with_bw()의 처리 결과를 JSON으로 저장할 수 있는 형태로 변환합니다.
+    QueryDifference 객체는 딕셔너리로, DB 비밀번호는 마스킹하여 저장합니다.
+
+    Args:
+        result (Dict): 인터페이스 처리 결과
+
+    Returns:
+        Dict: JSON 직렬화 가능한 결과
+    """
+    interface_info = dict(result.get('interface_info', {}))
+    for direction in ('send', 'recv'):
+        if isinstance(interface_info.get(direction), dict):
+            side = dict(interface_info[direction])
+            side['db_info'] = _mask_db_info(side.get('db_info'))
+            interface_info[direction] = side
+
+    comparisons = {}
+    for direction, diff in result.get('comparisons', {}).items():
+        comparisons[direction] = diff.to_dict() if isinstance(diff, QueryDifference) else None
+
+    data = dict(result)
+    data['interface_info'] = interface_info
+    data['comparisons'] = comparisons
+    return data
+
+
+def result_from_dict(data: Dict) -> Dict:
+    """
+    result_to_dict()로 저장한 결과를 원래 형태(QueryDifference 포함)로 복원합니다.
+
+    Args:
+        data (Dict): 저장된 결과
+
+    Returns:
+        Dict: 인터페이스 처리 결과
+    """
+    result = dict(data)
+    comparisons = {}
+    for direction, diff in data.get('comparisons', {}).items():
+        comparisons[direction] = QueryDifference.from_dict(diff) if diff else None
+    result['comparisons'] = comparisons
+    return result
+
+
+class RunManifest:
+    """
+    인터페이스별 입력 해시와 처리 결과를 JSON 파일로 관리하는 클래스
+    """
+    VERSION = 1
+
+    # 변경 여부 판단에 사용하는 해시 항목
+    HASH_KEYS = ['block', 'mq_send', 'mq_recv', 'bw_tree', 'bw_files', 'columns']
+    # 입력을 확인하지 못한 항목의 해시 값 (저장된 값과 같아도 변경된 것으로 봄)
+    UNAVAILABLE = 'unavailable'
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): 매니페스트 파일 경로
+        """
+        self.path = path
+        self.entries = {}
+        self.load()
+
+    def load(self):
+        """매니페스트 파일을 읽습니다. 파일이 없거나 형식이 다르면 빈 매니페스트로 시작합니다."""
+        self.entries = {}
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (IOError, ValueError) as e:
+            print(f"Warning: 매니페스트를 읽을 수 없어 전체 재처리합니다: {self.path} ({e})")
+            return
+        if data.get('version') != self.VERSION:
+            print(f"Warning: 매니페스트 버전이 달라 전체 재처리합니다: {self.path}")
+            return
+        self.entries = data.get('interfaces', {})
+
+    def save(self):
+        """매니페스트를 임시 파일에 쓴 뒤 교체하여 저장합니다."""
+        data = {
+            'version': self.VERSION,
+            'saved_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'interfaces': self.entries
+        }
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1, default=str)
+        os.replace(tmp_path, self.path)
+
+    def get(self, if_id: str) -> Optional[Dict]:
+        """인터페이스의 저장된 항목을 반환합니다."""
+        return self.entries.get(if_id)
+
+    def is_unchanged(self, if_id: str, hashes: Dict[str, str]) -> bool:
+        """
+        저장된 해시와 현재 해시가 모두 같고 결과가 저장되어 있는지 확인합니다.
+
+        Args:
+            if_id (str): 인터페이스 ID
+            hashes (Dict[str, str]): 현재 입력 해시
+
+        Returns:
+            bool: 재처리가 필요 없으면 True
+        """
+        entry = self.entries.get(if_id)
+        if not entry or not entry.get('result'):
+            return False
+        return not self.changed_keys(if_id, hashes)
+
+    def changed_keys(self, if_id: str, hashes: Dict[str, str]) -> List[str]:
+        """저장된 해시와 달라진 항목 목록을 반환합니다."""
+        saved = (self.entries.get(if_id) or {}).get('hashes', {})
+        return [key for key in self.HASH_KEYS
+                if saved.get(key) != hashes.get(key) or hashes.get(key) == self.UNAVAILABLE]
+
+    def update(self, if_id: str, hashes: Dict[str, str], result: Optional[Dict]):
+        """
+        인터페이스의 해시와 처리 결과를 기록합니다.
+
+        Args:
+            if_id (str): 인터페이스 ID
+            hashes (Dict[str, str]): 입력 해시
+            result (Optional[Dict]): process_interface_with_bw()의 결과 (실패시 None)
+        """
+        self.entries[if_id] = {
+            'hashes': hashes,
+            'updated_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'result': result_to_dict(result) if result else None
+        }
+
+    def cached_result(self, if_id: str) -> Optional[Dict]:
+        """저장된 처리 결과를 복원하여 반환합니다."""
+        entry = self.entries.get(if_id)
+        if not entry or not entry.get('result'):
+            return None
+        return result_from_dict(entry['result'])
+
+    def prune(self, if_ids: List[str]):
+        """현재 워크북에 없는 인터페이스 항목을 제거합니다."""
+        keep = set(if_ids)
+        for if_id in list(self.entries.keys()):
+            if if_id not in keep:
+                del self.entries[if_id]
@@ -0,0 +1,299 @@
+"""
+MQ 메시지 크기(행 폭) 계산 모듈
+
+송신 SELECT(sql_templates.MappingPlan.select_names) 순서의 컬럼마다 선언된 바이트 폭을 더하고
+어댑터의 메시지 형식(database 태그 format="xml", data_name="data")에 따른 XML 태그 오버헤드를 더하여
+한 행의 최대 메시지 크기를 구한 뒤, MQ 송신 어댑터의 buffer_size와 commit_count로
+메시지 하나와 커밋 한 번에 담기는 최대 행 수를 계산합니다.
+
+컬럼 폭:
+    - VARCHAR2/VARCHAR/CHAR: data_length 바이트
+    - NVARCHAR2/NVARCHAR/NCHAR: 문자 수 x3 (UTF-8)
+    - DATE: 송신 SELECT의 TO_CHAR(..., 'YYYYMMDDHH24MISS') 14자리
+    - TIMESTAMP: 14자리 + '.' + 소수 초 자릿수
+    - NUMBER: 정밀도 자릿수 + 부호 + 소수점, 정밀도가 없으면 NUMBER_MAX_WIDTH
+    - RAW: data_length x2 (16진 문자열)
+    - CLOB/NCLOB/BLOB 등 상한이 없는 타입은 합계에서 빼고 unbounded로 보고
+
+XML 오버헤드는 행마다 <data>...</data>, 컬럼마다 <컬럼명>...</컬럼명>, 메시지마다 XML 선언으로 계산합니다.
+
+    python comp_payload.py --input input.xlsx --xml-dir XML디렉토리 --output payload.xlsx
+"""
+import os
+import argparse
+from typing import Dict, List, Optional
+
+from adapter_model import int_value
+from column_rules import normalize_type, TEXT_TYPES, NCHAR_TYPES, TIMESTAMP_TYPES
+
+DATE_WIDTH = 14                 # 'YYYYMMDDHH24MISS' 형식 결과 길이
+NUMBER_MAX_WIDTH = 40           # 38자리 + 부호 + 소수점
+NCHAR_BYTES = 3                 # NCHAR 계열 문자당 최대 바이트 (UTF-8)
+DEFAULT_FRACTION = 6            # TIMESTAMP 소수 초 기본 자릿수
+XML_DECLARATION = '<?xml version="1.0" encoding="utf-8"?>'
+
+_SIZE_UNITS = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+PAYLOAD_HEADERS = [
+    "번호", "인터페이스 ID", "인터페이스 명", "송신 테이블", "컬럼 수",
+    "데이터(B)", "XML 오버헤드(B)", "행 크기(B)", "buffer_size", "메시지당 최대 행 수",
+    "commit_count", "커밋당 메시지 수", "점검 내용"
+]
+
+
+def parse_size(value) -> Optional[int]:
+    """
+    buffer_size 같은 크기 값을 바이트로 변환합니다. ('10M' -> 10485760, '4096' -> 4096)
+
+    Returns:
+        Optional[int]: 바이트 수, 해석할 수 없으면 None
+    """
+    text = str(value or '').strip().upper()
+    unit = _SIZE_UNITS.get(text[-1:])
+    number = int_value(text[:-1] if unit else text)
+    return number * (unit or 1) if number is not None else None
+
+
+def column_width(info: Dict) -> Optional[int]:
+    """
+    컬럼 하나가 메시지에서 차지하는 최대 바이트 수
+
+    Args:
+        info (Dict): 컬럼 정보 {'type', 'size', 'precision', 'scale'}
+
+    Returns:
+        Optional[int]: 바이트 수, 상한이 없는 타입(LOB 등)은 None
+    """
+    base, digits = normalize_type(str(info.get('type', '')))
+    size = int_value(info.get('size')) or 0
+    if base == 'DATE':
+        return DATE_WIDTH
+    if base in TIMESTAMP_TYPES:
+        fraction = int_value(info.get('scale'))
+        fraction = fraction if fraction is not None else (digits if digits is not None else DEFAULT_FRACTION)
+        return DATE_WIDTH + (1 + fraction if fraction else 0)
+    if base == 'NUMBER':
+        precision = int_value(info.get('precision'))
+        if precision is None:
+            return NUMBER_MAX_WIDTH
+        scale = int_value(info.get('scale')) or 0
+        return precision + 1 + (1 if scale > 0 else 0)
+    if base in NCHAR_TYPES:
+        return size * NCHAR_BYTES
+    if base in TEXT_TYPES:
+        return size
+    if base == 'RAW':
+        return size * 2
+    if base in ('FLOAT', 'BINARY_FLOAT', 'BINARY_DOUBLE'):
+        return NUMBER_MAX_WIDTH
+    return None
+
+
+def payload_size(names: List[str], columns: Dict[str, Dict],
+                 data_name: str = 'data', message_format: str = 'xml') -> Dict:
+    """
+    송신 컬럼 목록의 한 행 메시지 크기를 계산합니다.
+
+    Args:
+        names (List[str]): 메시지 필드 순서의 송신 컬럼명 (MappingPlan.select_names)
+        columns (Dict[str, Dict]): 송신 테이블 컬럼 정보
+        data_name (str): 어댑터 database 태그의 data_name (행 태그 이름)
+        message_format (str): 어댑터 database 태그의 format, 'xml'이 아니면 태그 오버헤드 없음
+
+    Returns:
+        Dict: {
+            'fields': [(컬럼명, 바이트)], 'data_bytes', 'overhead_bytes', 'row_bytes',
+            'unbounded': 상한이 없는 컬럼, 'missing': 컬럼 정보가 없는 컬럼
+        }
+    """
+    fields, unbounded, missing = [], [], []
+    data_bytes = 0
+    for name in names:
+        info = columns.get(name)
+        if info is None:
+            missing.append(name)
+            continue
+        width = column_width(info)
+        if width is None:
+            unbounded.append(name)
+            continue
+        fields.append((name, width))
+        data_bytes += width
+
+    overhead = 0
+    if (message_format or 'xml').lower() == 'xml':
+        # <data>...</data> + 필드마다 <NAME>...</NAME>
+        overhead = 2 * len(data_name) + 5 + sum(2 * len(name) + 5 for name in names if name not in missing)
+    return {
+        'fields': fields, 'data_bytes': data_bytes, 'overhead_bytes': overhead,
+        'row_bytes': data_bytes + overhead, 'unbounded': unbounded, 'missing': missing
+    }
+
+
+def message_capacity(row_bytes: int, buffer_size, commit_count) -> Dict:
+    """
+    메시지 하나와 커밋 한 번에 담기는 최대 행 수를 계산합니다.
+
+    Args:
+        row_bytes (int): 한 행 메시지 크기
+        buffer_size: MQ 송신 어댑터 buffer_size ('10M' 등)
+        commit_count: MQ 송신 어댑터 commit_count
+
+    Returns:
+        Dict: {'buffer_bytes', 'rows_per_message', 'commit_count', 'messages_per_commit', 'findings'}
+    """
+    buffer_bytes = parse_size(buffer_size)
+    commit = int_value(commit_count)
+    capacity = {'buffer_bytes': buffer_bytes, 'rows_per_message': None, 'commit_count': commit,
+                'messages_per_commit': None, 'findings': []}
+    if not buffer_bytes or not row_bytes:
+        return capacity
+
+    rows = max(buffer_bytes - len(XML_DECLARATION), 0) // row_bytes
+    capacity['rows_per_message'] = rows
+    if rows == 0:
+        capacity['findings'].append(f"행 크기 {row_bytes}B > buffer_size {buffer_size}")
+    elif commit:
+        capacity['messages_per_commit'] = -(-commit // rows)
+        if rows < commit:
+            capacity['findings'].append(
+                f"commit_count {commit}행이 buffer_size {buffer_size} 메시지 {capacity['messages_per_commit']}개로 나뉨 "
+                f"(메시지당 {rows}행)")
+    return capacity
+
+
+def interface_payload(plan, adapter=None) -> Dict:
+    """
+    인터페이스 하나의 메시지 크기와 메시지/커밋당 행 수를 계산합니다.
+
+    Args:
+        plan (MappingPlan): 송신 매핑/컬럼 정보로 만든 계획 (ColumnMapper.statement_plan())
+        adapter (AdapterFile, optional): MQ 송신 어댑터 파일, 없으면 기본 형식(xml, data)으로 크기만 계산
+
+    Returns:
+        Dict: payload_size() 결과에 message_capacity() 결과와 'findings'를 더한 딕셔너리
+    """
+    database = adapter.database_attrs if adapter is not None else {}
+    attrs = adapter.adapter_attrs if adapter is not None else {}
+    payload = payload_size(plan.select_names, plan.send_columns,
+                           database.get('data_name') or 'data', database.get('format') or 'xml')
+    capacity = message_capacity(payload['row_bytes'], attrs.get('buffer_size'), database.get('commit_count'))
+    findings = []
+    if payload['unbounded']:
+        findings.append(f"크기 상한 없는 컬럼(합계 제외): {', '.join(payload['unbounded'])}")
+    if payload['missing']:
+        findings.append(f"컬럼 정보 없음(합계 제외): {', '.join(payload['missing'])}")
+    findings.extend(capacity.pop('findings'))
+    payload.update(capacity)
+    payload['buffer_size'] = attrs.get('buffer_size', '')
+    payload['findings'] = findings
+    return payload
+
+
+def _send_adapter_path(xml_dir: str, files: List[str], if_id: str) -> Optional[str]:
+    """XMLComparator.list_interface_files()와 같은 규칙으로 송신 어댑터 파일 경로를 찾습니다."""
+    path = None
+    for file in files:
+        if file.startswith(if_id) and file.endswith('.SND.xml'):
+            path = os.path.join(xml_dir, file)
+    return path
+
+
+def payload_workbook(input_path: str, xml_dir: Optional[str] = None, mapper=None) -> List[List]:
+    """
+    입력 워크북의 모든 인터페이스에 대해 메시지 크기를 계산합니다.
+
+    Args:
+        input_path (str): 인터페이스 정보 엑셀 경로
+        xml_dir (str, optional): MQ 어댑터 XML 디렉토리, 없으면 buffer_size/commit_count 없이 크기만 계산
+        mapper (ColumnMapper, optional): 컬럼 정보 조회용 매퍼, 없으면 새로 생성
+
+    Returns:
+        List[List]: PAYLOAD_HEADERS 순서의 행 목록
+    """
+    import xml.etree.ElementTree as ET
+    from adapter_model import shared_cache
+    from comp_columns import load_interfaces
+    from comp_schema import load_catalog
+    from maptest import ColumnMapper
+    from sql_templates import MappingPlan
+
+    mapper = mapper or ColumnMapper()
+    interfaces = load_interfaces(input_path)
+    load_catalog(interfaces, mapper)
+    files = sorted(os.listdir(xml_dir)) if xml_dir else []
+
+    rows = []
+    for num, interface_info in enumerate(interfaces, 1):
+        send = interface_info['send']
+        db_info = send.get('db_info') or {}
+        columns = mapper.schema_catalog.get(
+            (db_info.get('sid', ''), db_info.get('username', ''), send.get('owner'), send.get('table_name')), {})
+        mapping = [col.strip() for col in send['columns'] if col and col.strip()]
+        plan = MappingPlan(mapping, [], columns, {})
+
+        adapter = None
+        path = _send_adapter_path(xml_dir, files, interface_info['interface_id']) if xml_dir else None
+        if path:
+            try:
+                adapter, _ = shared_cache.get(path)
+            except (ET.ParseError, OSError) as e:
+                print(f"Warning: 어댑터 파일 읽기 실패 ({path}): {e}")
+
+        payload = interface_payload(plan, adapter)
+        if not columns:
+            payload['findings'].insert(0, "송신 테이블 정보 없음")
+        rows.append([
+            num, interface_info['interface_id'], interface_info['interface_name'],
+            f"{send.get('owner')}.{send.get('table_name')}", len(payload['fields']),
+            payload['data_bytes'], payload['overhead_bytes'], payload['row_bytes'], payload['buffer_size'],
+            payload['rows_per_message'], payload['commit_count'], payload['messages_per_commit'],
+            '\n'.join(payload['findings'])
+        ])
+    return rows
+
+
+def write_payload_report(output_path: str, rows: List[List]):
+    """
+    메시지 크기 계산 결과를 '메시지 크기' 시트로 작성합니다.
+
+    Args:
+        output_path (str): 결과 엑셀 경로
+        rows (List[List]): payload_workbook() 결과
+    """
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill, Alignment
+
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = '메시지 크기'
+    sheet.append(PAYLOAD_HEADERS)
+    for cell in sheet[1]:
+        cell.font = Font(bold=True)
+        cell.fill = PatternFill(start_color='DDEBF7', end_color='DDEBF7', fill_type='solid')
+    sheet.freeze_panes = 'D2'
+    for row in rows:
+        sheet.append([value if value is not None else '' for value in row])
+        sheet.cell(row=sheet.max_row, column=len(PAYLOAD_HEADERS)).alignment = Alignment(wrap_text=True, vertical='top')
+
+    for index, width in enumerate([6, 15, 30, 30, 8, 10, 12, 10, 10, 12, 12, 12, 60]):
+        sheet.column_dimensions[openpyxl.utils.get_column_letter(index + 1)].width = width
+    wb.save(output_path)
+    wb.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='인터페이스별 MQ 메시지 크기/메시지당 행 수 계산')
+    parser.add_argument('--input', default='input.xlsx', help='인터페이스 정보 엑셀 파일')
+    parser.add_argument('--xml-dir', help='MQ 어댑터 XML 디렉토리 (buffer_size, commit_count, format, data_name)')
+    parser.add_argument('--output', default='payload.xlsx', help='결과 엑셀 파일')
+    args = parser.parse_args()
+
+    rows = payload_workbook(args.input, args.xml_dir)
+    write_payload_report(args.output, rows)
+    flagged = sum(1 for row in rows if row[-1])
+    print(f"총 인터페이스: {len(rows)}, 점검 필요: {flagged} -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
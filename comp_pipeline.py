@@ -0,0 +1,273 @@
+"""
+비동기 인터페이스 처리 파이프라인
+
+XMLComparator.process_all_interfaces_with_bw(pipeline=...)에서 사용합니다.
+인터페이스 처리를 단계로 나누고 asyncio로 연결하여 Oracle 응답 대기, 네트워크 드라이브 파일 읽기,
+쿼리 비교(CPU)가 인터페이스 사이에서 겹쳐 실행되도록 합니다.
+
+    읽기   : 입력 엑셀 인터페이스 블록, 저널 완료 기록 확인 (이벤트 루프, --resume이면 완료된 인터페이스는 기록으로)
+    DB     : 매니페스트 해시, 컬럼 메타데이터 조회/SQL 생성 (db개 스레드, 스레드마다 ColumnMapper.spawn())
+    파일   : MQ 어댑터 파일/BW 파일 검색과 파싱, 처리량 설정 점검 (io개 스레드)
+    비교   : MQ/BW 쿼리 비교 (cpu개 프로세스, 0이면 파일 단계 스레드)
+    기록   : 인터페이스 순서대로 결과 엑셀 기록 (스레드 1개)
+
+단계 사이는 queue_size 크기의 asyncio.Queue로 연결되어 뒤 단계가 밀리면 앞 단계가 기다리고(backpressure),
+읽었지만 아직 기록하지 않은 인터페이스(순서 맞춤 대기 포함)는 window개로 제한됩니다.
+경고 메시지는 단계가 실행되는 시점에 출력되므로 '처리 중' 줄보다 먼저 나올 수 있습니다.
+"""
+import os
+import time
+import asyncio
+import traceback
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple
+
+from xltest import process_interface
+from comp_q import QueryParser
+
+
+def compare_worker(mq_queries: Dict[str, str], bw_queries: Dict[str, str]) -> Tuple[Dict, Dict, float]:
+    """
+    비교 단계 작업 함수 (작업 프로세스 또는 스레드에서 실행)
+
+    Args:
+        mq_queries (Dict[str, str]): {'send': MQ 송신 쿼리, 'recv': MQ 수신 쿼리}
+        bw_queries (Dict[str, str]): {'send': BW 송신 쿼리, 'recv': BW 수신 쿼리}
+
+    Returns:
+        Tuple[Dict, Dict, float]: (비교 결과, 경고, 소요 시간(초))
+    """
+    start = time.perf_counter()
+    comparisons, warnings = QueryParser().compare_interface_queries(mq_queries, bw_queries)
+    return comparisons, warnings, time.perf_counter() - start
+
+
+class PipelineLimits:
+    """파이프라인 단계별 동시 실행 수와 큐 크기"""
+
+    def __init__(self, db: int = 2, io: int = 8, cpu: Optional[int] = None,
+                 queue_size: int = 8, window: int = 64):
+        """
+        Args:
+            db (int): 동시에 DB를 조회할 작업 수 (작업마다 DB 연결을 따로 사용)
+            io (int): 파일 검색/읽기 스레드 수
+            cpu (int, optional): 쿼리 비교 프로세스 수, 0이면 파일 단계 스레드에서 비교, None이면 CPU 수
+            queue_size (int): 단계 사이 큐 크기
+            window (int): 읽었지만 아직 기록하지 않은 최대 인터페이스 수
+        """
+        self.db = max(1, db)
+        self.io = max(1, io)
+        self.cpu = (os.cpu_count() or 1) if cpu is None else max(0, cpu)
+        self.queue_size = max(1, queue_size)
+        self.window = max(self.db + self.io + self.cpu + 1, window)
+
+    def __repr__(self) -> str:
+        return (f"PipelineLimits(db={self.db}, io={self.io}, cpu={self.cpu}, "
+                f"queue_size={self.queue_size}, window={self.window})")
+
+
+class InterfacePipeline:
+    """
+    XMLComparator의 인터페이스 처리를 단계별 asyncio 파이프라인으로 실행하는 클래스
+
+    단계 함수는 XMLComparator의 메서드(prepare_interface_info, find_interface_files, collect_bw_queries,
+    audit_throughput, _accept_result)를 그대로 사용하므로 결과는 순차 실행과 같습니다.
+    """
+
+    def __init__(self, comparator, limits: Optional[PipelineLimits] = None):
+        """
+        Args:
+            comparator (XMLComparator): 실행할 비교기 (엑셀 출력/매니페스트가 초기화된 상태)
+            limits (PipelineLimits, optional): 단계별 동시 실행 수, 없으면 기본값
+        """
+        self.comparator = comparator
+        self.limits = limits or PipelineLimits()
+        self.profiler = comparator.profiler
+
+    def run(self, run: Dict):
+        """
+        모든 인터페이스를 처리합니다. 끝나면 run의 카운터와 seen_ids/throughput_rows가 채워집니다.
+
+        Args:
+            run (Dict): process_all_interfaces_with_bw()의 실행 상태
+        """
+        print(f"파이프라인 실행: {self.limits}")
+        asyncio.run(self._run(run))
+
+    async def _run(self, run: Dict):
+        limits = self.limits
+        loop = asyncio.get_running_loop()
+
+        # 작업 프로세스를 스레드 풀보다 먼저 시작 (fork 시점에 다른 스레드가 없도록)
+        cpu_pool = None
+        if limits.cpu:
+            cpu_pool = ProcessPoolExecutor(max_workers=limits.cpu)
+            await loop.run_in_executor(cpu_pool, os.getpid)
+        db_pool = ThreadPoolExecutor(max_workers=limits.db, thread_name_prefix='pipeline-db')
+        io_pool = ThreadPoolExecutor(max_workers=limits.io, thread_name_prefix='pipeline-io')
+        write_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pipeline-write')
+        mappers = [self.comparator.mapper] + [self.comparator.mapper.spawn() for _ in range(limits.db - 1)]
+
+        db_queue = asyncio.Queue(limits.queue_size)
+        io_queue = asyncio.Queue(limits.queue_size)
+        cpu_queue = asyncio.Queue(limits.queue_size)
+        write_queue = asyncio.Queue(limits.queue_size)
+        window = asyncio.Semaphore(limits.window)
+
+        async def fetch(item, worker):
+            await loop.run_in_executor(db_pool, self._fetch, run, item, mappers[worker])
+
+        async def read_files(item, worker):
+            await loop.run_in_executor(io_pool, self._read_files, run, item)
+
+        async def compare(item, worker):
+            mq_queries = {direction: item['file_results'][direction]['query'] for direction in ('send', 'recv')}
+            comparisons, warnings, seconds = await loop.run_in_executor(
+                cpu_pool or io_pool, compare_worker, mq_queries, item['bw_queries'])
+            with self.profiler.bind(item['record']):
+                self.profiler.add_time('compare_queries', seconds)
+            item['result']['comparisons'] = comparisons
+            item['result']['warnings'] = warnings
+
+        try:
+            await asyncio.gather(
+                self._read(run, db_queue, window, limits.db),
+                self._stage('db', db_queue, io_queue, limits.db, limits.io, fetch),
+                self._stage('io', io_queue, cpu_queue, limits.io, max(1, limits.cpu), read_files),
+                self._stage('cpu', cpu_queue, write_queue, max(1, limits.cpu), 1, compare),
+                self._write(run, write_queue, window, write_pool)
+            )
+        finally:
+            for pool in (db_pool, io_pool, write_pool, cpu_pool):
+                if pool is not None:
+                    pool.shutdown(wait=True)
+
+    async def _read(self, run: Dict, outbox: asyncio.Queue, window: asyncio.Semaphore, next_workers: int):
+        """입력 엑셀 블록을 순서대로 읽어 DB 단계로 넘깁니다."""
+        for interface_count, start_col, interface_info in self.comparator.iter_interface_blocks():
+            await window.acquire()
+            run['interface_count'] = interface_count
+            run['seen_ids'].append(interface_info['interface_id'])
+            # 이전 실행 저널에 완료된 인터페이스는 바로 기록 단계로 (--resume)
+            result, hashes = run['journal'].completed(interface_info) or (None, None)
+            await outbox.put({
+                'index': interface_count,
+                'start_col': start_col,
+                'info': interface_info,
+                'record': self.profiler.new_record(interface_info['interface_id']),
+                'hashes': hashes,
+                'reused': False,
+                'journaled': result is not None,
+                'result': result,
+                'done': result is not None
+            })
+        for _ in range(next_workers):
+            await outbox.put(None)
+
+    async def _stage(self, name: str, inbox: asyncio.Queue, outbox: asyncio.Queue,
+                     workers: int, next_workers: int, step):
+        """
+        inbox의 항목을 workers개 작업으로 step(item, 작업 번호) 처리하여 outbox로 넘깁니다.
+        처리가 끝난(done) 항목은 그대로 넘기고, 오류가 난 항목은 결과 없이 끝난 것으로 표시합니다.
+        """
+        async def worker(index: int):
+            while True:
+                item = await inbox.get()
+                if item is None:
+                    return
+                if not item['done']:
+                    try:
+                        await step(item, index)
+                    except Exception as e:
+                        print(f"Error processing interface at column {item['start_col']} ({name}): {e}")
+                        traceback.print_exc()
+                        item['result'] = None
+                        item['done'] = True
+                await outbox.put(item)
+
+        await asyncio.gather(*(worker(index) for index in range(workers)))
+        for _ in range(next_workers):
+            await outbox.put(None)
+
+    async def _write(self, run: Dict, inbox: asyncio.Queue, window: asyncio.Semaphore, write_pool):
+        """끝난 항목을 인터페이스 순서대로 기록합니다."""
+        loop = asyncio.get_running_loop()
+        pending = {}
+        next_index = 1
+        while True:
+            item = await inbox.get()
+            if item is None:
+                break
+            pending[item['index']] = item
+            while next_index in pending:
+                await loop.run_in_executor(write_pool, self._write_item, run, pending.pop(next_index))
+                window.release()
+                next_index += 1
+
+    def _fetch(self, run: Dict, item: Dict, mapper):
+        """DB 단계: 매니페스트 확인, 컬럼 비교와 SQL/필드 XML 생성"""
+        comparator = self.comparator
+        interface_info = item['info']
+        if_id = interface_info['interface_id']
+        manifest = run['manifest']
+        with self.profiler.bind(item['record']):
+            if manifest is not None:
+                with self.profiler.stage('manifest_hash'):
+                    item['hashes'] = comparator._compute_interface_hashes(
+                        interface_info, manifest.get(if_id), run['bw_tree_hash'], mapper)
+                if manifest.is_unchanged(if_id, item['hashes']):
+                    item['result'] = manifest.cached_result(if_id)
+                    item['reused'] = True
+                    item['done'] = True
+                    return
+
+            comparator.prepare_interface_info(interface_info)
+            with self.profiler.stage('excel_mapping'):
+                item['excel_results'] = process_interface(interface_info, mapper)
+            if not item['excel_results']:
+                print(f"Warning: Failed to process interface at column {item['start_col']}")
+                item['done'] = True
+
+    def _read_files(self, run: Dict, item: Dict):
+        """파일 단계: MQ/BW 파일 검색과 파싱, 처리량 설정 점검"""
+        comparator = self.comparator
+        interface_info = item['info']
+        with self.profiler.bind(item['record']):
+            with self.profiler.stage('mq_files'):
+                file_results = comparator.find_interface_files(interface_info['interface_id'])
+            matching_files, bw_queries = comparator.collect_bw_queries(interface_info)
+            item['file_results'] = file_results
+            item['bw_queries'] = bw_queries
+            item['result'] = {
+                'interface_info': interface_info,
+                'excel_results': item['excel_results'],
+                'file_results': file_results,
+                'bw_queries': bw_queries,
+                'comparisons': {'send': None, 'recv': None},
+                'warnings': {'send': [], 'recv': []},
+                'bw_files': matching_files
+            }
+            if run['audit']:
+                item['result']['throughput'] = comparator.audit_throughput(item['result'])
+            if run['manifest'] is not None:
+                item['hashes']['bw_files'] = comparator._hash_bw_files(matching_files)
+
+    def _write_item(self, run: Dict, item: Dict):
+        """기록 단계: 매니페스트 갱신과 결과 엑셀 기록 (인터페이스 순서대로 호출됨)"""
+        interface_info = item['info']
+        if_id = interface_info['interface_id']
+        manifest = run['manifest']
+        print(f"처리 중: [{item['index']}] {if_id} - {interface_info['interface_name']}")
+        if manifest is not None and item['hashes'] is not None and not item['journaled']:
+            if item['reused']:
+                run['reused_count'] += 1
+                print(f"  - 변경 없음: 이전 결과 재사용")
+            else:
+                print(f"  - 변경 항목: {', '.join(manifest.changed_keys(if_id, item['hashes']))}")
+                if not item['result']:
+                    item['hashes']['bw_files'] = self.comparator._hash_bw_files([])
+                manifest.update(if_id, item['hashes'], item['result'])
+        with self.profiler.bind(item['record']):
+            self.comparator._accept_result(run, item['index'], interface_info, item['result'], item['hashes'],
+                                           item['journaled'])
+        self.profiler.add_interface(item['record'])
@@ -0,0 +1,217 @@
+"""
+XMLComparator 실행 프로파일 모듈
+
+단계별 소요 시간(context manager)과 카운터(읽은 바이트, 파싱한 파일 수, 캐시 적중 등)를
+인터페이스 단위로 기록하고, 단계별 p50/p95/max와 캐시 적중률을 집계합니다.
+여러 인터페이스를 동시에 처리할 때(comp_pipeline)는 작업 스레드마다 bind()로 기록 대상을 지정합니다.
+프로파일을 사용하지 않을 때는 NULL_PROFILER가 아무 것도 기록하지 않습니다.
+"""
+import json
+import time
+import threading
+import datetime
+import contextlib
+from typing import Dict, List, Optional
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    nearest-rank 방식의 백분위 값을 반환합니다.
+
+    Args:
+        values (List[float]): 값 목록
+        pct (float): 백분위 (0~100)
+
+    Returns:
+        float: 백분위 값, 값이 없으면 0
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered) + 0.5)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class RunProfiler:
+    """
+    실행 단계별 시간과 카운터를 기록하는 클래스
+
+    begin_interface()와 end_interface() 사이에 기록한 값은 해당 인터페이스에,
+    그 밖의 값은 실행 전체(run) 항목에 기록됩니다.
+    bind(record)로 지정한 스레드에서는 begin_interface()와 관계없이 record에 기록합니다.
+    """
+    enabled = True
+
+    def __init__(self):
+        self.interfaces = []  # [{'if_id', 'stages': {단계: 초}, 'counters': {이름: 값}}]
+        self.run = {'stages': {}, 'counters': {}}
+        self.current = None
+        self.started_at = datetime.datetime.now().isoformat(timespec='seconds')
+        self._start = time.perf_counter()
+        self.total_seconds = 0.0
+        self.lock = threading.Lock()
+        self._local = threading.local()
+
+    def _target(self) -> Dict:
+        record = getattr(self._local, 'record', None)
+        if record is not None:
+            return record
+        return self.current if self.current is not None else self.run
+
+    @contextlib.contextmanager
+    def stage(self, name: str):
+        """with 블록의 실행 시간을 name 단계에 더합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float):
+        """다른 곳(예: 작업 프로세스)에서 잰 시간을 name 단계에 더합니다."""
+        with self.lock:
+            stages = self._target()['stages']
+            stages[name] = stages.get(name, 0.0) + seconds
+
+    def count(self, name: str, value: int = 1):
+        """카운터 값을 더합니다."""
+        with self.lock:
+            counters = self._target()['counters']
+            counters[name] = counters.get(name, 0) + value
+
+    def new_record(self, if_id: str) -> Dict:
+        """bind()/add_interface()에 사용할 인터페이스 기록을 만듭니다."""
+        return {'if_id': if_id, 'stages': {}, 'counters': {}}
+
+    @contextlib.contextmanager
+    def bind(self, record: Dict):
+        """with 블록 동안 현재 스레드의 기록을 record에 합니다."""
+        previous = getattr(self._local, 'record', None)
+        self._local.record = record
+        try:
+            yield
+        finally:
+            self._local.record = previous
+
+    def add_interface(self, record: Dict):
+        """bind()로 기록을 마친 인터페이스를 추가합니다."""
+        self.interfaces.append(record)
+
+    def begin_interface(self, if_id: str):
+        """인터페이스 단위 기록을 시작합니다."""
+        self.current = self.new_record(if_id)
+
+    def end_interface(self):
+        """인터페이스 단위 기록을 마칩니다."""
+        if self.current is not None:
+            self.interfaces.append(self.current)
+        self.current = None
+
+    def finish(self):
+        """전체 실행 시간을 기록합니다."""
+        self.total_seconds = time.perf_counter() - self._start
+
+    def summary(self) -> Dict:
+        """
+        단계별 집계 결과를 반환합니다.
+
+        Returns:
+            Dict: {
+                'started_at', 'total_seconds', 'interface_count',
+                'stages': {단계: {'count', 'total', 'p50', 'p95', 'max'}},  # 인터페이스 단위 분포
+                'run_stages': {단계: 초},  # 인터페이스 밖에서 실행된 단계
+                'counters': {이름: 합계},
+                'cache_hit_rates': {캐시명: 적중률}
+            }
+        """
+        stage_values = {}
+        counters = dict(self.run['counters'])
+        for record in self.interfaces:
+            for name, seconds in record['stages'].items():
+                stage_values.setdefault(name, []).append(seconds)
+            for name, value in record['counters'].items():
+                counters[name] = counters.get(name, 0) + value
+
+        stages = {}
+        for name, values in stage_values.items():
+            stages[name] = {
+                'count': len(values),
+                'total': round(sum(values), 4),
+                'p50': round(percentile(values, 50), 4),
+                'p95': round(percentile(values, 95), 4),
+                'max': round(max(values), 4)
+            }
+
+        # '<캐시>_hit' / '<캐시>_miss' 카운터로 적중률 계산
+        cache_hit_rates = {}
+        for name in counters:
+            if name.endswith('_hit'):
+                cache = name[:-len('_hit')]
+                total = counters[name] + counters.get(cache + '_miss', 0)
+                cache_hit_rates[cache] = round(counters[name] / total, 4) if total else 0.0
+        for name in counters:
+            if name.endswith('_miss') and name[:-len('_miss')] not in cache_hit_rates:
+                cache_hit_rates[name[:-len('_miss')]] = 0.0
+
+        return {
+            'started_at': self.started_at,
+            'total_seconds': round(self.total_seconds, 4),
+            'interface_count': len(self.interfaces),
+            'stages': stages,
+            'run_stages': {name: round(seconds, 4) for name, seconds in self.run['stages'].items()},
+            'counters': counters,
+            'cache_hit_rates': cache_hit_rates
+        }
+
+    def to_dict(self) -> Dict:
+        """집계 결과와 인터페이스별 기록을 함께 반환합니다."""
+        data = self.summary()
+        data['interfaces'] = [
+            {
+                'if_id': record['if_id'],
+                'stages': {name: round(seconds, 4) for name, seconds in record['stages'].items()},
+                'counters': record['counters']
+            }
+            for record in self.interfaces
+        ]
+        return data
+
+    def write_json(self, path: str):
+        """프로파일을 JSON 파일로 저장합니다."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=1)
+
+
+class NullProfiler:
+    """프로파일을 사용하지 않을 때의 기록하지 않는 프로파일러"""
+    enabled = False
+
+    def stage(self, name: str):
+        return contextlib.nullcontext()
+
+    def add_time(self, name: str, seconds: float):
+        pass
+
+    def count(self, name: str, value: int = 1):
+        pass
+
+    def new_record(self, if_id: str):
+        return None
+
+    def bind(self, record):
+        return contextlib.nullcontext()
+
+    def add_interface(self, record):
+        pass
+
+    def begin_interface(self, if_id: str):
+        pass
+
+    def end_interface(self):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_PROFILER = NullProfiler()
@@ -4,6 +4,8 @@ from typing import Dict, List, Tuple, Optional
 import os
 import argparse
 
+from bw_graph import BWProcessGraph
+
 class QueryDifference:
     def __init__(self):
         self.is_equal = True
@@ -25,6 +27,25 @@ class QueryDifference:
         
         return "불일치"
 
+    def to_dict(self) -> Dict:
+        """JSON으로 저장할 수 있는 딕셔너리로 변환합니다."""
+        return {
+            'is_equal': self.is_equal,
+            'differences': list(self.differences),
+            'query_type': self.query_type,
+            'table_name': self.table_name
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'QueryDifference':
+        """to_dict()로 저장한 딕셔너리에서 객체를 복원합니다."""
+        diff = cls()
+        diff.is_equal = data.get('is_equal', True)
+        diff.differences = list(data.get('differences', []))
+        diff.query_type = data.get('query_type')
+        diff.table_name = data.get('table_name')
+        return diff
+
 class QueryParser:
     # 특수 컬럼 정의를 클래스 변수로 변경
     special_columns = {
@@ -567,6 +588,33 @@ class QueryParser:
                         
         return warnings
 
+    def compare_interface_queries(self, mq_queries: Dict[str, str],
+                                  bw_queries: Dict[str, str]) -> Tuple[Dict, Dict]:
+        """
+        인터페이스의 MQ XML 송수신 쿼리를 BW 쿼리와 비교하고 특수 컬럼을 점검합니다.
+        한쪽 쿼리가 없는 방향은 비교하지 않습니다.
+
+        Args:
+            mq_queries (Dict[str, str]): {'send': MQ 송신 쿼리, 'recv': MQ 수신 쿼리}
+            bw_queries (Dict[str, str]): {'send': BW 송신 쿼리, 'recv': BW 수신 쿼리}
+
+        Returns:
+            Tuple[Dict, Dict]: ({방향: QueryDifference 또는 None}, {방향: 경고 메시지 리스트})
+        """
+        comparisons = {'send': None, 'recv': None}
+        warnings = {'send': [], 'recv': []}
+        for direction in ('send', 'recv'):
+            if not mq_queries.get(direction) or not bw_queries.get(direction):
+                continue
+            try:
+                comparisons[direction] = self.compare_queries(mq_queries[direction], bw_queries[direction])
+                warnings[direction].extend(self.check_special_columns(mq_queries[direction], direction))
+            except Exception as e:
+                print(f"Error comparing {direction} queries: {e}")
+                print(f"MQ query: {mq_queries[direction]}")
+                print(f"BW query: {bw_queries[direction]}")
+        return comparisons, warnings
+
     def clean_select_query(self, query):
         """
         Clean SELECT query by removing WHERE clause
@@ -646,14 +694,19 @@ class QueryParser:
         
         return True
 
-    def find_files_by_table(self, folder_path: str, table_name: str, skip_meaningless: bool = True) -> dict:
+    def find_files_by_table(self, folder_path: str, table_name: str, skip_meaningless: bool = True,
+                            stats: dict = None) -> dict:
         """
-        Find files containing queries that reference the specified table
+        Find files containing queries that reference the specified table.
+        Each XML file is first checked with a case-insensitive byte search for the table
+        name (FileSearcher.file_mentions); only files that mention it are parsed.
         
         Args:
             folder_path (str): Path to the folder to search in
             table_name (str): Name of the DB table to search for
             skip_meaningless (bool): If True, skip queries that appear to be meaningless
+            stats (dict, optional): If given, 'files_scanned', 'files_skipped' (no byte match)
+                and 'files_parsed' counts are added to it
             
         Returns:
             dict: Dictionary with 'select' and 'insert' as keys, each containing a list of tuples
@@ -665,13 +718,13 @@ class QueryParser:
             'select': [],
             'insert': []
         }
+        if stats is None:
+            stats = {}
         
-        # Normalize table name for comparison
+        # Byte patterns for the prefilter, then normalize table name for comparison
+        prefilter = FileSearcher.mention_patterns(table_name)
         table_name = table_name.lower()
         
-        # Create parser instance for processing files
-        parser = self
-        
         # Walk through all files in the folder
         for root, _, files in os.walk(folder_path):
             for file in files:
@@ -681,8 +734,14 @@ class QueryParser:
                 if not file_path.lower().endswith('.xml'):
                     continue
                     
+                stats['files_scanned'] = stats.get('files_scanned', 0) + 1
                 try:
+                    if not FileSearcher.file_mentions(file_path, prefilter):
+                        stats['files_skipped'] = stats.get('files_skipped', 0) + 1
+                        continue
+                        
                     # Try to parse queries from the file
+                    stats['files_parsed'] = stats.get('files_parsed', 0) + 1
                     select_queries, insert_queries = self.parse_xml_file(file_path)
                     
                     # Check SELECT queries
@@ -1363,46 +1422,231 @@ class BWQueryExtractor:
             
         except Exception as e:
             print(f"쿼리 추출 중 오류 발생: {e}")
-            return ""  # 오류 발생 시 빈 문자열 반환        
+            return ""  # 오류 발생 시 빈 문자열 반환
+
+    def extract_throughput_settings(self, xml_path: str) -> Dict[str, List[Dict]]:
+        """
+        BW XML 파일에서 처리량에 영향을 주는 설정을 추출
+        값은 XML 그대로의 문자열이며 전역 변수(%%...%%)는 해석하지 않음
+
+        Args:
+            xml_path (str): XML 파일 경로
+
+        Returns:
+            Dict[str, List[Dict]]: {
+                'jdbc': [{'name', 'kind'(query/update), 'group', 'in_loop', 'maxRows', 'timeout', 'commit', 'for_each',
+                          'per_row'(조회 결과를 한 행씩 도는 루프 안)}],
+                'sleeps': [{'name', 'group', 'in_loop', 'interval'}]
+            }
+        """
+        try:
+            return BWProcessGraph.from_file(xml_path).throughput_settings()
+        except ET.ParseError as e:
+            print(f"XML 파싱 오류: {e}")
+            return {'jdbc': [], 'sleeps': []}
 
 class FileSearcher:
+    # Encodings tried for each keyword, in order (Korean adapter exports are often EUC-KR/CP949)
+    CANDIDATE_ENCODINGS = ('utf-8', 'cp949')
+    # Bytes decoded before a byte-pattern hit to confirm it (see _decodes_at)
+    MATCH_WINDOW = 256
+
     @staticmethod
-    def find_files_with_keywords(folder_path: str, keywords: list) -> dict:
+    def keyword_patterns(keywords: list, encodings: tuple = None) -> dict:
         """
-        Search for files in the given folder that contain any of the specified keywords
+        Encode each keyword once per candidate encoding
+        
+        Args:
+            keywords (list): Keywords to search for
+            encodings (tuple, optional): Candidate encodings, defaults to CANDIDATE_ENCODINGS
+            
+        Returns:
+            dict: {keyword: [(encodings, encoded bytes)]}, one entry per distinct byte pattern
+                with every encoding that produces it (e.g. ('utf-8', 'cp949') for ASCII keywords)
+        """
+        patterns = {}
+        for keyword in keywords:
+            candidates = {}
+            for encoding in encodings or FileSearcher.CANDIDATE_ENCODINGS:
+                try:
+                    pattern = keyword.encode(encoding)
+                except UnicodeEncodeError:
+                    continue
+                if pattern:
+                    candidates.setdefault(pattern, []).append(encoding)
+            patterns[keyword] = [(tuple(names), pattern) for pattern, names in candidates.items()]
+        return patterns
+
+    @staticmethod
+    def _decodes_at(data, pos: int, pattern: bytes, keyword: str, encoding: str) -> bool:
+        """
+        Check that a byte match at pos is the keyword itself in the given encoding and not bytes
+        straddling multi-byte characters.
+        An ASCII pattern right after an ASCII byte (or at the start of the file) is accepted without
+        decoding: an ASCII byte is never a lead byte in UTF-8 or CP949, so the match starts a character.
+        Otherwise only a bounded window before the match is decoded: it starts after the nearest byte
+        below 0x41, which is never a continuation byte in UTF-8 nor a trail byte in CP949, or
+        MATCH_WINDOW bytes back if there is none. A window cut that way may start inside a character:
+        UTF-8 skips the leading continuation bytes (self-synchronising), CP949 drops a leading partial
+        character by also trying the window one byte later.
+        """
+        if pattern.isascii() and (pos == 0 or data[pos - 1] < 0x80):
+            return True
+        lo = max(0, pos - FileSearcher.MATCH_WINDOW)
+        window = data[lo:pos + len(pattern)]
+        start = len(window) - len(pattern)
+        while start > 0 and window[start - 1] >= 0x41:
+            start -= 1
+        starts = [start]
+        if start == 0 and lo > 0:
+            if encoding.replace('_', '-').lower() in ('utf-8', 'utf8'):
+                while start < len(window) - len(pattern) and 0x80 <= window[start] <= 0xBF:
+                    start += 1
+                starts = [start]
+            else:
+                starts = [0, 1]
+        for start in starts:
+            try:
+                if window[start:].decode(encoding).endswith(keyword):
+                    return True
+            except UnicodeDecodeError:
+                continue
+        return False
+
+    @staticmethod
+    def match_file(file_path: str, patterns: dict, stats: dict = None) -> list:
+        """
+        Memory-map a file and return the keywords whose encoded bytes occur in it.
+        Each hit is confirmed by decoding a small window around it in the encodings that
+        produce the pattern (see _decodes_at), so matches that straddle multi-byte
+        characters are ruled out without decoding the whole file.
+        
+        Args:
+            file_path (str): File to scan
+            patterns (dict): keyword_patterns() result
+            stats (dict, optional): If given, 'files_scanned', 'bytes_read' and 'windows_decoded' are added to it
+            
+        Returns:
+            list: Matched keywords
+            
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        import mmap
+        
+        found = []
+        with open(file_path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if stats is not None:
+                stats['files_scanned'] = stats.get('files_scanned', 0) + 1
+                stats['bytes_read'] = stats.get('bytes_read', 0) + size
+            if size == 0:
+                return found
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                for keyword, candidates in patterns.items():
+                    if FileSearcher._find_keyword(data, keyword, candidates, stats):
+                        found.append(keyword)
+        return found
+
+    @staticmethod
+    def _find_keyword(data, keyword: str, candidates: list, stats: dict = None) -> bool:
+        """Check one keyword for match_file(): confirm each occurrence of its byte patterns in the candidate encodings"""
+        for encodings, pattern in candidates:
+            pos = data.find(pattern)
+            while pos != -1:
+                for encoding in encodings:
+                    if stats is not None:
+                        stats['windows_decoded'] = stats.get('windows_decoded', 0) + 1
+                    if FileSearcher._decodes_at(data, pos, pattern, keyword, encoding):
+                        return True
+                pos = data.find(pattern, pos + 1)
+        return False
+
+    @staticmethod
+    def mention_patterns(keyword: str) -> list:
+        """
+        Compile case-insensitive byte patterns of a keyword for each candidate encoding
+        
+        Args:
+            keyword (str): Keyword to search for (e.g. a table name)
+            
+        Returns:
+            list: Compiled bytes regular expressions for file_mentions()
+        """
+        return [re.compile(re.escape(pattern), re.IGNORECASE)
+                for _, pattern in FileSearcher.keyword_patterns([keyword])[keyword]]
+
+    @staticmethod
+    def file_mentions(file_path: str, regexes: list) -> bool:
+        """
+        Check whether a memory-mapped file matches any of the byte patterns, without decoding it
+        
+        Args:
+            file_path (str): File to check
+            regexes (list): mention_patterns() result
+            
+        Returns:
+            bool: True if any pattern occurs in the file
+            
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        import mmap
+        
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return any(regex.search(data) for regex in regexes)
+
+    @staticmethod
+    def find_files_with_keywords(folder_path: str, keywords: list, stats: dict = None,
+                                 content_index=None) -> dict:
+        """
+        Search for files in the given folder that contain any of the specified keywords.
+        Files are scanned as bytes for each candidate encoding (see match_file), so
+        non-UTF-8 files are searched instead of being skipped.
         
         Args:
             folder_path (str): Path to the folder to search in
             keywords (list): List of keywords to search for
+            stats (dict, optional): If given, 'files_scanned', 'files_skipped', 'files_deduped',
+                'windows_decoded' and 'bytes_read' counts are added to it
+            content_index (ContentIndex, optional): If given, byte-identical copies are scanned
+                once and the result of their canonical file is reused
             
         Returns:
             dict: Dictionary with keyword as key and list of matching files as value
         """
-        import os
-        
         # Initialize results dictionary
         results = {keyword: [] for keyword in keywords}
+        patterns = FileSearcher.keyword_patterns(keywords)
+        scanned = {}  # {canonical path: matched keywords}
         
         # Walk through all files in the folder
         for root, _, files in os.walk(folder_path):
             for file in files:
                 file_path = os.path.join(root, file)
+                canonical = content_index.canonical(file_path) if content_index is not None else file_path
                 
-                try:
-                    # Try to read file content
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        
-                    # Check for each keyword
-                    for keyword in keywords:
-                        if keyword in content:
-                            # Store relative path instead of full path
-                            rel_path = os.path.relpath(file_path, folder_path)
-                            results[keyword].append(rel_path)
-                            
-                except (UnicodeDecodeError, IOError):
-                    # Skip files that can't be read as text
-                    continue
+                if canonical in scanned:
+                    matched = scanned[canonical]
+                    if stats is not None:
+                        stats['files_deduped'] = stats.get('files_deduped', 0) + 1
+                else:
+                    try:
+                        matched = FileSearcher.match_file(canonical, patterns, stats)
+                    except (OSError, ValueError):
+                        # Skip files that can't be opened or mapped
+                        if stats is not None:
+                            stats['files_skipped'] = stats.get('files_skipped', 0) + 1
+                        continue
+                    if content_index is not None:
+                        scanned[canonical] = matched
+                    
+                for keyword in matched:
+                    # Store relative path instead of full path
+                    results[keyword].append(os.path.relpath(file_path, folder_path))
         
         return results
 
@@ -1456,8 +1700,12 @@ if __name__ == "__main__":
     query_parser = QueryParser()
     
     if args.command == "find_table":
-        table_results = query_parser.find_files_by_table(args.folder_path, args.table_name)
+        search_stats = {}
+        table_results = query_parser.find_files_by_table(args.folder_path, args.table_name, stats=search_stats)
         query_parser.print_table_search_results(table_results, args.table_name)
+        print(f"Scanned {search_stats.get('files_scanned', 0)} XML files: "
+              f"{search_stats.get('files_skipped', 0)} skipped by byte search, "
+              f"{search_stats.get('files_parsed', 0)} parsed")
     elif args.command == "compare":
         comparison_results = query_parser.compare_mq_bw_queries(args.mq_xml, args.bw_xml)
         print("\nComparison Results Summary:")
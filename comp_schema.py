@@ -0,0 +1,291 @@
+"""
+송신/수신 테이블 정의 일괄 비교(스키마 비교) 모듈
+
+워크북의 모든 인터페이스가 사용하는 테이블을 DB 접속 정보별로 모아
+접속마다 한 번의 일괄 조회(MetadataProvider.get_tables)로 전체 테이블 정의를 가져와
+ColumnMapper.schema_catalog에 채운 뒤, 컬럼 단위 조회 없이 컬럼명 집합 연산으로
+송신/수신 테이블 정의를 비교합니다.
+
+보고 항목:
+    - 테이블 없음: 카탈로그에 컬럼이 하나도 없는 송신/수신 테이블
+    - 삭제된 컬럼: 매핑에는 있지만 테이블에 없는 컬럼
+    - 수신 없는 송신 컬럼: 수신 테이블에 같은 이름이 없고 매핑되지도 않은 송신 컬럼
+    - 미매핑 NOT NULL: 매핑되지 않았고 자동 입력(EAI 표준 컬럼)도 아닌 수신 NOT NULL 컬럼
+    - 크기 축소: 매핑된 컬럼 쌍과 이름이 같은 컬럼 쌍 중 수신 크기가 더 작은 컬럼
+
+    python comp_schema.py --input input.xlsx --output schema_diff.xlsx
+"""
+import argparse
+import time
+from typing import Dict, List, Tuple
+
+from comp_columns import load_interfaces, prepare_interfaces
+from metadata_provider import MetadataProvider, OracleMetadataProvider
+
+# 수신 INSERT 생성 시 자동으로 값을 넣는 컬럼 (maptest.generate_receive_insert_into)
+RECV_AUTO_COLUMNS = frozenset(['EAI_SEQ_ID', 'DATA_INTERFACE_TYPE_CODE', 'EAI_INTERFACE_DATE', 'APPLICATION_TRANSFER_FLAG'])
+# 송신 테이블의 EAI 표준 컬럼 (송신 SELECT에서 자동 처리, 수신 없는 송신 컬럼에서 제외)
+SEND_AUTO_COLUMNS = frozenset(['EAI_SEQ_ID', 'DATA_INTERFACE_TYPE_CODE', 'EAI_TRANSFER_FLAG', 'EAI_TRANSFER_DATE'])
+
+TABLE_MISSING = "테이블 없음"
+DROPPED_COLUMN = "삭제된 컬럼"
+SEND_ONLY = "수신 없는 송신 컬럼"
+UNMAPPED_NOT_NULL = "미매핑 NOT NULL"
+SIZE_REGRESSION = "크기 축소"
+
+FINDING_HEADERS = ['No', 'IF ID', 'IF NAME', '구분', '송신 컬럼', '수신 컬럼', '내용']
+SUMMARY_HEADERS = ['IF ID', 'IF NAME', '송신 테이블', '수신 테이블',
+                   TABLE_MISSING, DROPPED_COLUMN, SEND_ONLY, UNMAPPED_NOT_NULL, SIZE_REGRESSION, '오류']
+
+
+def load_catalog(interfaces: List[Dict], mapper) -> Dict[Tuple[str, str, str], str]:
+    """
+    인터페이스가 사용하는 모든 테이블 정의를 DB 접속 정보별 일괄 조회로 스키마 카탈로그에 채웁니다.
+    이미 카탈로그에 있는 테이블은 다시 조회하지 않습니다.
+
+    Args:
+        interfaces (List[Dict]): read_interface_block() 결과 목록
+        mapper (ColumnMapper): 접속/카탈로그에 사용할 매퍼
+
+    Returns:
+        Dict[Tuple[str, str, str], str]: 조회에 실패한 접속 정보 {(sid, username, password): 오류 메시지}
+    """
+    if mapper.schema_catalog is None:
+        mapper.schema_catalog = {}
+
+    # (sid, username, password) -> [(owner, table_name)]
+    tables_by_login = {}
+    for interface_info in interfaces:
+        for side in (interface_info['send'], interface_info['recv']):
+            db_info = side.get('db_info')
+            if not db_info or not (side.get('owner') and side.get('table_name')):
+                continue
+            login = (db_info.get('sid', ''), db_info.get('username', ''), db_info.get('password', ''))
+            if (login[0], login[1], side['owner'], side['table_name']) in mapper.schema_catalog:
+                continue
+            tables_by_login.setdefault(login, {})[(side['owner'], side['table_name'])] = None
+
+    failures = {}
+    for login, tables in tables_by_login.items():
+        connection = None
+        try:
+            connection = mapper.connect_db(*login)
+            provider = connection if isinstance(connection, MetadataProvider) else OracleMetadataProvider(connection)
+            with mapper.profiler.stage('column_metadata'):
+                definitions = provider.get_tables(list(tables))
+            mapper.profiler.count('bulk_column_queries')
+        except Exception as e:
+            print(f"Warning: {login[0]}/{login[1]} 테이블 정의 조회 실패: {str(e)}")
+            failures[login] = str(e)
+            continue
+        finally:
+            if connection is not None and connection is not mapper.metadata_provider:
+                try:
+                    connection.close()
+                except:
+                    pass
+        for (owner, table_name), columns in definitions.items():
+            mapper.schema_catalog[(login[0], login[1], owner, table_name)] = columns
+    return failures
+
+
+def _mapped_pairs(interface_info: Dict) -> List[Tuple[str, str]]:
+    """같은 행에 송신/수신 컬럼이 모두 있는 매핑 쌍"""
+    pairs = []
+    for send_col, recv_col in zip(interface_info['send']['columns'], interface_info['recv']['columns']):
+        send_col = (send_col or '').strip()
+        recv_col = (recv_col or '').strip()
+        if send_col and recv_col:
+            pairs.append((send_col, recv_col))
+    return pairs
+
+
+def diff_interface(entry: Dict, catalog: Dict, rules) -> List[Dict]:
+    """
+    인터페이스 하나의 송신/수신 테이블 정의를 컬럼명 집합 연산으로 비교합니다.
+
+    Args:
+        entry (Dict): prepare_interfaces() 결과 항목
+        catalog (Dict): 스키마 카탈로그
+        rules (CompiledRules): 크기 비교 규칙
+
+    Returns:
+        List[Dict]: [{'category', 'send_column', 'recv_column', 'detail'}]
+    """
+    findings = []
+
+    def add(category, send_column='', recv_column='', detail=''):
+        findings.append({'category': category, 'send_column': send_column,
+                         'recv_column': recv_column, 'detail': detail})
+
+    send_cols = catalog.get(entry['send_key']) or {}
+    recv_cols = catalog.get(entry['recv_key']) or {}
+    if not send_cols:
+        add(TABLE_MISSING, detail=f"송신 테이블 {entry['send_key'][2]}.{entry['send_key'][3]}")
+    if not recv_cols:
+        add(TABLE_MISSING, detail=f"수신 테이블 {entry['recv_key'][2]}.{entry['recv_key'][3]}")
+    if not (send_cols and recv_cols):
+        return findings
+
+    mapped_send = set(entry['send_mapping'])
+    mapped_recv = set(entry['recv_mapping'])
+
+    # 매핑에는 있지만 테이블에 없는 컬럼
+    for column in entry['send_mapping']:
+        if column in mapped_send - send_cols.keys():
+            add(DROPPED_COLUMN, send_column=column, detail="송신 테이블에 없음")
+    for column in entry['recv_mapping']:
+        if column in mapped_recv - recv_cols.keys():
+            add(DROPPED_COLUMN, recv_column=column, detail="수신 테이블에 없음")
+
+    # 수신 테이블에 같은 이름이 없고 매핑되지도 않은 송신 컬럼 (테이블 컬럼 순서)
+    send_only = send_cols.keys() - recv_cols.keys() - mapped_send - SEND_AUTO_COLUMNS
+    for column in send_cols:
+        if column in send_only:
+            add(SEND_ONLY, send_column=column, detail=f"{send_cols[column]['type']}({send_cols[column]['size']})")
+
+    # 값이 들어가지 않는 수신 NOT NULL 컬럼
+    unmapped = recv_cols.keys() - mapped_recv - RECV_AUTO_COLUMNS
+    for column, info in recv_cols.items():
+        if column in unmapped and info['nullable'] == 'N':
+            add(UNMAPPED_NOT_NULL, recv_column=column, detail=f"{info['type']}({info['size']}) NOT NULL")
+
+    # 크기 축소: 매핑 쌍 + 매핑되지 않은 같은 이름 컬럼 쌍
+    pairs = _mapped_pairs(entry['info'])
+    same_named = (send_cols.keys() & recv_cols.keys()) - mapped_send - mapped_recv
+    pairs.extend((column, column) for column in send_cols if column in same_named)
+    for send_col, recv_col in pairs:
+        if send_col not in send_cols or recv_col not in recv_cols:
+            continue
+        diff = rules.size_diff(send_cols[send_col], recv_cols[recv_col])
+        if diff:
+            add(SIZE_REGRESSION, send_column=send_col, recv_column=recv_col, detail=diff)
+    return findings
+
+
+def diff_schemas(interfaces: List[Dict], mapper) -> List[Dict]:
+    """
+    모든 인터페이스의 송신/수신 테이블 정의를 비교합니다.
+
+    Args:
+        interfaces (List[Dict]): read_interface_block() 결과 목록
+        mapper (ColumnMapper): 접속/카탈로그/규칙에 사용할 매퍼
+
+    Returns:
+        List[Dict]: 인터페이스별 {'info', 'send_key', 'recv_key', 'findings', 'errors'}
+    """
+    failures = load_catalog(interfaces, mapper)
+    # 카탈로그가 채워져 있으므로 prepare_interfaces()는 DB를 다시 조회하지 않음 (실패한 접속만 재시도)
+    entries = prepare_interfaces(interfaces, mapper)
+
+    results = []
+    for entry in entries:
+        errors = list(entry['errors'])
+        for direction in ('send', 'recv'):
+            db_info = entry['info'][direction].get('db_info') or {}
+            message = failures.get((db_info.get('sid', ''), db_info.get('username', ''), db_info.get('password', '')))
+            if message and message not in errors:
+                errors.append(message)
+        findings = [] if errors else diff_interface(entry, mapper.schema_catalog, mapper.rules)
+        results.append({
+            'info': entry['info'],
+            'send_key': entry['send_key'],
+            'recv_key': entry['recv_key'],
+            'findings': findings,
+            'errors': errors
+        })
+    return results
+
+
+def write_schema_report(output_path: str, results: List[Dict]):
+    """
+    스키마 비교 결과를 '스키마 요약'/'스키마 비교' 시트로 작성합니다.
+
+    Args:
+        output_path (str): 결과 엑셀 경로
+        results (List[Dict]): diff_schemas() 결과
+    """
+    import openpyxl
+    from openpyxl.styles import Font, PatternFill
+
+    header_font = Font(bold=True)
+    header_fill = PatternFill(start_color='DDEBF7', end_color='DDEBF7', fill_type='solid')
+
+    wb = openpyxl.Workbook()
+    summary = wb.active
+    summary.title = '스키마 요약'
+    detail = wb.create_sheet('스키마 비교')
+    for sheet, headers in ((summary, SUMMARY_HEADERS), (detail, FINDING_HEADERS)):
+        sheet.append(headers)
+        for cell in sheet[1]:
+            cell.font = header_font
+            cell.fill = header_fill
+        sheet.freeze_panes = 'A2'
+
+    categories = SUMMARY_HEADERS[4:9]
+    num = 0
+    for result in results:
+        info = result['info']
+        counts = {category: 0 for category in categories}
+        for finding in result['findings']:
+            counts[finding['category']] += 1
+            num += 1
+            detail.append([num, info['interface_id'], info['interface_name'], finding['category'],
+                           finding['send_column'], finding['recv_column'], finding['detail']])
+        summary.append([
+            info['interface_id'], info['interface_name'],
+            f"{result['send_key'][2]}.{result['send_key'][3]}",
+            f"{result['recv_key'][2]}.{result['recv_key'][3]}",
+            *[counts[category] for category in categories],
+            '\n'.join(result['errors'])
+        ])
+
+    for sheet, widths in ((summary, [15, 30, 30, 30, 12, 12, 18, 16, 12, 40]),
+                          (detail, [6, 15, 30, 18, 25, 25, 40])):
+        for index, width in enumerate(widths):
+            sheet.column_dimensions[openpyxl.utils.get_column_letter(index + 1)].width = width
+    wb.save(output_path)
+    wb.close()
+
+
+def compare_schema_workbook(input_path: str, output_path: str, mapper=None) -> Dict:
+    """
+    입력 워크북의 모든 인터페이스에 대해 스키마 비교를 실행하고 결과 엑셀을 작성합니다.
+
+    Args:
+        input_path (str): 인터페이스 정보 엑셀 경로
+        output_path (str): 결과 엑셀 경로
+        mapper (ColumnMapper, optional): 컬럼 정보 조회용 매퍼, 없으면 새로 생성
+
+    Returns:
+        Dict: {'interfaces', 'tables', 'findings', 'errors', 'elapsed'}
+    """
+    from maptest import ColumnMapper
+
+    start = time.perf_counter()
+    mapper = mapper or ColumnMapper()
+    results = diff_schemas(load_interfaces(input_path), mapper)
+    write_schema_report(output_path, results)
+    return {
+        'interfaces': len(results),
+        'tables': len(mapper.schema_catalog),
+        'findings': sum(len(result['findings']) for result in results),
+        'errors': sum(1 for result in results if result['errors']),
+        'elapsed': time.perf_counter() - start
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='송신/수신 테이블 정의 일괄 비교')
+    parser.add_argument('--input', default='input.xlsx', help='인터페이스 정보 엑셀 파일')
+    parser.add_argument('--output', default='schema_diff.xlsx', help='결과 엑셀 파일')
+    args = parser.parse_args()
+
+    summary = compare_schema_workbook(args.input, args.output)
+    print(f"총 인터페이스: {summary['interfaces']}, 테이블: {summary['tables']}, "
+          f"발견 항목: {summary['findings']}, 오류 인터페이스: {summary['errors']} "
+          f"({summary['elapsed']:.2f}초)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,431 @@
+"""
+MQ XML / BW XML 비교 감시(데몬) 모드
+
+파일 목록, 파싱한 XML, 테이블 컬럼 정보(스키마 카탈로그)를 메모리에 유지한 채
+입력 엑셀, MQ XML 디렉토리, BW 디렉토리를 주기적으로 확인하여
+변경된 파일에 영향을 받는 인터페이스만 다시 비교합니다.
+비교 결과는 로컬 HTTP 엔드포인트로 조회할 수 있습니다.
+
+    python comp_watch.py --port 8765 --interval 5
+
+    GET  /status            감시 상태
+    GET  /results           전체 인터페이스 요약
+    GET  /results/<IF_ID>   인터페이스 상세 결과
+    POST /refresh           즉시 변경 확인, 테이블 컬럼 정보도 다시 조회 (?all=1 이면 전체 재비교)
+"""
+import os
+import copy
+import json
+import time
+import datetime
+import argparse
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, unquote
+from typing import Dict, List, Optional, Set
+
+import openpyxl
+
+from comp_xml import XMLComparator, read_interface_block
+from comp_q import FileSearcher
+from adapter_model import file_signature
+from comp_manifest import hash_object, result_to_dict
+
+
+class BWKeywordIndex:
+    """
+    BW 디렉토리의 파일 목록과 키워드별 매칭 결과를 메모리에 유지하는 인덱스
+    FileSearcher.find_files_with_keywords()와 같은 결과를 반환하지만,
+    파일이 바뀐 경우에만 해당 파일을 다시 읽습니다.
+    """
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root (str): BW 파일 검색 디렉토리
+        """
+        self.root = root
+        self.files = {}  # {상대경로: (mtime, size)}
+        self.order = []  # os.walk 순서의 상대경로 목록
+        self.matches = {}  # {키워드: 매칭된 상대경로 set}
+        self.lock = threading.Lock()
+
+    def _match(self, rel_path: str, keywords: List[str]) -> List[str]:
+        """파일에 들어 있는 키워드 목록 (FileSearcher.match_file), 읽을 수 없으면 빈 목록"""
+        try:
+            return FileSearcher.match_file(os.path.join(self.root, rel_path), FileSearcher.keyword_patterns(keywords))
+        except (OSError, ValueError):
+            return []
+
+    def refresh(self) -> Set[str]:
+        """
+        디렉토리를 다시 확인하여 추가/변경/삭제된 파일을 인덱스에 반영합니다.
+
+        Returns:
+            Set[str]: 추가/변경/삭제된 파일의 상대경로
+        """
+        current = {}
+        order = []
+        for root, _, files in os.walk(self.root):
+            for file in files:
+                full_path = os.path.join(root, file)
+                rel_path = os.path.relpath(full_path, self.root)
+                current[rel_path] = file_signature(full_path)
+                order.append(rel_path)
+
+        with self.lock:
+            removed = set(self.files) - set(current)
+            changed = {path for path, sig in current.items() if self.files.get(path) != sig}
+
+            for path in removed:
+                for matched in self.matches.values():
+                    matched.discard(path)
+
+            # 변경된 파일만 다시 읽어 알려진 키워드와 대조
+            if self.matches:
+                for path in changed:
+                    found = set(self._match(path, list(self.matches)))
+                    for keyword, matched in self.matches.items():
+                        if keyword in found:
+                            matched.add(path)
+                        else:
+                            matched.discard(path)
+
+            self.files = current
+            self.order = order
+        return changed | removed
+
+    def find(self, keyword: str) -> List[str]:
+        """
+        키워드를 포함하는 파일의 상대경로 목록을 반환합니다.
+        처음 조회하는 키워드는 전체 파일을 한 번 검색합니다.
+
+        Args:
+            keyword (str): 검색 키워드
+
+        Returns:
+            List[str]: os.walk 순서의 상대경로 목록
+        """
+        with self.lock:
+            if keyword not in self.matches:
+                matched = set()
+                patterns = FileSearcher.keyword_patterns([keyword])
+                for path in self.order:
+                    try:
+                        if FileSearcher.match_file(os.path.join(self.root, path), patterns):
+                            matched.add(path)
+                    except (OSError, ValueError):
+                        continue
+                self.matches[keyword] = matched
+            matched = self.matches[keyword]
+            return [path for path in self.order if path in matched]
+
+
+class ComparisonDaemon:
+    """
+    XMLComparator를 유지한 채 입력 변경을 감지하여 영향받는 인터페이스만 재비교하는 클래스
+    """
+
+    def __init__(self, excel_path: str, xml_dir: str, bw_dir: str, interval: float = 5.0):
+        """
+        Args:
+            excel_path (str): 인터페이스 정보 엑셀 파일 경로
+            xml_dir (str): MQ XML 파일 디렉토리
+            bw_dir (str): BW XML 파일 디렉토리
+            interval (float): 변경 확인 주기(초)
+        """
+        XMLComparator.BW_SEARCH_DIR = bw_dir
+        self.excel_path = excel_path
+        self.xml_dir = xml_dir
+        self.interval = interval
+
+        self.comparator = XMLComparator(excel_path, xml_dir)
+        self.comparator.mapper.schema_catalog = {}
+        self.comparator.bw_index = BWKeywordIndex(bw_dir)
+
+        self.lock = threading.Lock()  # poll() 직렬화
+        self.results_lock = threading.Lock()  # 결과 조회/갱신 보호
+        self.blocks = {}  # {if_id: {'start_col': int, 'info': dict, 'hash': str}}
+        self.results = {}  # {if_id: {'result': dict, 'updated_at': str, 'bw_files': list}}
+        self.xml_signatures = {}  # {파일명: (mtime, size)}
+        self.excel_signature = file_signature(excel_path)
+        self.poll_count = 0
+        self.last_poll = None
+        self.last_changed = []
+        self._stop = threading.Event()
+
+    def _read_blocks(self) -> Dict[str, Dict]:
+        """엑셀의 인터페이스 블록을 모두 읽습니다."""
+        blocks = {}
+        start_col = 2
+        while True:
+            interface_info = read_interface_block(self.comparator.worksheet, start_col)
+            if not interface_info:
+                break
+            blocks[interface_info['interface_id']] = {
+                'start_col': start_col,
+                'info': interface_info,
+                'hash': hash_object(interface_info)
+            }
+            start_col += 3
+        return blocks
+
+    def _reload_workbook(self):
+        """입력 엑셀을 다시 읽습니다."""
+        self.comparator.workbook.close()
+        self.comparator.workbook = openpyxl.load_workbook(self.excel_path)
+        self.comparator.worksheet = self.comparator.workbook.active
+
+    def _changed_blocks(self, reload: bool) -> Set[str]:
+        """엑셀이 바뀌었으면 다시 읽고 내용이 바뀐 인터페이스 ID를 반환합니다."""
+        if reload:
+            self._reload_workbook()
+        blocks = self._read_blocks()
+        changed = {if_id for if_id, block in blocks.items()
+                   if if_id not in self.blocks or self.blocks[if_id]['hash'] != block['hash']}
+        with self.results_lock:
+            for if_id in set(self.results) - set(blocks):
+                del self.results[if_id]
+        self.blocks = blocks
+        return changed
+
+    def _changed_xml_files(self) -> Set[str]:
+        """MQ XML 디렉토리 목록을 갱신하고 추가/변경/삭제된 파일명을 반환합니다."""
+        names = os.listdir(self.xml_dir)
+        signatures = {name: file_signature(os.path.join(self.xml_dir, name)) for name in names}
+        changed = {name for name, sig in signatures.items() if self.xml_signatures.get(name) != sig}
+        changed |= set(self.xml_signatures) - set(signatures)
+        self.comparator.file_index = names
+        self.xml_signatures = signatures
+        return changed
+
+    def _changed_schemas(self) -> Set[str]:
+        """
+        스키마 카탈로그를 비우고 인터페이스 테이블의 컬럼 정보를 다시 조회하여
+        컬럼 정보가 바뀌었거나 조회하지 못한 인터페이스 ID를 반환합니다.
+        """
+        catalog = self.comparator.mapper.schema_catalog
+        previous = dict(catalog)
+        catalog.clear()
+        changed = set()
+        for if_id, block in self.blocks.items():
+            metadata = self.comparator._fetch_column_metadata(block['info'])
+            if metadata is None:
+                changed.add(if_id)
+                continue
+            for direction in ('send', 'recv'):
+                side = block['info'][direction]
+                key = (side['db_info']['sid'], side['db_info']['username'], side['owner'], side['table_name'])
+                if previous.get(key) != metadata[direction]:
+                    changed.add(if_id)
+        return changed
+
+    def poll(self, force: bool = False, schema: bool = False) -> List[str]:
+        """
+        입력 변경을 확인하고 영향받는 인터페이스를 재비교합니다.
+
+        Args:
+            force (bool): True이면 변경 여부와 관계없이 모든 인터페이스를 재비교
+            schema (bool): True이면 스키마 카탈로그를 비우고 컬럼 정보가 바뀐 인터페이스도 재비교
+                (주기 확인은 DB를 조회하지 않으므로 Oracle 컬럼 변경은 POST /refresh로 반영)
+
+        Returns:
+            List[str]: 재비교한 인터페이스 ID 목록
+        """
+        with self.lock:
+            first = self.poll_count == 0
+            excel_signature = file_signature(self.excel_path)
+            reload = excel_signature != self.excel_signature
+            self.excel_signature = excel_signature
+
+            affected = self._changed_blocks(reload)
+
+            changed_xml = self._changed_xml_files()
+            for name in changed_xml:
+                affected.update(if_id for if_id in self.blocks if name.startswith(if_id))
+
+            changed_bw = self.comparator.bw_index.refresh()
+            if changed_bw:
+                for if_id, block in self.blocks.items():
+                    previous = set((self.results.get(if_id) or {}).get('bw_files', []))
+                    send_table = block['info']['send'].get('table_name')
+                    current = set(self.comparator.find_bw_matches(send_table)) if send_table else set()
+                    if previous != current or current & changed_bw:
+                        affected.add(if_id)
+
+            if schema:
+                affected |= self._changed_schemas()
+
+            if force or first:
+                affected = set(self.blocks)
+
+            # 엑셀 순서대로 재비교
+            ordered = [if_id for if_id in self.blocks if if_id in affected]
+            for if_id in ordered:
+                self._evaluate(if_id)
+
+            self.poll_count += 1
+            self.last_poll = datetime.datetime.now().isoformat(timespec='seconds')
+            self.last_changed = ordered
+            if ordered:
+                print(f"[{self.last_poll}] 재비교: {', '.join(ordered)}")
+            return ordered
+
+    def _evaluate(self, if_id: str):
+        """하나의 인터페이스를 비교하고 결과를 저장합니다."""
+        block = self.blocks[if_id]
+        result = self.comparator.process_interface_with_bw(block['start_col'], copy.deepcopy(block['info']))
+        entry = {
+            'result': result_to_dict(result) if result else None,
+            'updated_at': datetime.datetime.now().isoformat(timespec='seconds'),
+            'bw_files': result.get('bw_files', []) if result else []
+        }
+        with self.results_lock:
+            self.results[if_id] = entry
+
+    def summary(self) -> List[Dict]:
+        """인터페이스별 비교 결과 요약 목록을 반환합니다."""
+        rows = []
+        with self.results_lock:
+            for if_id, block in self.blocks.items():
+                entry = self.results.get(if_id) or {}
+                result = entry.get('result') or {}
+                comparisons = result.get('comparisons') or {}
+                rows.append({
+                    'if_id': if_id,
+                    'interface_name': block['info']['interface_name'],
+                    'processed': bool(result),
+                    'send_equal': (comparisons.get('send') or {}).get('is_equal'),
+                    'recv_equal': (comparisons.get('recv') or {}).get('is_equal'),
+                    'bw_files': entry.get('bw_files', []),
+                    'updated_at': entry.get('updated_at')
+                })
+        return rows
+
+    def status(self) -> Dict:
+        """감시 상태를 반환합니다."""
+        return {
+            'excel_path': self.excel_path,
+            'xml_dir': self.xml_dir,
+            'bw_dir': XMLComparator.BW_SEARCH_DIR,
+            'interval': self.interval,
+            'poll_count': self.poll_count,
+            'last_poll': self.last_poll,
+            'last_changed': self.last_changed,
+            'interfaces': len(self.blocks),
+            'cached_xml': len(self.comparator.adapter_cache),
+            'cached_tables': len(self.comparator.mapper.schema_catalog or {})
+        }
+
+    def get_result(self, if_id: str) -> Optional[Dict]:
+        """인터페이스의 상세 결과를 반환합니다."""
+        with self.results_lock:
+            return self.results.get(if_id)
+
+    def run(self):
+        """stop()이 호출될 때까지 주기적으로 변경을 확인합니다."""
+        while not self._stop.is_set():
+            try:
+                self.poll()
+            except Exception as e:
+                print(f"Error during watch poll: {e}")
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        """감시를 중지합니다."""
+        self._stop.set()
+
+    def close(self):
+        """리소스 정리"""
+        self.stop()
+        self.comparator.close()
+
+
+class WatchRequestHandler(BaseHTTPRequestHandler):
+    """ComparisonDaemon 결과를 JSON으로 제공하는 HTTP 핸들러"""
+    daemon = None  # make_server()에서 설정
+
+    def _send_json(self, data, status: int = 200):
+        body = json.dumps(data, ensure_ascii=False, indent=1, default=str).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        path = urlparse(self.path).path.rstrip('/')
+        if path in ('', '/status'):
+            self._send_json(self.daemon.status())
+        elif path == '/results':
+            self._send_json(self.daemon.summary())
+        elif path.startswith('/results/'):
+            if_id = unquote(path[len('/results/'):])
+            entry = self.daemon.get_result(if_id)
+            if entry is None:
+                self._send_json({'error': f'인터페이스를 찾을 수 없습니다: {if_id}'}, 404)
+            else:
+                self._send_json(entry)
+        else:
+            self._send_json({'error': f'알 수 없는 경로: {path}'}, 404)
+
+    def do_POST(self):
+        parsed = urlparse(self.path)
+        if parsed.path.rstrip('/') != '/refresh':
+            self._send_json({'error': f'알 수 없는 경로: {parsed.path}'}, 404)
+            return
+        force = parse_qs(parsed.query).get('all', ['0'])[0] in ('1', 'true')
+        changed = self.daemon.poll(force=force, schema=True)
+        self._send_json({'changed': changed})
+
+    def log_message(self, format, *args):
+        # 요청마다 콘솔에 출력하지 않음
+        pass
+
+
+def make_server(daemon: ComparisonDaemon, host: str = '127.0.0.1', port: int = 8765) -> ThreadingHTTPServer:
+    """
+    ComparisonDaemon 결과를 제공하는 HTTP 서버를 생성합니다.
+
+    Args:
+        daemon (ComparisonDaemon): 감시 데몬
+        host (str): 바인딩 주소 (기본: 로컬만)
+        port (int): 포트 (0이면 임의 포트)
+
+    Returns:
+        ThreadingHTTPServer: 생성된 서버 (serve_forever()로 실행)
+    """
+    handler = type('BoundWatchRequestHandler', (WatchRequestHandler,), {'daemon': daemon})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MQ XML과 BW XML 쿼리 비교 감시 모드")
+    parser.add_argument("--excel", default='C:\\work\\LT\\input_LT.xlsx', help="인터페이스 정보 엑셀 파일")
+    parser.add_argument("--xml-dir", default='C:\\work\\LT\\xml', help="MQ XML 파일 디렉토리")
+    parser.add_argument("--bw-dir", default='C:\\work\\LT\\BW소스', help="BW XML 파일 디렉토리")
+    parser.add_argument("--host", default='127.0.0.1', help="HTTP 바인딩 주소")
+    parser.add_argument("--port", type=int, default=8765, help="HTTP 포트")
+    parser.add_argument("--interval", type=float, default=5.0, help="변경 확인 주기(초)")
+    args = parser.parse_args()
+
+    daemon = ComparisonDaemon(args.excel, args.xml_dir, args.bw_dir, args.interval)
+    print("[초기 비교 시작]")
+    daemon.poll()
+
+    watcher = threading.Thread(target=daemon.run, daemon=True)
+    watcher.start()
+
+    server = make_server(daemon, args.host, args.port)
+    print(f"[감시 시작] http://{args.host}:{server.server_address[1]}/results (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[감시 종료]")
+    finally:
+        server.server_close()
+        daemon.close()
+
+
+if __name__ == "__main__":
+    main()
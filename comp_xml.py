@@ -9,8 +9,18 @@ from comp_excel import ExcelManager, read_interface_block
 from xltest import process_interface, read_interface_block
 from comp_q import QueryParser, QueryDifference, FileSearcher, BWQueryExtractor
 from maptest import ColumnMapper
+from comp_manifest import RunManifest, hash_file, hash_object
+from comp_journal import RunJournal
+from comp_export import ResultExporter, parse_formats
+from comp_profile import RunProfiler, NULL_PROFILER
+from adapter_model import shared_cache, file_signature
+from bw_graph import BWProcessGraph
+from content_index import ContentIndex, DUPLICATE_HEADERS
+from comp_audit import THROUGHPUT_HEADERS, audit_interface, estimate_throughput, throughput_row
 import datetime
+import threading
 import ast
+import argparse
 
 def read_interface_block(ws, start_col):
     """Excel에서 3컬럼 단위로 하나의 인터페이스 정보를 읽습니다.
@@ -100,6 +110,25 @@ class XMLComparator:
         self.excel_manager = ExcelManager()  # ExcelManager 인스턴스 생성
         self.interface_results = []  # 모든 인터페이스 처리 결과 저장
         self.output_path = 'C:\\work\\LT\\comp_mq_bw.xlsx'  # 기본 출력 경로
+        self.file_index = None  # search_dir 파일 목록 캐시, None이면 매번 디렉토리를 읽음
+        self.bw_index = None  # BWKeywordIndex (감시 모드), None이면 매번 BW 디렉토리를 검색
+        self.adapter_cache = shared_cache  # MQ 어댑터 파일 파싱 결과 (test23 검증과 공유)
+        self.bw_query_cache = {}  # {bw_file_path: ((mtime, size), queries)}
+        self.bw_settings_cache = {}  # {bw_file_path: ((mtime, size), 처리량 설정)} (--audit)
+        self._bw_cache_locks = {}  # {(캐시 이름, bw_file_path): Lock}, 같은 파일을 여러 스레드가 동시에 파싱하지 않도록 함
+        self._bw_cache_locks_guard = threading.Lock()
+        self.content_index = ContentIndex()  # 같은 내용 BW/MQ 파일은 대표 파일만 검색/파싱
+        self.profiler = NULL_PROFILER  # 단계별 시간 기록 (--profile)
+
+    def set_profiler(self, profiler):
+        """
+        단계별 시간/카운터를 기록할 프로파일러를 지정합니다.
+        
+        Args:
+            profiler: comp_profile.RunProfiler 또는 NULL_PROFILER
+        """
+        self.profiler = profiler
+        self.mapper.profiler = profiler
 
     def extract_from_xml(self, xml_path: str) -> Tuple[str, str]:
         """
@@ -116,30 +145,23 @@ class XMLComparator:
             if not os.path.exists(xml_path):
                 print(f"Warning: XML file not found: {xml_path}")
                 return None, None
-                
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
             
-            # XML 내용이 유효한지 확인
-            if root is None:
-                print(f"Warning: Invalid XML content in file: {xml_path}")
-                return None, None
+            # 파일이 바뀌지 않았으면 공유 캐시의 파싱 결과 사용
+            with self.profiler.stage('xml_parse'):
+                adapter, hit = self.adapter_cache.get(self.content_index.canonical(xml_path))
+            if hit:
+                self.profiler.count('xml_cache_hit')
+            else:
+                self.profiler.count('xml_cache_miss')
+                self.profiler.count('files_parsed')
+                self.profiler.count('bytes_read', adapter.signature[1] if adapter.signature else 0)
             
-            # SQL 노드 찾기
-            sql_node = root.find(".//SQL")
-            if sql_node is None or not sql_node.text:
+            # SQL 내용 확인
+            if not adapter.sql:
                 print(f"Warning: No SQL content found in file: {xml_path}")
                 return None, None
                 
-            query = sql_node.text.strip()
-            xml_content = ET.tostring(root, encoding='unicode')
-            
-            # 추출된 쿼리가 유효한지 확인
-            if not query:
-                print(f"Warning: Empty SQL query in file: {xml_path}")
-                return None, None
-                
-            return query, xml_content
+            return adapter.sql, adapter.xml_content
             
         except ET.ParseError as e:
             print(f"Error parsing XML file {xml_path}: {e}")
@@ -163,6 +185,35 @@ class XMLComparator:
             return None
         return self.query_parser.compare_queries(query1, query2)
         
+    def list_interface_files(self, if_id: str) -> Dict[str, Optional[str]]:
+        """
+        주어진 IF ID에 해당하는 송수신 XML 파일 경로만 찾습니다 (파싱하지 않음).
+        같은 유형의 파일이 여러 개면 디렉토리 목록에서 마지막 파일을 사용합니다.
+        
+        Args:
+            if_id (str): 인터페이스 ID
+            
+        Returns:
+            Dict[str, Optional[str]]: {'send': 송신파일경로, 'recv': 수신파일경로}
+        """
+        paths = {'send': None, 'recv': None}
+        if not if_id:
+            return paths
+            
+        if self.file_index is not None:
+            files = self.file_index
+        else:
+            with self.profiler.stage('listdir'):
+                files = os.listdir(self.search_dir)
+        for file in files:
+            if not file.startswith(if_id):
+                continue
+            if file.endswith('.SND.xml'):
+                paths['send'] = os.path.join(self.search_dir, file)
+            elif file.endswith('.RCV.xml'):
+                paths['recv'] = os.path.join(self.search_dir, file)
+        return paths
+        
     def find_interface_files(self, if_id: str) -> Dict[str, Dict]:
         """
         주어진 IF ID에 해당하는 송수신 XML 파일을 찾고 쿼리를 추출합니다.
@@ -187,32 +238,19 @@ class XMLComparator:
             return results
             
         try:
-            # 디렉토리 내의 모든 XML 파일 검색
-            for file in os.listdir(self.search_dir):
-                if not file.startswith(if_id):
+            # 디렉토리 내의 송수신 XML 파일 검색
+            paths = self.list_interface_files(if_id)
+            for direction, label in (('send', 'send'), ('recv', 'receive')):
+                file_path = paths[direction]
+                if not file_path:
                     continue
-                    
-                file_path = os.path.join(self.search_dir, file)
-                
-                # 송신 파일 (.SND.xml)
-                if file.endswith('.SND.xml'):
-                    results['send']['path'] = file_path
-                    query, xml = self.extract_from_xml(file_path)
-                    if query and xml:
-                        results['send']['query'] = query
-                        results['send']['xml'] = xml
-                    else:
-                        print(f"Warning: Failed to extract query from send file: {file_path}")
-                
-                # 수신 파일 (.RCV.xml)
-                elif file.endswith('.RCV.xml'):
-                    results['recv']['path'] = file_path
-                    query, xml = self.extract_from_xml(file_path)
-                    if query and xml:
-                        results['recv']['query'] = query
-                        results['recv']['xml'] = xml
-                    else:
-                        print(f"Warning: Failed to extract query from receive file: {file_path}")
+                results[direction]['path'] = file_path
+                query, xml = self.extract_from_xml(file_path)
+                if query and xml:
+                    results[direction]['query'] = query
+                    results[direction]['xml'] = xml
+                else:
+                    print(f"Warning: Failed to extract query from {label} file: {file_path}")
             
             # 파일을 찾았는지 확인
             if not results['send']['path'] and not results['recv']['path']:
@@ -515,134 +553,110 @@ class XMLComparator:
         # 인터페이스 시트 생성
         self.excel_manager.create_interface_sheet(if_info, mq_files, bw_files_dict, queries, comparison_results)
         
-    def process_interface_with_bw(self, start_col: int, interface_info: Dict) -> Optional[Dict]:
+    def prepare_interface_info(self, interface_info: Dict):
+        """
+        인터페이스 정보에 요약 시트용 표준 필드(send_system, recv_system, send_table, recv_table)를 채웁니다.
+        
+        Args:
+            interface_info (Dict): read_interface_block()의 결과
+        """
+        # DB 정보에서 시스템 정보 추출
+        if 'send' in interface_info and 'db_info' in interface_info['send'] and interface_info['send']['db_info']:
+            interface_info['send_system'] = interface_info['send']['db_info'].get('system', 'N/A')
+        else:
+            interface_info['send_system'] = 'N/A'
+            
+        if 'recv' in interface_info and 'db_info' in interface_info['recv'] and interface_info['recv']['db_info']:
+            interface_info['recv_system'] = interface_info['recv']['db_info'].get('system', 'N/A')
+        else:
+            interface_info['recv_system'] = 'N/A'
+            
+        # 테이블 정보 추출
+        if 'send' in interface_info and 'table_name' in interface_info['send']:
+            interface_info['send_table'] = interface_info['send']['table_name']
+        else:
+            interface_info['send_table'] = ''
+            
+        if 'recv' in interface_info and 'table_name' in interface_info['recv']:
+            interface_info['recv_table'] = interface_info['recv']['table_name']
+        else:
+            interface_info['recv_table'] = ''
+    
+    def collect_bw_queries(self, interface_info: Dict) -> Tuple[List[str], Dict[str, str]]:
+        """
+        송신 테이블명으로 BW 파일을 찾고 첫 번째 송신/수신 쿼리를 추출합니다.
+        
+        Args:
+            interface_info (Dict): prepare_interface_info()를 거친 인터페이스 정보
+            
+        Returns:
+            Tuple[List[str], Dict[str, str]]: (매칭된 BW 파일 상대 경로 목록, {'send': 쿼리, 'recv': 쿼리})
+        """
+        send_table = interface_info.get('send_table', '')
+        if not send_table:
+            print(f"Warning: No send table information for IF_ID: {interface_info['interface_id']}")
+            matching_files = []
+        else:
+            # 송신 테이블로 BW 파일 검색
+            matching_files = self.find_bw_matches(send_table)
+        
+        # BW 쿼리 추출
+        bw_queries = {
+            'send': '',
+            'recv': ''
+        }
+        for bw_file in matching_files:
+            bw_file_path = os.path.join(self.BW_SEARCH_DIR, bw_file)
+            if os.path.exists(bw_file_path):
+                # BWQueryExtractor의 extract_bw_queries 메서드를 사용하여 송신/수신 쿼리 모두 추출
+                queries = self.extract_bw_file_queries(bw_file_path)
+                
+                # 송신 쿼리가 없으면 첫 번째 송신 쿼리 저장
+                if not bw_queries['send'] and queries.get('send') and len(queries['send']) > 0:
+                    bw_queries['send'] = queries['send'][0]
+                
+                # 수신 쿼리가 없으면 첫 번째 수신 쿼리 저장
+                if not bw_queries['recv'] and queries.get('recv') and len(queries['recv']) > 0:
+                    bw_queries['recv'] = queries['recv'][0]
+        return matching_files, bw_queries
+    
+    def process_interface_with_bw(self, start_col: int, interface_info: Dict, mapper=None) -> Optional[Dict]:
         """
         하나의 인터페이스를 처리하고 BW 파일과 비교하여 결과 반환
         
         Args:
             start_col (int): 인터페이스 블록이 시작되는 컬럼
             interface_info (Dict): 인터페이스 정보
+            mapper (ColumnMapper, optional): 컬럼 비교에 사용할 매퍼, 없으면 self.mapper
             
         Returns:
             Optional[Dict]: 처리된 인터페이스 정보와 결과, 실패시 None
         """
         try:
             # 표준 필드 생성
-            # DB 정보에서 시스템 정보 추출
-            if 'send' in interface_info and 'db_info' in interface_info['send'] and interface_info['send']['db_info']:
-                interface_info['send_system'] = interface_info['send']['db_info'].get('system', 'N/A')
-            else:
-                interface_info['send_system'] = 'N/A'
-                
-            if 'recv' in interface_info and 'db_info' in interface_info['recv'] and interface_info['recv']['db_info']:
-                interface_info['recv_system'] = interface_info['recv']['db_info'].get('system', 'N/A')
-            else:
-                interface_info['recv_system'] = 'N/A'
-                
-            # 테이블 정보 추출
-            if 'send' in interface_info and 'table_name' in interface_info['send']:
-                interface_info['send_table'] = interface_info['send']['table_name']
-            else:
-                interface_info['send_table'] = ''
-                
-            if 'recv' in interface_info and 'table_name' in interface_info['recv']:
-                interface_info['recv_table'] = interface_info['recv']['table_name']
-            else:
-                interface_info['recv_table'] = ''
+            self.prepare_interface_info(interface_info)
                 
             # Excel에서 추출된 쿼리와 XML 얻기
-            excel_results = process_interface(interface_info, self.mapper)
+            with self.profiler.stage('excel_mapping'):
+                excel_results = process_interface(interface_info, mapper or self.mapper)
             if not excel_results:
                 print(f"Warning: Failed to process interface at column {start_col}")
                 return None
                 
             # 송수신 파일 찾기
-            file_results = self.find_interface_files(interface_info['interface_id'])
+            with self.profiler.stage('mq_files'):
+                file_results = self.find_interface_files(interface_info['interface_id'])
             if not file_results:
                 print(f"Warning: No interface files found for IF_ID: {interface_info['interface_id']}")
                 return None
             
-            # BW 파일 찾기
-            send_table = interface_info.get('send_table', '')
-            if not send_table:
-                print(f"Warning: No send table information for IF_ID: {interface_info['interface_id']}")
-                bw_files = []
-            else:
-                # 송신 테이블로 BW 파일 검색
-                bw_searcher = FileSearcher()
-                bw_files = bw_searcher.find_files_with_keywords(
-                    self.BW_SEARCH_DIR, 
-                    [send_table]
-                )
-            
-            # bw_files가 사전 형태이므로 send_table 키워드에 대한 결과를 가져옴
-            matching_files = bw_files.get(send_table, [])
-            
-            # BW 쿼리 추출
-            bw_queries = {
-                'send': '',
-                'recv': ''
-            }
-            extractor = BWQueryExtractor()
-            for bw_file in matching_files:
-                bw_file_path = os.path.join(self.BW_SEARCH_DIR, bw_file)
-                if os.path.exists(bw_file_path):
-                    # BWQueryExtractor의 extract_bw_queries 메서드를 사용하여 송신/수신 쿼리 모두 추출
-                    queries = extractor.extract_bw_queries(bw_file_path)
-                    
-                    # 송신 쿼리가 없으면 첫 번째 송신 쿼리 저장
-                    if not bw_queries['send'] and queries.get('send') and len(queries['send']) > 0:
-                        bw_queries['send'] = queries['send'][0]
-                    
-                    # 수신 쿼리가 없으면 첫 번째 수신 쿼리 저장
-                    if not bw_queries['recv'] and queries.get('recv') and len(queries['recv']) > 0:
-                        bw_queries['recv'] = queries['recv'][0]
-            
-            # 결과 초기화
-            comparisons = {
-                'send': None,
-                'recv': None
-            }
-            warnings = {
-                'send': [],
-                'recv': []
-            }
+            # BW 파일 찾기 및 쿼리 추출
+            matching_files, bw_queries = self.collect_bw_queries(interface_info)
             
-            # 송신 쿼리 비교 (MQ XML vs BW XML)
-            if file_results['send']['query'] and bw_queries['send']:
-                try:
-                    comparisons['send'] = self.query_parser.compare_queries(
-                        file_results['send']['query'],
-                        bw_queries['send']
-                    )
-                    warnings['send'].extend(
-                        self.query_parser.check_special_columns(
-                            file_results['send']['query'],
-                            'send'
-                        )
-                    )
-                except Exception as e:
-                    print(f"Error comparing send queries: {e}")
-                    print(f"MQ query: {file_results['send']['query']}")
-                    print(f"BW query: {bw_queries['send']}")
-            
-            # 수신 쿼리 비교 (MQ XML vs BW XML)
-            if file_results['recv']['query'] and bw_queries['recv']:
-                try:
-                    comparisons['recv'] = self.query_parser.compare_queries(
-                        file_results['recv']['query'],
-                        bw_queries['recv']
-                    )
-                    warnings['recv'].extend(
-                        self.query_parser.check_special_columns(
-                            file_results['recv']['query'],
-                            'recv'
-                        )
-                    )
-                except Exception as e:
-                    print(f"Error comparing recv queries: {e}")
-                    print(f"MQ query: {file_results['recv']['query']}")
-                    print(f"BW query: {bw_queries['recv']}")
+            # 송수신 쿼리 비교 (MQ XML vs BW XML)
+            mq_queries = {direction: file_results[direction]['query'] for direction in ('send', 'recv')}
+            with self.profiler.stage('compare_queries'):
+                comparisons, warnings = self.query_parser.compare_interface_queries(mq_queries, bw_queries)
             
             # 결과 반환
             return {
@@ -661,97 +675,490 @@ class XMLComparator:
             traceback.print_exc()
             return None
 
-    def process_all_interfaces_with_bw(self):
+    def process_all_interfaces_with_bw(self, incremental: bool = False, manifest_path: str = None,
+                                       profile: bool = False, audit: bool = False, pipeline=None,
+                                       resume: bool = False, journal_path: str = None,
+                                       export_dir: str = None, export_formats=('csv',), excel: bool = True):
         """
         모든 인터페이스를 처리하고 BW 파일과 비교하여 엑셀 파일로 결과 저장
+        
+        Args:
+            incremental (bool): True이면 입력이 바뀐 인터페이스만 재처리하고
+                나머지는 매니페스트에 저장된 이전 결과를 사용합니다.
+            manifest_path (str, optional): 매니페스트 파일 경로, 없으면 출력 파일 옆에 생성
+            profile (bool): True이면 단계별 시간을 기록하여 결과 엑셀의 '프로파일' 시트와
+                JSON 파일(get_profile_path())로 저장합니다. 시트에는 엑셀 저장 시간이 빠집니다.
+            audit (bool): True이면 MQ 어댑터/BW 처리량 설정을 점검하여 '처리량 설정' 시트로 저장합니다.
+            pipeline (comp_pipeline.PipelineLimits, optional): 주면 DB 조회, 파일 검색/파싱, 쿼리 비교를
+                단계별 동시 실행 수 제한 안에서 겹쳐 실행합니다 (결과 기록 순서는 순차 실행과 같음).
+            resume (bool): True이면 이전 실행 저널에 완료된 인터페이스는 처리하지 않고 저장된 결과를 사용합니다.
+                처리 결과는 실행 모드와 관계없이 끝나는 대로 저널에 기록되며, 결과 엑셀을 저장하면 삭제됩니다.
+            journal_path (str, optional): 저널 파일 경로, 없으면 출력 파일 옆에 생성
+            export_dir (str, optional): 주면 요약/컬럼 점검/쿼리 차이를 이 디렉토리에 표 파일로 내보냅니다
+                (comp_export.ResultExporter).
+            export_formats (Sequence[str]): 내보내기 형식 ('csv', 'jsonl', 'parquet')
+            excel (bool): False이면 결과 엑셀을 만들지 않고 내보내기 파일만 기록합니다
+                (엑셀은 나중에 comp_export.py로 내보내기 파일에서 만들 수 있음).
         """
+        if profile:
+            self.set_profiler(RunProfiler())
+        
         # 엑셀 파일 초기화 - ExcelManager 사용
         self.excel_manager.initialize_excel_output()
         
+        # 같은 내용의 BW/MQ 파일 묶기 (크기가 겹친 파일만 해시)
+        with self.profiler.stage('content_hash'):
+            self.content_index.scan(self.BW_SEARCH_DIR, 'BW')
+            self.content_index.scan(self.search_dir, 'MQ', recursive=False)
+        
+        manifest = None
+        bw_tree_hash = ''
+        if incremental:
+            manifest = RunManifest(manifest_path or self.get_manifest_path())
+            bw_tree_hash = self._hash_bw_tree()
+            if self.mapper.schema_catalog is None:
+                # 해시 계산과 인터페이스 처리가 같은 컬럼 정보를 한 번만 조회
+                self.mapper.schema_catalog = {}
+        
+        journal = RunJournal(journal_path or self.get_journal_path(), self.excel_path, resume)
+        if journal.entries:
+            print(f"재개: 저널의 완료 기록 {len(journal.entries)}개 ({journal.path})")
+        
+        exporter = ResultExporter(export_dir, export_formats) if export_dir else None
+        
         # 모든 열을 처리
         print("\n[인터페이스 처리 시작]")
         print("-" * 80)
         
-        interface_count = 0
-        processed_count = 0
+        run = {
+            'manifest': manifest,
+            'journal': journal,
+            'exporter': exporter,
+            'excel': excel,
+            'bw_tree_hash': bw_tree_hash,
+            'audit': audit,
+            'interface_count': 0,
+            'processed_count': 0,
+            'reused_count': 0,
+            'resumed_count': 0,
+            'seen_ids': [],
+            'throughput_rows': []
+        }
         
+        try:
+            if pipeline is not None:
+                from comp_pipeline import InterfacePipeline
+                InterfacePipeline(self, pipeline).run(run)
+            else:
+                for interface_count, start_col, interface_info in self.iter_interface_blocks():
+                    if_id = interface_info['interface_id']
+                    run['interface_count'] = interface_count
+                    run['seen_ids'].append(if_id)
+                    self.profiler.begin_interface(if_id)
+                    
+                    # 인터페이스 ID와 이름 출력
+                    print(f"처리 중: [{interface_count}] {if_id} - {interface_info['interface_name']}")
+                    
+                    # 이전 실행 저널에 완료된 인터페이스 (--resume)
+                    result, hashes = journal.completed(interface_info) or (None, None)
+                    journaled = result is not None
+                    if result is None and manifest is not None:
+                        with self.profiler.stage('manifest_hash'):
+                            hashes = self._compute_interface_hashes(interface_info, manifest.get(if_id), bw_tree_hash)
+                        if manifest.is_unchanged(if_id, hashes):
+                            result = manifest.cached_result(if_id)
+                            run['reused_count'] += 1
+                            print(f"  - 변경 없음: 이전 결과 재사용")
+                        else:
+                            print(f"  - 변경 항목: {', '.join(manifest.changed_keys(if_id, hashes))}")
+                    
+                    if result is None:
+                        # 인터페이스 처리 및 BW 비교
+                        result = self.process_interface_with_bw(start_col, interface_info)
+                        if manifest is not None:
+                            # 새로 매칭된 BW 파일 기준으로 해시 갱신
+                            hashes['bw_files'] = self._hash_bw_files(result.get('bw_files', []) if result else [])
+                            manifest.update(if_id, hashes, result)
+                    
+                    self._accept_result(run, interface_count, interface_info, result, hashes, journaled)
+                    self.profiler.end_interface()
+        finally:
+            journal.close()
+            export_paths = exporter.close() if exporter is not None else None
+        
+        interface_count = run['interface_count']
+        processed_count = run['processed_count']
+        reused_count = run['reused_count']
+        throughput_rows = run['throughput_rows']
+        
+        if manifest is not None:
+            manifest.prune(run['seen_ids'])
+            manifest.save()
+        
+        if audit and excel:
+            self.excel_manager.create_throughput_sheet(THROUGHPUT_HEADERS, throughput_rows)
+            ng_count = sum(1 for row in throughput_rows if row[-2] == 'NG')
+            print(f"처리량 설정 점검: {len(throughput_rows)}개 인터페이스 중 {ng_count}개 점검 필요")
+        
+        duplicate_rows = self.content_index.duplicate_rows({'BW': self.BW_SEARCH_DIR, 'MQ': self.search_dir})
+        if duplicate_rows and excel:
+            self.excel_manager.create_duplicates_sheet(DUPLICATE_HEADERS, duplicate_rows)
+            print(f"중복 파일: {len(duplicate_rows)}개 그룹 (대표 파일만 검색/파싱)")
+        
+        if self.profiler.enabled and excel:
+            self.profiler.finish()
+            self.excel_manager.create_profile_sheet(self.profiler.summary(), self.profiler.interfaces)
+        
+        # 결과 저장 (저장하지 못하면 저널을 남겨 --resume으로 보고서만 다시 만들 수 있게 함)
+        saved = True
+        if excel:
+            with self.profiler.stage('excel_save'):
+                saved = self.save_excel_output()
+        if saved:
+            journal.discard()
+        
+        profile_path = None
+        if self.profiler.enabled:
+            self.profiler.finish()
+            profile_path = self.get_profile_path()
+            self.profiler.write_json(profile_path)
+        
+        # 처리 결과 출력
+        print("\n" + "=" * 80)
+        print(f"처리 완료: 총 {interface_count}개 인터페이스 중 {processed_count}개 처리됨")
+        if manifest is not None:
+            print(f"증분 실행: {reused_count}개 재사용, {interface_count - reused_count}개 재처리")
+            print(f"매니페스트: {manifest.path}")
+        if run['resumed_count']:
+            print(f"재개 실행: {run['resumed_count']}개 인터페이스는 저널 결과 사용")
+        if not saved:
+            print(f"저널: {journal.path} (--resume으로 다시 실행하면 완료된 인터페이스는 처리하지 않음)")
+        if profile_path:
+            print(f"프로파일: {profile_path}")
+        if export_paths:
+            print(f"내보내기: {exporter.out_dir} ({', '.join(exporter.formats)}, "
+                  f"컬럼 점검 {exporter.counts['columns']}행, 쿼리 차이 {exporter.counts['query_diffs']}행)")
+        if excel:
+            print(f"결과 파일: {self.output_path}")
+        print("=" * 80)
+        
+    def iter_interface_blocks(self):
+        """
+        입력 엑셀의 인터페이스 블록을 순서대로 읽습니다 (2열부터 3칸씩, IF ID가 빈 블록에서 멈춤).
+        
+        Yields:
+            Tuple[int, int, Dict]: (인터페이스 번호(1부터), 시작 컬럼, read_interface_block() 결과)
+        """
+        interface_count = 0
         start_col = 2
         while True:
-            interface_info = read_interface_block(self.worksheet, start_col)
-            
+            with self.profiler.stage('read_block'):
+                interface_info = read_interface_block(self.worksheet, start_col)
             if not interface_info:
-                break
-                
+                return
             interface_count += 1
+            yield interface_count, start_col, interface_info
+            # 다음 인터페이스로 이동 (3칸씩)
+            start_col += 3
+    
+    def _accept_result(self, run: Dict, interface_count: int, interface_info: Dict,
+                       result: Optional[Dict], hashes: Optional[Dict], journaled: bool = False):
+        """
+        인터페이스 처리 결과에 처리량 점검/예상 처리량을 더하고 결과 엑셀에 기록합니다.
+        결과는 인터페이스 순서대로 넘겨야 합니다 (요약 시트 행 순서).
+        
+        Args:
+            run (Dict): process_all_interfaces_with_bw()의 실행 상태
+            interface_count (int): 인터페이스 번호
+            interface_info (Dict): 인터페이스 정보
+            result (Optional[Dict]): process_interface_with_bw() 결과 또는 매니페스트의 이전 결과
+            hashes (Optional[Dict]): 증분 실행 입력 해시
+            journaled (bool): 이전 실행 저널에서 가져온 결과이면 True (저널에 다시 기록하지 않음)
+        """
+        if not result:
+            return
+        manifest = run['manifest']
+        run['processed_count'] += 1
+        if journaled:
+            run['resumed_count'] += 1
+            print(f"  - 이전 실행에서 완료: 저널 결과 사용")
+            if manifest is not None and hashes:
+                manifest.update(interface_info['interface_id'], hashes, result)
+        # 이전 실행에서 점검하지 않은 재사용 결과도 점검 (MQ/BW 파일이 같으면 결과도 같음)
+        if run['audit'] and 'throughput' not in result:
+            result['throughput'] = self.audit_throughput(result)
+            if manifest is not None:
+                manifest.update(interface_info['interface_id'], hashes, result)
+        # 요약 시트의 예상 처리량 열 (--audit이 아니면 BW 파싱 없이 MQ 어댑터 설정으로만 추정)
+        throughput = result.get('throughput') or self.audit_throughput(result, bw=False)
+        result['estimate'] = estimate_throughput(result.get('excel_results'), throughput)
+        if run['audit']:
+            run['throughput_rows'].append(throughput_row(interface_count, interface_info, result['throughput']))
+        if run['excel']:
+            with self.profiler.stage('report_write'):
+                self._write_result_to_report(result, interface_count)
+        if run['exporter'] is not None:
+            with self.profiler.stage('export_write'):
+                run['exporter'].add_result(interface_count, result)
+        if not journaled:
+            with self.profiler.stage('journal_write'):
+                run['journal'].append(interface_count, interface_info, result, hashes)
+        
+    def _write_result_to_report(self, result, interface_count):
+        """
+        하나의 인터페이스 처리 결과를 인터페이스 시트와 요약 시트에 기록합니다.
+        
+        Args:
+            result (dict): process_interface_with_bw()의 결과
+            interface_count (int): 인터페이스 순번 (1부터 시작)
+        """
+        # 결과를 저장할 인터페이스 시트 생성
+        if_info = result['interface_info']
+        
+        # ExcelManager를 사용하여 인터페이스 시트 생성
+        # MQ 파일 정보
+        mq_files = {
+            'send': result['file_results']['send'],
+            'recv': result['file_results']['recv']
+        }
+        
+        # BW 파일 정보
+        bw_files = {
+            'send': result.get('bw_files', [])[0] if result.get('bw_files') and len(result.get('bw_files')) > 0 else 'N/A',
+            'recv': result.get('bw_files', [])[1] if result.get('bw_files') and len(result.get('bw_files')) > 1 else 'N/A'
+        }
+        
+        # 쿼리 정보
+        queries = {
+            'mq_send': result['file_results']['send']['query'],
+            'bw_send': result['bw_queries']['send'],
+            'mq_recv': result['file_results']['recv']['query'],
+            'bw_recv': result['bw_queries']['recv']
+        }
+        
+        # 비교 결과
+        comparison_results = {
+            'send': {
+                'is_equal': result['comparisons']['send'].is_equal if result['comparisons']['send'] else False,
+                'detail': self._get_difference_detail(result['comparisons']['send']) if result['comparisons']['send'] else '비교 불가'
+            },
+            'recv': {
+                'is_equal': result['comparisons']['recv'].is_equal if result['comparisons']['recv'] else False,
+                'detail': self._get_difference_detail(result['comparisons']['recv']) if result['comparisons']['recv'] else '비교 불가'
+            }
+        }
+        
+        self.excel_manager.create_interface_sheet(
+            if_info, 
+            mq_files, 
+            bw_files, 
+            queries, 
+            comparison_results
+        )
+        
+        # 요약 시트 업데이트
+        self.update_summary_sheet(result, interface_count + 1)
+        
+    def find_bw_matches(self, keyword: str) -> List[str]:
+        """
+        키워드(송신 테이블명)를 포함하는 BW 파일의 상대 경로 목록을 반환합니다.
+        감시 모드에서는 메모리에 유지되는 BW 인덱스를 사용합니다.
+        
+        Args:
+            keyword (str): 검색 키워드
             
-            # 인터페이스 ID와 이름 출력
-            print(f"처리 중: [{interface_count}] {interface_info['interface_id']} - {interface_info['interface_name']}")
+        Returns:
+            List[str]: BW_SEARCH_DIR 기준 상대 경로 목록
+        """
+        with self.profiler.stage('bw_scan'):
+            if self.bw_index is not None:
+                return self.bw_index.find(keyword)
+            stats = {}
+            matches = FileSearcher().find_files_with_keywords(
+                self.BW_SEARCH_DIR, [keyword], stats, self.content_index).get(keyword, [])
+        self.profiler.count('bw_files_deduped', stats.get('files_deduped', 0))
+        self.profiler.count('bw_files_scanned', stats.get('files_scanned', 0))
+        self.profiler.count('bytes_read', stats.get('bytes_read', 0))
+        return matches
+        
+    def _bw_cache_lock(self, cache_name: str, bw_file_path: str) -> threading.Lock:
+        """BW 파일 캐시 항목별 잠금을 반환합니다 (파이프라인 I/O 스레드, 감시 모드 요청 스레드)."""
+        with self._bw_cache_locks_guard:
+            return self._bw_cache_locks.setdefault((cache_name, bw_file_path), threading.Lock())
+        
+    def extract_bw_file_queries(self, bw_file_path: str) -> Dict[str, List[str]]:
+        """
+        BW 파일에서 송수신 쿼리를 추출합니다. 파일이 바뀌지 않았으면 이전 추출 결과를 사용합니다.
+        
+        Args:
+            bw_file_path (str): BW 파일 경로
             
-            # 인터페이스 처리 및 BW 비교
-            result = self.process_interface_with_bw(start_col, interface_info)
+        Returns:
+            Dict[str, List[str]]: {'send': [...], 'recv': [...]}
+        """
+        # 같은 내용의 다른 경로는 대표 파일의 추출 결과를 사용
+        bw_file_path = self.content_index.canonical(bw_file_path)
+        with self._bw_cache_lock('queries', bw_file_path):
+            signature = file_signature(bw_file_path)
+            cached = self.bw_query_cache.get(bw_file_path)
+            if cached and cached[0] == signature:
+                self.profiler.count('bw_query_cache_hit')
+                return cached[1]
+            self.profiler.count('bw_query_cache_miss')
+            with self.profiler.stage('bw_extract'):
+                queries = BWQueryExtractor().extract_bw_queries(bw_file_path)
+            self.profiler.count('files_parsed')
+            self.profiler.count('bytes_read', signature[1] if signature else 0)
+            self.bw_query_cache[bw_file_path] = (signature, queries)
+            return queries
+        
+    def extract_bw_file_settings(self, bw_file_path: str) -> Dict[str, List[Dict]]:
+        """
+        BW 파일의 처리량 설정을 추출합니다. 파일이 바뀌지 않았으면 이전 추출 결과를 사용합니다.
+
+        Args:
+            bw_file_path (str): BW 파일 경로
+
+        Returns:
+            Dict: BWQueryExtractor.extract_throughput_settings() 결과에
+                'cycle'(BWProcessGraph.cycle_cost() 주기 비용)을 더한 딕셔너리
+        """
+        bw_file_path = self.content_index.canonical(bw_file_path)
+        with self._bw_cache_lock('settings', bw_file_path):
+            signature = file_signature(bw_file_path)
+            cached = self.bw_settings_cache.get(bw_file_path)
+            if cached and cached[0] == signature:
+                return cached[1]
+            with self.profiler.stage('bw_settings'):
+                try:
+                    graph = BWProcessGraph.from_file(bw_file_path)
+                    settings = graph.throughput_settings()
+                    settings['cycle'] = graph.cycle_cost()
+                except ET.ParseError as e:
+                    print(f"XML 파싱 오류: {e}")
+                    settings = {'jdbc': [], 'sleeps': []}
+            self.bw_settings_cache[bw_file_path] = (signature, settings)
+            return settings
+
+    def audit_throughput(self, result: Dict, bw: bool = True) -> Dict:
+        """
+        인터페이스 처리 결과의 MQ 어댑터 파일과 BW 파일에서 처리량 설정을 모아 점검합니다.
+
+        Args:
+            result (Dict): process_interface_with_bw()의 결과
+            bw (bool): False이면 BW 프로세스를 파싱하지 않고 MQ 어댑터 설정만 모읍니다
+                (--audit 없이 요약 시트의 예상 처리량만 구하는 경우, BW 예상 처리량은 비어 있음)
+
+        Returns:
+            Dict: comp_audit.audit_interface() 결과
+        """
+        adapter_files = {}
+        for direction in ('send', 'recv'):
+            path = result['file_results'][direction].get('path')
+            adapter_files[direction] = None
+            if path:
+                try:
+                    adapter_files[direction], _ = self.adapter_cache.get(self.content_index.canonical(path))
+                except (ET.ParseError, OSError) as e:
+                    print(f"Warning: 처리량 설정 읽기 실패 ({path}): {e}")
+        bw_settings = []
+        for bw_file in result.get('bw_files', []) if bw else []:
+            bw_file_path = os.path.join(self.BW_SEARCH_DIR, bw_file)
+            if os.path.exists(bw_file_path):
+                bw_settings.append(self.extract_bw_file_settings(bw_file_path))
+        return audit_interface(adapter_files, bw_settings)
+
+    def get_profile_path(self) -> str:
+        """출력 파일 경로를 기준으로 프로파일 JSON 경로를 반환합니다."""
+        return os.path.splitext(self.output_path)[0] + '_profile.json'
+        
+    def get_journal_path(self) -> str:
+        """출력 파일 경로를 기준으로 기본 실행 저널 경로를 반환합니다."""
+        return os.path.splitext(self.output_path)[0] + '_journal.jsonl'
+        
+    def get_manifest_path(self) -> str:
+        """출력 파일 경로를 기준으로 기본 매니페스트 경로를 반환합니다."""
+        return os.path.splitext(self.output_path)[0] + '_manifest.json'
+        
+    def _hash_bw_tree(self) -> str:
+        """
+        BW 디렉토리의 파일 목록(내용 제외) 해시를 계산합니다.
+        파일이 추가/삭제되면 매칭 결과가 달라질 수 있으므로 모든 인터페이스를 재처리합니다.
+        """
+        rel_paths = []
+        for root, _, files in os.walk(self.BW_SEARCH_DIR):
+            for file in files:
+                rel_paths.append(os.path.relpath(os.path.join(root, file), self.BW_SEARCH_DIR))
+        return hash_object(sorted(rel_paths))
+        
+    def _hash_bw_files(self, bw_files: List[str]) -> str:
+        """매칭된 BW 파일들의 내용 해시를 계산합니다."""
+        return hash_object([
+            (bw_file, hash_file(os.path.join(self.BW_SEARCH_DIR, bw_file)))
+            for bw_file in bw_files
+        ])
+        
+    def _fetch_column_metadata(self, interface_info: Dict, mapper=None) -> Optional[Dict]:
+        """
+        인터페이스의 송수신 테이블 컬럼 메타데이터를 조회합니다.
+        
+        Args:
+            interface_info (Dict): read_interface_block()의 결과
+            mapper (ColumnMapper, optional): 조회에 사용할 매퍼, 없으면 self.mapper
+        
+        Returns:
+            Optional[Dict]: {'send': 컬럼정보, 'recv': 컬럼정보}, 조회 실패시 None
+        """
+        mapper = mapper or self.mapper
+        try:
+            metadata = {}
+            for direction in ('send', 'recv'):
+                side = interface_info[direction]
+                db_info = side.get('db_info')
+                if not db_info or not side.get('owner') or not side.get('table_name'):
+                    return None
+                # 스키마 카탈로그를 통해 조회하므로 이어지는 process_interface()의 조회는 캐시에서 처리되고
+                # 연결도 매퍼에 남아 다시 로그온하지 않음
+                connect = mapper.connect_send_db if direction == 'send' else mapper.connect_recv_db
+                connect(db_info['sid'], db_info['username'], db_info['password'])
+                metadata[direction] = mapper.lookup_columns(direction, side['owner'], side['table_name'])
+            return metadata
+        except Exception as e:
+            print(f"Warning: 컬럼 메타데이터 조회 실패 ({interface_info.get('interface_id')}): {e}")
+            return None
             
-            # 다음 인터페이스로 이동 (3칸씩)
-            start_col += 3
+    def _compute_interface_hashes(self, interface_info: Dict, cached_entry: Optional[Dict], bw_tree_hash: str,
+                                  mapper=None) -> Dict[str, str]:
+        """
+        증분 실행을 위한 인터페이스 입력 해시를 계산합니다.
+        
+        Args:
+            interface_info (Dict): read_interface_block()의 결과
+            cached_entry (Optional[Dict]): 매니페스트에 저장된 이전 항목
+            bw_tree_hash (str): BW 디렉토리 파일 목록 해시
+            mapper (ColumnMapper, optional): 컬럼 메타데이터 조회에 사용할 매퍼, 없으면 self.mapper
             
-            # 인터페이스 처리 결과가 있으면 엑셀에 저장
-            if result:
-                processed_count += 1
-                
-                # 결과를 저장할 인터페이스 시트 생성
-                if_info = result['interface_info']
-                
-                # ExcelManager를 사용하여 인터페이스 시트 생성
-                # MQ 파일 정보
-                mq_files = {
-                    'send': result['file_results']['send'],
-                    'recv': result['file_results']['recv']
-                }
-                
-                # BW 파일 정보
-                bw_files = {
-                    'send': result.get('bw_files', [])[0] if result.get('bw_files') and len(result.get('bw_files')) > 0 else 'N/A',
-                    'recv': result.get('bw_files', [])[1] if result.get('bw_files') and len(result.get('bw_files')) > 1 else 'N/A'
-                }
-                
-                # 쿼리 정보
-                queries = {
-                    'mq_send': result['file_results']['send']['query'],
-                    'bw_send': result['bw_queries']['send'],
-                    'mq_recv': result['file_results']['recv']['query'],
-                    'bw_recv': result['bw_queries']['recv']
-                }
-                
-                # 비교 결과
-                comparison_results = {
-                    'send': {
-                        'is_equal': result['comparisons']['send'].is_equal if result['comparisons']['send'] else False,
-                        'detail': self._get_difference_detail(result['comparisons']['send']) if result['comparisons']['send'] else '비교 불가'
-                    },
-                    'recv': {
-                        'is_equal': result['comparisons']['recv'].is_equal if result['comparisons']['recv'] else False,
-                        'detail': self._get_difference_detail(result['comparisons']['recv']) if result['comparisons']['recv'] else '비교 불가'
-                    }
-                }
-                
-                self.excel_manager.create_interface_sheet(
-                    if_info, 
-                    mq_files, 
-                    bw_files, 
-                    queries, 
-                    comparison_results
-                )
-                
-                # 요약 시트 업데이트
-                self.update_summary_sheet(result, interface_count + 1)
+        Returns:
+            Dict[str, str]: 항목별 해시
+        """
+        paths = self.list_interface_files(interface_info['interface_id'])
         
-        # 결과 저장
-        self.save_excel_output()
+        # BW 파일은 이전 실행에서 매칭된 파일의 내용으로 비교
+        previous_bw_files = []
+        if cached_entry and cached_entry.get('result'):
+            previous_bw_files = cached_entry['result'].get('bw_files', [])
         
-        # 처리 결과 출력
-        print("\n" + "=" * 80)
-        print(f"처리 완료: 총 {interface_count}개 인터페이스 중 {processed_count}개 처리됨")
-        print(f"결과 파일: {self.output_path}")
-        print("=" * 80)
+        metadata = self._fetch_column_metadata(interface_info, mapper)
+        
+        return {
+            'block': hash_object(interface_info),
+            'mq_send': hash_object([paths['send'], hash_file(paths['send'])]),
+            'mq_recv': hash_object([paths['recv'], hash_file(paths['recv'])]),
+            'bw_tree': bw_tree_hash,
+            'bw_files': self._hash_bw_files(previous_bw_files),
+            # 조회 실패시 RunManifest.changed_keys()가 변경으로 보고 재처리
+            'columns': hash_object(metadata) if metadata is not None else RunManifest.UNAVAILABLE
+        }
         
     def update_summary_sheet(self, result, row):
         """
@@ -859,18 +1266,66 @@ def main():
     # XML 비교기 초기화
     comparator = XMLComparator(excel_path, xml_dir)
     
-    # 명령행 인자가 있을 경우 처리
-    if len(sys.argv) > 1:
-        if sys.argv[1] == "excel":
-            # 엑셀 출력 모드 실행
-            print("\n[MQ XML과 BW XML 쿼리 비교 - 엑셀 출력 모드]")
-            comparator.process_all_interfaces_with_bw()
-            return
-        elif len(sys.argv) > 2 and sys.argv[1] == "output":
-            # 출력 경로 변경
-            output_path = sys.argv[2]
-            comparator.output_path = output_path
-            print(f"\n[출력 경로 변경: {output_path}]")
+    # 명령행 인자 처리
+    parser = argparse.ArgumentParser(description="MQ XML과 BW XML 쿼리 비교")
+    parser.add_argument("mode", nargs="?", choices=["excel", "output"],
+                        help="excel: 엑셀 출력 모드, output: 출력 경로 변경")
+    parser.add_argument("mode_arg", nargs="?", help="output 모드의 출력 엑셀 파일 경로")
+    parser.add_argument("--incremental", action="store_true",
+                        help="입력이 바뀐 인터페이스만 재처리하고 나머지는 이전 결과 사용 (excel 모드)")
+    parser.add_argument("--manifest", help="증분 실행 매니페스트 파일 경로")
+    parser.add_argument("--profile", action="store_true",
+                        help="단계별 처리 시간을 결과 엑셀 '프로파일' 시트와 JSON 파일로 저장 (excel 모드)")
+    parser.add_argument("--audit", action="store_true",
+                        help="MQ 어댑터/BW 처리량 설정을 점검하여 '처리량 설정' 시트로 저장, "
+                             "요약 시트의 BW 예상 MB/s도 이 옵션이 있을 때만 계산 (excel 모드)")
+    parser.add_argument("--resume", action="store_true",
+                        help="이전 실행 저널에 완료된 인터페이스는 처리하지 않고 저장된 결과로 보고서 작성 (excel 모드)")
+    parser.add_argument("--journal", help="실행 저널 파일 경로 (기본: 출력 파일 옆 *_journal.jsonl)")
+    parser.add_argument("--pipeline", action="store_true",
+                        help="DB 조회, 파일 검색/파싱, 쿼리 비교를 겹쳐 실행 (excel 모드)")
+    parser.add_argument("--db-workers", type=int, default=2,
+                        help="파이프라인 DB 조회 동시 실행 수 (기본: 2, 작업마다 DB 연결 사용)")
+    parser.add_argument("--io-workers", type=int, default=8,
+                        help="파이프라인 파일 검색/읽기 스레드 수 (기본: 8)")
+    parser.add_argument("--cpu-workers", type=int, default=None,
+                        help="파이프라인 쿼리 비교 프로세스 수 (기본: CPU 수, 0이면 프로세스 없이 스레드에서 비교)")
+    parser.add_argument("--queue-size", type=int, default=8,
+                        help="파이프라인 단계 사이 큐 크기 (기본: 8)")
+    parser.add_argument("--export", metavar="DIR",
+                        help="요약/컬럼 점검/쿼리 차이를 이 디렉토리에 표 파일로 내보내기 (excel 모드)")
+    parser.add_argument("--export-format", default="csv",
+                        help="내보내기 형식, 쉼표로 구분 (csv, jsonl, parquet / 기본: csv)")
+    parser.add_argument("--no-excel", action="store_true",
+                        help="결과 엑셀을 만들지 않고 --export 파일만 기록 (엑셀은 comp_export.py로 생성)")
+    args = parser.parse_args()
+    
+    try:
+        export_formats = parse_formats(args.export_format)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.no_excel and not args.export:
+        parser.error("--no-excel은 --export와 함께 사용해야 합니다")
+    
+    if args.mode == "excel":
+        # 엑셀 출력 모드 실행
+        print("\n[MQ XML과 BW XML 쿼리 비교 - 엑셀 출력 모드]")
+        pipeline = None
+        if args.pipeline:
+            from comp_pipeline import PipelineLimits
+            pipeline = PipelineLimits(db=args.db_workers, io=args.io_workers, cpu=args.cpu_workers,
+                                      queue_size=args.queue_size)
+        comparator.process_all_interfaces_with_bw(incremental=args.incremental, manifest_path=args.manifest,
+                                                  profile=args.profile, audit=args.audit, pipeline=pipeline,
+                                                  resume=args.resume, journal_path=args.journal,
+                                                  export_dir=args.export, export_formats=export_formats,
+                                                  excel=not args.no_excel)
+        return
+    elif args.mode == "output" and args.mode_arg:
+        # 출력 경로 변경
+        output_path = args.mode_arg
+        comparator.output_path = output_path
+        print(f"\n[출력 경로 변경: {output_path}]")
     
     # 기본 모드 실행 - 기존 로직 유지
     print("\n[MQ XML 파일 검색 및 쿼리 비교 시작]")
@@ -912,6 +1367,8 @@ def main():
     
     print("\n[처리 완료]")
     print("엑셀 출력 모드로 실행하려면 'python comp_xml.py excel' 명령을 사용하세요.")
+    print("변경된 인터페이스만 재처리하려면 'python comp_xml.py excel --incremental' 명령을 사용하세요.")
+    print("중단된 엑셀 출력 실행을 이어서 하려면 'python comp_xml.py excel --resume' 명령을 사용하세요.")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,141 @@
+"""
+파일 내용 해시 인덱스
+
+BW 소스 트리와 MQ XML 디렉토리에는 DEV/TST/PROD 폴더마다 바이트 단위로 같은 파일이 여러 벌 있습니다.
+ContentIndex는 디렉토리를 훑어 크기가 같은 파일끼리만 내용 해시(SHA-1)를 계산하고,
+같은 내용의 파일을 그룹으로 묶어 그룹마다 대표 경로(처음 발견한 경로)를 정합니다.
+XMLComparator는 키워드 검색/파싱을 대표 파일에만 하고 결과를 그룹의 모든 경로에 그대로 사용하며,
+중복 그룹은 결과 엑셀의 '중복 파일' 시트로 기록됩니다.
+"""
+import os
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from adapter_model import file_signature
+from comp_manifest import hash_file
+
+DUPLICATE_HEADERS = ["번호", "구분", "해시", "크기(B)", "파일 수", "대표 파일", "중복 경로"]
+
+
+class ContentIndex:
+    """
+    경로별 (수정시각, 크기)와 내용 해시, 같은 내용 파일의 대표 경로를 유지하는 인덱스
+    파일이 바뀌지 않았으면 다시 scan()해도 해시를 다시 계산하지 않습니다.
+    """
+
+    def __init__(self):
+        self.hashes = {}  # {경로: ((mtime, size), 해시)} 크기가 겹친 파일만
+        self.canonical_paths = {}  # {경로: 대표 경로} 중복 파일만
+        self.groups = {}  # {(구분, 해시): [경로, ...]} 2개 이상인 그룹만, 발견 순서
+        self.lock = threading.Lock()
+
+    def _digest(self, path: str, signature: Tuple[int, int]) -> str:
+        cached = self.hashes.get(path)
+        if cached and cached[0] == signature:
+            return cached[1]
+        digest = hash_file(path)
+        self.hashes[path] = (signature, digest)
+        return digest
+
+    def scan(self, root: str, label: str = '', recursive: bool = True) -> int:
+        """
+        디렉토리의 파일을 내용 해시로 묶습니다. 같은 label로 이전에 scan()한 결과는 대체합니다.
+
+        Args:
+            root (str): 디렉토리 경로
+            label (str): 보고서에 표시할 구분 (예: 'BW', 'MQ')
+            recursive (bool): 하위 디렉토리 포함 여부
+
+        Returns:
+            int: 대표 파일이 아닌 중복 파일 수
+        """
+        paths = []
+        if os.path.isdir(root):
+            if recursive:
+                for dir_path, _, files in os.walk(root):
+                    paths.extend(os.path.join(dir_path, file) for file in files)
+            else:
+                paths = [os.path.join(root, file) for file in os.listdir(root)
+                         if os.path.isfile(os.path.join(root, file))]
+
+        by_size = {}
+        signatures = {}
+        for path in paths:
+            signature = file_signature(path)
+            if signature is None:
+                continue
+            signatures[path] = signature
+            by_size.setdefault(signature[1], []).append(path)
+
+        groups = {}
+        with self.lock:
+            # 크기가 다른 파일은 내용도 다르므로 크기가 겹친 파일만 해시 계산
+            for size, same_size in by_size.items():
+                if len(same_size) < 2:
+                    continue
+                for path in same_size:
+                    digest = self._digest(path, signatures[path])
+                    if digest:
+                        groups.setdefault((label, digest), []).append(path)
+
+            for key in [key for key in self.groups if key[0] == label]:
+                for path in self.groups.pop(key):
+                    self.canonical_paths.pop(path, None)
+            for key, group in groups.items():
+                if len(group) < 2:
+                    continue
+                self.groups[key] = group
+                for path in group:
+                    self.canonical_paths[path] = group[0]
+            return sum(len(group) - 1 for key, group in self.groups.items() if key[0] == label)
+
+    def canonical(self, path: str) -> str:
+        """
+        같은 내용 그룹의 대표 경로, 중복이 아니거나 scan() 이후 둘 중 하나라도 바뀌었으면 path 그대로
+
+        Args:
+            path (str): 파일 경로
+
+        Returns:
+            str: 파싱/검색에 사용할 경로
+        """
+        canonical = self.canonical_paths.get(path)
+        if canonical is None or canonical == path:
+            return path
+        cached, canonical_cached = self.hashes.get(path), self.hashes.get(canonical)
+        if (cached and canonical_cached and cached[0] == file_signature(path)
+                and canonical_cached[0] == file_signature(canonical)):
+            return canonical
+        return path
+
+    def duplicate_groups(self) -> List[Dict]:
+        """
+        중복 그룹 목록
+
+        Returns:
+            List[Dict]: [{'label', 'digest', 'size', 'paths'}], 구분/대표 경로 순
+        """
+        with self.lock:
+            groups = [
+                {'label': label, 'digest': digest, 'size': self.hashes[paths[0]][0][1], 'paths': list(paths)}
+                for (label, digest), paths in self.groups.items()
+            ]
+        return sorted(groups, key=lambda group: (group['label'], group['paths'][0]))
+
+    def duplicate_rows(self, base_dirs: Optional[Dict[str, str]] = None) -> List[List]:
+        """
+        '중복 파일' 시트 행 (DUPLICATE_HEADERS 순서)
+
+        Args:
+            base_dirs (Dict[str, str], optional): {구분: 기준 디렉토리}, 주면 경로를 상대 경로로 표시
+
+        Returns:
+            List[List]: 행 목록
+        """
+        rows = []
+        for num, group in enumerate(self.duplicate_groups(), 1):
+            base = (base_dirs or {}).get(group['label'])
+            paths = [os.path.relpath(path, base) if base else path for path in group['paths']]
+            rows.append([num, group['label'], group['digest'][:12], group['size'], len(paths),
+                         paths[0], '\n'.join(paths[1:])])
+        return rows
@@ -0,0 +1,117 @@
+"""
+Tk 화면용 백그라운드 작업 실행 모듈
+
+DB 연결, 메타데이터 조회, XML 파싱처럼 오래 걸리는 작업을 작업 스레드에서 실행하고
+결과는 root.after() 폴링으로 Tk 이벤트 스레드에 전달합니다.
+Tk 위젯은 작업 스레드에서 건드리지 않고, 완료/오류 콜백만 이벤트 스레드에서 호출합니다.
+"""
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, CancelledError
+from typing import Callable, Optional
+
+
+class TaskCancelled(Exception):
+    """작업이 취소되었을 때 작업 함수에서 발생시키는 예외"""
+    pass
+
+
+class BackgroundRunner:
+    """
+    작업 함수를 스레드 풀에서 실행하고 결과를 Tk 이벤트 스레드로 전달하는 클래스
+
+    작업 함수는 첫 번째 인자로 threading.Event(취소 요청)를 받으며,
+    단계 사이에서 check_cancelled()로 취소 여부를 확인할 수 있습니다.
+    취소된 작업의 결과는 버리고 on_done 대신 on_cancel을 호출합니다.
+    """
+
+    def __init__(self, root, max_workers: int = 4, poll_ms: int = 100):
+        """
+        Args:
+            root: Tk 루트 위젯 (after() 사용)
+            max_workers (int): 동시에 실행할 최대 작업 수
+            poll_ms (int): 결과 확인 주기(밀리초)
+        """
+        self.root = root
+        self.poll_ms = poll_ms
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.results = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.pending = 0
+        self._polling = False
+
+    @property
+    def busy(self) -> bool:
+        """실행 중이거나 결과 전달을 기다리는 작업이 있는지 여부"""
+        return self.pending > 0
+
+    def check_cancelled(self):
+        """취소가 요청되었으면 TaskCancelled를 발생시킵니다."""
+        if self.cancel_event.is_set():
+            raise TaskCancelled()
+
+    def submit(self, func: Callable, *args, on_done: Optional[Callable] = None,
+               on_error: Optional[Callable] = None, on_cancel: Optional[Callable] = None):
+        """
+        작업을 실행합니다. 콜백은 모두 Tk 이벤트 스레드에서 호출됩니다.
+
+        Args:
+            func (Callable): func(cancel_event, *args) 형태의 작업 함수
+            on_done (Callable, optional): on_done(결과)
+            on_error (Callable, optional): on_error(예외)
+            on_cancel (Callable, optional): on_cancel()
+
+        Returns:
+            Future: 실행 중인 작업
+        """
+        if not self.busy:
+            self.cancel_event.clear()
+        self.pending += 1
+        cancel_event = self.cancel_event
+
+        def run():
+            try:
+                if cancel_event.is_set():
+                    raise TaskCancelled()
+                result = func(cancel_event, *args)
+                if cancel_event.is_set():
+                    raise TaskCancelled()
+                self.results.put((on_done, (result,)))
+            except (TaskCancelled, CancelledError):
+                self.results.put((on_cancel, ()))
+            except Exception as e:
+                self.results.put((on_error, (e,)))
+
+        future = self.executor.submit(run)
+        if not self._polling:
+            self._polling = True
+            self.root.after(self.poll_ms, self._poll)
+        return future
+
+    def _poll(self):
+        """완료된 작업의 콜백을 Tk 이벤트 스레드에서 호출합니다."""
+        while True:
+            try:
+                callback, args = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if callback is not None:
+                try:
+                    callback(*args)
+                except Exception as e:
+                    print(f"Warning: 백그라운드 작업 콜백 오류: {str(e)}")
+
+        if self.pending > 0:
+            self.root.after(self.poll_ms, self._poll)
+        else:
+            self._polling = False
+
+    def cancel(self):
+        """실행 중인 작업에 취소를 요청합니다. 이미 DB/파일 호출 중인 작업은 호출이 끝난 뒤 결과를 버립니다."""
+        self.cancel_event.set()
+
+    def shutdown(self):
+        """작업 취소를 요청하고 스레드 풀을 정리합니다."""
+        self.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -1,6 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
 from maptest import ColumnMapper
+from gui_worker import BackgroundRunner
 
 class MapperGUI:
     def __init__(self):
@@ -8,6 +9,9 @@ class MapperGUI:
         self.root.title("DB 컬럼 매핑 도구")
         self.setup_gui()
         self.mapper = ColumnMapper()
+        # DB 연결/메타데이터 조회는 작업 스레드에서 실행 (mapper를 공유하므로 한 번에 하나씩)
+        self.runner = BackgroundRunner(self.root, max_workers=1)
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
 
     def setup_gui(self):
         # 프레임 생성
@@ -66,111 +70,152 @@ class MapperGUI:
         self.recv_columns.grid(row=5, column=1, sticky="ew")
 
         # 버튼 프레임
-        ttk.Button(button_frame, text="실행", command=self.run_test).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="SQL 생성", command=self.generate_sql).pack(side="left", padx=5)
-        ttk.Button(button_frame, text="XML 생성", command=self.generate_xml).pack(side="left", padx=5)
+        self.run_button = ttk.Button(button_frame, text="실행", command=self.run_test)
+        self.sql_button = ttk.Button(button_frame, text="SQL 생성", command=self.generate_sql)
+        self.xml_button = ttk.Button(button_frame, text="XML 생성", command=self.generate_xml)
+        self.cancel_button = ttk.Button(button_frame, text="취소", command=self.cancel_task, state="disabled")
+        self.run_button.pack(side="left", padx=5)
+        self.sql_button.pack(side="left", padx=5)
+        self.xml_button.pack(side="left", padx=5)
+        self.cancel_button.pack(side="left", padx=5)
+
+        # 진행 표시
+        self.progress = ttk.Progressbar(button_frame, mode="indeterminate", length=120)
+        self.status_label = ttk.Label(button_frame, text="")
+        self.progress.pack(side="left", padx=5)
+        self.status_label.pack(side="left", padx=5)
 
         # 결과 프레임
         self.result_text = scrolledtext.ScrolledText(result_frame, width=50, height=20)
         self.result_text.pack(fill="both", expand=True)
 
+    def start_task(self, message, func, *args, on_done=None):
+        """버튼을 비활성화하고 작업 스레드에서 func를 실행합니다."""
+        if self.runner.busy:
+            return
+        for button in (self.run_button, self.sql_button, self.xml_button):
+            button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.status_label.config(text=message)
+        self.progress.start(10)
+        self.runner.submit(
+            func, *args,
+            on_done=lambda result: self.finish_task(on_done, result),
+            on_error=lambda e: self.finish_task(self.show_error, e),
+            on_cancel=lambda: self.finish_task(None, None, "취소되었습니다.")
+        )
+
+    def finish_task(self, callback, value, message=""):
+        """진행 표시를 멈추고 버튼을 다시 활성화한 뒤 결과를 표시합니다."""
+        self.progress.stop()
+        self.status_label.config(text=message)
+        self.cancel_button.config(state="disabled")
+        for button in (self.run_button, self.sql_button, self.xml_button):
+            button.config(state="normal")
+        if callback is not None:
+            callback(value)
+
+    def cancel_task(self):
+        self.status_label.config(text="취소 중...")
+        self.runner.cancel()
+
+    def show_error(self, error):
+        messagebox.showerror("오류", str(error))
+
+    def show_text(self, text):
+        self.result_text.delete("1.0", tk.END)
+        self.result_text.insert(tk.END, text)
+
     def run_test(self):
+        # 입력값은 이벤트 스레드에서 읽고, DB 작업만 작업 스레드로 넘김
+        params = {
+            'send_db': (self.send_sid.get(), self.send_username.get(), self.send_password.get()),
+            'recv_db': (self.recv_sid.get(), self.recv_username.get(), self.recv_password.get()),
+            'send_table': (self.send_owner.get(), self.send_table.get()),
+            'recv_table': (self.recv_owner.get(), self.recv_table.get()),
+            'send_mapping': self.send_columns.get("1.0", tk.END),
+            'recv_mapping': self.recv_columns.get("1.0", tk.END)
+        }
+        self.start_task("DB 연결 및 컬럼 비교 중...", self.compare_worker, params, on_done=self.show_results)
+
+    def compare_worker(self, cancel_event, params):
+        """작업 스레드: DB 연결, 테이블/매핑 설정, 컬럼 비교"""
         try:
             # 송신 DB 연결
-            self.mapper.connect_send_db(
-                self.send_sid.get(),
-                self.send_username.get(),
-                self.send_password.get()
-            )
+            self.mapper.connect_send_db(*params['send_db'])
+            self.runner.check_cancelled()
 
             # 수신 DB 연결
-            self.mapper.connect_recv_db(
-                self.recv_sid.get(),
-                self.recv_username.get(),
-                self.recv_password.get()
-            )
-
-            # 송신 테이블 설정
-            self.mapper.set_send_table(
-                self.send_owner.get(),
-                self.send_table.get()
-            )
-
-            # 수신 테이블 설정
-            self.mapper.set_recv_table(
-                self.recv_owner.get(),
-                self.recv_table.get()
-            )
+            self.mapper.connect_recv_db(*params['recv_db'])
+            self.runner.check_cancelled()
+
+            # 송신/수신 테이블 설정
+            self.mapper.set_send_table(*params['send_table'])
+            self.runner.check_cancelled()
+            self.mapper.set_recv_table(*params['recv_table'])
+            self.runner.check_cancelled()
 
             # 매핑 컬럼 설정
-            self.mapper.set_send_mapping(self.send_columns.get("1.0", tk.END))
-            self.mapper.set_recv_mapping(self.recv_columns.get("1.0", tk.END))
+            self.mapper.set_send_mapping(params['send_mapping'])
+            self.mapper.set_recv_mapping(params['recv_mapping'])
 
             # 컬럼 비교 실행
-            results = self.mapper.compare_columns()
-            
-            # 결과 표시
-            self.result_text.delete("1.0", tk.END)
-            
-            has_error = False
-            error_messages = ["컬럼 비교 결과:"]
-            
-            for result in results:
-                if 'error' in result:
-                    error_messages.append(f"\n{result['error']}")
-                    has_error = True
-                    continue
-                    
-                if result.get('errors'):
-                    # 무시할 에러 메시지 목록
-                    ignore_messages = [
-                        "수신 매핑이 설정되지 않았습니다 (선택적 수신)",
-                    ]
-                    
-                    # 실제 에러만 필터링
-                    real_errors = [
-                        error for error in result['errors']
-                        if not any(ignore_msg in error for ignore_msg in ignore_messages)
-                    ]
-                    
-                    # 실제 에러가 있는 경우만 출력
-                    if real_errors:
-                        error_messages.append(f"\n[{result['send_column']} -> {result['recv_column'] or '(매핑 없음)'}]")
-                        error_messages.append("  - " + "\n  - ".join(real_errors))
-                        has_error = True
-
-            if not has_error:
-                self.result_text.insert(tk.END, "모든 컬럼이 정상적으로 매핑되었습니다.")
-            else:
-                self.result_text.insert(tk.END, "\n".join(error_messages))
-
-        except Exception as e:
-            messagebox.showerror("오류", str(e))
+            return self.mapper.compare_columns()
         finally:
             self.mapper.close_connections()
 
+    def show_results(self, results):
+        has_error = False
+        error_messages = ["컬럼 비교 결과:"]
+        
+        for result in results:
+            if 'error' in result:
+                error_messages.append(f"\n{result['error']}")
+                has_error = True
+                continue
+                
+            if result.get('errors'):
+                # 무시할 에러 메시지 목록
+                ignore_messages = [
+                    "수신 매핑이 설정되지 않았습니다 (선택적 수신)",
+                ]
+                
+                # 실제 에러만 필터링
+                real_errors = [
+                    error for error in result['errors']
+                    if not any(ignore_msg in error for ignore_msg in ignore_messages)
+                ]
+                
+                # 실제 에러가 있는 경우만 출력
+                if real_errors:
+                    error_messages.append(f"\n[{result['send_column']} -> {result['recv_column'] or '(매핑 없음)'}]")
+                    error_messages.append("  - " + "\n  - ".join(real_errors))
+                    has_error = True
+
+        if not has_error:
+            self.show_text("모든 컬럼이 정상적으로 매핑되었습니다.")
+        else:
+            self.show_text("\n".join(error_messages))
+
     def generate_sql(self):
-        try:
-            # 송신 SQL 생성
-            send_sql = self.mapper.generate_send_sql()
-            recv_sql = self.mapper.generate_recv_sql()
-            
-            self.result_text.delete("1.0", tk.END)
-            self.result_text.insert(tk.END, "=== 송신 SQL ===\n")
-            self.result_text.insert(tk.END, send_sql)
-            self.result_text.insert(tk.END, "\n\n=== 수신 SQL ===\n")
-            self.result_text.insert(tk.END, recv_sql)
-
-        except Exception as e:
-            messagebox.showerror("오류", str(e))
+        self.start_task("SQL 생성 중...", self.sql_worker, on_done=self.show_text)
+
+    def sql_worker(self, cancel_event):
+        """작업 스레드: 실행 단계에서 조회한 컬럼 정보로 송신/수신 SQL 생성"""
+        send_sql = self.mapper.generate_send_sql_from_mapping()
+        recv_sql = self.mapper.generate_recv_sql()
+        return f"=== 송신 SQL ===\n{send_sql}\n\n=== 수신 SQL ===\n{recv_sql}"
 
     def generate_xml(self):
-        try:
-            xml = self.mapper.generate_field_xml()
-            self.result_text.delete("1.0", tk.END)
-            self.result_text.insert(tk.END, xml)
-        except Exception as e:
-            messagebox.showerror("오류", str(e))
+        self.start_task("XML 생성 중...", self.xml_worker, on_done=self.show_text)
+
+    def xml_worker(self, cancel_event):
+        """작업 스레드: 매핑 정보로 필드 XML 생성"""
+        return self.mapper.generate_field_xml_from_mapping()
+
+    def on_close(self):
+        self.runner.shutdown()
+        self.root.destroy()
 
     def run(self):
         self.root.mainloop()
@@ -0,0 +1,41 @@
+"""
+테스트용 ColumnMapper 픽스처 모듈
+
+메모리 스키마(InMemoryMetadataProvider)로 ColumnMapper를 만들고
+송수신 DB 연결, 테이블 지정, 매핑 지정까지 마친 상태로 반환합니다.
+"""
+from typing import Dict, Optional, Tuple
+
+from maptest import ColumnMapper
+from metadata_provider import InMemoryMetadataProvider
+
+DB_INFO = {'sid': 'SID', 'username': 'user', 'password': 'pw'}
+
+
+def build_mapper(schema: Dict, send_table: Optional[Tuple[str, str]] = None,
+                 recv_table: Optional[Tuple[str, str]] = None,
+                 send_mapping: str = '', recv_mapping: str = '') -> ColumnMapper:
+    """
+    메모리 스키마를 사용하는 ColumnMapper를 만듭니다.
+
+    Args:
+        schema (Dict): {(owner, 테이블명): {컬럼명: 컬럼정보}}
+        send_table (Tuple[str, str], optional): 송신 (owner, 테이블명), 없으면 송신 쪽은 설정하지 않음
+        recv_table (Tuple[str, str], optional): 수신 (owner, 테이블명), 없으면 수신 쪽은 설정하지 않음
+        send_mapping (str): 송신 매핑 컬럼 (줄바꿈 구분)
+        recv_mapping (str): 수신 매핑 컬럼 (줄바꿈 구분)
+
+    Returns:
+        ColumnMapper: 설정을 마친 매퍼
+    """
+    mapper = ColumnMapper()
+    mapper.metadata_provider = InMemoryMetadataProvider(schema)
+    if send_table:
+        mapper.connect_send_db(DB_INFO['sid'], DB_INFO['username'], DB_INFO['password'])
+        mapper.set_send_table(*send_table)
+        mapper.set_send_mapping(send_mapping)
+    if recv_table:
+        mapper.connect_recv_db(DB_INFO['sid'], DB_INFO['username'], DB_INFO['password'])
+        mapper.set_recv_table(*recv_table)
+        mapper.set_recv_mapping(recv_mapping)
+    return mapper
@@ -1,9 +1,38 @@
-import oracledb
-import pandas as pd
+import os
+from metadata_provider import MetadataProvider, OracleMetadataProvider
+from comp_profile import NULL_PROFILER
+from column_rules import DEFAULT_RULES
+from sql_templates import MappingPlan, APPEND_VALUES_HINT
+
+# thick 모드가 필요한 경우(구버전 DB 등) Instant Client 경로를 환경변수로 지정합니다.
+# 예: set ORACLE_CLIENT_LIB_DIR=C:\instantclient_21_3
+ORACLE_CLIENT_LIB_DIR_ENV = 'ORACLE_CLIENT_LIB_DIR'
+
+_oracledb = None
+
+
+def get_oracledb():
+	"""oracledb 모듈을 처음 사용할 때 import 합니다.
+	기본은 thin 모드이며, ORACLE_CLIENT_LIB_DIR 환경변수가 있으면 해당 Instant Client로 thick 모드를 초기화합니다.
+
+	Returns:
+		oracledb 모듈
+	"""
+	global _oracledb
+	if _oracledb is None:
+		try:
+			import oracledb
+		except ImportError:
+			raise ImportError("DB 연결에는 oracledb 패키지가 필요합니다. (pip install oracledb)")
+		lib_dir = os.environ.get(ORACLE_CLIENT_LIB_DIR_ENV)
+		if lib_dir:
+			oracledb.init_oracle_client(lib_dir=lib_dir)
+		_oracledb = oracledb
+	return _oracledb
+
 
 class ColumnMapper:
 	def __init__(self):
-		oracledb.init_oracle_client(lib_dir=r"C:\instantclient_21_3")
 		self.send_connection = None
 		self.recv_connection = None
 		self.send_mapping = []  # 사용자가 입력한 송신 컬럼 순서
@@ -15,18 +44,70 @@ class ColumnMapper:
 		self.comparison_results = []
 		self.send_mapping_str = ''''''  # 송신 매핑 문자열
 		self.recv_mapping_str = ''''''  # 수신 매핑 문자열
+		self.schema_catalog = None  # 컬럼 정보 캐시 {(sid, username, owner, table_name): 컬럼 정보}, None이면 사용 안 함
+		self.send_login = None  # 송신 DB 접속 정보 (sid, username, password)
+		self.recv_login = None  # 수신 DB 접속 정보 (sid, username, password)
+		self.metadata_provider = None  # MetadataProvider, 지정하면 Oracle 대신 컬럼 정보 조회에 사용
+		self.profiler = NULL_PROFILER  # comp_profile.RunProfiler, DB 접속/컬럼 조회 시간 기록
+		self.rules = DEFAULT_RULES  # column_rules.CompiledRules, 타입/크기 호환성 규칙
+		self._statement_plan = None  # sql_templates.MappingPlan, SQL/필드 XML 생성용 (매핑이 바뀌면 다시 생성)
+
+	def spawn(self):
+		"""같은 설정(컬럼 정보 제공자, 스키마 카탈로그, 프로파일러, 규칙)을 사용하는 새 ColumnMapper를 만듭니다.
+		DB 연결과 매핑 상태는 공유하지 않으므로 스레드마다 하나씩 사용할 수 있습니다.
+		"""
+		mapper = ColumnMapper()
+		if self.metadata_provider is not None:
+			mapper.metadata_provider = self.metadata_provider.spawn()
+		mapper.schema_catalog = self.schema_catalog
+		mapper.profiler = self.profiler
+		mapper.rules = self.rules
+		return mapper
 
 	def connect_db(self, sid, username, password):
-		"""DB 연결을 생성합니다."""
-		return oracledb.connect(user=username, password=password, dsn=sid)
+		"""DB 연결을 생성합니다. metadata_provider가 지정되어 있으면 Oracle 대신 제공자를 반환합니다."""
+		if self.metadata_provider is not None:
+			return self.metadata_provider
+		with self.profiler.stage('db_logon'):
+			connection = get_oracledb().connect(user=username, password=password, dsn=sid)
+		self.profiler.count('db_logons')
+		return connection
 
 	def connect_send_db(self, sid, username, password):
-		"""송신 DB에 연결합니다."""
+		"""송신 DB에 연결합니다.
+		스키마 카탈로그를 사용하는 경우 컬럼 정보 조회가 필요할 때까지 연결을 미룹니다.
+		"""
+		login = (sid, username, password)
+		if self.schema_catalog is not None:
+			# 다른 DB로 바뀌면 이전 연결은 닫음
+			if self.send_connection and self.send_login != login:
+				try:
+					self.send_connection.close()
+				except:
+					pass
+				self.send_connection = None
+			self.send_login = login
+			return self.send_connection
+		self.send_login = login
 		self.send_connection = self.connect_db(sid, username, password)
 		return self.send_connection
 
 	def connect_recv_db(self, sid, username, password):
-		"""수신 DB에 연결합니다."""
+		"""수신 DB에 연결합니다.
+		스키마 카탈로그를 사용하는 경우 컬럼 정보 조회가 필요할 때까지 연결을 미룹니다.
+		"""
+		login = (sid, username, password)
+		if self.schema_catalog is not None:
+			# 다른 DB로 바뀌면 이전 연결은 닫음
+			if self.recv_connection and self.recv_login != login:
+				try:
+					self.recv_connection.close()
+				except:
+					pass
+				self.recv_connection = None
+			self.recv_login = login
+			return self.recv_connection
+		self.recv_login = login
 		self.recv_connection = self.connect_db(sid, username, password)
 		return self.recv_connection
 
@@ -37,32 +118,23 @@ class ColumnMapper:
 				self.send_connection.close()
 			except:
 				pass
+			self.send_connection = None
 		if self.recv_connection:
 			try:
 				self.recv_connection.close()
 			except:
 				pass
+			self.recv_connection = None
 
 	def get_column_info(self, owner, table_name, connection):
-		"""테이블의 컬럼 정보를 조회합니다."""
-		cursor = connection.cursor()
-		query = """
-			SELECT column_name, data_type, data_length, nullable
-			FROM all_tab_columns
-			WHERE owner = :owner
-			AND table_name = :table_name
-			ORDER BY column_id
+		"""테이블의 컬럼 정보를 조회합니다.
+		connection이 MetadataProvider이면 제공자로, 아니면 Oracle all_tab_columns로 조회합니다.
 		"""
-		cursor.execute(query, owner=owner, table_name=table_name)
-		columns = {}
-		for row in cursor:
-			columns[row[0]] = {
-				'name': row[0],
-				'type': row[1],
-				'size': str(row[2]),
-				'nullable': 'Y' if row[3] == 'Y' else 'N'
-			}
-		cursor.close()
+		if not isinstance(connection, MetadataProvider):
+			connection = OracleMetadataProvider(connection)
+		with self.profiler.stage('column_metadata'):
+			columns = connection.get_column_info(owner, table_name)
+		self.profiler.count('column_queries')
 		return columns
 
 	def set_send_mapping(self, column_list):
@@ -73,20 +145,52 @@ class ColumnMapper:
 		"""수신 매핑 컬럼을 설정합니다."""
 		self.recv_mapping = [col.strip() for col in column_list.split('\n') if col.strip()]
 
+	def lookup_columns(self, direction, owner, table_name):
+		"""스키마 카탈로그를 먼저 확인하고, 없으면 DB에서 컬럼 정보를 조회합니다.
+
+		Args:
+			direction: 'send' 또는 'recv'
+			owner: 스키마명
+			table_name: 테이블명
+
+		Returns:
+			컬럼 정보 딕셔너리
+		"""
+		login = self.send_login if direction == 'send' else self.recv_login
+		key = None
+		if self.schema_catalog is not None and login:
+			key = (login[0], login[1], owner, table_name)
+			if key in self.schema_catalog:
+				self.profiler.count('schema_catalog_hit')
+				return self.schema_catalog[key]
+			self.profiler.count('schema_catalog_miss')
+
+		connection = self.send_connection if direction == 'send' else self.recv_connection
+		if not connection and self.schema_catalog is not None and login:
+			# 카탈로그에 없는 테이블을 처음 조회할 때 연결
+			connection = self.connect_db(*login)
+			if direction == 'send':
+				self.send_connection = connection
+			else:
+				self.recv_connection = connection
+		if not connection:
+			raise Exception("송신 DB 연결이 필요합니다." if direction == 'send' else "수신 DB 연결이 필요합니다.")
+
+		columns = self.get_column_info(owner, table_name, connection)
+		if key is not None:
+			self.schema_catalog[key] = columns
+		return columns
+
 	def set_send_table(self, owner, table_name):
 		"""송신 테이블 정보를 설정합니다."""
-		if not self.send_connection:
-			raise Exception("송신 DB 연결이 필요합니다.")
+		self.send_columns = self.lookup_columns('send', owner, table_name)
 		self.send_table_info = {'owner': owner, 'table_name': table_name}
-		self.send_columns = self.get_column_info(owner, table_name, self.send_connection)
 		return self.send_columns
 
 	def set_recv_table(self, owner, table_name):
 		"""수신 테이블 정보를 설정합니다."""
-		if not self.recv_connection:
-			raise Exception("수신 DB 연결이 필요합니다.")
+		self.recv_columns = self.lookup_columns('recv', owner, table_name)
 		self.recv_table_info = {'owner': owner, 'table_name': table_name}
-		self.recv_columns = self.get_column_info(owner, table_name, self.recv_connection)
 		return self.recv_columns
 
 	def convert_mapping_str_to_list(self, mapping_str=None, mapping_type='send'):
@@ -196,11 +300,7 @@ class ColumnMapper:
 			return "컬럼 정보 형식 오류"
 		if 'type' not in send or 'type' not in recv:
 			return "컬럼 타입 정보 누락"
-		if send['type'] == recv['type']:
-			return ""
-		if (send['type'] in ["VARCHAR", "VARCHAR2", "CHAR"]) and (recv['type'] in ["VARCHAR", "VARCHAR2", "CHAR"]):
-			return ""
-		return "칼럼 Type NG"
+		return self.rules.type_diff(send, recv)
 
 	def check_size_diff(self, send, recv):
 		"""크기 차이 체크"""
@@ -208,22 +308,8 @@ class ColumnMapper:
 			return "컬럼 정보 형식 오류"
 		if 'type' not in send or 'type' not in recv or 'size' not in send or 'size' not in recv:
 			return "컬럼 크기 정보 누락"
-			
-		# DATE 타입이 포함된 경우 크기 비교하지 않음
-		if 'DATE' in (send['type'], recv['type']):
-			return ""
-			
-		# VARCHAR 계열 타입끼리만 크기 비교
-		if (send['type'] in ["VARCHAR", "VARCHAR2", "CHAR"]) and (recv['type'] in ["VARCHAR", "VARCHAR2", "CHAR"]):
-			try:
-				send_size = int(send['size'])
-				recv_size = int(recv['size'])
-				if send_size > recv_size:
-					return f"송신({send_size}) > 수신({recv_size})"
-				return ""
-			except ValueError:
-				return "크기 변환 오류"
-		return ""
+		# 타입 조합별 크기 비교 (VARCHAR 계열 길이, NUMBER 정밀도/스케일, TIMESTAMP 소수 초, DATE 등은 비교 안 함)
+		return self.rules.size_diff(send, recv)
 
 	def check_size_over_1024(self, col_info):
 		"""1024 바이트 초과 체크"""
@@ -231,13 +317,7 @@ class ColumnMapper:
 			return "컬럼 정보 형식 오류"
 		if 'type' not in col_info or 'size' not in col_info:
 			return "컬럼 크기 정보 누락"
-			
-		if col_info['type'] in ["NVARCHAR", "NCHAR", "NVARCHAR2"]:
-			if float(col_info['size']) > 1024 / 3:
-				return "칼럼 Size > 1024"
-		if float(col_info['size']) > 1024:
-			return "칼럼 Size > 1024"
-		return ""
+		return self.rules.size_over(col_info)
 
 	def check_nullable_diff(self, send, recv):
 		"""Nullable 차이 체크"""
@@ -258,41 +338,45 @@ class ColumnMapper:
 			return "Nullable NG (수신 Not Null 제약 위반 가능성)"
 		return ""
 
+	def statement_plan(self):
+		"""현재 매핑/컬럼 정보의 MappingPlan을 반환합니다. 매핑이나 테이블이 바뀌지 않았으면 이전 계획을 재사용합니다."""
+		plan = self._statement_plan
+		if plan is None or not plan.built_from(self.send_mapping, self.recv_mapping, self.send_columns, self.recv_columns):
+			plan = MappingPlan(self.send_mapping, self.recv_mapping, self.send_columns, self.recv_columns)
+			self._statement_plan = plan
+		return plan
+
 	def generate_send_sql_from_mapping(self):
 		"""송신 SQL 생성"""
 		if not self.send_mapping or not self.send_table_info:
 			return "송신 테이블 정보가 설정되지 않았습니다."
-		return self.generate_full_send_sql(self.send_table_info, self.send_mapping, self.send_columns)
+		return self.statement_plan().select_sql(self.send_table_info)
+
+	def generate_recv_sql(self, hint=None):
+		"""수신 SQL 생성
 
-	def generate_recv_sql(self):
-		"""수신 SQL 생성"""
+		Args:
+			hint: 옵티마이저 힌트 (예: sql_templates.APPEND_HINT), 없으면 힌트 없음
+		"""
 		if not self.recv_mapping or not self.recv_table_info:
 			return "수신 테이블 정보가 설정되지 않았습니다."
-		return self.generate_full_receive_sql(self.recv_table_info, self.recv_mapping, self.recv_columns)
+		return self.statement_plan().insert_sql(self.recv_table_info, hint)
+
+	def generate_recv_array_sql(self, hint=APPEND_VALUES_HINT):
+		"""대량 인터페이스용 배열 바인드(executemany) 수신 INSERT 생성
+
+		Returns:
+			(INSERT 문, 바인드 순서의 송신 컬럼명 목록), 테이블 정보가 없으면 (오류 메시지, [])
+		"""
+		if not self.recv_mapping or not self.recv_table_info:
+			return "수신 테이블 정보가 설정되지 않았습니다.", []
+		return self.statement_plan().array_insert_sql(self.recv_table_info, hint)
 
 	def generate_field_xml_from_mapping(self):
 		"""매핑 정보로부터 필드 XML 생성"""
 		if not self.send_mapping or not self.send_columns:
 			return ""
-		
-		lines = []
-		lines.append(f'<field count="{len(self.send_mapping)}">')
-		
-		for idx, send_col in enumerate(self.send_mapping, 1):
-			if send_col in self.send_columns:
-				col_info = self.send_columns[send_col]
-				recv_col = self.recv_mapping[idx-1] if idx <= len(self.recv_mapping) else ""
-				
-				lines.append(f'    <col{idx}>')
-				lines.append(f'        <length>{col_info["size"]}</length>')
-				lines.append(f'        <type>{col_info["type"]}</type>')
-				lines.append(f'        <name>{send_col}</name>')
-				if recv_col:
-					lines.append(f'        <mapping>{recv_col}</mapping>')
-				lines.append(f'    </col{idx}>')
-		
-		lines.append('</field>')
-		return '\n'.join(lines)
+		return self.statement_plan().field_xml()
 
 	def generate_receive_insert_into(self, column_list, columns_info, base_query):
 		"""수신 INSERT 문의 INTO 부분 생성
@@ -304,28 +388,10 @@ class ColumnMapper:
 		Returns:
 			INTO 절 문자열
 		"""
-		sql_parts = [
-			"EAI_SEQ_ID", "DATA_INTERFACE_TYPE_CODE",
-			"EAI_INTERFACE_DATE", "APPLICATION_TRANSFER_FLAG"
-		]
-		for col in column_list:
-			if not col:
-				continue
-			if col not in columns_info:
-				continue
-			sql_parts.append(col)
-		formatted_parts = []
-		for i in range(0, len(sql_parts), 2):
-			pair = []
-			pair.append(sql_parts[i])
-			if i + 1 < len(sql_parts):
-				pair.append(sql_parts[i+1])
-			formatted_parts.append(f"    {', '.join(pair)}")
-		if formatted_parts:
-			formatted_parts[-1] = formatted_parts[-1].rstrip(',')
+		into_part = MappingPlan(self.send_mapping, column_list, {}, columns_info).into_columns()
 		if base_query:
-			return f"{base_query}\n" + ",\n".join(formatted_parts)
-		return ",\n".join(formatted_parts)
+			return f"{base_query}\n{into_part}"
+		return into_part
 
 	def generate_receive_insert_values(self, column_list, columns_info, base_query):
 		"""수신 INSERT 문의 VALUES 부분 생성
@@ -337,35 +403,10 @@ class ColumnMapper:
 		Returns:
 			VALUES 절 문자열
 		"""
-		sql_parts = [
-			":EAI_SEQ_ID", ":DATA_INTERFACE_TYPE_CODE",
-			"SYSDATE", "'N'"
-		]
-		for idx, recv_col in enumerate(column_list):
-			if not recv_col:
-				continue
-			if recv_col not in columns_info:
-				continue
-			send_col = self.send_mapping[idx] if idx < len(self.send_mapping) else None
-			if not send_col:
-				continue
-			col_info = columns_info[recv_col]
-			if col_info['type'] == 'DATE':
-				sql_parts.append(f"TO_DATE(:{send_col}, 'YYYYMMDDHH24MISS')")
-			else:
-				sql_parts.append(f":{send_col}")
-		formatted_parts = []
-		for i in range(0, len(sql_parts), 2):
-			pair = []
-			pair.append(sql_parts[i])
-			if i + 1 < len(sql_parts):
-				pair.append(sql_parts[i+1])
-			formatted_parts.append(f"    {', '.join(pair)}")
-		if formatted_parts:
-			formatted_parts[-1] = formatted_parts[-1].rstrip(',')
+		values_part = MappingPlan(self.send_mapping, column_list, {}, columns_info).insert_values()
 		if base_query:
-			return f"{base_query}\n" + ",\n".join(formatted_parts)
-		return ",\n".join(formatted_parts)
+			return f"{base_query}\n{values_part}"
+		return values_part
 
 	def generate_full_send_sql(self, table_info, column_list, columns_info):
 		"""전체 송신 SQL 생성 (SELECT 문 전체)
@@ -378,12 +419,7 @@ class ColumnMapper:
 		Returns:
 			완성된 SELECT 문
 		"""
-		columns_sql = self.generate_send_sql(column_list, columns_info, "")
-		if not columns_sql:
-			return ""
-		sql = f"SELECT\n{columns_sql}"
-		sql += f"\nFROM {table_info['owner']}.{table_info['table_name']}"
-		return sql
+		return MappingPlan(column_list, [], columns_info, {}).select_sql(table_info)
 
 	def generate_send_sql(self, column_list, columns_info, base_query):
 		"""송신 SQL 생성
@@ -396,32 +432,8 @@ class ColumnMapper:
 		Returns:
 			생성된 SQL 문자열
 		"""
-		sql_parts = ["EAI_SEQ_ID", "DATA_INTERFACE_TYPE_CODE"]
-		for col in column_list:
-			if not col:
-				continue
-			if col not in columns_info:
-				continue
-			col_info = columns_info[col]
-			if col_info['type'] == 'DATE':
-				sql_parts.append(f"TO_CHAR({col}, 'YYYYMMDDHH24MISS')")
-			else:
-				sql_parts.append(col)
-		formatted_parts = []
-		for i in range(0, len(sql_parts), 2):
-			pair = []
-			pair.append(sql_parts[i])
-			if i + 1 < len(sql_parts):
-				pair.append(sql_parts[i+1])
-			formatted_parts.append(f"    {', '.join(pair)}")
-		if formatted_parts:
-			formatted_parts[-1] = formatted_parts[-1].rstrip(',')
-		if base_query:
-			sql = f"{base_query}\n"
-		else:
-			sql = "SELECT\n"
-		sql += ",\n".join(formatted_parts)
-		return sql
+		columns_part = MappingPlan(column_list, [], columns_info, {}).select_columns()
+		return f"{base_query or 'SELECT'}\n{columns_part}"
 
 	def generate_full_receive_sql(self, table_info, column_list, columns_info):
 		"""전체 수신 INSERT 문 생성
@@ -434,13 +446,7 @@ class ColumnMapper:
 		Returns:
 			완성된 INSERT 문
 		"""
-		base_query = "INSERT INTO "
-		if table_info['owner']:
-			base_query += f"{table_info['owner']}."
-		base_query += f"{table_info['table_name']} ("
-		into_part = self.generate_receive_insert_into(column_list, columns_info, "")
-		values_part = self.generate_receive_insert_values(column_list, columns_info, "")
-		return f"{base_query}\n{into_part}\n) VALUES (\n{values_part}\n)"
+		return MappingPlan(self.send_mapping, column_list, {}, columns_info).insert_sql(table_info)
 
 if __name__ == "__main__":
 	# 테스트를 위한 DB 연결 정보
@@ -0,0 +1,349 @@
+"""
+테이블 컬럼 메타데이터 제공자 모듈
+
+ColumnMapper.get_column_info()가 사용하는 컬럼 조회를 Oracle 이외의 저장소로도
+수행할 수 있도록 제공자 인터페이스와 구현을 정의합니다.
+
+- OracleMetadataProvider: Oracle all_tab_columns 조회 (기본 동작)
+- SQLiteMetadataProvider: all_tab_columns와 같은 구조의 SQLite 파일 (벤치마크/테스트용)
+- InMemoryMetadataProvider: 딕셔너리로 주어진 스키마
+
+DB 없이 처리량을 측정할 수 있도록 대량의 가상 스키마와 인터페이스 정보를 생성하는 함수도 제공합니다.
+
+    python metadata_provider.py --tables 5000 --out synthetic_schema.db
+"""
+import os
+import random
+import argparse
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+
+# Oracle all_tab_columns 조회 쿼리 (SQLite 픽스처도 같은 테이블 구조를 사용)
+COLUMN_QUERY = """
+    SELECT column_name, data_type, data_length, nullable, data_precision, data_scale
+    FROM all_tab_columns
+    WHERE owner = :owner
+    AND table_name = :table_name
+    ORDER BY column_id
+"""
+
+# 여러 테이블의 컬럼을 한 번에 조회하는 쿼리 ({tables}: (owner, table_name) 값 목록)
+BULK_COLUMN_QUERY = """
+    SELECT owner, table_name, column_name, data_type, data_length, nullable, data_precision, data_scale
+    FROM all_tab_columns
+    WHERE (owner, table_name) IN ({tables})
+    ORDER BY owner, table_name, column_id
+"""
+
+# 한 번의 조회에 넣을 최대 테이블 수 (Oracle IN 목록 1000개 제한)
+BULK_CHUNK_SIZE = 500
+
+# 스키마 딕셔너리 형식: {(owner, table_name): {column_name: {'name', 'type', 'size', 'nullable', 'precision', 'scale'}}}
+# precision/scale은 NUMBER 정밀도와 스케일(TIMESTAMP는 scale이 소수 초 자릿수)이며 없으면 None
+Schema = Dict[Tuple[str, str], Dict[str, Dict[str, str]]]
+
+
+def _rows_to_columns(rows) -> Dict[str, Dict[str, str]]:
+    """(column_name, data_type, data_length, nullable, data_precision, data_scale) 행을 ColumnMapper 컬럼 정보 형식으로 변환합니다."""
+    columns = {}
+    for row in rows:
+        columns[row[0]] = {
+            'name': row[0],
+            'type': row[1],
+            'size': str(row[2]),
+            'nullable': 'Y' if row[3] == 'Y' else 'N',
+            'precision': row[4],
+            'scale': row[5]
+        }
+    return columns
+
+
+def _group_rows(rows) -> Dict[Tuple[str, str], Dict[str, Dict[str, str]]]:
+    """(owner, table_name, 컬럼 행...) 행을 테이블별 컬럼 정보로 묶습니다."""
+    grouped = {}
+    for row in rows:
+        grouped.setdefault((row[0], row[1]), []).append(row[2:])
+    return {key: _rows_to_columns(table_rows) for key, table_rows in grouped.items()}
+
+
+def _chunks(items: List, size: int):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class MetadataProvider(ABC):
+    """
+    컬럼 메타데이터 제공자 기본 클래스
+    ColumnMapper.connect_db()가 반환하는 연결 대신 사용할 수 있도록 close()를 제공합니다.
+    get_column_info()를 구현하지 않은 제공자는 생성할 때 TypeError가 발생합니다.
+    """
+
+    @abstractmethod
+    def get_column_info(self, owner: str, table_name: str) -> Dict[str, Dict[str, str]]:
+        """
+        테이블의 컬럼 정보를 조회합니다.
+
+        Args:
+            owner (str): 스키마명
+            table_name (str): 테이블명
+
+        Returns:
+            Dict[str, Dict[str, str]]: {컬럼명: {'name', 'type', 'size', 'nullable', 'precision', 'scale'}}, 컬럼 순서 유지
+        """
+
+    def get_tables(self, tables: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Dict[str, str]]]:
+        """
+        여러 테이블의 컬럼 정보를 조회합니다. 기본 구현은 테이블마다 get_column_info()를 호출합니다.
+
+        Args:
+            tables (List[Tuple[str, str]]): (owner, table_name) 목록
+
+        Returns:
+            Dict: {(owner, table_name): 컬럼 정보}, 존재하지 않는 테이블은 빈 딕셔너리
+        """
+        return {(owner, table_name): self.get_column_info(owner, table_name) for owner, table_name in tables}
+
+    def close(self):
+        """연결을 종료합니다. 다시 조회하면 필요한 경우 새로 연결합니다."""
+        pass
+
+    def spawn(self) -> 'MetadataProvider':
+        """
+        다른 스레드에서 함께 사용할 제공자를 반환합니다.
+        기본 구현은 자신을 반환하며, 연결을 공유할 수 없는 제공자는 새 인스턴스를 반환합니다.
+        """
+        return self
+
+
+class OracleMetadataProvider(MetadataProvider):
+    """Oracle 연결로 all_tab_columns를 조회하는 제공자"""
+
+    def __init__(self, connection):
+        """
+        Args:
+            connection: oracledb 연결
+        """
+        self.connection = connection
+
+    def get_column_info(self, owner: str, table_name: str) -> Dict[str, Dict[str, str]]:
+        cursor = self.connection.cursor()
+        try:
+            cursor.execute(COLUMN_QUERY, owner=owner, table_name=table_name)
+            return _rows_to_columns(cursor)
+        finally:
+            cursor.close()
+
+    def get_tables(self, tables: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Dict[str, str]]]:
+        """all_tab_columns를 BULK_CHUNK_SIZE개 테이블 단위로 한 번에 조회합니다."""
+        tables = list(dict.fromkeys(tables))
+        result = {key: {} for key in tables}
+        cursor = self.connection.cursor()
+        try:
+            cursor.arraysize = 5000
+            for chunk in _chunks(tables, BULK_CHUNK_SIZE):
+                binds = {}
+                values = []
+                for index, (owner, table_name) in enumerate(chunk):
+                    binds[f"o{index}"] = owner
+                    binds[f"t{index}"] = table_name
+                    values.append(f"(:o{index}, :t{index})")
+                cursor.execute(BULK_COLUMN_QUERY.format(tables=", ".join(values)), binds)
+                result.update(_group_rows(cursor))
+        finally:
+            cursor.close()
+        return result
+
+    def close(self):
+        self.connection.close()
+
+
+class SQLiteMetadataProvider(MetadataProvider):
+    """all_tab_columns 테이블을 가진 SQLite 파일을 조회하는 제공자"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): SQLite 파일 경로 (create_sqlite_fixture()로 생성)
+        """
+        self.path = path
+        self._connection = None
+
+    def _connect(self):
+        if self._connection is None:
+            import sqlite3
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        return self._connection
+
+    def get_column_info(self, owner: str, table_name: str) -> Dict[str, Dict[str, str]]:
+        rows = self._connect().execute(COLUMN_QUERY, {'owner': owner, 'table_name': table_name})
+        return _rows_to_columns(rows)
+
+    def get_tables(self, tables: List[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict[str, Dict[str, str]]]:
+        """all_tab_columns를 BULK_CHUNK_SIZE개 테이블 단위로 한 번에 조회합니다."""
+        tables = list(dict.fromkeys(tables))
+        result = {key: {} for key in tables}
+        for chunk in _chunks(tables, BULK_CHUNK_SIZE):
+            values = ", ".join(["(?, ?)"] * len(chunk))
+            params = [value for key in chunk for value in key]
+            query = BULK_COLUMN_QUERY.format(tables=values)
+            result.update(_group_rows(self._connect().execute(query, params)))
+        return result
+
+    def close(self):
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def spawn(self) -> 'SQLiteMetadataProvider':
+        # close()가 다른 스레드의 조회 중인 연결을 닫지 않도록 연결을 따로 사용
+        return SQLiteMetadataProvider(self.path)
+
+
+class InMemoryMetadataProvider(MetadataProvider):
+    """메모리의 스키마 딕셔너리를 조회하는 제공자"""
+
+    def __init__(self, schema: Schema):
+        """
+        Args:
+            schema (Schema): {(owner, table_name): {컬럼명: 컬럼정보}}
+        """
+        self.schema = schema
+
+    def get_column_info(self, owner: str, table_name: str) -> Dict[str, Dict[str, str]]:
+        columns = self.schema.get((owner, table_name), {})
+        return {name: dict(info) for name, info in columns.items()}
+
+
+def create_sqlite_fixture(path: str, schema: Schema):
+    """
+    스키마 딕셔너리를 all_tab_columns 구조의 SQLite 파일로 저장합니다. 기존 파일은 덮어씁니다.
+
+    Args:
+        path (str): 저장할 SQLite 파일 경로
+        schema (Schema): 저장할 스키마
+    """
+    import sqlite3
+    if os.path.exists(path):
+        os.remove(path)
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("""
+            CREATE TABLE all_tab_columns (
+                owner TEXT, table_name TEXT, column_name TEXT,
+                data_type TEXT, data_length INTEGER, nullable TEXT, column_id INTEGER,
+                data_precision INTEGER, data_scale INTEGER
+            )
+        """)
+        connection.executemany(
+            "INSERT INTO all_tab_columns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                (owner, table_name, info['name'], info['type'], int(info['size']), info['nullable'], column_id,
+                 info.get('precision'), info.get('scale'))
+                for (owner, table_name), columns in schema.items()
+                for column_id, info in enumerate(columns.values(), 1)
+            )
+        )
+        connection.execute("CREATE INDEX ix_all_tab_columns ON all_tab_columns (owner, table_name)")
+        connection.commit()
+    finally:
+        connection.close()
+
+
+# 가상 컬럼 타입과 크기 후보
+_SYNTHETIC_TYPES = [
+    ('VARCHAR2', [10, 20, 50, 100, 200, 500, 2000]),
+    ('CHAR', [1, 2, 10]),
+    ('NUMBER', [22]),
+    ('DATE', [7]),
+    ('NVARCHAR2', [100, 400, 1000]),
+]
+
+
+def _synthetic_column(rng: random.Random, name: str) -> Dict[str, str]:
+    data_type, sizes = rng.choice(_SYNTHETIC_TYPES)
+    return {'name': name, 'type': data_type, 'size': str(rng.choice(sizes)), 'nullable': rng.choice(['Y', 'N'])}
+
+
+def generate_synthetic_schema(pair_count: int, min_columns: int = 5, max_columns: int = 40,
+                              mismatch_rate: float = 0.1, owner: str = 'BENCH', seed: int = 0) -> Schema:
+    """
+    송신/수신 테이블 쌍으로 이루어진 가상 스키마를 생성합니다.
+    수신 테이블은 송신 테이블과 같은 컬럼을 가지며, mismatch_rate 비율의 컬럼은
+    타입/크기/NULL 허용 여부를 달리하여 compare_columns()의 경고 경로도 측정되도록 합니다.
+
+    Args:
+        pair_count (int): 테이블 쌍 개수 (전체 테이블 수는 2배)
+        min_columns (int): 테이블당 최소 컬럼 수
+        max_columns (int): 테이블당 최대 컬럼 수
+        mismatch_rate (float): 수신 컬럼을 다르게 만들 비율 (0~1)
+        owner (str): 스키마명
+        seed (int): 난수 시드 (같은 시드면 같은 스키마)
+
+    Returns:
+        Schema: {(owner, 테이블명): {컬럼명: 컬럼정보}}
+    """
+    rng = random.Random(seed)
+    schema = {}
+    for idx in range(1, pair_count + 1):
+        send_columns = {}
+        recv_columns = {}
+        for col_idx in range(1, rng.randint(min_columns, max_columns) + 1):
+            name = f'COL_{col_idx:03d}'
+            send_info = _synthetic_column(rng, name)
+            recv_info = dict(send_info)
+            if rng.random() < mismatch_rate:
+                recv_info = _synthetic_column(rng, name)
+            send_columns[name] = send_info
+            recv_columns[name] = recv_info
+        schema[(owner, f'TB_SYN_{idx:05d}_S')] = send_columns
+        schema[(owner, f'TB_SYN_{idx:05d}_R')] = recv_columns
+    return schema
+
+
+def synthetic_interfaces(schema: Schema, db_info: Optional[Dict] = None) -> List[Dict]:
+    """
+    generate_synthetic_schema()의 테이블 쌍마다 read_interface_block()과 같은 형식의 인터페이스 정보를 만듭니다.
+
+    Args:
+        schema (Schema): 가상 스키마
+        db_info (Dict, optional): 송수신 DB 정보, 없으면 가상 값 사용
+
+    Returns:
+        List[Dict]: 인터페이스 정보 목록
+    """
+    db_info = db_info or {'sid': 'SYNTH', 'username': 'bench', 'password': 'bench'}
+    interfaces = []
+    for (owner, table_name), columns in schema.items():
+        if not table_name.endswith('_S'):
+            continue
+        recv_table = table_name[:-2] + '_R'
+        if (owner, recv_table) not in schema:
+            continue
+        base = table_name[:-2]
+        interfaces.append({
+            'interface_name': f'{base} 인터페이스',
+            'interface_id': f'IF_{base[len("TB_SYN_"):]}',
+            'send': {'owner': owner, 'table_name': table_name, 'columns': list(columns), 'db_info': dict(db_info)},
+            'recv': {'owner': owner, 'table_name': recv_table, 'columns': list(schema[(owner, recv_table)]), 'db_info': dict(db_info)}
+        })
+    return interfaces
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가상 스키마 SQLite 픽스처 생성")
+    parser.add_argument("--tables", type=int, default=1000, help="생성할 테이블 쌍 개수")
+    parser.add_argument("--min-columns", type=int, default=5, help="테이블당 최소 컬럼 수")
+    parser.add_argument("--max-columns", type=int, default=40, help="테이블당 최대 컬럼 수")
+    parser.add_argument("--mismatch-rate", type=float, default=0.1, help="수신 컬럼을 다르게 만들 비율")
+    parser.add_argument("--seed", type=int, default=0, help="난수 시드")
+    parser.add_argument("--out", default='synthetic_schema.db', help="출력 SQLite 파일")
+    args = parser.parse_args()
+
+    schema = generate_synthetic_schema(args.tables, args.min_columns, args.max_columns, args.mismatch_rate, seed=args.seed)
+    create_sqlite_fixture(args.out, schema)
+    column_count = sum(len(columns) for columns in schema.values())
+    print(f"생성 완료: {len(schema)}개 테이블, {column_count}개 컬럼 -> {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+송신 SELECT / 수신 INSERT / 필드 XML 템플릿 생성 모듈
+
+매핑을 한 번 순회하여 SELECT 컬럼, INSERT 컬럼/값, 필드 XML 항목을 모두 만든 MappingPlan을 만들고,
+모듈에 미리 정의한 문장 템플릿(str.format 형식)에 채워 넣습니다.
+생성한 문장은 MappingPlan에 보관하며, ColumnMapper(maptest.py)는 매핑/테이블이 바뀌지 않으면
+같은 MappingPlan을 재사용하므로 화면에서 다시 생성할 때는 문자열 조합을 반복하지 않습니다.
+
+대량 인터페이스용 변형:
+    - insert_sql(hint=APPEND_HINT): INSERT /*+ APPEND */ INTO ... (직접 경로 INSERT 힌트)
+    - array_insert_sql(): 위치 바인드(:1, :2, ...) INSERT와 바인드 순서의 컬럼명 목록
+      cursor.executemany(sql, rows)에 그대로 사용할 수 있으며, 기본 힌트는 APPEND_VALUES
+      (Oracle은 VALUES 절 INSERT에서 APPEND 힌트를 무시하고 배열 바인드에는 APPEND_VALUES를 사용)
+"""
+from typing import Dict, List, Optional, Tuple
+
+# 송신 SELECT / 수신 INSERT에 항상 들어가는 EAI 표준 컬럼
+SEND_AUTO_SELECT = ('EAI_SEQ_ID', 'DATA_INTERFACE_TYPE_CODE')
+RECV_AUTO_INTO = ('EAI_SEQ_ID', 'DATA_INTERFACE_TYPE_CODE', 'EAI_INTERFACE_DATE', 'APPLICATION_TRANSFER_FLAG')
+RECV_AUTO_VALUES = (':EAI_SEQ_ID', ':DATA_INTERFACE_TYPE_CODE', 'SYSDATE', "'N'")
+# 배열 바인드 INSERT에서 값으로 바인드하는 EAI 표준 컬럼 (나머지는 SYSDATE, 'N' 고정값)
+RECV_AUTO_BINDS = ('EAI_SEQ_ID', 'DATA_INTERFACE_TYPE_CODE')
+
+DATE_FORMAT = 'YYYYMMDDHH24MISS'
+
+APPEND_HINT = 'APPEND'
+APPEND_VALUES_HINT = 'APPEND_VALUES'
+
+SELECT_TEMPLATE = "SELECT\n{columns}\nFROM {table}"
+INSERT_TEMPLATE = "INSERT {hint}INTO {table} (\n{columns}\n) VALUES (\n{values}\n)"
+FIELD_TEMPLATE = (
+    "    <col{index}>\n"
+    "        <length>{length}</length>\n"
+    "        <type>{type}</type>\n"
+    "        <name>{name}</name>\n"
+    "{mapping}"
+    "    </col{index}>"
+)
+FIELD_MAPPING_TEMPLATE = "        <mapping>{name}</mapping>\n"
+
+
+def format_pairs(items: List[str]) -> str:
+    """항목을 한 줄에 두 개씩 '    a, b' 형식으로 나열합니다."""
+    return ",\n".join(f"    {', '.join(items[i:i + 2])}" for i in range(0, len(items), 2))
+
+
+def table_name(table_info: Dict) -> str:
+    """{'owner', 'table_name'}을 'OWNER.TABLE' (owner가 없으면 'TABLE')로 만듭니다."""
+    if table_info.get('owner'):
+        return f"{table_info['owner']}.{table_info['table_name']}"
+    return table_info['table_name']
+
+
+def _hint(hint: Optional[str]) -> str:
+    return f"/*+ {hint} */ " if hint else ""
+
+
+class MappingPlan:
+    """
+    송신/수신 매핑을 한 번 순회하여 만든 문장 생성용 항목 목록
+
+    - select_items: 송신 SELECT 항목 (DATE는 TO_CHAR)
+    - select_names: select_items 순서의 송신 컬럼명 (수신 INSERT의 바인드 이름)
+    - into_items: 수신 INSERT 컬럼
+    - value_items: 수신 INSERT 값 (송신 컬럼명 바인드, DATE는 TO_DATE)
+    - value_binds: value_items에 대응하는 (송신 컬럼명, DATE 여부)
+    - field_items: 필드 XML 항목
+    """
+
+    def __init__(self, send_mapping: List[str], recv_mapping: List[str],
+                 send_columns: Dict[str, Dict], recv_columns: Dict[str, Dict]):
+        """
+        Args:
+            send_mapping (List[str]): 송신 매핑 컬럼 순서
+            recv_mapping (List[str]): 수신 매핑 컬럼 순서
+            send_columns (Dict[str, Dict]): 송신 테이블 컬럼 정보
+            recv_columns (Dict[str, Dict]): 수신 테이블 컬럼 정보
+        """
+        self.send_mapping = list(send_mapping)
+        self.recv_mapping = list(recv_mapping)
+        self.send_columns = send_columns
+        self.recv_columns = recv_columns
+
+        self.select_items = list(SEND_AUTO_SELECT)
+        self.select_names = list(SEND_AUTO_SELECT)
+        self.into_items = list(RECV_AUTO_INTO)
+        self.value_items = list(RECV_AUTO_VALUES)
+        self.value_binds = []
+        self.field_items = []
+        self._rendered = {}  # 생성한 문장 {(종류, 테이블, 힌트): 문장}
+
+        send_count, recv_count = len(self.send_mapping), len(self.recv_mapping)
+        for idx in range(max(send_count, recv_count)):
+            send_col = self.send_mapping[idx] if idx < send_count else None
+            recv_col = self.recv_mapping[idx] if idx < recv_count else None
+
+            send_info = send_columns.get(send_col) if send_col else None
+            if send_info is not None:
+                if send_info['type'] == 'DATE':
+                    self.select_items.append(f"TO_CHAR({send_col}, '{DATE_FORMAT}')")
+                else:
+                    self.select_items.append(send_col)
+                self.select_names.append(send_col)
+                self.field_items.append(FIELD_TEMPLATE.format(
+                    index=idx + 1, length=send_info['size'], type=send_info['type'], name=send_col,
+                    mapping=FIELD_MAPPING_TEMPLATE.format(name=recv_col) if recv_col else ""
+                ))
+
+            recv_info = recv_columns.get(recv_col) if recv_col else None
+            if recv_info is not None:
+                self.into_items.append(recv_col)
+                if send_col:
+                    is_date = recv_info['type'] == 'DATE'
+                    self.value_items.append(f"TO_DATE(:{send_col}, '{DATE_FORMAT}')" if is_date else f":{send_col}")
+                    self.value_binds.append((send_col, is_date))
+
+    def built_from(self, send_mapping: List[str], recv_mapping: List[str],
+                   send_columns: Dict[str, Dict], recv_columns: Dict[str, Dict]) -> bool:
+        """같은 매핑과 같은 컬럼 정보 객체로 만든 계획인지 확인합니다."""
+        return (self.send_columns is send_columns and self.recv_columns is recv_columns
+                and self.send_mapping == send_mapping and self.recv_mapping == recv_mapping)
+
+    def select_columns(self) -> str:
+        """송신 SELECT 컬럼 목록"""
+        return format_pairs(self.select_items)
+
+    def into_columns(self) -> str:
+        """수신 INSERT 컬럼 목록"""
+        return format_pairs(self.into_items)
+
+    def insert_values(self) -> str:
+        """수신 INSERT 값 목록"""
+        return format_pairs(self.value_items)
+
+    def select_sql(self, table_info: Dict) -> str:
+        """
+        송신 SELECT 문을 생성합니다.
+
+        Args:
+            table_info (Dict): {'owner': 스키마명, 'table_name': 테이블명}
+
+        Returns:
+            str: SELECT 문
+        """
+        key = ('select', table_name(table_info), None)
+        if key not in self._rendered:
+            self._rendered[key] = SELECT_TEMPLATE.format(columns=self.select_columns(), table=key[1])
+        return self._rendered[key]
+
+    def insert_sql(self, table_info: Dict, hint: Optional[str] = None) -> str:
+        """
+        수신 INSERT 문을 생성합니다.
+
+        Args:
+            table_info (Dict): {'owner': 스키마명, 'table_name': 테이블명}
+            hint (str, optional): 옵티마이저 힌트 (예: APPEND_HINT)
+
+        Returns:
+            str: INSERT 문
+        """
+        key = ('insert', table_name(table_info), hint)
+        if key not in self._rendered:
+            self._rendered[key] = INSERT_TEMPLATE.format(hint=_hint(hint), table=key[1],
+                                                         columns=self.into_columns(), values=self.insert_values())
+        return self._rendered[key]
+
+    def array_insert_sql(self, table_info: Dict, hint: Optional[str] = APPEND_VALUES_HINT) -> Tuple[str, List[str]]:
+        """
+        배열 바인드(executemany)용 위치 바인드 INSERT 문을 생성합니다.
+
+        Args:
+            table_info (Dict): {'owner': 스키마명, 'table_name': 테이블명}
+            hint (str, optional): 옵티마이저 힌트, 기본 APPEND_VALUES
+
+        Returns:
+            Tuple[str, List[str]]: (INSERT 문, 바인드 순서의 송신 컬럼명 목록)
+        """
+        key = ('array_insert', table_name(table_info), hint)
+        if key in self._rendered:
+            sql, bind_names = self._rendered[key]
+            return sql, list(bind_names)
+
+        bind_names = list(RECV_AUTO_BINDS)
+        values = [':1', ':2', 'SYSDATE', "'N'"]
+        for send_col, is_date in self.value_binds:
+            bind_names.append(send_col)
+            position = f":{len(bind_names)}"
+            values.append(f"TO_DATE({position}, '{DATE_FORMAT}')" if is_date else position)
+        sql = INSERT_TEMPLATE.format(hint=_hint(hint), table=key[1],
+                                     columns=self.into_columns(), values=format_pairs(values))
+        self._rendered[key] = (sql, bind_names)
+        return sql, list(bind_names)
+
+    def field_xml(self) -> str:
+        """매핑 정보로부터 필드 XML 생성"""
+        key = ('field', None, None)
+        if key not in self._rendered:
+            lines = [f'<field count="{len(self.send_mapping)}">']
+            lines.extend(self.field_items)
+            lines.append('</field>')
+            self._rendered[key] = '\n'.join(lines)
+        return self._rendered[key]
@@ -6,16 +6,22 @@ from typing import Dict, List, Tuple, Optional
 
 # Import functionality from existing files
 from comp_q import QueryParser
-from comp_xml import XMLComparator
+from adapter_model import shared_cache
 
 class XMLQueryValidator:
     """
     XML 파일 내부의 SQL 쿼리를 검증하는 클래스
     """
     
-    def __init__(self):
-        """초기화 메서드"""
+    def __init__(self, adapter_cache=None):
+        """
+        초기화 메서드
+        
+        Args:
+            adapter_cache (AdapterCache, optional): 어댑터 파일 파싱 캐시, 없으면 comp_xml과 공유하는 캐시 사용
+        """
         self.query_parser = QueryParser()  # 기존 QueryParser 활용
+        self.adapter_cache = adapter_cache if adapter_cache is not None else shared_cache
     
     def extract_from_xml(self, xml_path: str) -> Tuple[str, str, List[str], int]:
         """
@@ -33,47 +39,28 @@ class XMLQueryValidator:
                 print(f"Warning: XML file not found: {xml_path}")
                 return None, None, [], 0
                 
-            tree = ET.parse(xml_path)
-            root = tree.getroot()
+            # 한 번 파싱한 어댑터 파일 모델 사용 (comp_xml과 공유)
+            adapter, _ = self.adapter_cache.get(xml_path)
             
-            # XML 내용이 유효한지 확인
-            if root is None:
-                print(f"Warning: Invalid XML content in file: {xml_path}")
-                return None, None, [], 0
-            
-            # SQL 노드 찾기
-            sql_node = root.find(".//SQL")
-            if sql_node is None or not sql_node.text:
+            # SQL 내용 확인
+            if not adapter.has_sql_text:
                 print(f"Warning: No SQL content found in file: {xml_path}")
                 return None, None, [], 0
             
-            # fields 태그 찾기
-            fields_tag = root.find(".//fields")
-            field_names = []
-            fields_count = 0
-            
-            if fields_tag is not None:
-                # fields의 count 속성 확인
-                fields_count = int(fields_tag.get('count', '0'))
+            if adapter.fields_attrs is not None:
                 # 디버깅: fields 태그의 count 속성 값 확인
-                print(f"DEBUG - fields 태그의 count 속성 값: {fields_count}")
-                print(f"DEBUG - fields 태그의 원본 속성: {fields_tag.attrib}")
-                
-                # 모든 field 태그를 찾아 name 속성 값 추출
-                for field_tag in fields_tag.findall(".//field"):
-                    name = field_tag.get('name')
-                    if name:
-                        field_names.append(name.lower())  # 소문자로 통일하여 비교
+                print(f"DEBUG - fields 태그의 count 속성 값: {adapter.fields_count}")
+                print(f"DEBUG - fields 태그의 원본 속성: {adapter.fields_attrs}")
             
-            query = sql_node.text.strip()
-            xml_content = ET.tostring(root, encoding='unicode')
+            # 필드 이름은 소문자로 통일하여 비교
+            field_names = [name.lower() for name in adapter.field_names]
             
             # 추출된 쿼리가 유효한지 확인
-            if not query:
+            if not adapter.sql:
                 print(f"Warning: Empty SQL query in file: {xml_path}")
                 return None, None, [], 0
             
-            return query, xml_content, field_names, fields_count
+            return adapter.sql, adapter.xml_content, field_names, adapter.fields_count
             
         except ET.ParseError as e:
             print(f"Error parsing XML file {xml_path}: {e}")
@@ -593,15 +580,98 @@ class XMLQueryValidator:
             
         return result
 
-def validate_xml_files_in_directory(directory: str, output_file: str = None):
+def _summarize_result(result: Dict) -> Tuple[str, str, str]:
+    """
+    검증 결과에서 요약 표의 쿼리유형, 상태, 요약 문자열을 만듭니다.
+    
+    Args:
+        result (Dict): validate_xml_file()의 결과
+        
+    Returns:
+        Tuple[str, str, str]: (쿼리유형, 상태, 요약)
+    """
+    # 쿼리 유형 결정
+    query_type = "N/A"
+    if result['select_queries']:
+        query_type = "SELECT"
+    elif result['insert_queries']:
+        query_type = "INSERT"
+    
+    # 상태 결정
+    status = "정상" if result['valid'] else "비정상"
+    
+    # 요약 메시지 생성
+    summary = []
+    if not result['xml_structure']:
+        summary.append("XML구조오류")
+    elif not result['valid']:
+        if result['select_queries'] and not result['select_queries'][0]['valid']:
+            query_result = result['select_queries'][0]
+            if 'columns_match_xml_fields' in query_result and not query_result['columns_match_xml_fields']:
+                summary.append("컬럼-필드불일치")
+            if 'xml_fields_count_valid' in query_result and not query_result['xml_fields_count_valid']:
+                summary.append("필드수부족")
+        elif result['insert_queries'] and not result['insert_queries'][0]['valid']:
+            query_result = result['insert_queries'][0]
+            if not query_result['columns_values_match']:
+                summary.append("컬럼-값불일치")
+            if not query_result['xml_fields_count_valid']:
+                summary.append("필드수부족")
+        if not summary:
+            summary.append("기타오류")
+    else:
+        summary.append("필드수정상")
+        if query_type == "SELECT":
+            summary.append("컬럼-필드일치")
+        elif query_type == "INSERT":
+            summary.append("컬럼-값일치")
+    
+    return query_type, status, ", ".join(summary)
+
+def _list_xml_files(directory: str) -> List[str]:
+    """디렉토리의 XML 파일 경로를 정렬된 순서로 반환합니다 (실행마다 같은 출력 순서 보장)."""
+    xml_files = []
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for file in sorted(files):
+            if file.lower().endswith('.xml'):
+                xml_files.append(os.path.join(root, file))
+    return xml_files
+
+_worker_validator = None
+
+def _validate_file_worker(xml_path: str) -> Dict:
+    """
+    프로세스 풀 작업 함수. 프로세스마다 검증기를 하나 만들어 재사용합니다.
+    디버그 출력이 섞이지 않도록 작업 중 표준 출력은 버리고,
+    프로세스 간 전송량을 줄이기 위해 xml_content는 결과에서 제외합니다.
+    """
+    global _worker_validator
+    import contextlib
+    if _worker_validator is None:
+        _worker_validator = XMLQueryValidator()
+    with open(os.devnull, 'w', encoding='utf-8') as devnull, contextlib.redirect_stdout(devnull):
+        result = _worker_validator.validate_xml_file(xml_path)
+    result['xml_content'] = None
+    return result
+
+def validate_xml_files_in_directory(directory: str, output_file: str = None, jobs: int = 1):
     """
     지정된 디렉토리의 모든 XML 파일을 검증하고 결과를 출력합니다.
+    결과는 파일 경로 순서로 처리되는 대로 화면과 결과 파일에 기록됩니다.
     
     Args:
         directory (str): 검색할 디렉토리 경로
         output_file (str, optional): 결과를 저장할 파일 경로
+        jobs (int): 병렬 검증 프로세스 수 (1이면 현재 프로세스에서 순차 처리, 0이면 CPU 수)
+        
+    Returns:
+        List[Dict]: 파일별 검증 결과 (병렬 처리 시 xml_content는 None)
     """
-    validator = XMLQueryValidator()
+    xml_files = _list_xml_files(directory)
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+    
     results = []
     valid_count = 0
     invalid_count = 0
@@ -612,137 +682,74 @@ def validate_xml_files_in_directory(directory: str, output_file: str = None):
     print(f"{'파일명':<30} {'쿼리유형':<10} {'상태':<8} {'요약'}")
     print("-"*60)
     
-    # 디렉토리 내의 모든 XML 파일 검색
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.lower().endswith('.xml'):
-                file_path = os.path.join(root, file)
-                
-                # XML 파일 검증
-                result = validator.validate_xml_file(file_path)
-                result['file_path'] = file_path
-                results.append(result)
-                
-                # 간략한 요약 정보 추출
-                file_name = os.path.basename(file_path)
-                
-                # 쿼리 유형 결정
-                query_type = "N/A"
-                if result['select_queries']:
-                    query_type = "SELECT"
-                elif result['insert_queries']:
-                    query_type = "INSERT"
-                
-                # 상태 결정
-                status = "정상" if result['valid'] else "비정상"
-                if result['valid']:
-                    valid_count += 1
-                else:
-                    invalid_count += 1
-                
-                # 요약 메시지 생성
-                summary = []
-                if not result['xml_structure']:
-                    summary.append("XML구조오류")
-                elif not result['valid']:
-                    if result['select_queries'] and not result['select_queries'][0]['valid']:
-                        query_result = result['select_queries'][0]
-                        if 'columns_match_xml_fields' in query_result and not query_result['columns_match_xml_fields']:
-                            summary.append("컬럼-필드불일치")
-                        if 'xml_fields_count_valid' in query_result and not query_result['xml_fields_count_valid']:
-                            summary.append("필드수부족")
-                    elif result['insert_queries'] and not result['insert_queries'][0]['valid']:
-                        query_result = result['insert_queries'][0]
-                        if not query_result['columns_values_match']:
-                            summary.append("컬럼-값불일치")
-                        if not query_result['xml_fields_count_valid']:
-                            summary.append("필드수부족")
-                    if not summary:
-                        summary.append("기타오류")
-                else:
-                    summary.append("필드수정상")
-                    if query_type == "SELECT":
-                        summary.append("컬럼-필드일치")
-                    elif query_type == "INSERT":
-                        summary.append("컬럼-값일치")
-                
-                summary_str = ", ".join(summary)
-                
-                # 결과 출력
-                print(f"{file_name:<30} {query_type:<10} {status:<8} {summary_str}")
+    out = None
+    if output_file:
+        out = open(output_file, 'w', encoding='utf-8')
+        out.write("XML 쿼리 검증 결과\n")
+        out.write("=" * 60 + "\n\n")
+        out.write(f"{'파일명':<30} {'쿼리유형':<10} {'상태':<8} {'요약'}\n")
+        out.write("-"*60 + "\n")
+    
+    executor = None
+    try:
+        if jobs > 1 and len(xml_files) > 1:
+            from concurrent.futures import ProcessPoolExecutor
+            executor = ProcessPoolExecutor(max_workers=jobs)
+            # map()은 입력 순서대로 결과를 돌려주므로 출력 순서가 항상 같음
+            chunksize = max(1, min(64, len(xml_files) // (jobs * 8)))
+            result_iter = executor.map(_validate_file_worker, xml_files, chunksize=chunksize)
+        else:
+            validator = XMLQueryValidator()
+            result_iter = (validator.validate_xml_file(file_path) for file_path in xml_files)
+        
+        for file_path, result in zip(xml_files, result_iter):
+            result['file_path'] = file_path
+            results.append(result)
+            
+            if result['valid']:
+                valid_count += 1
+            else:
+                invalid_count += 1
+            
+            file_name = os.path.basename(file_path)
+            query_type, status, summary_str = _summarize_result(result)
+            line = f"{file_name:<30} {query_type:<10} {status:<8} {summary_str}"
+            
+            # 결과 출력
+            print(line)
+            if out:
+                out.write(line + "\n")
+    finally:
+        if executor:
+            executor.shutdown()
+        if out:
+            out.write("-"*60 + "\n")
+            out.write(f"총 파일 수: {len(results)}, 정상: {valid_count}, 비정상: {invalid_count}\n")
+            out.close()
     
     # 전체 요약 출력
     print("-"*60)
     print(f"총 파일 수: {len(results)}, 정상: {valid_count}, 비정상: {invalid_count}")
     print("="*60)
-    
-    # 결과를 파일로 저장 (선택 사항)
     if output_file:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("XML 쿼리 검증 결과\n")
-            f.write("=" * 60 + "\n\n")
-            
-            f.write(f"{'파일명':<30} {'쿼리유형':<10} {'상태':<8} {'요약'}\n")
-            f.write("-"*60 + "\n")
-            
-            for result in results:
-                file_name = os.path.basename(result['file_path'])
-                
-                # 쿼리 유형 결정
-                query_type = "N/A"
-                if result['select_queries']:
-                    query_type = "SELECT"
-                elif result['insert_queries']:
-                    query_type = "INSERT"
-                
-                # 상태 결정
-                status = "정상" if result['valid'] else "비정상"
-                
-                # 요약 메시지 생성
-                summary = []
-                if not result['xml_structure']:
-                    summary.append("XML구조오류")
-                elif not result['valid']:
-                    if result['select_queries'] and not result['select_queries'][0]['valid']:
-                        query_result = result['select_queries'][0]
-                        if 'columns_match_xml_fields' in query_result and not query_result['columns_match_xml_fields']:
-                            summary.append("컬럼-필드불일치")
-                        if 'xml_fields_count_valid' in query_result and not query_result['xml_fields_count_valid']:
-                            summary.append("필드수부족")
-                    elif result['insert_queries'] and not result['insert_queries'][0]['valid']:
-                        query_result = result['insert_queries'][0]
-                        if not query_result['columns_values_match']:
-                            summary.append("컬럼-값불일치")
-                        if not query_result['xml_fields_count_valid']:
-                            summary.append("필드수부족")
-                    if not summary:
-                        summary.append("기타오류")
-                else:
-                    summary.append("필드수정상")
-                    if query_type == "SELECT":
-                        summary.append("컬럼-필드일치")
-                    elif query_type == "INSERT":
-                        summary.append("컬럼-값일치")
-                
-                summary_str = ", ".join(summary)
-                
-                f.write(f"{file_name:<30} {query_type:<10} {status:<8} {summary_str}\n")
-            
-            f.write("-"*60 + "\n")
-            f.write(f"총 파일 수: {len(results)}, 정상: {valid_count}, 비정상: {invalid_count}\n")
-            
-            print(f"결과가 파일에 저장되었습니다: {output_file}")
+        print(f"결과가 파일에 저장되었습니다: {output_file}")
             
     return results
 
 if __name__ == "__main__":
     # 커맨드 라인 인자 처리
-    if len(sys.argv) > 1:
-        directory = sys.argv[1]
-        output_file = sys.argv[2] if len(sys.argv) > 2 else None
-        validate_xml_files_in_directory(directory, output_file)
+    import argparse
+    arg_parser = argparse.ArgumentParser(description="XML 파일 내 SQL 쿼리 검증")
+    arg_parser.add_argument("directory", nargs="?", help="검증할 XML 디렉토리 경로")
+    arg_parser.add_argument("output_file", nargs="?", help="결과 파일 경로")
+    arg_parser.add_argument("--jobs", "-j", type=int, default=1,
+                            help="병렬 검증 프로세스 수 (기본 1: 순차, 0: CPU 수)")
+    args = arg_parser.parse_args()
+    
+    if args.directory:
+        validate_xml_files_in_directory(args.directory, args.output_file, args.jobs)
     else:
-        print("사용법: python test23.py <XML_디렉토리_경로> [결과_파일_경로]")
+        print("사용법: python test23.py <XML_디렉토리_경로> [결과_파일_경로] [--jobs N]")
         
         # 예제 실행
         example_xml = input("검증할 XML 파일 경로를 입력하세요 (Enter 키를 누르면 건너뜁니다): ")
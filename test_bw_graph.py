@@ -0,0 +1,103 @@
+"""
+BW 프로세스 그래프(bw_graph) 테스트 모듈
+
+전이/그룹 중첩 그래프, 행 단위 JDBC 호출 탐지, 주기 비용과 예상 최대 처리량을 확인합니다.
+"""
+from bw_graph import BWProcessGraph
+from comp_audit import audit_interface
+
+HEADER = (
+    '<pd:ProcessDefinition xmlns:pd="http://xmlns.tibco.com/bw/process/2003" '
+    'xmlns:xsl="http://www.w3.org/1999/XSL/Transform">\n'
+    '<pd:name>Test.process</pd:name>\n'
+    '<pd:startName>Timer</pd:startName>\n'
+    '<pd:starter name="Timer"><pd:type>com.tibco.plugin.timer.TimerEventSource</pd:type>'
+    '<config><TimeInterval>1</TimeInterval><FrequencyIndex>Minute</FrequencyIndex></config></pd:starter>\n'
+)
+
+
+def jdbc(name, kind, max_rows='', for_each=False):
+    activity_type = 'JDBCQueryActivity' if kind == 'query' else 'JDBCUpdateActivity'
+    bindings = '<xsl:for-each select="$SelectP/resultSet/Record"><Record/></xsl:for-each>' if for_each else ''
+    return (f'<pd:activity name="{name}"><pd:type>com.tibco.plugin.jdbc.{activity_type}</pd:type>'
+            f'<config><timeout>10</timeout><commit>false</commit><maxRows>{max_rows}</maxRows>'
+            f'<statement>SELECT 1 FROM DUAL</statement></config>'
+            f'<pd:inputBindings><jdbcInput>{bindings}</jdbcInput></pd:inputBindings></pd:activity>\n')
+
+
+def transition(source, target):
+    return (f'<pd:transition><pd:from>{source}</pd:from><pd:to>{target}</pd:to>'
+            f'<pd:conditionType>always</pd:conditionType></pd:transition>\n')
+
+
+# 조회 후 결과 Record를 한 행씩 돌며 UPDATE (행 단위 JDBC), Orphan은 전이가 없어 실행되지 않음
+PER_ROW_XML = (
+    HEADER
+    + jdbc('SelectP', 'query', '500')
+    + '<pd:group name="RowLoop"><pd:type>com.tibco.pe.core.LoopGroup</pd:type>'
+      '<config><pd:groupType>inputLoop</pd:groupType><pd:over>$SelectP/resultSet/Record</pd:over></config>\n'
+    + jdbc('UpdateRow', 'update')
+    + transition('start', 'UpdateRow') + transition('UpdateRow', 'end')
+    + '</pd:group>\n'
+    + jdbc('Orphan', 'update')
+    + transition('Timer', 'SelectP') + transition('SelectP', 'RowLoop') + transition('RowLoop', 'End')
+    + '</pd:ProcessDefinition>'
+)
+
+# 조회 결과가 없을 때까지 반복하는 루프 안에서 배열 INSERT 후 1초 Sleep
+DRAIN_XML = (
+    HEADER
+    + '<pd:group name="Drain"><pd:type>com.tibco.pe.core.LoopGroup</pd:type><config/>\n'
+    + jdbc('SelectP', 'query', '1000')
+    + jdbc('InsertR', 'update', for_each=True)
+    + '<pd:activity name="Sleep"><pd:type>com.tibco.plugin.timer.SleepActivity</pd:type><config/>'
+      '<pd:inputBindings><SleepInputSchema><IntervalInMillisec>1000</IntervalInMillisec>'
+      '</SleepInputSchema></pd:inputBindings></pd:activity>\n'
+    + '</pd:group>\n'
+    + '</pd:ProcessDefinition>'
+)
+
+
+def test_per_row_loop():
+    graph = BWProcessGraph.from_string(PER_ROW_XML)
+    assert graph.timer_seconds() == 60
+    assert graph.successors('SelectP') == ['RowLoop']
+    assert graph.nodes['UpdateRow'].parent == 'RowLoop'
+    assert graph.reachable() == ['SelectP', 'RowLoop', 'UpdateRow']
+    assert graph.per_row_jdbc() == ['UpdateRow']
+
+    cost = graph.cycle_cost(call_seconds=0.005)
+    print(cost)
+    assert cost['rows_source'] == 'SelectP' and cost['rows_per_cycle'] == 500
+    assert cost['draining_loop'] is None
+    # 조회 1회 + 행마다 UPDATE 500회, 타이머 주기(60초)가 더 길어 타이머가 처리량을 제한
+    assert cost['jdbc_calls_per_cycle'] == 501
+    assert cost['max_rows_per_sec'] == round(500 / 60, 1)
+
+    settings = graph.throughput_settings()
+    update = next(activity for activity in settings['jdbc'] if activity['name'] == 'UpdateRow')
+    assert update['per_row'] and update['in_loop'] and update['group'] == 'RowLoop'
+    audit = audit_interface({}, [dict(settings, cycle=cost)])
+    print(audit['findings'])
+    assert audit['findings'] == ["BW 행 단위 JDBC 호출(UpdateRow, RowLoop 루프의 행마다 실행)"]
+    print("\nTest completed.")
+
+
+def test_draining_loop():
+    graph = BWProcessGraph.from_string(DRAIN_XML)
+    assert graph.reachable() == ['Drain', 'SelectP', 'InsertR', 'Sleep']
+    assert graph.per_row_jdbc() == []
+
+    cost = graph.cycle_cost(call_seconds=0.005)
+    print(cost)
+    # 루프 1회: 조회 + 배열 INSERT 2회(0.01초) + Sleep 1초 동안 1000행
+    assert cost['draining_loop'] == 'Drain'
+    assert cost['jdbc_calls_per_cycle'] == 2
+    assert cost['sleep_seconds_per_cycle'] == 1.0
+    assert cost['max_rows_per_sec'] == round(1000 / 1.01, 1)
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_per_row_loop()
+    test_draining_loop()
@@ -0,0 +1,145 @@
+"""
+컬럼 일괄 비교(comp_columns) 테스트 모듈
+
+가상 스키마의 모든 인터페이스를 일괄 비교한 결과가
+인터페이스마다 ColumnMapper.compare_columns()를 실행한 결과와 같은지 확인합니다.
+"""
+from maptest import ColumnMapper
+from column_rules import DEFAULT_RULES
+from metadata_provider import InMemoryMetadataProvider, generate_synthetic_schema, synthetic_interfaces
+
+DB_INFO = {'sid': 'BENCHDB', 'username': 'bench', 'password': 'bench'}
+
+
+def build_case():
+    """
+    가상 스키마와 인터페이스 목록을 만들고 비교 규칙의 예외 경우를 섞습니다.
+
+    Returns:
+        (스키마, 인터페이스 목록)
+    """
+    schema = generate_synthetic_schema(40, mismatch_rate=0.5, seed=7)
+    tables = list(schema.values())
+    first = list(tables[0].values())
+    first[0].update(type='NVARCHAR2', size='400')  # NVARCHAR 1024/3 초과
+    first[1].update(size='abc')                     # float 변환 실패 -> 인터페이스 오류
+    tables[2][list(tables[2])[0]]['nullable'] = 'X'  # Nullable 값 오류
+
+    # NUMBER(p,s), TIMESTAMP, CLOB, RAW 조합 (송신/수신 테이블 쌍의 앞 컬럼 교체)
+    extra_types = [
+        ({'type': 'NUMBER', 'size': '22', 'precision': 10, 'scale': 2},
+         {'type': 'NUMBER', 'size': '22', 'precision': 8, 'scale': 2}),
+        ({'type': 'NUMBER', 'size': '22', 'precision': 10, 'scale': 4},
+         {'type': 'NUMBER', 'size': '22', 'precision': 12, 'scale': 2}),
+        ({'type': 'NUMBER', 'size': '22', 'precision': None, 'scale': None},
+         {'type': 'NUMBER', 'size': '22', 'precision': 10, 'scale': 0}),
+        ({'type': 'TIMESTAMP(9)', 'size': '11', 'scale': 9}, {'type': 'TIMESTAMP(6)', 'size': '11', 'scale': 6}),
+        ({'type': 'DATE', 'size': '7'}, {'type': 'TIMESTAMP(6)', 'size': '11', 'scale': 6}),
+        ({'type': 'TIMESTAMP(6)', 'size': '11', 'scale': 6}, {'type': 'DATE', 'size': '7'}),
+        ({'type': 'VARCHAR2', 'size': '4000'}, {'type': 'CLOB', 'size': '4000'}),
+        ({'type': 'CLOB', 'size': '4000'}, {'type': 'VARCHAR2', 'size': '4000'}),
+        ({'type': 'RAW', 'size': '32'}, {'type': 'RAW', 'size': '16'}),
+    ]
+    pair_keys = list(schema)
+    for index, (send_info, recv_info) in enumerate(extra_types):
+        send_table, recv_table = schema[pair_keys[20 + index * 2]], schema[pair_keys[21 + index * 2]]
+        name = list(send_table)[0]
+        send_table[name].update(send_info)
+        recv_table[name].update(recv_info)
+
+    interfaces = synthetic_interfaces(schema, DB_INFO)
+    interfaces[3]['send']['columns'].append('NO_SUCH_COLUMN')
+    interfaces[4]['recv']['columns'][0] = 'NO_SUCH_COLUMN'
+    interfaces[5]['recv']['columns'] = interfaces[5]['recv']['columns'][:2]
+    interfaces[6]['recv']['table_name'] = 'NO_SUCH_TABLE'
+    interfaces[7]['send']['table_name'] = 'NO_SUCH_TABLE'
+    interfaces[8]['send']['owner'] = ''
+    return schema, interfaces
+
+
+def test_compatibility_rules():
+    """컴파일된 호환성 규칙 테이블의 타입/크기 판정을 확인합니다."""
+    cases = [
+        # (송신, 수신, 타입 결과, 크기 결과)
+        ({'type': 'VARCHAR2', 'size': '20'}, {'type': 'CHAR', 'size': '10'}, "", "송신(20) > 수신(10)"),
+        ({'type': 'DATE', 'size': '7'}, {'type': 'VARCHAR2', 'size': '14'}, "칼럼 Type NG", ""),
+        ({'type': 'NUMBER', 'size': '22', 'precision': 10, 'scale': 2},
+         {'type': 'NUMBER', 'size': '22', 'precision': 8, 'scale': 2}, "", "송신(10,2) > 수신(8,2)"),
+        ({'type': 'NUMBER', 'size': '22', 'precision': 5, 'scale': 0},
+         {'type': 'NUMBER', 'size': '22', 'precision': None, 'scale': None}, "", ""),
+        ({'type': 'NUMBER', 'size': '22', 'precision': 10, 'scale': 4},
+         {'type': 'NUMBER', 'size': '22', 'precision': None, 'scale': 0}, "", "송신(10,4) > 수신(*,0)"),
+        ({'type': 'NUMBER', 'size': '22', 'precision': 12, 'scale': 0},
+         {'type': 'NUMBER', 'size': '22', 'precision': None, 'scale': 0}, "", ""),
+        ({'type': 'TIMESTAMP(9)', 'size': '11'}, {'type': 'TIMESTAMP(6)', 'size': '11'}, "", "송신(9) > 수신(6)"),
+        ({'type': 'TIMESTAMP(6) WITH TIME ZONE', 'size': '13'}, {'type': 'TIMESTAMP(6)', 'size': '11'},
+         "칼럼 Type NG", ""),
+        ({'type': 'DATE', 'size': '7'}, {'type': 'TIMESTAMP(6)', 'size': '11'}, "", ""),
+        ({'type': 'VARCHAR2', 'size': '4000'}, {'type': 'CLOB', 'size': '4000'}, "", ""),
+        ({'type': 'CLOB', 'size': '4000'}, {'type': 'VARCHAR2', 'size': '4000'}, "칼럼 Type NG", ""),
+        ({'type': 'RAW', 'size': '32'}, {'type': 'RAW', 'size': '16'}, "", "송신(32) > 수신(16)"),
+    ]
+    for send, recv, expected_type, expected_size in cases:
+        type_diff = DEFAULT_RULES.type_diff(send, recv)
+        size_diff = DEFAULT_RULES.size_diff(send, recv)
+        print(f"{send['type']:<28} -> {recv['type']:<14} 타입: {type_diff or '-':<12} 크기: {size_diff or '-'}")
+        assert type_diff == expected_type
+        assert size_diff == expected_size
+
+    assert DEFAULT_RULES.size_over({'type': 'NVARCHAR2', 'size': '400'}) == "칼럼 Size > 1024"
+    assert DEFAULT_RULES.size_over({'type': 'VARCHAR2', 'size': '1024'}) == ""
+    print("\nTest completed.")
+
+
+def compare_one_by_one(provider, interface_info):
+    """xltest.process_interface()와 같은 순서로 인터페이스 하나를 비교합니다."""
+    mapper = ColumnMapper()
+    mapper.metadata_provider = provider
+    send, recv = interface_info['send'], interface_info['recv']
+    if not (send['owner'] and send['table_name']):
+        return None, ["송신 테이블 정보가 없습니다."]
+    try:
+        mapper.connect_send_db(DB_INFO['sid'], DB_INFO['username'], DB_INFO['password'])
+        mapper.connect_recv_db(DB_INFO['sid'], DB_INFO['username'], DB_INFO['password'])
+        mapper.set_send_table(send['owner'], send['table_name'])
+        mapper.set_recv_table(recv['owner'], recv['table_name'])
+        mapper.set_send_mapping('\n'.join(send['columns']))
+        mapper.set_recv_mapping('\n'.join(recv['columns']))
+        return mapper.compare_columns(), []
+    except Exception as e:
+        return None, [str(e)]
+
+
+def test_batch_matches_compare_columns():
+    """일괄 비교 결과가 compare_columns()와 같은지 확인합니다."""
+    try:
+        import comp_columns
+        comp_columns._load_pandas()
+    except ImportError as e:
+        print(f"건너뜀 ({e})")
+        return
+
+    schema, interfaces = build_case()
+    provider = InMemoryMetadataProvider(schema)
+
+    mapper = ColumnMapper()
+    mapper.metadata_provider = provider
+    entries = comp_columns.prepare_interfaces(interfaces, mapper)
+    frame = comp_columns.compare_interfaces(entries, mapper.schema_catalog)
+    comparisons = comp_columns.frame_to_results(frame, entries, mapper.schema_catalog)
+
+    for index, interface_info in enumerate(interfaces):
+        expected, expected_errors = compare_one_by_one(provider, interface_info)
+        print(f"{interface_info['interface_id']}: 오류 {entries[index]['errors'] or '-'}")
+        assert comparisons[index] == expected, f"{interface_info['interface_id']} 비교 결과 불일치"
+        assert entries[index]['errors'] == expected_errors, f"{interface_info['interface_id']} 오류 불일치"
+
+    flagged = frame[frame['warnings'].map(bool)]
+    print(f"\n비교 행: {len(frame)}, 경고 행: {len(flagged)}")
+    assert len(flagged) > 0
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_compatibility_rules()
+    test_batch_matches_compare_columns()
@@ -0,0 +1,105 @@
+"""
+결과 내보내기(comp_export) 테스트 모듈
+
+csv/jsonl 파일로 내보낸 결과를 다시 읽었을 때 같은지, 엑셀 작성 시 시트를 나누는지 확인합니다.
+"""
+import io
+import os
+import tempfile
+import contextlib
+
+import openpyxl
+
+from comp_export import COLUMN_FIELDS, ResultExporter, read_table, render_workbook, parse_formats
+from comp_q import QueryDifference
+from mapper_fixture import build_mapper
+
+SCHEMA = {
+    ('SRC', 'TB_ORDER'): {
+        'ID': {'type': 'NUMBER', 'size': '22', 'nullable': 'N'},
+        'NAME': {'type': 'VARCHAR2', 'size': '20', 'nullable': 'Y'},
+        'AMT': {'type': 'NUMBER', 'size': '22', 'nullable': 'Y'},
+    },
+    ('DST', 'TB_ORDER_R'): {
+        'ID': {'type': 'NUMBER', 'size': '22', 'nullable': 'N'},
+        'NAME': {'type': 'VARCHAR2', 'size': '10', 'nullable': 'Y'},
+        'AMT': {'type': 'NUMBER', 'size': '22', 'nullable': 'Y'},
+    },
+}
+
+
+def compare_columns():
+    """ColumnMapper.compare_columns() 결과 (send_info/recv_info 포함)"""
+    mapper = build_mapper(SCHEMA, ('SRC', 'TB_ORDER'), ('DST', 'TB_ORDER_R'), 'ID\nNAME\nAMT', 'ID\nNAME\nAMT')
+    return mapper.compare_columns()
+
+
+def make_result():
+    diff = QueryDifference()
+    diff.add_difference('AMT', 'AMT', 'AMOUNT')
+    return {
+        'interface_info': {'interface_id': 'IF_ORDER_001', 'interface_name': '주문 송신',
+                           'send': {'owner': 'SRC', 'table_name': 'TB_ORDER'},
+                           'recv': {'owner': 'DST', 'table_name': 'TB_ORDER_R'}},
+        'excel_results': {'comparison': compare_columns(), 'errors': []},
+        'file_results': {'send': {'path': 'IF_ORDER_001.SND.xml', 'query': None, 'xml': None},
+                         'recv': {'path': None, 'query': None, 'xml': None}},
+        'bw_queries': {'send': '', 'recv': ''},
+        'comparisons': {'send': diff, 'recv': None},
+        'warnings': {'send': [], 'recv': []},
+        'bw_files': ['Processes/IF_ORDER_001.process']
+    }
+
+
+def test_export_roundtrip():
+    assert parse_formats('CSV, jsonl,csv') == ['csv', 'jsonl']
+    with tempfile.TemporaryDirectory() as tmp:
+        tables = {}
+        for fmt in ('csv', 'jsonl'):
+            out_dir = os.path.join(tmp, fmt)
+            exporter = ResultExporter(out_dir, [fmt])
+            exporter.add_result(1, make_result())
+            exporter.close()
+            tables[fmt] = {table: list(read_table(out_dir, table)) for table in exporter.paths}
+        print(tables['csv'])
+        assert tables['csv'] == tables['jsonl']
+        summary = tables['csv']['summary'][0]
+        assert summary[:2] == [1, 'IF_ORDER_001']
+        columns = tables['csv']['columns']
+        assert len(columns) == 3
+        names = [name for name, _ in COLUMN_FIELDS]
+        row = dict(zip(names, columns[1]))
+        print(row)
+        assert (row['send_type'], row['send_size'], row['send_nullable']) == ('VARCHAR2', '20', 'Y')
+        assert (row['recv_type'], row['recv_size'], row['recv_nullable']) == ('VARCHAR2', '10', 'Y')
+        assert row['size_diff'] and row['warnings']
+        assert dict(zip(names, columns[0]))['send_nullable'] == 'N'
+        assert len(tables['csv']['query_diffs']) == 1
+
+        # pyarrow가 없으면 parquet은 경고 후 건너뜀
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            exporter = ResultExporter(os.path.join(tmp, 'both'), ['csv', 'parquet'])
+        exporter.close()
+        assert exporter.formats == ['csv', 'parquet'] or 'pyarrow' in out.getvalue()
+    print("\nTest completed.")
+
+
+def test_render_workbook_splits_sheets():
+    with tempfile.TemporaryDirectory() as tmp:
+        exporter = ResultExporter(tmp)
+        for seq in range(1, 4):
+            exporter.add_result(seq, make_result())
+        exporter.close()
+        output_path = os.path.join(tmp, 'result.xlsx')
+        counts = render_workbook(tmp, output_path, max_rows=5)
+        workbook = openpyxl.load_workbook(output_path)
+        print(counts, workbook.sheetnames)
+        assert counts == {'summary': 3, 'columns': 9, 'query_diffs': 3}
+        assert workbook.sheetnames == ['요약', '컬럼 점검', '컬럼 점검 (2)', '컬럼 점검 (3)', '쿼리 차이']
+        assert workbook['컬럼 점검 (3)'].max_row == 2  # 헤더 + 마지막 1행
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_export_roundtrip()
+    test_render_workbook_splits_sheets()
@@ -0,0 +1,82 @@
+"""
+실행 저널(comp_journal) 테스트 모듈
+
+완료 기록 재사용, 끊긴 마지막 줄 처리, 입력 블록/엑셀이 바뀐 경우를 확인합니다.
+"""
+import os
+import copy
+import tempfile
+
+from comp_journal import RunJournal
+from comp_q import QueryDifference
+
+INTERFACE = {
+    'interface_name': '주문 송신',
+    'interface_id': 'IF_ORDER_001',
+    'send': {'owner': 'SRC', 'table_name': 'TB_ORDER', 'columns': ['ID', 'AMT'],
+             'db_info': {'sid': 'SRC', 'username': 'app', 'password': 'secret'}},
+    'recv': {'owner': 'DST', 'table_name': 'TB_ORDER_R', 'columns': ['ID', 'AMT'],
+             'db_info': {'sid': 'DST', 'username': 'app', 'password': 'secret'}},
+}
+
+
+def make_result(interface_info):
+    diff = QueryDifference()
+    diff.add_difference('AMT', 'AMT', 'AMOUNT')
+    return {
+        'interface_info': interface_info,
+        'excel_results': {'comparison': None, 'errors': []},
+        'file_results': {'send': {'path': None, 'query': None, 'xml': None},
+                         'recv': {'path': None, 'query': None, 'xml': None}},
+        'bw_queries': {'send': '', 'recv': ''},
+        'comparisons': {'send': diff, 'recv': None},
+        'warnings': {'send': [], 'recv': []},
+        'bw_files': []
+    }
+
+
+def test_resume_from_journal():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'run_journal.jsonl')
+        excel_path = os.path.join(tmp, 'input.xlsx')
+        interface_info = copy.deepcopy(INTERFACE)
+
+        journal = RunJournal(path, excel_path)
+        # 처리 중에 더해지는 필드는 블록 비교에서 제외
+        interface_info['send_system'] = 'N/A'
+        journal.append(1, interface_info, make_result(interface_info), {'block': 'x'})
+        journal.close()
+        # 강제 종료로 끊긴 마지막 줄
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "interface", "if_id": "IF_')
+
+        resumed = RunJournal(path, excel_path, resume=True)
+        completed = resumed.completed(copy.deepcopy(INTERFACE))
+        print(completed)
+        assert completed is not None
+        result, hashes = completed
+        assert hashes == {'block': 'x'}
+        assert isinstance(result['comparisons']['send'], QueryDifference)
+        assert not result['comparisons']['send'].is_equal
+        assert result['interface_info']['send']['db_info']['password'] == '***'
+        resumed.close()
+        with open(path, encoding='utf-8') as f:
+            assert len(f.readlines()) == 2  # 헤더 + 완료 기록 (끊긴 줄 정리)
+
+        # 블록이 바뀐 인터페이스는 다시 처리
+        changed = copy.deepcopy(INTERFACE)
+        changed['send']['columns'].append('REG_DATE')
+        resumed = RunJournal(path, excel_path, resume=True)
+        assert resumed.completed(changed) is None
+        resumed.close()
+
+        # 다른 입력 엑셀의 저널은 사용하지 않음
+        other = RunJournal(path, os.path.join(tmp, 'other.xlsx'), resume=True)
+        assert other.completed(copy.deepcopy(INTERFACE)) is None
+        other.discard()
+        assert not os.path.exists(path)
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_resume_from_journal()
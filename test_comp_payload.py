@@ -0,0 +1,74 @@
+"""
+MQ 메시지 크기 계산(comp_payload) 테스트 모듈
+
+타입별 컬럼 폭, XML 태그 오버헤드, buffer_size/commit_count에 따른 메시지당 행 수를 확인합니다.
+"""
+from comp_payload import column_width, payload_size, message_capacity, interface_payload, parse_size
+from sql_templates import MappingPlan
+from comp_audit import row_width
+
+COLUMNS = {
+    'EAI_SEQ_ID': {'type': 'VARCHAR2', 'size': '20'},
+    'ID': {'type': 'NUMBER', 'size': '22', 'precision': None, 'scale': None},
+    'AMT': {'type': 'NUMBER', 'size': '22', 'precision': 10, 'scale': 2},
+    'NAME': {'type': 'VARCHAR2', 'size': '100'},
+    'NM': {'type': 'NVARCHAR2', 'size': '10'},
+    'REG_DATE': {'type': 'DATE', 'size': '7'},
+    'UPD_TS': {'type': 'TIMESTAMP(3)', 'size': '11', 'scale': 3},
+    'MEMO': {'type': 'CLOB', 'size': '4000'},
+}
+
+
+def test_column_width():
+    widths = {name: column_width(info) for name, info in COLUMNS.items()}
+    print(widths)
+    assert widths['ID'] == 40            # 정밀도 없는 NUMBER
+    assert widths['AMT'] == 12           # 10자리 + 부호 + 소수점
+    assert widths['NAME'] == 100
+    assert widths['NM'] == 30            # NVARCHAR2 문자 x3
+    assert widths['REG_DATE'] == 14      # YYYYMMDDHH24MISS
+    assert widths['UPD_TS'] == 18        # 14 + '.' + 3
+    assert widths['MEMO'] is None
+    assert parse_size('10M') == 10 * 1024 * 1024 and parse_size('512') == 512 and parse_size('%%X%%') is None
+    print("\nTest completed.")
+
+
+def test_message_capacity():
+    payload = payload_size(['ID', 'NAME', 'MEMO', 'GONE'], COLUMNS)
+    print(payload)
+    assert payload['data_bytes'] == 140
+    # <data></data> 13 + <ID></ID> 9 + <NAME></NAME> 13 + <MEMO></MEMO> 13
+    assert payload['overhead_bytes'] == 48
+    assert payload['row_bytes'] == 188
+    assert payload['unbounded'] == ['MEMO'] and payload['missing'] == ['GONE']
+    assert payload_size(['ID'], COLUMNS, message_format='fixed')['overhead_bytes'] == 0
+
+    # (1024 - XML 선언 38) // 188 = 5행, commit_count 12행은 메시지 3개
+    capacity = message_capacity(188, '1K', '12')
+    print(capacity)
+    assert capacity['rows_per_message'] == 5
+    assert capacity['messages_per_commit'] == 3
+    assert capacity['findings']
+    assert message_capacity(2000, '1K', '1')['findings'] == ["행 크기 2000B > buffer_size 1K"]
+
+    # 송신 SELECT 순서(EAI 표준 컬럼 포함)로 계산
+    plan = MappingPlan(['NAME', 'REG_DATE'], [], COLUMNS, {})
+    result = interface_payload(plan)
+    print(result)
+    assert [name for name, _ in result['fields']] == ['EAI_SEQ_ID', 'NAME', 'REG_DATE']
+    assert result['missing'] == ['DATA_INTERFACE_TYPE_CODE']
+    assert result['rows_per_message'] is None
+
+    # 요약 시트의 행 크기(comp_audit.row_width)도 같은 폭 모델
+    excel_results = {
+        'comparison': [{'send_column': name, 'send_info': COLUMNS[name], 'size_over': None}
+                       for name in ('NAME', 'REG_DATE')],
+        'send_columns': {'EAI_SEQ_ID': COLUMNS['EAI_SEQ_ID']}
+    }
+    assert row_width(excel_results) == (result['row_bytes'], [])
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_column_width()
+    test_message_capacity()
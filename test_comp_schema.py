@@ -0,0 +1,64 @@
+"""
+스키마 비교(comp_schema) 테스트 모듈
+
+메모리 스키마로 송신/수신 테이블 정의를 비교하여 보고 항목별 결과를 확인합니다.
+"""
+from mapper_fixture import DB_INFO, build_mapper
+from comp_schema import (diff_schemas, TABLE_MISSING, DROPPED_COLUMN, SEND_ONLY,
+                         UNMAPPED_NOT_NULL, SIZE_REGRESSION)
+
+SCHEMA = {
+    ('SRC', 'TB_ORDER'): {
+        'EAI_SEQ_ID': {'type': 'VARCHAR2', 'size': '20', 'nullable': 'N'},
+        'ID': {'type': 'NUMBER', 'size': '22', 'nullable': 'N'},
+        'NAME': {'type': 'VARCHAR2', 'size': '100', 'nullable': 'Y'},
+        'CODE': {'type': 'VARCHAR2', 'size': '20', 'nullable': 'Y'},
+        'MEMO': {'type': 'VARCHAR2', 'size': '200', 'nullable': 'Y'},
+    },
+    ('DST', 'TB_ORDER_R'): {
+        'EAI_SEQ_ID': {'type': 'VARCHAR2', 'size': '20', 'nullable': 'N'},
+        'ID': {'type': 'NUMBER', 'size': '22', 'nullable': 'N'},
+        'NM': {'type': 'VARCHAR2', 'size': '50', 'nullable': 'Y'},
+        'CODE': {'type': 'VARCHAR2', 'size': '10', 'nullable': 'Y'},
+        'REG_USER': {'type': 'VARCHAR2', 'size': '10', 'nullable': 'N'},
+    },
+}
+
+
+def make_interface(if_id, recv_table='TB_ORDER_R'):
+    return {
+        'interface_name': f'{if_id} 인터페이스',
+        'interface_id': if_id,
+        'send': {'owner': 'SRC', 'table_name': 'TB_ORDER', 'columns': ['ID', 'NAME', 'GONE'],
+                 'db_info': dict(DB_INFO)},
+        'recv': {'owner': 'DST', 'table_name': recv_table, 'columns': ['ID', 'NM', 'GONE_R'],
+                 'db_info': dict(DB_INFO)},
+    }
+
+
+def test_diff_interface_findings():
+    mapper = build_mapper(SCHEMA)
+    results = diff_schemas([make_interface('IF_ORDER'), make_interface('IF_NO_RECV', 'NO_SUCH_TABLE')], mapper)
+
+    found = {(f['category'], f['send_column'], f['recv_column']) for f in results[0]['findings']}
+    for finding in results[0]['findings']:
+        print(finding)
+    assert results[0]['errors'] == []
+    assert found == {
+        (DROPPED_COLUMN, 'GONE', ''),
+        (DROPPED_COLUMN, '', 'GONE_R'),
+        (SEND_ONLY, 'MEMO', ''),                 # EAI 표준 컬럼은 제외
+        (UNMAPPED_NOT_NULL, '', 'REG_USER'),     # EAI 자동 입력 컬럼은 제외
+        (SIZE_REGRESSION, 'NAME', 'NM'),         # 매핑 쌍
+        (SIZE_REGRESSION, 'CODE', 'CODE'),       # 매핑되지 않은 같은 이름 컬럼 쌍
+    }
+
+    missing = results[1]['findings']
+    print(missing)
+    assert [f['category'] for f in missing] == [TABLE_MISSING]
+    assert missing[0]['detail'] == "수신 테이블 DST.NO_SUCH_TABLE"
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_diff_interface_findings()
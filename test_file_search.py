@@ -0,0 +1,40 @@
+"""
+FileSearcher 바이트 검색 테스트 모듈
+
+UTF-8/CP949 파일에서 키워드를 찾고, 멀티바이트 문자에 걸친 바이트 일치는 제외하는지 확인합니다.
+"""
+import os
+import tempfile
+
+from comp_q import FileSearcher
+
+
+def test_match_file_encodings():
+    patterns = FileSearcher.keyword_patterns(['ABC', '주문', 'TB_ORDER', '테이블'])
+    cases = [
+        # (파일 내용, 찾아야 하는 키워드)
+        ('<sql>SELECT 주문TB_ORDER FROM x</sql>'.encode('cp949'), ['주문', 'TB_ORDER']),
+        ('<sql>SELECT 주문TB_ORDER FROM x</sql>'.encode('utf-8'), ['주문', 'TB_ORDER']),
+        # CP949 '캚'(B0 41)의 둘째 바이트가 'A'라서 ABC와 바이트만 일치
+        (b'x=' + '캚'.encode('cp949') + b'BC', []),
+        (b'x= ABC', ['ABC']),
+        # 앞쪽 256바이트 안에 ASCII가 없어 창이 문자 중간에서 잘리는 경우
+        (('가' * 100 + 'TB_ORDER').encode('utf-8'), ['TB_ORDER']),
+        (('주문' * 100 + '테이블').encode('utf-8'), ['주문', '테이블']),
+        (('주문' * 100 + '테이블').encode('cp949'), ['주문', '테이블']),
+        (('가' * 200 + 'TB_ORDER').encode('cp949'), ['TB_ORDER']),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'adapter.xml')
+        for data, expected in cases:
+            with open(path, 'wb') as f:
+                f.write(data)
+            stats = {}
+            found = FileSearcher.match_file(path, patterns, stats)
+            print(data, found, stats)
+            assert found == expected
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_match_file_encodings()
@@ -0,0 +1,103 @@
+"""
+SQL/필드 XML 템플릿 생성(sql_templates) 테스트 모듈
+
+ColumnMapper의 송신 SELECT, 수신 INSERT, 필드 XML 생성 결과와
+대량 인터페이스용 APPEND / 배열 바인드 INSERT 변형을 확인합니다.
+"""
+from maptest import ColumnMapper
+from mapper_fixture import build_mapper
+from sql_templates import APPEND_HINT
+
+SCHEMA = {
+    ('SND', 'TB_SEND'): {
+        'ID': {'type': 'NUMBER', 'size': '22', 'nullable': 'N'},
+        'NAME': {'type': 'VARCHAR2', 'size': '100', 'nullable': 'Y'},
+        'REG_DATE': {'type': 'DATE', 'size': '7', 'nullable': 'Y'},
+    },
+    ('RCV', 'TB_RECV'): {
+        'ID': {'type': 'NUMBER', 'size': '22', 'nullable': 'N'},
+        'NM': {'type': 'VARCHAR2', 'size': '100', 'nullable': 'Y'},
+        'REG_DT': {'type': 'DATE', 'size': '7', 'nullable': 'Y'},
+    },
+}
+
+
+def send_recv_mapper():
+    # 송신 테이블에 없는 컬럼(MISSING)은 SELECT와 필드 XML에서 제외
+    return build_mapper(SCHEMA, ('SND', 'TB_SEND'), ('RCV', 'TB_RECV'),
+                        'ID\nNAME\nMISSING\nREG_DATE', 'ID\nNM\nNONE\nREG_DT')
+
+
+def test_generate_statements():
+    mapper = send_recv_mapper()
+
+    send_sql = mapper.generate_send_sql_from_mapping()
+    print(send_sql)
+    assert send_sql == (
+        "SELECT\n"
+        "    EAI_SEQ_ID, DATA_INTERFACE_TYPE_CODE,\n"
+        "    ID, NAME,\n"
+        "    TO_CHAR(REG_DATE, 'YYYYMMDDHH24MISS')\n"
+        "FROM SND.TB_SEND"
+    )
+
+    recv_sql = mapper.generate_recv_sql()
+    print(recv_sql)
+    assert recv_sql == (
+        "INSERT INTO RCV.TB_RECV (\n"
+        "    EAI_SEQ_ID, DATA_INTERFACE_TYPE_CODE,\n"
+        "    EAI_INTERFACE_DATE, APPLICATION_TRANSFER_FLAG,\n"
+        "    ID, NM,\n"
+        "    REG_DT\n"
+        ") VALUES (\n"
+        "    :EAI_SEQ_ID, :DATA_INTERFACE_TYPE_CODE,\n"
+        "    SYSDATE, 'N',\n"
+        "    :ID, :NAME,\n"
+        "    TO_DATE(:REG_DATE, 'YYYYMMDDHH24MISS')\n"
+        ")"
+    )
+
+    field_xml = mapper.generate_field_xml_from_mapping()
+    print(field_xml)
+    assert field_xml.startswith('<field count="4">\n    <col1>')
+    assert '<col3>' not in field_xml
+    assert '    <col4>\n        <length>7</length>\n        <type>DATE</type>\n' \
+           '        <name>REG_DATE</name>\n        <mapping>REG_DT</mapping>\n    </col4>' in field_xml
+
+    # 매핑이 바뀌지 않으면 같은 계획을 재사용하고, 바뀌면 다시 생성
+    plan = mapper.statement_plan()
+    assert mapper.statement_plan() is plan
+    mapper.set_recv_mapping('ID\nNM')
+    assert mapper.statement_plan() is not plan
+    print("\nTest completed.")
+
+
+def test_bulk_variants():
+    mapper = send_recv_mapper()
+
+    append_sql = mapper.generate_recv_sql(APPEND_HINT)
+    assert append_sql.startswith("INSERT /*+ APPEND */ INTO RCV.TB_RECV (\n")
+    assert append_sql.split('\n', 1)[1] == mapper.generate_recv_sql().split('\n', 1)[1]
+
+    array_sql, bind_names = mapper.generate_recv_array_sql()
+    print(array_sql)
+    print(bind_names)
+    assert array_sql.startswith("INSERT /*+ APPEND_VALUES */ INTO RCV.TB_RECV (\n")
+    assert array_sql.endswith(
+        ") VALUES (\n"
+        "    :1, :2,\n"
+        "    SYSDATE, 'N',\n"
+        "    :3, :4,\n"
+        "    TO_DATE(:5, 'YYYYMMDDHH24MISS')\n"
+        ")"
+    )
+    assert bind_names == ['EAI_SEQ_ID', 'DATA_INTERFACE_TYPE_CODE', 'ID', 'NAME', 'REG_DATE']
+
+    empty = ColumnMapper()
+    assert empty.generate_recv_array_sql() == ("수신 테이블 정보가 설정되지 않았습니다.", [])
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_generate_statements()
+    test_bulk_variants()
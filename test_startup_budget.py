@@ -0,0 +1,71 @@
+"""
+시작 시간 예산 테스트 - 각 실행 스크립트의 import 시간과 DB 계층 지연 로딩 검증
+
+각 모듈을 새 파이썬 프로세스에서 import 하여 소요 시간을 측정하고,
+oracledb / pandas 가 import 시점에 로드되지 않는지 확인합니다.
+"""
+import sys
+import json
+import subprocess
+
+# 실행 스크립트별 import 시간 예산(초)
+STARTUP_BUDGETS = {
+    'comp_xml': 1.0,
+    'comp_watch': 1.0,
+    'xltest': 1.0,
+    'test23': 1.0,
+    'mapgui': 1.0,
+    'xml_parse1': 1.0,
+    'comp_columns': 1.0,
+}
+
+# 첫 사용 시점까지 로드되면 안 되는 모듈
+DEFERRED_MODULES = ['oracledb', 'pandas']
+
+_PROBE = """
+import sys, json, time
+start = time.perf_counter()
+try:
+    import {module}
+except ImportError as e:
+    print(json.dumps({{'skipped': str(e)}}))
+    sys.exit(0)
+elapsed = time.perf_counter() - start
+print(json.dumps({{'elapsed': elapsed, 'loaded': [m for m in {deferred!r} if m in sys.modules]}}))
+"""
+
+
+def measure_startup(module):
+    """
+    새 프로세스에서 모듈을 import 하고 결과를 반환합니다.
+
+    Args:
+        module: 모듈명
+
+    Returns:
+        {'elapsed': 초, 'loaded': 로드된 지연 대상 모듈 목록} 또는 {'skipped': 사유}
+    """
+    code = _PROBE.format(module=module, deferred=DEFERRED_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_startup_budget():
+    """
+    각 실행 스크립트의 import 시간이 예산 안에 있고 DB 계층이 로드되지 않는지 확인합니다.
+    GUI 의존 패키지(tkinterdnd2 등)가 없는 환경에서는 해당 스크립트를 건너뜁니다.
+    """
+    for module, budget in STARTUP_BUDGETS.items():
+        result = measure_startup(module)
+        if 'skipped' in result:
+            print(f"{module:<12} 건너뜀 ({result['skipped']})")
+            continue
+        print(f"{module:<12} {result['elapsed']:.3f}s / {budget:.1f}s  로드된 모듈: {result['loaded'] or '-'}")
+        assert not result['loaded'], f"{module} import 시 {result['loaded']} 로드됨"
+        assert result['elapsed'] <= budget, f"{module} import 시간 {result['elapsed']:.3f}s > 예산 {budget}s"
+
+    print("\nTest completed.")
+
+
+if __name__ == "__main__":
+    test_startup_budget()
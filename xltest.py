@@ -134,6 +134,10 @@ def process_interface(interface_info, mapper):
         # 필드 XML 생성
         results['field_xml'] = mapper.generate_field_xml_from_mapping()
         
+        # 송신 SELECT 컬럼 정보 (EAI 자동 컬럼 포함, 요약 시트의 행 크기 추정용)
+        results['send_columns'] = {name: mapper.send_columns[name]
+                                   for name in mapper.statement_plan().select_names if name in mapper.send_columns}
+        
     except Exception as e:
         results['errors'].append(str(e))
     finally:
@@ -207,8 +211,8 @@ def write_interface_result_to_sheet(wb, interface_info, results, interface_num):
     row = 6
     if results['comparison']:
         for comp in results['comparison']:
-            send_info = comp.get('send_info', {})
-            recv_info = comp.get('recv_info', {})
+            send_info = comp.get('send_info') or {}
+            recv_info = comp.get('recv_info') or {}
             
             # 송신 컬럼 정보
             ws[f'A{row}'] = comp.get('send_column', '')
@@ -1,118 +1,280 @@
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 import xml.etree.ElementTree as ET
 import re
+import os
+import csv
+from tkinter import filedialog
 from tkinterdnd2 import DND_FILES, TkinterDnD
+from gui_worker import BackgroundRunner
+
+XSL_NS = 'http://www.w3.org/1999/XSL/Transform'
+
+def collect_xml_files(paths):
+    """
+    Expand dropped paths into a list of XML files.
+    Folders are walked recursively and their XML files are added in sorted order.
+    """
+    xml_files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dir_path, dir_names, file_names in os.walk(path):
+                dir_names.sort()
+                for file_name in sorted(file_names):
+                    if file_name.lower().endswith('.xml'):
+                        xml_files.append(os.path.join(dir_path, file_name))
+        elif path.lower().endswith('.xml'):
+            xml_files.append(path)
+    return xml_files
+
+def collect_bindings(record, namespaces):
+    """
+    Collect the column bound to each ? of the statement, in Record order.
+    Handles direct mappings (value-of) and conditional mappings (choose/when exists()).
+    """
+    bindings = []
+    for elem in record.findall('.//*'):
+        # Get all direct mappings (simple value-of)
+        value_of = elem.find('.//xsl:value-of', namespaces)
+        if value_of is not None:
+            select_val = value_of.get('select')
+            if select_val:
+                bindings.append(select_val)
+                continue
+
+        # Get conditional mappings (choose/when)
+        choose = elem.find('.//xsl:choose', namespaces)
+        if choose is not None:
+            when = choose.find('.//xsl:when', namespaces)
+            if when is not None and when.get('test', '').startswith('exists('):
+                value_of = when.find('.//xsl:value-of', namespaces)
+                if value_of is not None:
+                    select_val = value_of.get('select')
+                    if select_val:
+                        bindings.append(select_val)
+    return bindings
+
+def substitute_placeholders(sql, bindings):
+    """
+    Replace the ? placeholders with :column_name in one positional pass.
+    Placeholders without a binding are left as ?.
+    """
+    parts = sql.split('?')
+    result = [parts[0]]
+    for index, part in enumerate(parts[1:]):
+        result.append(':' + bindings[index] if index < len(bindings) else '?')
+        result.append(part)
+    return ''.join(result)
+
+def extract_sql_statements(file_path):
+    """
+    Extract SQL statements from a TIBCO BW process XML file in a single pass.
+    Each activity is processed when its end tag is read and then released,
+    so large process files are not kept in memory as a whole tree.
+    Does not touch any Tk widget, so it can run on a worker thread.
+
+    Returns:
+        list of (activity_name, sql) tuples
+
+    Raises:
+        ET.ParseError: if the file is not valid XML
+    """
+    statements = []
+    activity_tag = None
+    namespaces = {'xsl': XSL_NS}
+    depth = 0
+
+    for event, elem in ET.iterparse(file_path, events=('start', 'end')):
+        if event == 'start':
+            if activity_tag is None:
+                # Handle namespaces (process definition namespace from the root tag)
+                namespaces['pd'] = re.findall(r'{(.*?)}', elem.tag)[0] if '}' in elem.tag else ''
+                activity_tag = '{%s}activity' % namespaces['pd'] if namespaces['pd'] else 'activity'
+            elif elem.tag == activity_tag:
+                depth += 1
+            continue
+
+        if elem.tag != activity_tag:
+            continue
+        depth -= 1
+
+        config = elem.find('.//config')
+        statement = config.find('.//statement') if config is not None else None
+        if statement is not None and statement.text:
+            activity_name = elem.get('name', 'Unknown')
+            sql = statement.text.strip()
+
+            # Find inputBindings for this activity and map ? to the bound columns
+            input_bindings = elem.find('.//pd:inputBindings', namespaces)
+            record = input_bindings.find('.//Record') if input_bindings is not None else None
+            if record is not None:
+                sql = substitute_placeholders(sql, collect_bindings(record, namespaces))
+
+            statements.append((activity_name, sql))
+
+        # Release the processed activity (nested activities are kept until the outer one is done)
+        if depth == 0:
+            elem.clear()
+
+    return statements
+
+def write_sql_csv(file_path, rows):
+    """
+    Write extracted SQL rows (file, activity, sql no, sql) to a CSV file.
+    Uses utf-8-sig so that Excel opens Korean text correctly.
+    """
+    with open(file_path, 'w', encoding='utf-8-sig', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['file', 'activity', 'sql_no', 'sql'])
+        writer.writerows(rows)
 
 class XMLParserApp:
     def __init__(self, root):
         self.root = root
         self.root.title("TIBCO XML SQL Parser")
         self.root.geometry("800x600")
-        
+
         # Create main frame
         self.main_frame = tk.Frame(root)
         self.main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        
+
         # Create drag-drop label
         self.drop_label = tk.Label(
             self.main_frame,
-            text="Drag and Drop XML File Here",
+            text="Drag and Drop XML Files or Folders Here",
             relief="solid",
             width=40,
             height=4
         )
         self.drop_label.pack(pady=20)
-        
+
+        # Create progress indicator and cancel button
+        self.status_frame = tk.Frame(self.main_frame)
+        self.status_frame.pack(fill=tk.X)
+        self.progress = ttk.Progressbar(self.status_frame, mode="determinate", length=300)
+        self.progress.pack(side=tk.LEFT, padx=5)
+        self.status_label = tk.Label(self.status_frame, text="")
+        self.status_label.pack(side=tk.LEFT, padx=5)
+        self.cancel_button = tk.Button(self.status_frame, text="Cancel", command=self.cancel_parse, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+        self.export_button = tk.Button(self.status_frame, text="Export CSV", command=self.export_csv, state=tk.DISABLED)
+        self.export_button.pack(side=tk.RIGHT, padx=5)
+
         # Create text widget for displaying results
         self.result_text = tk.Text(self.main_frame, height=20, width=80)
         self.result_text.pack(pady=20)
-        
+
+        # Parse dropped files on worker threads, results come back via after()
+        self.runner = BackgroundRunner(self.root, max_workers=4)
+        self.file_results = {}
+        self.file_paths = []
+        self.next_index = 0  # next file (in drop order) to write into the text widget
+        self.rows = []  # (file, activity, sql no, sql) rows for CSV export
+
         # Configure drag-drop
         self.drop_label.drop_target_register(DND_FILES)
         self.drop_label.dnd_bind('<<Drop>>', self.process_dropped_file)
 
     def process_dropped_file(self, event):
-        file_path = event.data
-        if not file_path.lower().endswith('.xml'):
-            messagebox.showerror("Error", "Please drop an XML file")
+        # Several files or folders may be dropped at once ({path with spaces} path2 ...)
+        file_paths = collect_xml_files(self.root.tk.splitlist(event.data))
+        if not file_paths:
+            messagebox.showerror("Error", "Please drop an XML file or a folder containing XML files")
             return
-            
+        if self.runner.busy:
+            messagebox.showerror("Error", "Previous files are still being parsed")
+            return
+
         try:
-            self.parse_xml(file_path)
+            self.parse_xml(file_paths)
         except Exception as e:
             messagebox.showerror("Error", f"Error processing file: {str(e)}")
-    
-    def parse_xml(self, file_path):
+
+    def parse_xml(self, file_paths):
         self.result_text.delete(1.0, tk.END)
+        self.file_paths = list(file_paths)
+        self.file_results = {}
+        self.next_index = 0
+        self.rows = []
+        self.progress.config(maximum=len(self.file_paths), value=0)
+        self.status_label.config(text=f"Parsing 0/{len(self.file_paths)}...")
+        self.cancel_button.config(state=tk.NORMAL)
+        self.export_button.config(state=tk.DISABLED)
+
+        for file_path in self.file_paths:
+            self.runner.submit(
+                lambda cancel_event, path: extract_sql_statements(path), file_path,
+                on_done=lambda statements, path=file_path: self.file_finished(path, statements),
+                on_error=lambda e, path=file_path: self.file_finished(path, e),
+                on_cancel=lambda path=file_path: self.file_finished(path, None)
+            )
+
+    def file_finished(self, file_path, result):
+        self.file_results[file_path] = result
+        done = len(self.file_results)
+        self.progress.config(value=done)
+        self.status_label.config(text=f"Parsing {done}/{len(self.file_paths)}...")
+
+        # Stream finished files into the widget in drop order
+        while self.next_index < len(self.file_paths) and self.file_paths[self.next_index] in self.file_results:
+            path = self.file_paths[self.next_index]
+            self.show_file_result(path, self.file_results[path])
+            self.next_index += 1
+
+        if done == len(self.file_paths):
+            self.show_summary()
+
+    def show_file_result(self, file_path, result):
+        if len(self.file_paths) > 1:
+            self.result_text.insert(tk.END, f"\n===== {file_path} =====\n")
+
+        if result is None:
+            self.result_text.insert(tk.END, "Cancelled.\n")
+        elif isinstance(result, ET.ParseError):
+            self.result_text.insert(tk.END, f"Error parsing XML: {str(result)}\n")
+        elif isinstance(result, Exception):
+            self.result_text.insert(tk.END, f"Error: {str(result)}\n")
+        elif not result:
+            self.result_text.insert(tk.END, "No SQL queries found in the XML file.\n")
+        else:
+            for sql_count, (activity_name, sql) in enumerate(result, 1):
+                self.result_text.insert(tk.END, f"\n--- SQL Query #{sql_count} (Activity: {activity_name}) ---\n")
+                self.result_text.insert(tk.END, sql + "\n")
+                self.rows.append((file_path, activity_name, sql_count, sql))
+            self.result_text.insert(tk.END, f"\nTotal SQL queries found: {len(result)}\n")
+        self.result_text.see(tk.END)
+
+    def show_summary(self):
+        cancelled = sum(1 for result in self.file_results.values() if result is None)
+        failed = sum(1 for result in self.file_results.values() if isinstance(result, Exception))
+        if len(self.file_paths) > 1:
+            self.result_text.insert(
+                tk.END,
+                f"\n===== {len(self.file_paths)} files, {len(self.rows)} SQL queries, "
+                f"{failed} errors, {cancelled} cancelled =====\n"
+            )
+            self.result_text.see(tk.END)
+
+        self.cancel_button.config(state=tk.DISABLED)
+        self.export_button.config(state=tk.NORMAL if self.rows else tk.DISABLED)
+        self.status_label.config(text="Cancelled" if cancelled else f"Done ({len(self.file_paths)} file(s))")
+
+    def export_csv(self):
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
+        )
+        if not file_path:
+            return
         try:
-            # Parse XML with namespace handling
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Handle namespaces
-            namespaces = {
-                'pd': re.findall(r'{(.*?)}', root.tag)[0] if '}' in root.tag else '',
-                'xsl': 'http://www.w3.org/1999/XSL/Transform'
-            }
-            
-            # Find all SQL statements
-            sql_count = 0
-            for activity in root.findall('.//pd:activity', namespaces):
-                if activity is not None:
-                    config = activity.find('.//config')
-                    if config is not None:
-                        statement = config.find('.//statement')
-                        if statement is not None and statement.text:
-                            sql_count += 1
-                            activity_name = activity.get('name', 'Unknown')
-                            
-                            # Get the SQL and find the column mappings
-                            sql = statement.text.strip()
-                            
-                            # Find inputBindings for this activity
-                            input_bindings = activity.find('.//pd:inputBindings', namespaces)
-                            if input_bindings is not None:
-                                record = input_bindings.find('.//Record')
-                                if record is not None:
-                                    # Get all direct mappings (simple value-of)
-                                    for elem in record.findall('.//*'):
-                                        value_of = elem.find('.//xsl:value-of', namespaces)
-                                        if value_of is not None:
-                                            select_val = value_of.get('select')
-                                            if select_val:
-                                                # Replace ? with :column_name in SQL
-                                                sql = sql.replace('?', ':' + select_val, 1)
-                                                continue
-                                                
-                                        # Get conditional mappings (choose/when)
-                                        choose = elem.find('.//xsl:choose', namespaces)
-                                        if choose is not None:
-                                            when = choose.find('.//xsl:when', namespaces)
-                                            if when is not None:
-                                                test_val = when.get('test', '')
-                                                if test_val.startswith('exists('):
-                                                    # Extract column name from exists()
-                                                    col_name = test_val[7:-1]  # Remove exists( and )
-                                                    value_of = when.find('.//xsl:value-of', namespaces)
-                                                    if value_of is not None:
-                                                        select_val = value_of.get('select')
-                                                        if select_val:
-                                                            # Replace ? with :column_name in SQL
-                                                            sql = sql.replace('?', ':' + select_val, 1)
-                            
-                            self.result_text.insert(tk.END, f"\n--- SQL Query #{sql_count} (Activity: {activity_name}) ---\n")
-                            self.result_text.insert(tk.END, sql + "\n")
-            
-            if sql_count == 0:
-                self.result_text.insert(tk.END, "No SQL queries found in the XML file.")
-            else:
-                self.result_text.insert(tk.END, f"\nTotal SQL queries found: {sql_count}")
-                
-        except ET.ParseError as e:
-            self.result_text.insert(tk.END, f"Error parsing XML: {str(e)}")
-        except Exception as e:
-            self.result_text.insert(tk.END, f"Error: {str(e)}")
+            write_sql_csv(file_path, self.rows)
+            self.status_label.config(text=f"Exported {len(self.rows)} rows to {file_path}")
+        except IOError as e:
+            messagebox.showerror("Error", f"Error writing CSV: {str(e)}")
+
+    def cancel_parse(self):
+        self.status_label.config(text="Cancelling...")
+        self.runner.cancel()
 
 def main():
     root = TkinterDnD.Tk()